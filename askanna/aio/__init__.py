@@ -0,0 +1,35 @@
+"""
+Asyncio version of the AskAnna Python SDK
+
+The SDK objects in this package have the same methods as the objects in the askanna package, but the methods are
+coroutines. They share one async HTTP client, so many requests can be in flight at the same time:
+
+    import asyncio
+    from askanna import aio
+
+    async def main(run_suuids):
+        return await asyncio.gather(*(aio.run.status(run_suuid) for run_suuid in run_suuids))
+
+The async client requires httpx, you can install it with: pip install askanna[aio]
+"""
+
+try:
+    import httpx  # noqa: F401
+except ImportError as e:  # pragma: no cover
+    raise ImportError("askanna.aio requires 'httpx', you can install it with: pip install askanna[aio]") from e
+
+from askanna.aio.api_client import AsyncClient, client  # noqa: F401
+from askanna.aio.sdk.job import JobSDK
+from askanna.aio.sdk.package import PackageSDK
+from askanna.aio.sdk.project import ProjectSDK
+from askanna.aio.sdk.run import RunSDK
+from askanna.aio.sdk.variable import VariableSDK
+from askanna.aio.sdk.workspace import WorkspaceSDK
+
+# Instantiated objects for query or actions, these do not contain any data on load and will be filled when needed
+job = JobSDK()
+package = PackageSDK()
+project = ProjectSDK()
+run = RunSDK()
+variable = VariableSDK()
+workspace = WorkspaceSDK()
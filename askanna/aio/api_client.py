@@ -0,0 +1,290 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+import click
+import httpx
+
+from askanna.config import config
+from askanna.config.api_url import askanna_url
+from askanna.core.exceptions import ConnectionError
+from askanna.core.utils.object import encode_json
+from askanna.gateways.api_client import (
+    FAILURE_STATUS_CODES,
+    IDEMPOTENT_METHODS,
+    CircuitBreaker,
+    RetryPolicy,
+)
+from askanna.gateways.api_client import client as sync_client
+from askanna.gateways.trace import RequestEvent, endpoint_template
+from askanna.settings import DEFAULT_AIO_MAX_CONNECTIONS, DEFAULT_HTTP_POOL_MAXSIZE
+
+# With these errors the connection failed before the request was sent, so requests with any method can be retried
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def request_size(request: httpx.Request) -> int:
+    try:
+        return len(request.content)
+    except httpx.RequestNotRead:
+        # A streamed body, like a file upload
+        return int(request.headers.get("Content-Length") or 0)
+
+
+class AsyncClient:
+    """
+    Async client for communication with AskAnna API service
+
+    The client uses an httpx.AsyncClient per event loop, so many requests can be in flight at the same time without a
+    thread per request. The number of connections is limited to AA_AIO_MAX_CONNECTIONS, requests above this limit wait
+    for a free connection.
+
+    The client uses the configuration and authentication headers of the sync client in askanna.gateways.api_client,
+    and retries requests and fails fast with the same RetryPolicy and CircuitBreaker. Functions added with add_hook
+    are called with a RequestEvent after each request.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.config = config
+        self.askanna_url = askanna_url
+
+        if max_connections is None:
+            max_connections = int(os.getenv("AA_AIO_MAX_CONNECTIONS", DEFAULT_AIO_MAX_CONNECTIONS))
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_connections, DEFAULT_HTTP_POOL_MAXSIZE),
+        )
+        self.transport = transport
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.hooks: List[Callable[[RequestEvent], None]] = []
+
+        # An httpx.AsyncClient can only be used in the event loop it was created in
+        self._sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._headers_versions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """The httpx client of the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.get(loop)
+            if session is None or session.is_closed:
+                session = httpx.AsyncClient(limits=self.limits, transport=self.transport, follow_redirects=True)
+                self._sessions[loop] = session
+                self._headers_versions[loop] = None
+
+            if self._headers_versions[loop] != sync_client.headers_version:
+                # The headers change when the user logs in with the sync client
+                session.headers.update(sync_client.headers)
+                self._headers_versions[loop] = sync_client.headers_version
+
+        return session
+
+    async def aclose(self) -> None:
+        """Close the connections of the httpx client of the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.pop(loop, None)
+        if session is not None:
+            await session.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """Call the hook with a RequestEvent after each request"""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        self.hooks.remove(hook)
+
+    def _call_hooks(
+        self,
+        method: str,
+        url: str,
+        start: float,
+        duration: float,
+        retries: int,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> None:
+        event = RequestEvent(
+            method=method,
+            url=url,
+            endpoint=endpoint_template(url),
+            status_code=response.status_code if response is not None else None,
+            start=start,
+            duration=duration,
+            request_bytes=request_size(response.request) if response is not None else 0,
+            response_bytes=len(response.content) if response is not None else 0,
+            retries=retries,
+            thread_id=threading.get_ident(),
+            error=str(error) if error else None,
+        )
+        for hook in list(self.hooks):
+            try:
+                hook(event)
+            except Exception as e:
+                click.echo(f"Request hook {hook!r} failed: {e}", err=True)
+
+    def _connection_error_message(self, url, error):
+        connection_error_message_base = "Something went wrong. Please check whether the URL is an AskAnna Backend."
+        return f"{connection_error_message_base}\n    URL:    {url}\n    Error: {error!r}"
+
+    def _httpx_kwargs(self, kwargs: dict) -> dict:
+        """Translate the arguments of a requests call to the arguments of an httpx call"""
+        if kwargs.get("params"):
+            # Like requests, leave out query parameters that are None
+            kwargs["params"] = {key: value for key, value in kwargs["params"].items() if value is not None}
+
+        if kwargs.get("json") is not None and not kwargs.get("data"):
+            kwargs["content"] = encode_json(kwargs.pop("json"))
+            headers = httpx.Headers(kwargs.get("headers") or {})
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
+        kwargs.pop("json", None)
+
+        if isinstance(kwargs.get("data"), (bytes, str)):
+            kwargs["content"] = kwargs.pop("data")
+
+        return kwargs
+
+    def _retry_error(self, method: str, error: httpx.TransportError, retry: Optional[bool]) -> bool:
+        if isinstance(error, NOT_SENT_ERRORS):
+            return retry is not False
+        return retry is not False and (retry or method in IDEMPOTENT_METHODS)
+
+    async def request(self, method: str, url: str, retry: Optional[bool] = None, **kwargs) -> httpx.Response:
+        """
+        Do a request and retry it if it fails according to the retry policy. See Client.request for the arguments.
+
+        Raises:
+            ConnectionError: Could not connect to the backend, or the circuit breaker is open
+
+        Returns:
+            httpx.Response: The response of the last try
+        """
+        method = method.upper()
+        kwargs = self._httpx_kwargs(kwargs)
+        if kwargs.get("files"):
+            # A file is read while sending the request, so we cannot send the same request again
+            retry = False
+
+        start, start_counter = time.time(), time.perf_counter()
+        retry_number = 0
+        response = error = None
+        try:
+            while True:
+                self.circuit_breaker.check(url)
+                can_retry = retry_number < self.retry_policy.retries
+
+                try:
+                    response = await self.session.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    self.circuit_breaker.record_failure(url)
+                    if not can_retry or not self._retry_error(method, e, retry):
+                        raise ConnectionError(self._connection_error_message(url, e))
+                    delay = self.retry_policy.delay(retry_number)
+                else:
+                    if response.status_code in FAILURE_STATUS_CODES:
+                        self.circuit_breaker.record_failure(url)
+                    else:
+                        self.circuit_breaker.record_success(url)
+
+                    if not can_retry or not self.retry_policy.retry_status(method, response.status_code, retry):
+                        return response
+                    delay = self.retry_policy.delay(retry_number, response)
+                    response = None
+
+                await asyncio.sleep(delay)
+                retry_number += 1
+        except ConnectionError as e:
+            error = e
+            raise
+        finally:
+            if self.hooks:
+                self._call_hooks(
+                    method, url, start, time.perf_counter() - start_counter, retry_number, response, error
+                )
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def head(self, url, **kwargs):
+        return await self.request("HEAD", url, **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request("PATCH", url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request("PUT", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def create(self, url, **kwargs):
+        return await self.post(url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request("DELETE", url, **kwargs)
+
+    async def download(self, url: str, output_file: Union[Path, str], overwrite: bool = False) -> int:
+        """Download the content of the URL to a file, without keeping the whole content in memory
+
+        The content is written to a .part file next to the output file, which is renamed when the download is
+        complete. If the response is not 200, nothing is written.
+
+        Args:
+            url (str): URL to download
+            output_file (Path | str): Path to save the content to
+            overwrite (bool, optional): Overwrite the file if it already exists. Defaults to False.
+
+        Raises:
+            ValueError: The output file is a directory, or it exists and overwrite is False
+            ConnectionError: Could not connect to the backend, or the circuit breaker is open
+
+        Returns:
+            int: The status code of the response
+        """
+        output_file = Path(output_file)
+        if output_file.is_dir():
+            raise ValueError(f"The output path '{output_file}' is a directory, but should be a file name")
+        if output_file.exists() and not overwrite:
+            raise ValueError(f"The output file '{output_file}' already exists.")
+
+        self.circuit_breaker.check(url)
+        try:
+            async with self.session.stream("GET", url) as response:
+                if response.status_code != 200:
+                    return response.status_code
+
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                part_file = output_file.with_name(output_file.name + ".part")
+                with part_file.open("wb") as f:
+                    async for chunk in response.aiter_bytes():
+                        f.write(chunk)
+                part_file.replace(output_file)
+        except httpx.TransportError as e:
+            self.circuit_breaker.record_failure(url)
+            raise ConnectionError(self._connection_error_message(url, e))
+
+        self.circuit_breaker.record_success(url)
+        return response.status_code
+
+
+client = AsyncClient()
@@ -0,0 +1,72 @@
+from typing import Optional
+
+from askanna.aio.gateways.utils import run_operation
+from askanna.core.dataclasses.job import Job
+from askanna.core.dataclasses.run import RunStatus
+from askanna.gateways.job import (
+    JobListResponse,
+    change_operation,
+    delete_operation,
+    detail_operation,
+    list_operation,
+    run_request_operation,
+)
+
+
+class JobGateway:
+    """Management of jobs in AskAnna with asyncio
+    This is the class which act as gateway to the API of AskAnna
+
+    The methods have the same arguments as JobGateway in askanna.gateways.job and run its operations, which build the
+    requests and handle the responses.
+    """
+
+    async def list(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> JobListResponse:
+        """List all jobs with filter and order options"""
+        return await run_operation(
+            list_operation(
+                project_suuid=project_suuid,
+                workspace_suuid=workspace_suuid,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+            )
+        )
+
+    async def detail(self, job_suuid: str) -> Job:
+        """Get information of a job"""
+        return await run_operation(detail_operation(job_suuid=job_suuid))
+
+    async def run_request(
+        self,
+        job_suuid: str,
+        data: Optional[dict] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> RunStatus:
+        """Do a request to run a job on the AskAnna platform"""
+        return await run_operation(
+            run_request_operation(job_suuid=job_suuid, data=data, name=name, description=description)
+        )
+
+    async def change(
+        self,
+        job_suuid: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Job:
+        """Change the name and/or description of a job"""
+        return await run_operation(change_operation(job_suuid=job_suuid, name=name, description=description))
+
+    async def delete(self, job_suuid: str) -> bool:
+        """Delete a job"""
+        return await run_operation(delete_operation(job_suuid=job_suuid))
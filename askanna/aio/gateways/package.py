@@ -0,0 +1,53 @@
+from pathlib import Path
+from typing import Optional, Union
+
+from askanna.aio.gateways.utils import run_operation
+from askanna.core.dataclasses.package import Package
+from askanna.gateways.package import (
+    PackageListResponse,
+    detail_operation,
+    download_operation,
+    list_operation,
+)
+
+
+class PackageGateway:
+    """Management of packages in AskAnna with asyncio
+    This is the class which act as gateway to the API of AskAnna
+
+    The methods have the same arguments as PackageGateway in askanna.gateways.package and run its operations, which
+    build the requests and handle the responses.
+    """
+
+    async def list(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        created_by_name: Optional[str] = None,
+        created_by_suuid: Optional[str] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> PackageListResponse:
+        """Get a list of packages"""
+        return await run_operation(
+            list_operation(
+                project_suuid=project_suuid,
+                workspace_suuid=workspace_suuid,
+                created_by_name=created_by_name,
+                created_by_suuid=created_by_suuid,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+            )
+        )
+
+    async def detail(self, package_suuid: str) -> Package:
+        """Get information of a package"""
+        return await run_operation(detail_operation(package_suuid=package_suuid))
+
+    async def download(self, package_suuid: str, output_path: Optional[Union[Path, str]] = None) -> Union[bytes, None]:
+        """Download a package"""
+        return await run_operation(download_operation(package_suuid=package_suuid, output_path=output_path))
@@ -0,0 +1,75 @@
+from typing import Optional
+
+from askanna.aio.gateways.utils import run_operation
+from askanna.core.dataclasses.base import VISIBILITY
+from askanna.core.dataclasses.project import Project
+from askanna.gateways.project import (
+    ProjectListResponse,
+    change_operation,
+    create_operation,
+    delete_operation,
+    detail_operation,
+    list_operation,
+)
+
+
+class ProjectGateway:
+    """Management of projects in AskAnna with asyncio
+    This is the class which act as the gateway to the API of AskAnna
+
+    The methods have the same arguments as ProjectGateway in askanna.gateways.project and run its operations, which
+    build the requests and handle the responses.
+    """
+
+    async def list(
+        self,
+        workspace_suuid: Optional[str] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+        is_member: Optional[bool] = None,
+        visibility: Optional[VISIBILITY] = None,
+    ) -> ProjectListResponse:
+        """List all projects with filter and order options"""
+        return await run_operation(
+            list_operation(
+                workspace_suuid=workspace_suuid,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+                is_member=is_member,
+                visibility=visibility,
+            )
+        )
+
+    async def detail(self, project_suuid: str) -> Project:
+        """Get information of a project"""
+        return await run_operation(detail_operation(project_suuid=project_suuid))
+
+    async def create(
+        self, workspace_suuid: str, name: str, description: str = "", visibility: str = "PRIVATE"
+    ) -> Project:
+        """Create a new project"""
+        return await run_operation(
+            create_operation(
+                workspace_suuid=workspace_suuid, name=name, description=description, visibility=visibility
+            )
+        )
+
+    async def change(
+        self,
+        project_suuid: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        visibility: Optional[str] = None,
+    ) -> Project:
+        """Change the name, description and/or visibility of a project"""
+        return await run_operation(
+            change_operation(project_suuid=project_suuid, name=name, description=description, visibility=visibility)
+        )
+
+    async def delete(self, project_suuid: str) -> bool:
+        """Delete a project"""
+        return await run_operation(delete_operation(project_suuid=project_suuid))
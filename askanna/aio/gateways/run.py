@@ -0,0 +1,174 @@
+from pathlib import Path
+from typing import List, Optional, Union
+
+from askanna.aio.gateways.utils import run_operation
+from askanna.core.dataclasses.job import Payload
+from askanna.core.dataclasses.run import (
+    STATUS,
+    TRIGGER,
+    ArtifactInfo,
+    MetricList,
+    Run,
+    RunStatus,
+    VariableList,
+)
+from askanna.gateways.run import (
+    RunListResponse,
+    artifact_info_operation,
+    artifact_operation,
+    change_operation,
+    delete_operation,
+    detail_operation,
+    list_operation,
+    log_operation,
+    manifest_operation,
+    metric_operation,
+    metric_update_operation,
+    payload_info_operation,
+    payload_operation,
+    result_content_type_operation,
+    result_operation,
+    status_operation,
+    variable_operation,
+    variable_update_operation,
+)
+
+
+class RunGateway:
+    """Management of runs in AskAnna with asyncio
+    This is the class which act as the gateway to the API of AskAnna
+
+    The methods have the same arguments as RunGateway in askanna.gateways.run and run its operations, which build the
+    requests and handle the responses.
+    """
+
+    async def list(
+        self,
+        status: Optional[STATUS] = None,
+        status__exclude: Optional[STATUS] = None,
+        run_suuid_list: Optional[List[str]] = None,
+        run_suuid__exclude: Optional[str] = None,
+        job_suuid: Optional[str] = None,
+        job_suuid__exclude: Optional[str] = None,
+        project_suuid: Optional[str] = None,
+        project_suuid__exclude: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        workspace_suuid__exclude: Optional[str] = None,
+        created_by_suuid: Optional[str] = None,
+        created_by_suuid__exclude: Optional[str] = None,
+        trigger: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+        trigger__exclude: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+        package_suuid: Optional[str] = None,
+        package_suuid__exclude: Optional[str] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> RunListResponse:
+        """List all runs with filter and order options"""
+        return await run_operation(
+            list_operation(
+                status=status,
+                status__exclude=status__exclude,
+                run_suuid_list=run_suuid_list,
+                run_suuid__exclude=run_suuid__exclude,
+                job_suuid=job_suuid,
+                job_suuid__exclude=job_suuid__exclude,
+                project_suuid=project_suuid,
+                project_suuid__exclude=project_suuid__exclude,
+                workspace_suuid=workspace_suuid,
+                workspace_suuid__exclude=workspace_suuid__exclude,
+                created_by_suuid=created_by_suuid,
+                created_by_suuid__exclude=created_by_suuid__exclude,
+                trigger=trigger,
+                trigger__exclude=trigger__exclude,
+                package_suuid=package_suuid,
+                package_suuid__exclude=package_suuid__exclude,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+            )
+        )
+
+    async def detail(self, run_suuid: str) -> Run:
+        """Get information of a run"""
+        return await run_operation(detail_operation(run_suuid=run_suuid))
+
+    async def change(self, run_suuid: str, name: Optional[str] = None, description: Optional[str] = None) -> Run:
+        """Change the name and/or description of a run"""
+        return await run_operation(change_operation(run_suuid=run_suuid, name=name, description=description))
+
+    async def delete(self, run_suuid: str) -> bool:
+        """Delete a run"""
+        return await run_operation(delete_operation(run_suuid=run_suuid))
+
+    async def status(self, run_suuid: str) -> RunStatus:
+        """Get the status of a run"""
+        return await run_operation(status_operation(run_suuid=run_suuid))
+
+    async def manifest(
+        self,
+        run_suuid: str,
+        output_path: Optional[Union[Path, str]] = None,
+        overwrite: bool = False,
+    ) -> Union[bytes, None]:
+        """Get the manifest of a run and optionally save it to a file"""
+        return await run_operation(
+            manifest_operation(run_suuid=run_suuid, output_path=output_path, overwrite=overwrite)
+        )
+
+    async def metric(self, run_suuid: str) -> MetricList:
+        """Get the metrics of a run"""
+        return await run_operation(metric_operation(run_suuid=run_suuid))
+
+    async def metric_update(self, run_suuid: str, metrics: MetricList, partial: bool = False) -> None:
+        """Update the metrics of a run"""
+        return await run_operation(metric_update_operation(run_suuid=run_suuid, metrics=metrics, partial=partial))
+
+    async def variable(self, run_suuid: str) -> VariableList:
+        """Get the variables of a run"""
+        return await run_operation(variable_operation(run_suuid=run_suuid))
+
+    async def variable_update(self, run_suuid: str, variables: VariableList) -> None:
+        """Update the variables of a run"""
+        return await run_operation(variable_update_operation(run_suuid=run_suuid, variables=variables))
+
+    async def log(self, run_suuid: str, limit: Optional[int] = -1, offset: Optional[int] = None) -> List:
+        """Get the log of a run"""
+        return await run_operation(log_operation(run_suuid=run_suuid, limit=limit, offset=offset))
+
+    async def payload_info(self, run_suuid: str) -> Union[Payload, None]:
+        """Get the payload info of a run"""
+        return await run_operation(payload_info_operation(run_suuid=run_suuid))
+
+    async def payload(
+        self, run_suuid: str, payload_suuid: str, output_path: Optional[Union[Path, str]] = None
+    ) -> Union[bytes, None]:
+        """Get the payload of a run and optionally save it to a file"""
+        return await run_operation(
+            payload_operation(run_suuid=run_suuid, payload_suuid=payload_suuid, output_path=output_path)
+        )
+
+    async def result(self, run_suuid: str, output_path: Optional[Union[Path, str]] = None) -> Union[bytes, None]:
+        """Get the result of a run and optionally save it to a file"""
+        return await run_operation(result_operation(run_suuid=run_suuid, output_path=output_path))
+
+    async def result_content_type(self, run_suuid: str) -> str:
+        """Get the content type of the result of a run"""
+        return await run_operation(result_content_type_operation(run_suuid=run_suuid))
+
+    async def artifact(
+        self,
+        run_suuid: str,
+        artifact_suuid: Optional[str] = None,
+        output_path: Optional[Union[Path, str]] = None,
+    ) -> Union[bytes, None]:
+        """Get the artifact of a run and optionally save it to a file"""
+        return await run_operation(
+            artifact_operation(run_suuid=run_suuid, artifact_suuid=artifact_suuid, output_path=output_path)
+        )
+
+    async def artifact_info(self, run_suuid: str, artifact_suuid: Optional[str] = None) -> ArtifactInfo:
+        """Get artifact info of a run"""
+        return await run_operation(artifact_info_operation(run_suuid=run_suuid, artifact_suuid=artifact_suuid))
@@ -0,0 +1,16 @@
+from askanna.aio.api_client import client
+from askanna.gateways.utils import Download, Operation, T
+
+
+async def run_operation(operation: Operation[T]) -> T:
+    """Do the requests of an operation with the async client and return the result, see askanna.gateways.utils"""
+    try:
+        step = next(operation)
+        while True:
+            if isinstance(step, Download):
+                status_code = await client.download(step.url, step.output_file, overwrite=step.overwrite)
+                step = operation.send(status_code)
+            else:
+                step = operation.send(await getattr(client, step.method)(step.url, **step.kwargs))
+    except StopIteration as stop:
+        return stop.value
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from askanna.aio.gateways.utils import run_operation
+from askanna.core.dataclasses.variable import Variable
+from askanna.gateways.variable import (
+    VariableListResponse,
+    change_operation,
+    create_operation,
+    delete_operation,
+    detail_operation,
+    list_operation,
+)
+
+
+class VariableGateway:
+    """Management of variables in AskAnna with asyncio
+    This is the class which act as gateway to the API of AskAnna
+
+    The methods have the same arguments as VariableGateway in askanna.gateways.variable and run its operations, which
+    build the requests and handle the responses.
+    """
+
+    async def list(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        is_masked: Optional[bool] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> VariableListResponse:
+        """List variables with the option to filter and order options"""
+        return await run_operation(
+            list_operation(
+                project_suuid=project_suuid,
+                workspace_suuid=workspace_suuid,
+                is_masked=is_masked,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+            )
+        )
+
+    async def detail(self, variable_suuid: str) -> Variable:
+        """Get the details of a variable"""
+        return await run_operation(detail_operation(variable_suuid=variable_suuid))
+
+    async def create(self, project_suuid: str, name: str, value: str, is_masked: bool = False) -> Variable:
+        """Create a new variable for a project"""
+        return await run_operation(
+            create_operation(project_suuid=project_suuid, name=name, value=value, is_masked=is_masked)
+        )
+
+    async def change(
+        self,
+        variable_suuid: str,
+        name: Optional[str] = None,
+        value: Optional[str] = None,
+        is_masked: Optional[bool] = None,
+    ) -> Variable:
+        """Change the name, value or is_masked of a variable"""
+        return await run_operation(
+            change_operation(variable_suuid=variable_suuid, name=name, value=value, is_masked=is_masked)
+        )
+
+    async def delete(self, variable_suuid: str) -> bool:
+        """Delete a variable"""
+        return await run_operation(delete_operation(variable_suuid=variable_suuid))
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from askanna.aio.gateways.utils import run_operation
+from askanna.core.dataclasses.base import VISIBILITY
+from askanna.core.dataclasses.workspace import Workspace
+from askanna.gateways.workspace import (
+    WorkspaceListResponse,
+    change_operation,
+    create_operation,
+    delete_operation,
+    detail_operation,
+    list_operation,
+)
+
+
+class WorkspaceGateway:
+    """Management of workspaces in AskAnna with asyncio
+    This is the class which act as the gateway to the API of AskAnna
+
+    The methods have the same arguments as WorkspaceGateway in askanna.gateways.workspace and run its operations, which
+    build the requests and handle the responses.
+    """
+
+    async def list(
+        self,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+        is_member: Optional[bool] = None,
+        visibility: Optional[VISIBILITY] = None,
+    ) -> WorkspaceListResponse:
+        """List all workspaces"""
+        return await run_operation(
+            list_operation(
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+                is_member=is_member,
+                visibility=visibility,
+            )
+        )
+
+    async def detail(self, workspace_suuid: str) -> Workspace:
+        """Get information of a workspace"""
+        return await run_operation(detail_operation(workspace_suuid=workspace_suuid))
+
+    async def create(self, name: str, description: str = "", visibility: str = "PRIVATE") -> Workspace:
+        """Create a new workspace"""
+        return await run_operation(create_operation(name=name, description=description, visibility=visibility))
+
+    async def change(
+        self,
+        workspace_suuid: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        visibility: Optional[str] = None,
+    ) -> Workspace:
+        """Change the name, description and/or visibility of a workspace"""
+        return await run_operation(
+            change_operation(
+                workspace_suuid=workspace_suuid, name=name, description=description, visibility=visibility
+            )
+        )
+
+    async def delete(self, workspace_suuid: str) -> bool:
+        """Delete a workspace"""
+        return await run_operation(delete_operation(workspace_suuid=workspace_suuid))
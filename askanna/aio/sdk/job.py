@@ -0,0 +1,220 @@
+from typing import AsyncIterator, List, Optional
+
+from askanna.aio.gateways.job import JobGateway
+from askanna.config import config
+from askanna.core.dataclasses.job import Job
+from askanna.core.dataclasses.run import RunStatus
+from askanna.sdk.job import match_job_by_name
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
+
+from .mixins import AsyncListMixin
+
+__all__ = [
+    "JobSDK",
+]
+
+
+class JobSDK(AsyncListMixin):
+    """Management of jobs in AskAnna with asyncio
+    This class is a wrapper around the async JobGateway and can be used to manage jobs in Python.
+    """
+
+    gateway = JobGateway()
+    job_suuid = None
+
+    def _get_job_suuid(self) -> str:
+        if not self.job_suuid:
+            raise ValueError("No job SUUID set")
+
+        return self.job_suuid
+
+    async def list(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        number_of_results: int = 100,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Job]:
+        """List all jobs with filter and order options
+
+        Args:
+            project_suuid (str, optional): Project SUUID to filter for jobs in a project. Defaults to None.
+            workspace_suuid (str, optional): Workspace SUUID to filter for jobs in a workspace. Defaults to None.
+            number_of_results (int): Number of jobs to return. Defaults to 100.
+            order_by (str, optional): Order by field(s).
+            search (str, optional): Search for a specific job.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            List[Job]: A list of jobs. List items are of type Job dataclass.
+        """
+        return await super().list(
+            number_of_results=number_of_results,
+            order_by=order_by,
+            other_query_params={
+                "project_suuid": project_suuid,
+                "workspace_suuid": workspace_suuid,
+                "search": search,
+            },
+        )
+
+    def iter(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[Job]:
+        """Iterate over jobs with filter and order options. The jobs are requested page by page when they are
+        needed, so only one page of jobs is kept in memory.
+
+        Args:
+            project_suuid (str, optional): Project SUUID to filter for jobs in a project. Defaults to None.
+            workspace_suuid (str, optional): Workspace SUUID to filter for jobs in a workspace. Defaults to None.
+            number_of_results (int, optional): Maximum number of jobs. Defaults to None (all jobs).
+            page_size (int, optional): Number of jobs to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead in a task while the jobs of the current
+                page are handled. Defaults to 0 (no prefetching).
+            order_by (str, optional): Order by field(s).
+            search (str, optional): Search for a specific job.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Job: Job dataclass
+        """
+        return self.iter_list(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params={
+                "project_suuid": project_suuid,
+                "workspace_suuid": workspace_suuid,
+                "search": search,
+            },
+        )
+
+    async def get(self, job_suuid: str) -> Job:
+        """Get information of a job
+
+        Args:
+            job_suuid (str): SUUID of the job
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            Job: Job information in a Job dataclass
+        """
+        return await self.gateway.detail(job_suuid)
+
+    async def get_job_by_name(
+        self,
+        job_name: str,
+        project_suuid: Optional[str] = None,
+    ) -> Job:
+        """Get information of a job by searching on the job name. This only works if the job name is unique, or unique
+        within a project.
+
+        Args:
+            job_name (str): Name of the job you are looking for
+            project_suuid (str, optional): Project SUUID to filter for jobs in a project. Defaults to None.
+
+        Raises:
+            GetError: If the job name is not unique or not found
+
+        Returns:
+            Job: Job information in a Job dataclass
+        """
+        job_list = await self.list(project_suuid=project_suuid, search=job_name)
+        return match_job_by_name(job_list, job_name=job_name, project_suuid=project_suuid)
+
+    async def run_request(
+        self,
+        job_suuid: Optional[str] = None,
+        data: Optional[dict] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        project_suuid: Optional[str] = None,
+        job_name: Optional[str] = None,
+    ) -> RunStatus:
+        """Do a request to run a job on the AskAnna platform
+
+        Args:
+            job_suuid (str, optioanl): SUUID of the job you want to start a run of. job_suuid or job_name is required.
+            data (dict, optional): Data to pass to the job.
+            name (str, optional): Optionally give the run a name
+            description (str, optional): Optionally give the run a description
+            project_suuid (str, optional): Project SUUID to filter for jobs in a project. Defaults to None.
+            job_name (str, optional): Name of the job you want to start a run of. job_name or job_suuid is required.
+
+        Raises:
+            PostError: Error based on response status code with the error message from the API
+
+        Returns:
+            RunStatus: The run status information in a RunStatus dataclass
+        """
+        assert job_suuid or job_name, "To start a run we need at least a job SUUID or job name"
+        assert not (job_suuid and job_name), "Parameters 'job_suuid' and 'job_name' are both set. Please only set one."
+
+        if job_name:
+            project_suuid = project_suuid or config.project.project_suuid
+            job_suuid = (await self.get_job_by_name(job_name=job_name, project_suuid=project_suuid)).suuid
+        if not job_suuid:
+            raise ValueError("No job SUUID set")
+
+        return await self.gateway.run_request(
+            job_suuid=job_suuid,
+            data=data,
+            name=name,
+            description=description,
+        )
+
+    async def change(
+        self,
+        job_suuid: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Job:
+        """Change the name and/or description of a job
+
+        Args:
+            job_suuid (str): SUUID of the job you want to change the information of
+            name (str, optional): New name for the project. Defaults to None.
+            description (str, optional): New description of the project. Defaults to None.
+
+        Raises:
+            ValueError: Error when visibility is not "PUBLIC" or "PRIVATE"
+            ValueError: Error if none of the arguments 'name', 'description' or 'visibility' are provided
+            PatchError: Error based on response status code with the error message from the API
+
+        Returns:
+            Project: The changed project information in a Project dataclass
+        """
+        return await self.gateway.change(
+            job_suuid=job_suuid,
+            name=name,
+            description=description,
+        )
+
+    async def delete(self, job_suuid: str) -> bool:
+        """Delete a job
+
+        Args:
+            job_suuid (str): SUUID of the job you want to delete
+
+        Raises:
+            DeleteError: Error based on response status code with the error message from the API
+
+        Returns:
+            bool: True if the job was succesfully deleted
+        """
+        return await self.gateway.delete(job_suuid=job_suuid)
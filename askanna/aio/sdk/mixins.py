@@ -0,0 +1,171 @@
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from askanna.sdk.mixins import is_last_page, list_query_params, page_results
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
+
+__all__ = [
+    "AsyncListMixin",
+]
+
+
+class AsyncListMixin:
+    """Base class for the list method of the async SDKs
+
+    Like ListMixin, but the gateway methods are coroutines and iter_pages and iter_list are async generators. With
+    prefetch, the next pages are requested in a task while the caller handles the current page.
+
+    Example:
+
+        class WorkspaceSDK(AsyncListMixin):
+            gateway = WorkspaceGateway()
+    """
+
+    gateway = None
+
+    def __init__(self):
+        self.list_total_count = None
+
+    def get_gateway(self):
+        assert self.gateway is not None, "Gateway is not set"
+        return self.gateway
+
+    async def list(
+        self,
+        number_of_results: int = 100,
+        order_by: Optional[str] = None,
+        other_query_params: Optional[dict] = None,
+    ) -> list:
+        return [
+            result
+            async for result in self.iter_list(
+                number_of_results=number_of_results,
+                page_size=number_of_results,
+                order_by=order_by,
+                other_query_params=other_query_params,
+            )
+        ]
+
+    def iter_pages(
+        self,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        order_by: Optional[str] = None,
+        other_query_params: Optional[dict] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[List]:
+        """Async generator that yields the results page by page. The next page is requested when the previous page
+        is consumed, following the cursor of the previous page.
+
+        With prefetch, a task requests and decodes up to prefetch pages ahead of the page that is consumed. This way
+        the time waiting for the API overlaps with the time spent on handling the results.
+
+        Args:
+            number_of_results (int, optional): Maximum number of results. Defaults to None, which means all results.
+            page_size (int, optional): Number of results per page. Defaults to 100.
+            order_by (str, optional): Order by field(s).
+            other_query_params (dict, optional): Query parameters to filter the results.
+            prefetch (int, optional): Number of pages to request ahead. Defaults to 0 (no prefetching).
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            List: The results of a page
+        """
+        pages = self._iter_pages(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            order_by=order_by,
+            other_query_params=other_query_params,
+        )
+        if prefetch > 0:
+            return prefetch_iterator(pages, depth=prefetch)
+        return pages
+
+    async def _iter_pages(
+        self,
+        number_of_results: Optional[int],
+        page_size: int,
+        order_by: Optional[str],
+        other_query_params: Optional[dict],
+    ) -> AsyncIterator[List]:
+        gateway = self.get_gateway()
+        query_params = list_query_params(page_size, order_by, other_query_params)
+
+        list_response = await gateway.list(**query_params)
+        self.list_total_count = list_response.total_count
+
+        remaining = number_of_results
+        while True:
+            results, remaining = page_results(list_response, remaining)
+            if results:
+                yield results
+
+            if is_last_page(list_response, remaining):
+                return
+            list_response = await gateway.list(
+                cursor=list_response.next_url_cursor,
+                **query_params,
+            )
+
+    async def iter_list(
+        self,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        order_by: Optional[str] = None,
+        other_query_params: Optional[dict] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator:
+        """Async generator that yields the results one by one. See iter_pages for the arguments."""
+        async for page in self.iter_pages(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            order_by=order_by,
+            other_query_params=other_query_params,
+            prefetch=prefetch,
+        ):
+            for result in page:
+                yield result
+
+
+async def prefetch_iterator(iterator: AsyncIterator, depth: int) -> AsyncIterator:
+    """Consume an async iterator in a task and yield its items, with at most depth items waiting to be yielded
+
+    Like prefetch_iterator in askanna.sdk.mixins, but with a task instead of a worker thread. Exceptions raised by the
+    iterator are raised when the item that failed is next. If the generator is closed before the iterator is
+    exhausted, the task is cancelled.
+
+    Args:
+        iterator (AsyncIterator): The async iterator to consume in the task
+        depth (int): Maximum number of items that are consumed ahead
+
+    Yields:
+        The items of the iterator
+    """
+    assert depth > 0, "depth must be larger than 0"
+    items: asyncio.Queue = asyncio.Queue(maxsize=depth)
+    done = object()
+
+    async def consume():
+        try:
+            async for item in iterator:
+                await items.put((item, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await items.put((done, e))
+        else:
+            await items.put((done, None))
+
+    task = asyncio.create_task(consume())
+    try:
+        while True:
+            item, error = await items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        task.cancel()
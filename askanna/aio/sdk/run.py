@@ -0,0 +1,535 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Tuple, Union
+
+from askanna.aio.gateways.run import RunGateway
+from askanna.config import config
+from askanna.core.dataclasses.job import Payload
+from askanna.core.dataclasses.run import (
+    STATUS,
+    TRIGGER,
+    ArtifactInfo,
+    MetricList,
+    Run,
+    RunStatus,
+    VariableList,
+)
+from askanna.sdk.run import raise_fetch_errors
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE, DEFAULT_RUN_FETCH_CONCURRENCY
+
+from .job import JobSDK
+from .mixins import AsyncListMixin
+
+__all__ = [
+    "RunSDK",
+]
+
+
+class RunSDK(AsyncListMixin):
+    """Management of runs in AskAnna with asyncio
+    This class is a wrapper around the async RunGateway and can be used to manage runs in Python.
+
+    Unlike the sync RunSDK, this class does not use the run cache.
+    """
+
+    gateway = RunGateway()
+    run_suuid = None
+    # Maximum number of requests at the same time to get the metrics and variables of runs
+    fetch_concurrency = int(os.getenv("AA_RUN_FETCH_CONCURRENCY", DEFAULT_RUN_FETCH_CONCURRENCY))
+
+    def _get_run_suuid(self) -> str:
+        if not self.run_suuid:
+            raise ValueError("No run SUUID set")
+
+        return self.run_suuid
+
+    async def _include_metrics_and_variables(
+        self, runs: List[Run], include_metrics: bool = False, include_variables: bool = False
+    ) -> None:
+        """Get the metrics and/or variables of the runs and add them to the Run dataclasses
+
+        The requests are done concurrently with at most fetch_concurrency requests at the same time. All requests
+        are finished before errors are raised, so one failing run does not hide the errors of other runs.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API. If more than one
+              request failed, the error lists the errors per run.
+        """
+        requests = []
+        if include_metrics:
+            requests.extend((run, "metrics", self.gateway.metric) for run in runs)
+        if include_variables:
+            requests.extend((run, "variables", self.gateway.variable) for run in runs)
+        if not requests:
+            return
+
+        semaphore = asyncio.Semaphore(max(1, self.fetch_concurrency))
+
+        async def fetch(get, run_suuid):
+            async with semaphore:
+                return await get(run_suuid)
+
+        results = await asyncio.gather(
+            *(fetch(get, run.suuid) for run, _, get in requests),
+            return_exceptions=True,
+        )
+
+        failed: List[Tuple[Run, str, BaseException]] = []
+        for (run, field, _), result in zip(requests, results):
+            if isinstance(result, BaseException):
+                failed.append((run, field, result))
+            else:
+                setattr(run, field, result)
+
+        raise_fetch_errors(failed)
+
+    async def _list_query_params(self, job_name: Optional[str] = None, **query_params) -> dict:
+        """Query parameters to list runs. If job_name is set, the runs are filtered on the SUUID of that job."""
+        if query_params.get("job_suuid") and job_name:
+            raise ValueError("Parameters 'job_suuid' and 'job_name' are both set. Please only set one.")
+        if job_name:
+            project_suuid = query_params.get("project_suuid") or config.project.project_suuid
+            query_params["project_suuid"] = project_suuid
+            job = await JobSDK().get_job_by_name(job_name=job_name, project_suuid=project_suuid)
+            query_params["job_suuid"] = job.suuid
+
+        return query_params
+
+    async def list(
+        self,
+        status: Optional[STATUS] = None,
+        status__exclude: Optional[STATUS] = None,
+        run_suuid_list: Optional[List[str]] = None,
+        run_suuid__exclude: Optional[str] = None,
+        job_name: Optional[str] = None,
+        job_suuid: Optional[str] = None,
+        job_suuid__exclude: Optional[str] = None,
+        project_suuid: Optional[str] = None,
+        project_suuid__exclude: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        workspace_suuid__exclude: Optional[str] = None,
+        created_by_suuid: Optional[str] = None,
+        created_by_suuid__exclude: Optional[str] = None,
+        trigger: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+        trigger__exclude: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+        package_suuid: Optional[str] = None,
+        package_suuid__exclude: Optional[str] = None,
+        include_metrics: bool = False,
+        include_variables: bool = False,
+        number_of_results: int = 100,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Run]:
+        """List all runs with filter and order options
+
+        Args:
+            status (STATUS, optional): Status of the run to filter on. Defaults to None.
+            status__exclude (str, optional): Status of the run to exclude. Defaults to None.
+              STATUS values: queued, running, finished, failed
+
+            run_suuid_list (List[str], optional): List of run SUUIDs to filter on. Defaults to None.
+            run_suuid__exclude (str, optional): SUUID of the run to exclude. Defaults to None.
+
+            job_name (str, optional): Name of the job to filter on. Defaults to None.
+            job_suuid (str, optional): SUUID of the job to filter on. Defaults to None.
+            job_suuid__exclude (str, optional): SUUID of the job to exclude. Defaults to None.
+
+            project_suuid (str, optional): SUUID of the project to filter on. Defaults to None.
+            project_suuid__exclude (str, optional): SUUID of the project to exclude. Defaults to None.
+
+            workspace_suuid (str, optional): SUUID of the workspace to filter on. Defaults to None.
+            workspace_suuid__exclude (str, optional): SUUID of the workspace to exclude. Defaults to None.
+
+            created_by_suuid (str, optional): SUUID of the workspace member to filter on. Defaults to None.
+            created_by_suuid__exclude (str, optional): SUUID of the workspace member to exclude.
+              Defaults to None.
+
+            trigger (TRIGGER, optional): Trigger of the run to filter on. Defaults to None.
+            trigger__exclude (TRIGGER, optional): Trigger of the run to exclude. Defaults to None.
+              TRIGGER values: api, cli, python-sdk, webui, schedule, worker
+
+            package_suuid (str, optional): SUUID of the package to filter on. Defaults to None.
+            package_suuid__exclude (str, optional): SUUID of the package to exclude. Defaults to None.
+
+            include_metrics (bool, optional): Include the metrics in the Run dataclass. Defaults to False.
+            include_variables (bool, optional): Include the variables in the Run dataclass. Defaults to False.
+
+            number_of_results (int): Number of runs to return. Defaults to 100.
+            order_by (str, optional): Order by field(s).
+
+            search (str, optional): Search for a specific run.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            List[Run]: List of runs. List items are of type Run dataclass.
+        """
+
+        run_list = await super().list(
+            number_of_results=number_of_results,
+            order_by=order_by,
+            other_query_params=await self._list_query_params(
+                status=status,
+                status__exclude=status__exclude,
+                run_suuid_list=run_suuid_list,
+                run_suuid__exclude=run_suuid__exclude,
+                job_name=job_name,
+                job_suuid=job_suuid,
+                job_suuid__exclude=job_suuid__exclude,
+                project_suuid=project_suuid,
+                project_suuid__exclude=project_suuid__exclude,
+                workspace_suuid=workspace_suuid,
+                workspace_suuid__exclude=workspace_suuid__exclude,
+                created_by_suuid=created_by_suuid,
+                created_by_suuid__exclude=created_by_suuid__exclude,
+                trigger=trigger,
+                trigger__exclude=trigger__exclude,
+                package_suuid=package_suuid,
+                package_suuid__exclude=package_suuid__exclude,
+                search=search,
+            ),
+        )
+
+        await self._include_metrics_and_variables(run_list, include_metrics, include_variables)
+
+        return run_list
+
+    async def iter(
+        self,
+        status: Optional[STATUS] = None,
+        status__exclude: Optional[STATUS] = None,
+        run_suuid_list: Optional[List[str]] = None,
+        run_suuid__exclude: Optional[str] = None,
+        job_name: Optional[str] = None,
+        job_suuid: Optional[str] = None,
+        job_suuid__exclude: Optional[str] = None,
+        project_suuid: Optional[str] = None,
+        project_suuid__exclude: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        workspace_suuid__exclude: Optional[str] = None,
+        created_by_suuid: Optional[str] = None,
+        created_by_suuid__exclude: Optional[str] = None,
+        trigger: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+        trigger__exclude: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+        package_suuid: Optional[str] = None,
+        package_suuid__exclude: Optional[str] = None,
+        include_metrics: bool = False,
+        include_variables: bool = False,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[Run]:
+        """Iterate over runs with filter and order options. Runs are requested page by page when they are needed, so
+        also iterating over a large number of runs only keeps one page of runs in memory.
+
+        The filter and include arguments are the same as for the list method.
+
+        Args:
+            number_of_results (int, optional): Maximum number of runs. Defaults to None (all runs).
+            page_size (int, optional): Number of runs to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead in a task while the runs of the current
+                page are handled. Defaults to 0 (no prefetching).
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Run: Run dataclass
+        """
+        async for page in self.iter_pages(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params=await self._list_query_params(
+                status=status,
+                status__exclude=status__exclude,
+                run_suuid_list=run_suuid_list,
+                run_suuid__exclude=run_suuid__exclude,
+                job_name=job_name,
+                job_suuid=job_suuid,
+                job_suuid__exclude=job_suuid__exclude,
+                project_suuid=project_suuid,
+                project_suuid__exclude=project_suuid__exclude,
+                workspace_suuid=workspace_suuid,
+                workspace_suuid__exclude=workspace_suuid__exclude,
+                created_by_suuid=created_by_suuid,
+                created_by_suuid__exclude=created_by_suuid__exclude,
+                trigger=trigger,
+                trigger__exclude=trigger__exclude,
+                package_suuid=package_suuid,
+                package_suuid__exclude=package_suuid__exclude,
+                search=search,
+            ),
+        ):
+            await self._include_metrics_and_variables(page, include_metrics, include_variables)
+            for run in page:
+                yield run
+
+    async def get(
+        self,
+        run_suuid: Optional[str] = None,
+        include_metrics: bool = False,
+        include_variables: bool = False,
+    ) -> Run:
+        """Get information about a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+            include_metrics (bool, optional): Include the run metrics in the Run dataclass. Defaults to False.
+            include_variables (bool, optional): Include the run variables in the Run dataclass. Defaults to False.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            Run: Run info in a Run dataclass
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        run = await self.gateway.detail(run_suuid)
+        await self._include_metrics_and_variables([run], include_metrics, include_variables)
+
+        return run
+
+    async def change(
+        self, run_suuid: Optional[str] = None, name: Optional[str] = None, description: Optional[str] = None
+    ) -> Run:
+        """Change the name or description of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+            name (str, optional): New name of the run. Defaults to None.
+            description (str, optional): New description of the run. Defaults to None.
+
+        Raises:
+            PatchError: Error based on response status code with the error message from the API
+
+        Returns:
+            Run: The updated run in a Run dataclass
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.change(run_suuid=run_suuid, name=name, description=description)
+
+    async def delete(self, run_suuid: Optional[str] = None) -> bool:
+        """Delete a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+
+        Raises:
+            DeleteError: Error based on response status code with the error message from the API
+
+        Returns:
+            bool: True if the run was deleted
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.delete(run_suuid=run_suuid)
+
+    async def start(
+        self,
+        job_suuid: Optional[str] = None,
+        data: Optional[dict] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        project_suuid: Optional[str] = None,
+        job_name: Optional[str] = None,
+    ) -> RunStatus:
+        """Start a run
+
+        Args:
+            job_suuid (str, optional): SUUID of the job to run. If not set, job_name must be set.
+            data (dict, optional): Data to pass to the job. Defaults to None.
+            name (str, optional): Name of the run. Defaults to None.
+            description (str, optional): Description of the run. Defaults to None.
+            project_suuid (str, optional): SUUID of the project to run the job in. Defaults to None.
+            job_name (str, optional): Name of the job to run. Defaults to None.
+
+        Raises:
+            PostError: Error based on response status code with the error message from the API
+
+        Returns:
+            RunStatus: The run status information in a RunStatus dataclass
+        """
+        run_status = await JobSDK().run_request(job_suuid, data, name, description, project_suuid, job_name)
+        self.run_suuid = run_status.suuid
+        return run_status
+
+    async def status(self, run_suuid: Optional[str] = None) -> RunStatus:
+        """Get the status of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            RunStatus: The run status information in a RunStatus dataclass
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.status(run_suuid)
+
+    async def log(self, run_suuid: Optional[str] = None, number_of_lines: int = 100) -> List:
+        """Get the log of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+            number_of_lines (int, optional): Number of lines to return. Defaults to 100.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            List: List of log lines
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.log(run_suuid, limit=number_of_lines)
+
+    async def get_metric(self, run_suuid: Optional[str] = None) -> MetricList:
+        """Get the metrics of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            MetricList: List of metrics
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.metric(run_suuid=run_suuid)
+
+    async def get_variable(self, run_suuid: Optional[str] = None) -> VariableList:
+        """Get the variables used for a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            VariableList: List of variables
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.variable(run_suuid=run_suuid)
+
+    async def payload(
+        self,
+        run_suuid: Optional[str] = None,
+        payload_suuid: Optional[str] = None,
+        output_path: Optional[Union[Path, str]] = None,
+    ) -> Union[bytes, None]:
+        """Get the payload of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+            output_path (Path | str, optional): Path to save the payload to. Defaults to None.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            None: if output_path is set, the payload is saved to the output_path and None is returned
+            bytes: if output_path is not set, the payload is returned as bytes
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+
+        if not payload_suuid:
+            payload_info = await self.gateway.payload_info(run_suuid)
+
+            if not payload_info:
+                return None
+
+            payload_suuid = payload_info.suuid
+
+        return await self.gateway.payload(run_suuid=run_suuid, payload_suuid=payload_suuid, output_path=output_path)
+
+    async def payload_info(self, run_suuid: Optional[str] = None) -> Union[Payload, None]:
+        """Get the payload info of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            Payload: Payload info in a Payload dataclass
+            None: If no payload is available for the run
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.payload_info(run_suuid)
+
+    async def result(
+        self, run_suuid: Optional[str] = None, output_path: Optional[Union[Path, str]] = None
+    ) -> Union[bytes, None]:
+        """Get the result of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+            output_path (Path | str, optional): Path to save the result to. Defaults to None.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            None: if output_path is set, the result is saved to the output_path and None is returned
+            bytes: if output_path is not set, the result is returned as bytes
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.result(run_suuid, output_path)
+
+    async def result_content_type(self, run_suuid: Optional[str] = None) -> str:
+        """Get the content type of the result of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            str: Content type of the result
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.result_content_type(run_suuid)
+
+    async def artifact(
+        self, run_suuid: Optional[str] = None, output_path: Optional[Union[Path, str]] = None
+    ) -> Union[bytes, None]:
+        """Get the artifact of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+            output_path (Path | str, optional): Path to save the artifact to. Defaults to None.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            None: if output_path is set, the artifact is saved to the output_path and None is returned
+            bytes: if output_path is not set, the artifact is returned as bytes
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.artifact(run_suuid=run_suuid, output_path=output_path)
+
+    async def artifact_info(self, run_suuid: Optional[str] = None) -> ArtifactInfo:
+        """Get the artifact info of a run
+
+        Args:
+            run_suuid (str, optional): SUUID of the run
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            ArtifactInfo: Artifact info in a ArtifactInfo dataclass
+        """
+        run_suuid = run_suuid or self._get_run_suuid()
+        return await self.gateway.artifact_info(run_suuid)
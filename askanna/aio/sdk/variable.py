@@ -0,0 +1,179 @@
+from typing import AsyncIterator, List, Optional
+
+from askanna.aio.gateways.variable import VariableGateway
+from askanna.core.dataclasses.variable import Variable
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
+
+from .mixins import AsyncListMixin
+
+__all__ = [
+    "VariableSDK",
+]
+
+
+class VariableSDK(AsyncListMixin):
+    """Management of variables in AskAnna with asyncio
+    This class is a wrapper around the async VariableGateway and can be used to manage variables in Python.
+    """
+
+    gateway = VariableGateway()
+
+    async def list(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        is_masked: Optional[bool] = None,
+        number_of_results: int = 100,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Variable]:
+        """List variables with filter and order options
+
+        Args:
+            project_suuid (str, optional): SUUID of the project to filter on. Defaults to None.
+            workspace_suuid (str, optional): SUUID of the workspace to filter on. Defaults to None.
+            is_masked (bool, optional): Filter on masked variables. Defaults to None.
+            number_of_results (int, optional): Number of results to return. Defaults to 100.
+            order_by (str, optional): Order by a specific field. Defaults to None.
+            search (str, optional): Search for a specific variable. Defaults to None.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            List[Variable]: List of variables. List items are of type Variable dataclass
+        """
+        return await super().list(
+            number_of_results=number_of_results,
+            order_by=order_by,
+            other_query_params={
+                "project_suuid": project_suuid,
+                "workspace_suuid": workspace_suuid,
+                "is_masked": is_masked,
+                "search": search,
+            },
+        )
+
+    def iter(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        is_masked: Optional[bool] = None,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[Variable]:
+        """Iterate over variables with filter and order options. The variables are requested page by page when they are
+        needed, so only one page of variables is kept in memory.
+
+        Args:
+            project_suuid (str, optional): SUUID of the project to filter on. Defaults to None.
+            workspace_suuid (str, optional): SUUID of the workspace to filter on. Defaults to None.
+            is_masked (bool, optional): Filter on masked variables. Defaults to None.
+            number_of_results (int, optional): Maximum number of variables. Defaults to None (all variables).
+            page_size (int, optional): Number of variables to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead in a task while the variables of the current
+                page are handled. Defaults to 0 (no prefetching).
+            order_by (str, optional): Order by field(s).
+            search (str, optional): Search for a specific variable. Defaults to None.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Variable: Variable dataclass
+        """
+        return self.iter_list(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params={
+                "project_suuid": project_suuid,
+                "workspace_suuid": workspace_suuid,
+                "is_masked": is_masked,
+                "search": search,
+            },
+        )
+
+    async def get(self, variable_suuid: str) -> Variable:
+        """Get information of a variable
+
+        Args:
+            variable_suuid (str): SUUID of the variable
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            Variable: Variable info in a Variable dataclass
+        """
+        return await self.gateway.detail(variable_suuid=variable_suuid)
+
+    async def add(self, project_suuid: str, name: str, value: str, is_masked: bool = False) -> Variable:
+        """Add a new variable to a project
+
+        Args:
+            project_suuid (str): SUUID of the project
+            name (str): Name of the variable
+            value (str): Value of the variable
+            is_masked (bool, optional): Mask the variable. Defaults to False.
+
+        Raises:
+            PostError: Error based on response status code with the error message from the API
+
+        Returns:
+            Variable: The newly created variable in a Variable dataclass
+        """
+        return await self.gateway.create(
+            project_suuid=project_suuid,
+            name=name,
+            value=value,
+            is_masked=is_masked,
+        )
+
+    async def change(
+        self,
+        variable_suuid: str,
+        name: Optional[str] = None,
+        value: Optional[str] = None,
+        is_masked: Optional[bool] = None,
+    ) -> Variable:
+        """Change the name, value and/or mask of a variable
+
+        Note: is_masked can only be changed to True, a masked variable cannot be set to unmasked.
+
+        Args:
+            variable_suuid (str): SUUID of the variable
+            name (str, optional): Name of the variable. Defaults to None.
+            value (str, optional): Value of the variable. Defaults to None.
+            is_masked (bool, optional): Mask the variable. Defaults to None.
+
+        Raises:
+            PatchError: Error based on response status code with the error message from the API
+
+        Returns:
+            Variable: The updated variable in a Variable dataclass
+        """
+        return await self.gateway.change(
+            variable_suuid=variable_suuid,
+            name=name,
+            value=value,
+            is_masked=is_masked,
+        )
+
+    async def delete(self, variable_suuid: str) -> bool:
+        """Delete a variable
+
+        Args:
+            variable_suuid (str): SUUID of the variable
+
+        Raises:
+            DeleteError: Error based on response status code with the error message from the API
+
+        Returns:
+            bool: True if the variable was successfully deleted
+        """
+        return await self.gateway.delete(variable_suuid=variable_suuid)
@@ -31,6 +31,7 @@ def cli():
 
 commands = [
     "artifact",
+    "cache",
     "create",
     "init",
     "job",
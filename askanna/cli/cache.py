@@ -0,0 +1,35 @@
+import click
+
+from askanna.core.cache import run_cache
+
+
+@click.group()
+def cli1():
+    pass
+
+
+@cli1.command(help="Remove all data from the local cache of runs", short_help="Clear local cache")
+def clear():
+    run_cache.clear()
+    click.echo(f"The local cache in '{run_cache.path}' is cleared.")
+
+
+@cli1.command(help="Show the size and number of runs in the local cache of runs", short_help="Show cache stats")
+def stats():
+    stats = run_cache.stats()
+    print_list = [
+        ("Path", stats["path"]),
+        ("Runs", f"{stats['runs']:,}"),
+        ("Entries", f"{stats['entries']:,}"),
+        ("Size", f"{stats['size'] / 1024**2:,.1f} MB"),
+        ("Max size", f"{stats['max_size'] / 1024**2:,.1f} MB"),
+    ]
+    for item in print_list:
+        click.echo(f"{item[0] + ':':16} {item[1]}")
+
+
+cli = click.CommandCollection(
+    sources=[cli1],
+    help="Manage the local cache with data of finished and failed runs",
+    short_help="Manage local run cache",
+)
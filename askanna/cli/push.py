@@ -33,7 +33,19 @@ SHORT_HELP = "Push code to AskAnna"
     help="Add description to this code",
     default="",
 )
-def cli(force, description, message):
+@click.option(
+    "--upload-concurrency",
+    "upload_concurrency",
+    type=click.IntRange(min=1),
+    help="Number of chunks to upload at the same time [default: AA_UPLOAD_CONCURRENCY or 4]",
+)
+@click.option(
+    "--skip-unchanged/--no-skip-unchanged",
+    default=True,
+    show_default=True,
+    help="Do not upload the code if it did not change since the last push of the project from this machine",
+)
+def cli(force, description, message, upload_concurrency, skip_unchanged):
     if len(description) > 0 and len(message) > 0:
         click.echo("Cannot use both --description and --message.", err=True)
         sys.exit(1)
@@ -57,4 +69,9 @@ def cli(force, description, message):
             click.echo("We are not pushing your code to AskAnna. You choose to not replace your existing code.")
             sys.exit(0)
 
-    push(overwrite=True, description=description or message)
+    push(
+        overwrite=True,
+        description=description or message,
+        upload_concurrency=upload_concurrency,
+        skip_unchanged=skip_unchanged,
+    )
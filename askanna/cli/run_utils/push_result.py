@@ -29,7 +29,13 @@ SHORT_HELP = "Push result to AskAnna"
     envvar="AA_JOB_NAME",
     help="The name of the job",
 )
-def cli(run_suuid, job_name):
+@click.option(
+    "--upload-concurrency",
+    "upload_concurrency",
+    type=click.IntRange(min=1),
+    help="Number of chunks to upload at the same time [default: AA_UPLOAD_CONCURRENCY or 4]",
+)
+def cli(run_suuid, job_name, upload_concurrency):
     project_config = config.project.config_dict
 
     # First check whether we need to create result or not.
@@ -53,7 +59,7 @@ def cli(run_suuid, job_name):
     click.echo("  Uploading result to AskAnna...")
 
     try:
-        uploader = ResultUpload(run_suuid)
+        uploader = ResultUpload(run_suuid, concurrency=upload_concurrency)
         status, msg = uploader.upload(result_path)
     except Exception as e:
         click.echo(f"  {e}", err=True)
@@ -35,6 +35,9 @@ class ServerConfig:
     server: str = "default"
     token: str = ""
     ui: str = ""
+    # Largest upload chunk in bytes that the server accepts, for servers with a lower request size limit than the
+    # default maximum chunk size
+    upload_chunk_size_max: Optional[int] = None
 
     @property
     def is_authenticated(self) -> bool:
@@ -91,6 +94,7 @@ def load_config(server_config_path: str = SERVER_CONFIG_PATH, server: str = SERV
     remote = os.getenv("AA_REMOTE", server_dict.get("remote", DEFAULT_SERVER_REMOTE))
     ui = os.getenv("AA_UI", server_dict.get("ui", DEFAULT_SERVER_UI))
     token = os.getenv("AA_TOKEN", server_dict.get("token", ""))
+    upload_chunk_size_max = server_dict.get("upload_chunk_size_max")
 
     return ServerConfig(
         config_dict=config_dict,
@@ -99,6 +103,7 @@ def load_config(server_config_path: str = SERVER_CONFIG_PATH, server: str = SERV
         remote=remote,
         ui=ui,
         token=token,
+        upload_chunk_size_max=int(upload_chunk_size_max) if upload_chunk_size_max else None,
     )
 
 
@@ -0,0 +1,209 @@
+import datetime
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from askanna.core.dataclasses.run import Run
+from askanna.core.utils.object import json_serializer
+from askanna.settings import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_SIZE
+
+# The data of runs with these statuses does not change anymore
+CACHED_RUN_STATUSES = ("finished", "failed")
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CachedRun:
+    """The SUUID and modified_at of a run that has entries in the cache, which is enough to read and add entries"""
+
+    suuid: str
+    modified_at: datetime.datetime
+
+
+RunKey = Union[Run, CachedRun]
+
+
+def run_version(modified_at: datetime.datetime) -> int:
+    """Microseconds since the epoch of modified_at, computed without floats so CachedRun gets the same version"""
+    if modified_at.tzinfo is None:
+        modified_at = modified_at.replace(tzinfo=datetime.timezone.utc)
+    return (modified_at - EPOCH) // datetime.timedelta(microseconds=1)
+
+
+class RunCache:
+    """
+    Local cache for the data of runs that are finished or failed
+
+    The metrics, variables, artifact info, result and payload of these runs do not change anymore, so we can read
+    them from disk instead of getting them from the API again. Entries are stored per run SUUID and modified_at of the
+    run, so if a run is changed the old entries are not used. When the cache is larger than max_size bytes, the least
+    recently used entries are removed.
+
+    Because the data of these runs does not change, get_run finds the cached version of a run without getting the run
+    from the API again.
+    """
+
+    def __init__(self, path: Union[Path, str], max_size: int):
+        self.path = Path(path)
+        self.max_size = max_size
+
+    def is_cacheable(self, run: Run) -> bool:
+        return run.status in CACHED_RUN_STATUSES and run.modified_at is not None
+
+    def get_run(self, run_suuid: str) -> Optional[CachedRun]:
+        """Get the run if it has entries in the cache, else None"""
+        try:
+            versions = [
+                int(path.name)
+                for path in (self.path / run_suuid).iterdir()
+                if path.name.isdigit() and any(not entry.name.startswith(".") for entry in path.iterdir())
+            ]
+        except OSError:
+            return None
+
+        if not versions:
+            return None
+        return CachedRun(suuid=run_suuid, modified_at=EPOCH + datetime.timedelta(microseconds=max(versions)))
+
+    def run_path(self, run: RunKey) -> Path:
+        return self.path / run.suuid / str(run_version(run.modified_at))
+
+    def entry_path(self, run: RunKey, name: str) -> Path:
+        return self.run_path(run) / name
+
+    def get_file(self, run: RunKey, name: str) -> Path:
+        """
+        Get the path of a cache entry and mark it as recently used
+
+        Raises:
+            KeyError: The entry is not in the cache
+        """
+        path = self.entry_path(run, name)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            raise KeyError(name)
+        return path
+
+    def get_bytes(self, run: RunKey, name: str) -> bytes:
+        try:
+            return self.get_file(run, name).read_bytes()
+        except FileNotFoundError:
+            # The entry was removed by another process after we found it
+            raise KeyError(name)
+
+    def get_object(self, run: RunKey, name: str, from_dict: Callable[[Any], T]) -> Union[T, None]:
+        """
+        Get an object that is saved with put_object, decoded from JSON with from_dict
+
+        Raises:
+            KeyError: The entry is not in the cache, or it can't be decoded
+        """
+        data = self.get_bytes(run, name)
+        try:
+            value = json.loads(data)
+            return None if value is None else from_dict(value)
+        except (ValueError, KeyError, TypeError):
+            # For example an entry saved by another version of AskAnna, we get the data again and replace the entry
+            raise KeyError(name)
+
+    def put_bytes(self, run: RunKey, name: str, data: bytes) -> None:
+        if len(data) > self.max_size:
+            return
+
+        def write(path: Path):
+            path.write_bytes(data)
+
+        self._put(run, name, write)
+
+    def put_object(self, run: RunKey, name: str, value: Any) -> None:
+        """Save an object that has a to_dict method, or None, as JSON"""
+        data = None if value is None else value.to_dict()
+        self.put_bytes(run, name, json.dumps(data, default=json_serializer).encode())
+
+    def put_file(self, run: RunKey, name: str, source: Union[Path, str]) -> None:
+        if Path(source).stat().st_size > self.max_size:
+            return
+
+        def copy(path: Path):
+            shutil.copyfile(source, path)
+
+        self._put(run, name, copy)
+
+    def _put(self, run: RunKey, name: str, write) -> None:
+        run_path = self.run_path(run)
+        run_path.mkdir(parents=True, exist_ok=True)
+
+        # Entries for an older version of the run are never used again
+        for other_path in run_path.parent.iterdir():
+            if other_path != run_path:
+                shutil.rmtree(other_path, ignore_errors=True)
+
+        # Write to a temporary file first, so other processes never read a partly written entry
+        fd, temp_name = tempfile.mkstemp(dir=run_path, prefix=f".{name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            write(Path(temp_name))
+            os.replace(temp_name, self.entry_path(run, name))
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    def entries(self) -> List[Tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.path.glob("*/*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                pass
+        return entries
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache is not larger than max_size"""
+        entries = self.entries()
+        size = sum(stat.st_size for _, stat in entries)
+        if size <= self.max_size:
+            return
+
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            path.unlink(missing_ok=True)
+            try:
+                # Remove the directories of the run if they are empty now
+                path.parent.rmdir()
+                path.parent.parent.rmdir()
+            except OSError:
+                pass
+
+            size -= stat.st_size
+            if size <= self.max_size:
+                break
+
+    def clear(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self.entries()
+        return {
+            "path": str(self.path),
+            "runs": len({path.parent.parent.name for path, _ in entries}),
+            "entries": len(entries),
+            "size": sum(stat.st_size for _, stat in entries),
+            "max_size": self.max_size,
+        }
+
+
+run_cache = RunCache(
+    path=os.getenv("AA_CACHE_DIR", DEFAULT_CACHE_DIR),
+    max_size=int(os.getenv("AA_CACHE_MAX_SIZE", DEFAULT_CACHE_MAX_SIZE)),
+)
@@ -1,19 +1,41 @@
 import json
 import tempfile
+import threading
+import time
 import uuid
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Iterable, List, Optional, Union
 
 import click
 
+from askanna.core.dataclasses.base import Label
 from askanna.core.dataclasses.run import (
     MetricList,
     MetricObject,
     VariableList,
     VariableObject,
 )
+from askanna.core.utils.object import json_serializer
 from askanna.core.utils.suuid import create_suuid
 from askanna.gateways.run import RunGateway
+from askanna.settings import (
+    DEFAULT_METRIC_FLUSH_INTERVAL,
+    DEFAULT_METRIC_FLUSH_SIZE,
+    DEFAULT_METRIC_FLUSH_TIMEOUT,
+)
+
+SERIES_VALUE_PLACEHOLDER = "__askanna_series_value__"
+SERIES_STEP_PLACEHOLDER = "__askanna_series_step__"
+
+
+def encode_json_values(values: List[Any], type: Optional[str] = None) -> List[str]:
+    """
+    Encode each value to JSON. A list of numbers is encoded at once and then split, which is a lot faster than encoding
+    each number separately.
+    """
+    if values and type in ("integer", "float", "boolean"):
+        return json.dumps(values)[1:-1].split(", ")
+    return [json.dumps(value, default=json_serializer) for value in values]
 
 
 class CollectorTemplate:
@@ -31,7 +53,7 @@ class CollectorTemplate:
 
     # And methods:
     # - append_from_dict (with one input attribute of type dict)
-    # - save_to_askanna
+    # - save_to_askanna (with one input attribute force of type bool)
 
     collector_type = "template"
     file_name = "collector.json"
@@ -47,7 +69,17 @@ class CollectorTemplate:
         if not self.run_suuid:
             self.local_suuid = create_suuid(uuid.uuid4())
 
+        # Number of records in the data collection that are acknowledged by AskAnna. AskAnna replaces the saved data
+        # with the data of each push, so a save only pushes when records are added after the last successful push,
+        # unless a push is forced.
+        self.pushed_count = 0
+
         self.collector_file = Path(tempfile.gettempdir(), "askanna/run", self.suuid, self.file_name)
+        # Every record that is added is appended to the journal file. On save, the journal is compacted into the
+        # collector file so adding a record never requires rewriting all collected data. The first line of a journal
+        # has its id, and the collector file has the id of the journal that is compacted into it.
+        self.journal_file = self.collector_file.with_suffix(".jsonl")
+        self.journal_id: Optional[str] = None
 
         if self.run_suuid:
             self._restore_session()
@@ -61,7 +93,7 @@ class CollectorTemplate:
     def append_from_dict(self, *args) -> None:
         raise NotImplementedError(f"Please implement 'append_from_dict' for  {self.__class__.__name__}")
 
-    def save_to_askanna(self):
+    def save_to_askanna(self, force: bool = False):
         raise NotImplementedError(f"Please implement 'save_to_askanna' for  {self.__class__.__name__}")
 
     @property
@@ -75,6 +107,13 @@ class CollectorTemplate:
         return len(self.data_collection)
 
     def add(self, object: Union[MetricObject, VariableObject]) -> None:
+        self.set_run_suuid(object)
+
+        self.data_collection.append(object)
+        self.append_to_journal(object)
+        self.changed = True
+
+    def set_run_suuid(self, object: Union[MetricObject, VariableObject]) -> None:
         if not object.run_suuid:
             object.run_suuid = self.suuid
         elif object.run_suuid != self.suuid:
@@ -83,27 +122,77 @@ class CollectorTemplate:
                 f"'{self.suuid}' of the session where the collector is initialized."
             )
 
-        self.data_collection.append(object)
-        self.save_local()
-        self.changed = True
-
     def _restore_session(self):
         """
-        Restore the run session and get records from the json collector file. The file does not have to exist, for
-        example when the store is started for a new run.
+        Restore the run session and get records from the json collector file and the journal file. The files do not
+        have to exist, for example when the store is started for a new run.
         """
+        compacted_journal_id = None
         try:
             with self.collector_file.open() as f:
                 records = json.load(f)
-                for record in records:
+            # Collector files saved before the journal got an id only contain the list of records
+            if isinstance(records, dict):
+                compacted_journal_id, records = records["journal_id"], records["records"]
+            for record in records:
+                self.append_from_dict(record)
+        except FileNotFoundError:
+            pass
+
+        try:
+            with self.journal_file.open() as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A record that was not completely written, for example because the process was killed while
+                        # writing to the journal. We skip the record and continue with the next one.
+                        continue
+                    if "journal_id" in record:
+                        self.journal_id = record["journal_id"]
+                        if self.journal_id == compacted_journal_id:
+                            # The process stopped after the journal was compacted and before it was removed
+                            break
+                        continue
                     self.append_from_dict(record)
         except FileNotFoundError:
             pass
 
+        if compacted_journal_id and self.journal_id == compacted_journal_id:
+            self.journal_file.unlink(missing_ok=True)
+            self.journal_id = None
+
+    def open_journal(self):
+        """
+        Open the journal file to append records. A new journal starts with a line with the id of the journal.
+        """
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        f = self.journal_file.open("a")
+        if f.tell() == 0:
+            self.journal_id = uuid.uuid4().hex
+            f.write(json.dumps({"journal_id": self.journal_id}) + "\n")
+        return f
+
+    def append_to_journal(self, *objects: Union[MetricObject, VariableObject]) -> None:
+        self.append_records_to_journal(object.to_dict() for object in objects)
+
+    def append_records_to_journal(self, records: Iterable[dict]) -> None:
+        with self.open_journal() as f:
+            f.writelines(json.dumps(record, default=json_serializer) + "\n" for record in records)
+
     def save_local(self):
+        """
+        Write all collected data to the json collector file and remove the journal file, because the records in the
+        journal are now part of the collector file. The collector file has the id of the journal, so if the process
+        stops before the journal is removed, the records in the journal are not restored twice.
+        """
         self.collector_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.collector_file.open("w") as f:
-            f.write(self.data_collection.to_json())
+        collector_file_tmp = self.collector_file.with_suffix(".tmp")
+        with collector_file_tmp.open("w") as f:
+            f.write(f'{{"journal_id": {json.dumps(self.journal_id)}, "records": {self.data_collection.to_json()}}}')
+        collector_file_tmp.replace(self.collector_file)
+        self.journal_file.unlink(missing_ok=True)
+        self.journal_id = None
 
     def save(self, force: bool = False) -> None:
         """
@@ -119,32 +208,245 @@ class CollectorTemplate:
             click.echo(f"Your {self.collector_type} data is saved locally in:\n  {self.collector_file}")
             return
 
-        self.save_to_askanna()
+        self.save_to_askanna(force=force)
 
 
 class MetricCollector(CollectorTemplate):
+    """
+    Collector for metrics
+
+    In buffered mode, added metrics are put in an in-memory buffer. A daemon thread moves the buffered metrics to the
+    collection and stores them locally when `flush_size` metrics are buffered or when `flush_interval` seconds have
+    passed since the last flush.
+
+    Every push sends all metrics of the run, because AskAnna replaces the saved metrics with the pushed metrics. If we
+    pushed on every full buffer, the number of metrics sent would grow quadratically with the number of metrics. So the
+    flush thread only pushes when the number of metrics doubled since the last push, when `flush_interval` seconds
+    have passed since the last push, or when the thread is stopped.
+    """
+
     collector_type = "metric"
     file_name = "metrics.json"
 
-    metrics = MetricList()
+    def __init__(
+        self,
+        run_suuid: Optional[str] = None,
+        buffered: bool = False,
+        flush_size: int = DEFAULT_METRIC_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_METRIC_FLUSH_INTERVAL,
+    ):
+        self.metrics = MetricList()
+        super().__init__(run_suuid=run_suuid)
+
+        self.buffered = buffered
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._buffer: List[MetricObject] = []
+        self._buffer_lock = threading.Lock()
+        self._collection_lock = threading.Lock()
+        # Only one push at a time, so a push never sends the same records as a push that is still running
+        self._push_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._last_push = time.monotonic()
+
+        if self.buffered:
+            self.start_flush_thread()
 
     @property
     def data_collection(self) -> MetricList:
         return self.metrics
 
+    def __len__(self) -> int:
+        return len(self.data_collection) + len(self._buffer)
+
+    def add(self, object: MetricObject) -> None:
+        if not self.buffered:
+            return super().add(object)
+
+        self.set_run_suuid(object)
+        with self._buffer_lock:
+            self._buffer.append(object)
+            buffer_full = len(self._buffer) >= self.flush_size
+
+        if buffer_full:
+            self._flush_event.set()
+
+    def add_series(
+        self,
+        name: str,
+        type: str,
+        values: List[Any],
+        labels: Optional[List[Label]] = None,
+        steps: Optional[List[Any]] = None,
+        step_type: str = "integer",
+    ) -> None:
+        """
+        Add a series of metric values with the same name and type in one operation
+        """
+        if self.buffered:
+            # Move buffered metrics to the collection first, so the metrics keep the order in which they are added
+            self.flush(push=False)
+
+        with self._collection_lock:
+            start = len(self.metrics)
+            self.metrics.append_series(
+                name=name,
+                type=type,
+                values=values,
+                run_suuid=self.suuid,
+                labels=labels,
+                steps=steps,
+                step_type=step_type,
+            )
+            self.append_series_to_journal(self.metrics.columns.get_dict(start), type, values, steps, step_type)
+            self.changed = True
+
+    def append_series_to_journal(
+        self,
+        record: dict,
+        type: str,
+        values: List[Any],
+        steps: Optional[List[Any]] = None,
+        step_type: Optional[str] = None,
+    ) -> None:
+        """
+        Append the records of a series to the journal. The records of a series only differ in value and step, so we
+        encode the first record once and fill in the encoded value and step for each record.
+        """
+        record["metric"]["value"] = SERIES_VALUE_PLACEHOLDER
+        if steps is not None:
+            record["label"][-1]["value"] = SERIES_STEP_PLACEHOLDER
+        record_json = json.dumps(record, default=json_serializer) + "\n"
+
+        prefix, _, suffix = record_json.partition(f'"{SERIES_VALUE_PLACEHOLDER}"')
+        values_json = encode_json_values(values, type)
+        if steps is None:
+            lines = (prefix + value + suffix for value in values_json)
+        else:
+            infix, _, suffix = suffix.partition(f'"{SERIES_STEP_PLACEHOLDER}"')
+            lines = (
+                prefix + value + infix + step + suffix
+                for value, step in zip(values_json, encode_json_values(steps, step_type))
+            )
+
+        with self.open_journal() as f:
+            f.writelines(lines)
+
+    def start_flush_thread(self) -> None:
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+
+        self.buffered = True
+        self._stop_event.clear()
+        self._flush_thread = threading.Thread(target=self._flush_worker, name="askanna-metric-flush", daemon=True)
+        self._flush_thread.start()
+
+    def stop_flush_thread(self, timeout: Optional[float] = DEFAULT_METRIC_FLUSH_TIMEOUT) -> bool:
+        """
+        Stop the flush thread after it has flushed the buffered metrics. If the thread did not finish within `timeout`
+        seconds, the remaining buffered metrics are only stored locally and the metrics should not be pushed again.
+
+        Returns:
+            bool: True if all buffered metrics were flushed by the flush thread
+        """
+        self.buffered = False
+        if not self._flush_thread:
+            return True
+
+        self._stop_event.set()
+        self._flush_event.set()
+        self._flush_thread.join(timeout)
+
+        if self._flush_thread.is_alive():
+            self.flush(push=False)
+            self.save_local()
+            click.echo(
+                f"AskAnna could not push all metrics within {timeout} seconds. Your metric data is saved locally in:"
+                f"\n  {self.collector_file}",
+                err=True,
+            )
+            return False
+
+        self._flush_thread = None
+        return True
+
+    def _flush_worker(self) -> None:
+        while True:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            stop = self._stop_event.is_set()
+
+            self.flush(push=stop or self._push_due())
+
+            if stop:
+                break
+
+    def _push_due(self) -> bool:
+        return len(self) >= 2 * self.pushed_count or time.monotonic() - self._last_push >= self.flush_interval
+
+    def flush(self, push: bool = True) -> None:
+        """
+        Move the buffered metrics to the collection and store them locally. If push is set to True and the run SUUID
+        is set, the metrics are also pushed to AskAnna.
+        """
+        with self._buffer_lock:
+            records, self._buffer = self._buffer, []
+
+        if records:
+            with self._collection_lock:
+                for record in records:
+                    self.data_collection.append(record)
+                self.append_to_journal(*records)
+                self.changed = True
+
+        if not push or not self.run_suuid or not self.changed:
+            return
+
+        try:
+            self.save_to_askanna()
+        except Exception as e:
+            # The flush thread should not stop because of a failed push. The metrics are stored locally and will be
+            # pushed again with the next flush or when the run session is saved.
+            click.echo(f"AskAnna could not push the metrics to the platform: {e}", err=True)
+
     def append_from_dict(self, dict: dict) -> None:
         self.data_collection.append(MetricObject.from_dict(dict))
 
-    def save_to_askanna(self):
-        if self.run_suuid:
-            RunGateway().metric_update(self.run_suuid, self.metrics)
+    def save_local(self):
+        with self._collection_lock:
+            super().save_local()
+
+    def save_to_askanna(self, force: bool = False):
+        if not self.run_suuid:
+            return
+
+        with self._push_lock:
+            # Take the metrics to push while no metrics are added, but don't block adding metrics during the push
+            with self._collection_lock:
+                count = len(self.metrics)
+                if not force and count == self.pushed_count:
+                    return
+                metrics = MetricList(metrics=self.metrics[:count])
+
+            RunGateway().metric_update(self.run_suuid, metrics)
+            with self._collection_lock:
+                self.pushed_count = count
+                self._last_push = time.monotonic()
+                # Metrics that were added during the push are not pushed yet, so the collection is still changed
+                if self.pushed_count == len(self.metrics):
+                    self.changed = False
 
 
 class VariableCollector(CollectorTemplate):
     collector_type = "variable"
     file_name = "variables.json"
 
-    variables = VariableList()
+    def __init__(self, run_suuid: Optional[str] = None):
+        self.variables = VariableList()
+        super().__init__(run_suuid=run_suuid)
 
     @property
     def data_collection(self) -> VariableList:
@@ -153,6 +455,11 @@ class VariableCollector(CollectorTemplate):
     def append_from_dict(self, dict: dict) -> None:
         self.data_collection.append(VariableObject.from_dict(dict))
 
-    def save_to_askanna(self):
-        if self.run_suuid:
-            RunGateway().variable_update(self.run_suuid, self.variables)
+    def save_to_askanna(self, force: bool = False):
+        if not self.run_suuid:
+            return
+
+        count = len(self.variables)
+        if force or count != self.pushed_count:
+            RunGateway().variable_update(self.run_suuid, VariableList(variables=self.variables[:count]))
+        self.pushed_count = count
@@ -1,10 +1,116 @@
+import dataclasses
 import datetime
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, Literal
+from typing import Any, Callable, Dict, Literal, Tuple, Type, TypeVar
 
 VISIBILITY = Literal["private", "public", "PRIVATE", "PUBLIC"]
 
+T = TypeVar("T")
 
+
+def with_slots(cls: Type[T]) -> Type[T]:
+    """Recreate a dataclass with __slots__ for its fields, so the objects don't have a __dict__
+
+    This is what dataclass(slots=True) does from Python 3.10. Objects with slots use a lot less memory, which matters
+    for types that we create millions of, like metrics and labels. Every class in the hierarchy of the dataclass should
+    have slots, otherwise the objects still get a __dict__.
+
+    The state for pickle and copy is a dict with the field values, the same as the state of the dataclass without
+    slots. So objects pickled before the dataclass got slots can still be loaded.
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    inherited_slots = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(name for name in field_names if name not in inherited_slots)
+    for name in field_names:
+        # Remove the defaults of the fields, __init__ of the dataclass has them already
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in field_names}
+
+    def __setstate__(self, state) -> None:
+        if isinstance(state, tuple):
+            # The state of objects with slots that are pickled with the default reduce method: (dict, slots)
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    cls_dict.setdefault("__getstate__", __getstate__)
+    cls_dict.setdefault("__setstate__", __setstate__)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+class ReadOnly:
+    """Base class for a read-only view of a dataclass with slots
+
+    MetricList and VariableList store records in columns and create the record objects when a record is read, so
+    changing such an object would not change the list. The lists return views instead: a subclass of the dataclass
+    that inherits this class first, for example `class ReadOnlyMetric(ReadOnly, Metric)`. Setting or deleting a field
+    of a view raises a FrozenInstanceError. Creating, copying or pickling a view, for example with dataclasses.replace
+    or copy.copy, gives an object of the dataclass itself that can be changed.
+    """
+
+    __slots__ = ()
+    __hash__ = None  # type: ignore
+
+    mutable_class: Type
+    field_names: Tuple[str, ...]
+    view: Callable[..., Any]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.mutable_class = next(base for base in cls.__mro__[1:] if dataclasses.is_dataclass(base))
+        cls.field_names = tuple(field.name for field in dataclasses.fields(cls.mutable_class))
+        # The slot descriptors of the fields set a value without going through __setattr__
+        field_setters = tuple(getattr(cls.mutable_class, name).__set__ for name in cls.field_names)
+
+        def view(*values):
+            """Create a view with the values of the fields in order, without running __init__ and __post_init__"""
+            obj = object.__new__(cls)
+            for set_field, value in zip(field_setters, values):
+                set_field(obj, value)
+            return obj
+
+        # A function with the setters in its closure is faster than a classmethod, and views are created per record
+        cls.view = staticmethod(view)
+
+    def __new__(cls, *args, **kwargs):
+        return cls.mutable_class(*args, **kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise dataclasses.FrozenInstanceError(
+            f"cannot assign to field '{name}' of a {type(self).__name__} that is read from a list, the list would "
+            "not change"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field '{name}' of a {type(self).__name__}")
+
+    def __eq__(self, other):
+        if not isinstance(other, self.mutable_class):
+            return NotImplemented
+        return all(view_value_equal(getattr(self, name), getattr(other, name)) for name in self.field_names)
+
+    def __reduce__(self):
+        return self.mutable_class, tuple(getattr(self, name) for name in self.field_names)
+
+
+def view_value_equal(view_value: Any, value: Any) -> bool:
+    # A view has tuples instead of lists, for example for the labels, and is equal to an object with the same items
+    if isinstance(view_value, tuple) and isinstance(value, list):
+        return view_value == tuple(value)
+    return view_value == value
+
+
+@with_slots
 @dataclass
 class Label:
     name: str
@@ -17,6 +123,15 @@ class Label:
     def to_dict(self, yes=True) -> Dict:
         return {"name": self.name, "value": self.value, "type": self.type}
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Label":
+        # Label names and types repeat a lot, so we intern them to keep one copy of each in memory
+        return cls(name=sys.intern(data["name"]), value=data["value"], type=sys.intern(data["type"]))
+
+
+class ReadOnlyLabel(ReadOnly, Label):
+    __slots__ = ()
+
 
 @dataclass
 class User:
@@ -28,6 +143,7 @@ class User:
     last_login: datetime.datetime
 
 
+@with_slots
 @dataclass
 class MembershipRole:
     name: str
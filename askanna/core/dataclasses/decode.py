@@ -0,0 +1,134 @@
+import dataclasses
+import datetime
+import functools
+from typing import Any, Callable, Dict, Type, TypeVar
+
+from dateutil import parser as dateutil_parser
+
+__all__ = [
+    "parse_datetime",
+    "lazy_dataclass",
+]
+
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse a timestamp from the AskAnna API
+
+    The API returns ISO 8601 timestamps, which datetime.fromisoformat can parse a lot faster than dateutil. Before
+    Python 3.11, fromisoformat does not support the "Z" suffix and all variations of ISO 8601, so if it cannot parse
+    the value we fall back to dateutil.
+
+    Args:
+        value (str): The timestamp
+
+    Returns:
+        datetime.datetime: The parsed timestamp
+    """
+    try:
+        if value.endswith("Z"):
+            return datetime.datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return dateutil_parser.parse(value)
+
+
+class LazyField:
+    """Descriptor that decodes a field from the raw data of a lazy dataclass object on first access
+
+    The decoded value is stored in the __dict__ of the object, so next time the attribute is read directly. Setting the
+    attribute also stores the value in the __dict__ of the object.
+    """
+
+    def __init__(self, field: dataclasses.Field, decode: Callable[[Any], Any] = None):
+        self.name = field.name
+        self.field = field
+        self.decode = decode
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        try:
+            value = instance._data[self.name]
+        except KeyError:
+            if self.field.default is not dataclasses.MISSING:
+                value = self.field.default
+            elif self.field.default_factory is not dataclasses.MISSING:
+                value = self.field.default_factory()
+            else:
+                raise AttributeError(f"'{self.name}' is not in the data of the {owner.__name__} object")
+        else:
+            if self.decode is not None and value:
+                value = self.decode(value)
+
+        instance.__dict__[self.name] = value
+        return value
+
+
+def cls_from_values(cls: Type[T], values: Dict[str, Any]) -> T:
+    return cls(**values)
+
+
+def lazy_dataclass(cls: Type[T], **decoders: Callable[[Any], Any]) -> Type[T]:
+    """Create a subclass of a dataclass that keeps the raw data from the API and decodes a field on first access
+
+    Objects of the lazy class are instances of the dataclass, and compare equal to dataclass objects with the same
+    values. When a lazy object is pickled, copied or changed with dataclasses.replace, the result is an object of the
+    dataclass itself. The repr of a lazy object is the repr of the dataclass object with the same values.
+
+    Args:
+        cls (Type): The dataclass
+        **decoders (Callable): Function per field name to decode the raw value with. Values that are None or empty
+            are not decoded.
+
+    Returns:
+        Type: The lazy subclass of the dataclass. Create an object with LazyClass(data).
+    """
+    fields = dataclasses.fields(cls)
+
+    def __new__(lazy_cls, *args, **kwargs):
+        if kwargs:
+            # Called with field values, for example by dataclasses.replace
+            return cls(*args, **kwargs)
+        return object.__new__(lazy_cls)
+
+    def __init__(self, data: Dict):
+        self._data = data
+
+    def __repr__(self):
+        return repr(self.materialize())
+
+    def __eq__(self, other):
+        if not isinstance(other, cls) or dataclasses.fields(other) != fields:
+            return NotImplemented
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in fields)
+
+    def __reduce_ex__(self, protocol):
+        return cls_from_values, (cls, self._field_values())
+
+    def _field_values(self) -> Dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in fields}
+
+    def materialize(self) -> T:
+        """Decode all fields and return an object of the dataclass"""
+        return cls(**self._field_values())
+
+    namespace = {
+        "__new__": __new__,
+        "__init__": __init__,
+        "__repr__": __repr__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__reduce_ex__": __reduce_ex__,
+        "__module__": cls.__module__,
+        "__qualname__": f"Lazy{cls.__qualname__}",
+        "materialize": materialize,
+        "_field_values": _field_values,
+    }
+    for field in fields:
+        namespace[field.name] = LazyField(field, decoders.get(field.name))
+
+    return type(f"Lazy{cls.__name__}", (cls,), namespace)
@@ -1,9 +1,8 @@
 import datetime
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Dict
 
-from dateutil import parser as dateutil_parser
-
+from .decode import lazy_dataclass, parse_datetime
 from .relation import ProjectRelation, WorkspaceRelation
 
 
@@ -23,8 +22,8 @@ class Job:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Job":
-        data["created_at"] = dateutil_parser.parse(data["created_at"])
-        data["modified_at"] = dateutil_parser.parse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
 
         project = ProjectRelation.from_dict(data["project"])
         del data["project"]
@@ -34,6 +33,15 @@ class Job:
         return cls(project=project, workspace=workspace, **data)
 
 
+LazyJob = lazy_dataclass(
+    Job,
+    project=ProjectRelation.from_dict,
+    workspace=WorkspaceRelation.from_dict,
+    created_at=parse_datetime,
+    modified_at=parse_datetime,
+)
+
+
 @dataclass
 class Payload:
     suuid: str
@@ -54,8 +62,11 @@ class Payload:
     def __repr__(self):
         return f"Payload(suuid='{self.suuid}', size={self.size}, lines={self.lines})"
 
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
     @classmethod
     def from_dict(cls, data: Dict) -> "Payload":
-        data["created_at"] = dateutil_parser.parse(data["created_at"])
-        data["modified_at"] = dateutil_parser.parse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
         return cls(**data)
@@ -2,8 +2,7 @@ import datetime
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-from dateutil import parser as dateutil_parser
-
+from .decode import lazy_dataclass, parse_datetime
 from .relation import ProjectRelation, WorkspaceRelation
 
 
@@ -24,8 +23,8 @@ class Package:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Package":
-        data["created_at"] = dateutil_parser.parse(data["created_at"])
-        data["modified_at"] = dateutil_parser.parse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
 
         workspace = WorkspaceRelation.from_dict(data["workspace"])
         del data["workspace"]
@@ -33,3 +32,12 @@ class Package:
         del data["project"]
 
         return cls(workspace=workspace, project=project, **data)
+
+
+LazyPackage = lazy_dataclass(
+    Package,
+    workspace=WorkspaceRelation.from_dict,
+    project=ProjectRelation.from_dict,
+    created_at=parse_datetime,
+    modified_at=parse_datetime,
+)
@@ -2,9 +2,8 @@ import datetime
 from dataclasses import dataclass
 from typing import Dict, Optional
 
-from dateutil import parser as dateutil_parser
-
 from .base import VISIBILITY
+from .decode import lazy_dataclass, parse_datetime
 from .relation import CreatedByWithAvatarRelation, PackageRelation, WorkspaceRelation
 
 
@@ -27,8 +26,8 @@ class Project:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Project":
-        data["created_at"] = dateutil_parser.parse(data["created_at"])
-        data["modified_at"] = dateutil_parser.parse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
 
         workspace = WorkspaceRelation.from_dict(data["workspace"])
         del data["workspace"]
@@ -40,3 +39,13 @@ class Project:
         del data["created_by"]
 
         return cls(workspace=workspace, package=package, created_by=created_by, **data)
+
+
+LazyProject = lazy_dataclass(
+    Project,
+    workspace=WorkspaceRelation.from_dict,
+    package=PackageRelation.from_dict,
+    created_by=CreatedByWithAvatarRelation.from_dict,
+    created_at=parse_datetime,
+    modified_at=parse_datetime,
+)
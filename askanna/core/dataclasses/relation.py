@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from typing import Dict, Optional
 
-from .base import MembershipRole
+from .base import MembershipRole, with_slots
 
 
+@with_slots
 @dataclass
 class BaseRelation:
     relation: str
@@ -15,26 +16,32 @@ class BaseRelation:
         return cls(**data)
 
 
+@with_slots
 @dataclass
 class WorkspaceRelation(BaseRelation): ...
 
 
+@with_slots
 @dataclass
 class ProjectRelation(BaseRelation): ...
 
 
+@with_slots
 @dataclass
 class PackageRelation(BaseRelation): ...
 
 
+@with_slots
 @dataclass
 class JobRelation(BaseRelation): ...
 
 
+@with_slots
 @dataclass
 class RunRelation(BaseRelation): ...
 
 
+@with_slots
 @dataclass
 class CreatedByRelation(BaseRelation):
     job_title: str
@@ -49,6 +56,7 @@ class CreatedByRelation(BaseRelation):
         return cls(role=role, **data)
 
 
+@with_slots
 @dataclass
 class CreatedByWithAvatarRelation(CreatedByRelation):
     avatar: Optional[dict]
@@ -61,6 +69,7 @@ class CreatedByWithAvatarRelation(CreatedByRelation):
         return cls(role=role, **data)
 
 
+@with_slots
 @dataclass
 class PayloadRelation(BaseRelation):
     size: int
@@ -1,14 +1,19 @@
+import bisect
+import builtins
 import datetime
+import importlib
 import json
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Union
-
-from dateutil import parser as dateutil_parser
+import sys
+from array import array
+from dataclasses import asdict, dataclass, field
+from itertools import chain, repeat
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Union
 
 from askanna.core.exceptions import MultipleObjectsReturnedError
 from askanna.core.utils.object import json_serializer
 
-from .base import Label
+from .base import Label, ReadOnly, ReadOnlyLabel, with_slots
+from .decode import lazy_dataclass, parse_datetime
 from .relation import (
     CreatedByRelation,
     CreatedByWithAvatarRelation,
@@ -23,6 +28,7 @@ STATUS = Literal["queued", "running", "finished", "failed"]
 TRIGGER = Literal["api", "cli", "python-sdk", "webui", "schedule", "worker"]
 
 
+@with_slots
 @dataclass
 class Variable:
     name: str
@@ -40,6 +46,7 @@ class Variable:
         }
 
 
+@with_slots
 @dataclass
 class VariableObject:
     variable: Variable
@@ -71,40 +78,599 @@ class VariableObject:
     def from_dict(cls, data: Dict) -> "VariableObject":
         return cls(
             variable=Variable(
-                name=data["variable"]["name"],
+                name=sys.intern(data["variable"]["name"]),
                 value=data["variable"]["value"],
-                type=data["variable"]["type"],
+                type=sys.intern(data["variable"]["type"]),
             ),
-            label=[Label(**label) for label in data["label"]],
+            label=[Label.from_dict(label) for label in data["label"]],
             run_suuid=data["run_suuid"],
-            created_at=dateutil_parser.isoparse(data["created_at"]),
+            created_at=parse_datetime(data["created_at"]),
         )
 
 
-@dataclass
+class CodeTable:
+    """Dictionary encoding of values: each distinct value is stored once and referred to by an integer code"""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def encode(self, value: Any, key: Any = None) -> int:
+        key = value if key is None else key
+        code = self.codes.get(key)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[key] = code
+        return code
+
+    def decode(self, code: int) -> Any:
+        return self.values[code]
+
+
+def hashable_key(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return ("json", json.dumps(value, sort_keys=True, default=json_serializer))
+    return value
+
+
+EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Storage kinds for values. Floats, integers and booleans are stored in typed arrays, other values as Python objects.
+VALUE_OBJECT = 0
+VALUE_FLOAT = 1
+VALUE_INTEGER = 2
+VALUE_BOOLEAN = 3
+
+# Timezone codes 0 and 1 are reserved for records without created_at and records with a naive created_at
+TZ_NONE = 0
+TZ_NAIVE = 1
+
+
+class RecordColumns:
+    """
+    Columnar storage for metric and variable records
+
+    Instead of keeping a dataclass instance per record, every field of a record is stored in a column. Names, types,
+    run SUUIDs and label sets are dictionary encoded, numeric values are stored in typed arrays and created_at is
+    stored as nanoseconds since epoch. Record objects are created on demand when a record is read.
+    """
+
+    def __init__(self, object_class, value_class, value_field: str):
+        self.object_class = object_class
+        self.value_class = value_class
+        self.value_field = value_field
+
+        self.name_codes = array("I")
+        self.type_codes = array("I")
+        self.value_kinds = array("B")
+        self.value_slots = array("I")
+        self.run_suuid_codes = array("I")
+        self.created_at_ns = array("q")
+        self.created_at_tz_codes = array("H")
+        self.label_codes = array("I")
+
+        self.float_values = array("d")
+        self.integer_values = array("q")
+        self.object_values: List[Any] = []
+
+        self.names = CodeTable()
+        self.types = CodeTable()
+        self.run_suuids = CodeTable()
+        self.label_sets = CodeTable()
+        self.timezones = CodeTable()
+        self.timezones.encode(None, key=("tz", "none"))
+        self.timezones.encode(None, key=("tz", "naive"))
+
+        # Indexes to find records by name, label and created_at. They are built the first time they are used and
+        # updated with the records appended since, so appending records does not get slower.
+        self.indexed_rows = 0
+        self.name_index: Dict[int, array] = {}
+        self.label_set_index: Dict[int, array] = {}
+        self.created_at_index_ns = array("q")
+        self.created_at_index_rows = array("I")
+        self.indexed_label_sets = 0
+        self.label_name_index: Dict[str, Set[int]] = {}
+        self.label_value_index: Dict[Tuple[str, Any], Set[int]] = {}
+
+    def __len__(self):
+        return len(self.name_codes)
+
+    def append(self, record) -> None:
+        value_object = getattr(record, self.value_field)
+        self.name_codes.append(self.names.encode(value_object.name))
+        self.type_codes.append(self.types.encode(value_object.type))
+        self.append_value(value_object.value)
+        self.run_suuid_codes.append(self.run_suuids.encode(record.run_suuid))
+        self.append_created_at(record.created_at)
+        self.label_codes.append(self.encode_labels(record.label))
+
+    def append_series(
+        self,
+        name: str,
+        type: str,
+        values: List[Any],
+        run_suuid: Optional[str],
+        created_at: Optional[datetime.datetime],
+        labels: Optional[List[Label]] = None,
+        steps: Optional[List[Any]] = None,
+        step_type: str = "integer",
+    ) -> None:
+        """
+        Append a series of values with the same name and type in one operation. If steps are set, each record gets a
+        label 'step' with the step of the value.
+        """
+        count = len(values)
+        start = len(self)
+        if not count:
+            return
+
+        self.name_codes.extend(repeat(self.names.encode(name), count))
+        self.type_codes.extend(repeat(self.types.encode(type), count))
+        self.run_suuid_codes.extend(repeat(self.run_suuids.encode(run_suuid), count))
+
+        value_types = set(map(builtins.type, values))
+        if value_types == {float}:
+            self.value_kinds.extend(repeat(VALUE_FLOAT, count))
+            self.value_slots.extend(range(len(self.float_values), len(self.float_values) + count))
+            self.float_values.extend(values)
+        elif value_types == {bool}:
+            self.value_kinds.extend(repeat(VALUE_BOOLEAN, count))
+            self.value_slots.extend(range(len(self.integer_values), len(self.integer_values) + count))
+            self.integer_values.extend(map(int, values))
+        elif value_types == {int} and -(2**63) <= min(values) and max(values) < 2**63:
+            self.value_kinds.extend(repeat(VALUE_INTEGER, count))
+            self.value_slots.extend(range(len(self.integer_values), len(self.integer_values) + count))
+            self.integer_values.extend(values)
+        else:
+            for value in values:
+                self.append_value(value)
+
+        self.append_created_at(created_at)
+        self.created_at_ns.extend(repeat(self.created_at_ns[start], count - 1))
+        self.created_at_tz_codes.extend(repeat(self.created_at_tz_codes[start], count - 1))
+
+        label_set = tuple((label.name, label.value, label.type) for label in labels or [])
+        if steps is None:
+            self.label_codes.extend(repeat(self.encode_label_set(label_set), count))
+        else:
+            # Steps are scalars, so we extend the key of the labels that are the same for every value
+            key = tuple((name, type, hashable_key(value)) for name, value, type in label_set)
+            self.label_codes.extend(
+                self.label_sets.encode(
+                    label_set + (("step", step, step_type),), key=key + (("step", step_type, step),)
+                )
+                for step in steps
+            )
+
+    def append_value(self, value: Any) -> None:
+        value_type = type(value)
+        if value_type is float:
+            self.value_kinds.append(VALUE_FLOAT)
+            self.value_slots.append(len(self.float_values))
+            self.float_values.append(value)
+        elif value_type is bool:
+            self.value_kinds.append(VALUE_BOOLEAN)
+            self.value_slots.append(len(self.integer_values))
+            self.integer_values.append(int(value))
+        elif value_type is int and -(2**63) <= value < 2**63:
+            self.value_kinds.append(VALUE_INTEGER)
+            self.value_slots.append(len(self.integer_values))
+            self.integer_values.append(value)
+        else:
+            self.value_kinds.append(VALUE_OBJECT)
+            self.value_slots.append(len(self.object_values))
+            self.object_values.append(value)
+
+    def append_created_at(self, created_at: Optional[datetime.datetime]) -> None:
+        if created_at is None:
+            self.created_at_tz_codes.append(TZ_NONE)
+            self.created_at_ns.append(0)
+            return
+
+        if created_at.tzinfo is None:
+            self.created_at_tz_codes.append(TZ_NAIVE)
+        else:
+            self.created_at_tz_codes.append(self.timezones.encode(created_at.tzinfo, key=hashable_tzinfo(created_at)))
+        self.created_at_ns.append(datetime_to_ns(created_at))
+
+    def encode_labels(self, labels: List[Label]) -> int:
+        return self.encode_label_set(tuple((label.name, label.value, label.type) for label in labels))
+
+    def encode_label_set(self, label_set: Tuple[Tuple[str, Any, str], ...]) -> int:
+        key = tuple((name, type, hashable_key(value)) for name, value, type in label_set)
+        return self.label_sets.encode(label_set, key=key)
+
+    def value(self, row: int) -> Any:
+        kind = self.value_kinds[row]
+        slot = self.value_slots[row]
+        if kind == VALUE_FLOAT:
+            return self.float_values[slot]
+        if kind == VALUE_INTEGER:
+            return self.integer_values[slot]
+        if kind == VALUE_BOOLEAN:
+            return bool(self.integer_values[slot])
+        return self.object_values[slot]
+
+    def created_at(self, row: int) -> Optional[datetime.datetime]:
+        tz_code = self.created_at_tz_codes[row]
+        if tz_code == TZ_NONE:
+            return None
+
+        delta = datetime.timedelta(microseconds=self.created_at_ns[row] // 1000)
+        if tz_code == TZ_NAIVE:
+            return (EPOCH_UTC + delta).astimezone().replace(tzinfo=None)
+        return (EPOCH_UTC + delta).astimezone(self.timezones.decode(tz_code))
+
+    def labels(self, row: int) -> Tuple[Label, ...]:
+        label_set = self.label_sets.decode(self.label_codes[row])
+        return tuple(ReadOnlyLabel.view(name, value, type) for name, value, type in label_set)
+
+    def get_object(self, row: int):
+        """Create a read-only view of a record, because a change to the object would not change the columns"""
+        return self.object_class.view(
+            self.value_class.view(
+                self.names.decode(self.name_codes[row]),
+                self.value(row),
+                self.types.decode(self.type_codes[row]),
+            ),
+            self.labels(row),
+            self.run_suuids.decode(self.run_suuid_codes[row]),
+            self.created_at(row),
+        )
+
+    def get_dict(self, row: int) -> Dict:
+        return {
+            self.value_field: {
+                "name": self.names.decode(self.name_codes[row]),
+                "value": self.value(row),
+                "type": self.types.decode(self.type_codes[row]),
+            },
+            "label": [
+                {"name": name, "value": value, "type": type}
+                for name, value, type in self.label_sets.decode(self.label_codes[row])
+            ],
+            "run_suuid": self.run_suuids.decode(self.run_suuid_codes[row]),
+            "created_at": self.created_at(row),
+        }
+
+    def rows(self, index: Union[int, slice]) -> Union[int, range]:
+        if isinstance(index, slice):
+            return range(*index.indices(len(self)))
+
+        row = index + len(self) if index < 0 else index
+        if row < 0 or row >= len(self):
+            raise IndexError("list index out of range")
+        return row
+
+    def update_index(self) -> None:
+        """Add the records and label sets appended since the last update to the indexes"""
+        start = self.indexed_rows
+        end = len(self)
+        if start == end:
+            return
+
+        for row in range(start, end):
+            name_rows = self.name_index.get(self.name_codes[row])
+            if name_rows is None:
+                name_rows = self.name_index[self.name_codes[row]] = array("I")
+            name_rows.append(row)
+
+            label_set_rows = self.label_set_index.get(self.label_codes[row])
+            if label_set_rows is None:
+                label_set_rows = self.label_set_index[self.label_codes[row]] = array("I")
+            label_set_rows.append(row)
+
+        for code in range(self.indexed_label_sets, len(self.label_sets)):
+            for name, value, _ in self.label_sets.decode(code):
+                self.label_name_index.setdefault(name, set()).add(code)
+                self.label_value_index.setdefault((name, hashable_key(value)), set()).add(code)
+        self.indexed_label_sets = len(self.label_sets)
+
+        # Records are mostly appended in the order they are created. Only if they are not, we sort the index again.
+        new_rows = [row for row in range(start, end) if self.created_at_tz_codes[row] != TZ_NONE]
+        new_ns = [self.created_at_ns[row] for row in new_rows]
+        in_order = new_ns == sorted(new_ns) and (
+            not new_ns or not self.created_at_index_ns or self.created_at_index_ns[-1] <= new_ns[0]
+        )
+        self.created_at_index_ns.extend(new_ns)
+        self.created_at_index_rows.extend(new_rows)
+        if not in_order:
+            index = sorted(zip(self.created_at_index_ns, self.created_at_index_rows))
+            self.created_at_index_ns = array("q", (ns for ns, _ in index))
+            self.created_at_index_rows = array("I", (row for _, row in index))
+
+        self.indexed_rows = end
+
+    def rows_with_name(self, name: str) -> List[int]:
+        code = self.names.codes.get(name)
+        if code is None:
+            return []
+        self.update_index()
+        return list(self.name_index.get(code, []))
+
+    def rows_with_labels(self, label: Union[str, list, dict]) -> List[int]:
+        """
+        Rows of the records that have all labels. If label is a string or a list, the records should have labels with
+        these names. If label is a dictionary, the records should have labels with these names and values.
+        """
+        self.update_index()
+        if isinstance(label, str):
+            label_codes = [self.label_name_index.get(label, set())]
+        elif isinstance(label, dict):
+            label_codes = [
+                self.label_value_index.get((name, hashable_key(value)), set()) for name, value in label.items()
+            ]
+        else:
+            label_codes = [self.label_name_index.get(name, set()) for name in label]
+
+        if not label_codes:
+            return list(range(len(self)))
+        codes = set.intersection(*label_codes)
+        if len(codes) == 1:
+            return list(self.label_set_index.get(codes.pop(), []))
+        return sorted(chain.from_iterable(self.label_set_index.get(code, []) for code in codes))
+
+    def rows_created_between(
+        self, since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None
+    ) -> List[int]:
+        """Rows of the records created at or after since and at or before until, in order of the records"""
+        self.update_index()
+        start = 0 if since is None else bisect.bisect_left(self.created_at_index_ns, datetime_to_ns(since))
+        end = len(self.created_at_index_ns)
+        if until is not None:
+            end = bisect.bisect_right(self.created_at_index_ns, datetime_to_ns(until))
+        return sorted(self.created_at_index_rows[start:end])
+
+    def find_rows(
+        self,
+        name: Optional[str] = None,
+        label: Optional[Union[str, list, dict]] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> List[int]:
+        """Rows of the records that match all filters, in order of the records"""
+        row_lists = []
+        if name is not None:
+            row_lists.append(self.rows_with_name(name))
+        if label is not None:
+            row_lists.append(self.rows_with_labels(label))
+        if since is not None or until is not None:
+            row_lists.append(self.rows_created_between(since, until))
+        if not row_lists:
+            return list(range(len(self)))
+
+        row_lists.sort(key=len)
+        rows = row_lists[0]
+        for other_rows in row_lists[1:]:
+            other_rows_set = set(other_rows)
+            rows = [row for row in rows if row in other_rows_set]
+        return rows
+
+    def export_values(self, rows: List[int]):
+        """
+        NumPy array with the values of the rows. Floats, integers and booleans are gathered from the typed columns; if
+        the rows have values of other types, or values of different types, the array has dtype object.
+        """
+        np = import_optional("numpy")
+        rows = np.asarray(rows, dtype=np.int64)
+        kinds = np.frombuffer(self.value_kinds, dtype=np.uint8)[rows]
+        slots = np.frombuffer(self.value_slots, dtype=np.uint32)[rows]
+        value_kinds = set(np.unique(kinds).tolist())
+
+        if value_kinds == {VALUE_FLOAT}:
+            return np.frombuffer(self.float_values, dtype=np.float64)[slots]
+        if value_kinds == {VALUE_INTEGER}:
+            return np.frombuffer(self.integer_values, dtype=np.int64)[slots]
+        if value_kinds == {VALUE_BOOLEAN}:
+            return np.frombuffer(self.integer_values, dtype=np.int64)[slots].astype(bool)
+        if value_kinds == {VALUE_FLOAT, VALUE_INTEGER}:
+            values = np.empty(len(rows), dtype=np.float64)
+            is_float = kinds == VALUE_FLOAT
+            values[is_float] = np.frombuffer(self.float_values, dtype=np.float64)[slots[is_float]]
+            values[~is_float] = np.frombuffer(self.integer_values, dtype=np.int64)[slots[~is_float]]
+            return values
+
+        # Fill the array value by value, so NumPy does not unpack list values into an extra dimension
+        values = np.empty(len(rows), dtype=object)
+        for index, row in enumerate(rows.tolist()):
+            values[index] = self.value(row)
+        return values
+
+    def export(self, rows: List[int]) -> Dict[str, Any]:
+        """
+        Columns with the records of the rows for exporting to a DataFrame or Arrow table. Names, types and run SUUIDs
+        are exported as codes with categories, created_at as datetime64 in UTC and every label name gets a column
+        'label.<name>' with the value of the label, or None if the record does not have the label.
+        """
+        np = import_optional("numpy")
+        rows = np.asarray(rows, dtype=np.int64)
+
+        def categorical(codes: array, code_table: CodeTable) -> Tuple[Any, List[Any]]:
+            # Categories cannot contain None, so records with value None get code -1
+            codes = np.frombuffer(codes, dtype=np.uint32)[rows].astype(np.int32)
+            categories = list(code_table.values)
+            if None in categories:
+                none_code = categories.index(None)
+                codes = np.where(codes == none_code, -1, codes - (codes > none_code))
+                del categories[none_code]
+            return codes, categories
+
+        created_at = np.frombuffer(self.created_at_ns, dtype=np.int64)[rows].view("datetime64[ns]")
+        created_at[np.frombuffer(self.created_at_tz_codes, dtype=np.uint16)[rows] == TZ_NONE] = np.datetime64("NaT")
+
+        columns = {
+            "name": categorical(self.name_codes, self.names),
+            "value": self.export_values(rows),
+            "type": categorical(self.type_codes, self.types),
+            "run_suuid": categorical(self.run_suuid_codes, self.run_suuids),
+            "created_at": created_at,
+        }
+
+        # Look up the label values per label set, and then per row by the label set of the row
+        label_codes = np.frombuffer(self.label_codes, dtype=np.uint32)[rows]
+        label_values: Dict[str, Any] = {}
+        for code in np.unique(label_codes).tolist():
+            for name, value, _ in self.label_sets.decode(code):
+                if name not in label_values:
+                    label_values[name] = np.full(len(self.label_sets), None, dtype=object)
+                label_values[name][code] = value
+        for name, values in label_values.items():
+            columns[f"label.{name}"] = values[label_codes]
+
+        return columns
+
+
+def datetime_to_ns(value: datetime.datetime) -> int:
+    """
+    Nanoseconds since epoch. A naive datetime is in local time, similar to `datetime.astimezone`, so it is compared
+    with aware datetimes at the moment it represents on this machine.
+    """
+    if value.tzinfo is None:
+        value = value.astimezone()
+    delta = value - EPOCH_UTC
+    return ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1000
+
+
+def import_optional(name: str):
+    """Import an optional dependency, or raise an ImportError that explains which package to install"""
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(f"This method requires '{name}', you can install it with: pip install {name}") from e
+
+
+def columns_to_pandas(columns: Dict[str, Any]):
+    pd = import_optional("pandas")
+    data = {}
+    for name, column in columns.items():
+        if isinstance(column, tuple):
+            codes, categories = column
+            data[name] = pd.Categorical.from_codes(codes, categories=categories)
+        elif name == "created_at":
+            data[name] = pd.Series(column).dt.tz_localize("UTC")
+        else:
+            data[name] = column
+    dataframe = pd.DataFrame(data)
+
+    # Label columns have dtype object, so pandas can infer a more specific dtype per label
+    label_columns = [name for name in dataframe.columns if name.startswith("label.")]
+    dataframe[label_columns] = dataframe[label_columns].infer_objects()
+    return dataframe
+
+
+def columns_to_arrow(columns: Dict[str, Any]):
+    pa = import_optional("pyarrow")
+    arrays = {}
+    for name, column in columns.items():
+        if isinstance(column, tuple):
+            codes, categories = column
+            arrays[name] = pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0, type=pa.int32()), pa.array(categories, type=pa.string())
+            )
+        elif name == "created_at":
+            arrays[name] = pa.array(column, type=pa.timestamp("ns", tz="UTC"))
+        else:
+            try:
+                arrays[name] = pa.array(column, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Arrow columns have one type, so values of different types are stored as JSON
+                arrays[name] = pa.array(
+                    [None if value is None else json.dumps(value, default=json_serializer) for value in column]
+                )
+    return pa.table(arrays)
+
+
+def hashable_tzinfo(created_at: datetime.datetime) -> Any:
+    tzinfo = created_at.tzinfo
+    try:
+        hash(tzinfo)
+    except TypeError:
+        # For example dateutil's tzutc is not hashable
+        return ("tz", repr(tzinfo))
+    return tzinfo
+
+
+class ReadOnlyVariable(ReadOnly, Variable):
+    __slots__ = ()
+
+
+class ReadOnlyVariableObject(ReadOnly, VariableObject):
+    __slots__ = ()
+
+
 class VariableList:
-    variables: List[VariableObject] = field(default_factory=list)
+    """
+    The variables are stored in columns, and reading a variable creates a read-only view of it.
+
+    This is an intentional breaking change: setting a field of a variable read from the list raises a
+    FrozenInstanceError and `.variables` is a tuple. Use append to add variables, assign a new list to `.variables` to
+    replace them, or use dataclasses.replace or copy.copy to get a VariableObject that can be changed.
+    """
+
+    def __init__(self, variables: Optional[List[VariableObject]] = None):
+        self.variables = variables or []
+
+    @property
+    def variables(self) -> Tuple[VariableObject, ...]:
+        """The variables as a tuple of read-only views. Use append to add a variable to the list."""
+        return tuple(self)
+
+    @variables.setter
+    def variables(self, variables: List[VariableObject]) -> None:
+        self.columns = RecordColumns(ReadOnlyVariableObject, ReadOnlyVariable, "variable")
+        for variable in variables:
+            self.append(variable)
 
     def __len__(self):
-        return len(self.variables)
+        return len(self.columns)
 
     def __iter__(self):
-        yield from self.variables
+        for row in range(len(self.columns)):
+            yield self.columns.get_object(row)
 
     def __getitem__(self, row):
-        return self.variables[row]
+        rows = self.columns.rows(row)
+        if isinstance(rows, range):
+            return [self.columns.get_object(row) for row in rows]
+        return self.columns.get_object(rows)
+
+    def __eq__(self, other):
+        if not isinstance(other, VariableList):
+            return NotImplemented
+        return self.variables == other.variables
 
     def __str__(self):
-        return f"List of {len(self.variables)} variable" + ("s" if len(self.variables) != 1 else "")
+        return f"List of {len(self)} variable" + ("s" if len(self) != 1 else "")
 
     def __repr__(self):
-        return f"VariableList({len(self.variables)} variable" + ("s" if len(self.variables) != 1 else "") + ")"
+        return f"VariableList({len(self)} variable" + ("s" if len(self) != 1 else "") + ")"
 
     def append(self, variable: VariableObject):
-        self.variables.append(variable)
-
-    def get(self, name) -> Union[VariableObject, None]:
-        variables_filtered = self.filter(name)
+        self.columns.append(variable)
+
+    def get(
+        self,
+        name: str,
+        label: Optional[Union[str, list, dict]] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> Union[VariableObject, None]:
+        """
+        Get the variable with the name. See filter for the other arguments.
+
+        Raises:
+            MultipleObjectsReturnedError: More than one variable matches
+
+        Returns:
+            VariableObject or None: The variable, or None if no variable matches
+        """
+        variables_filtered = self.filter(name, label=label, since=since, until=until)
         if len(variables_filtered) == 1:
             return variables_filtered[0]
         if len(variables_filtered) > 1:
@@ -113,22 +679,75 @@ class VariableList:
             )
         return None
 
-    def filter(self, name) -> List[VariableObject]:
-        variables_filtered = list(filter(lambda x: x.variable.name == name, self.variables))
-        return variables_filtered
+    def filter(
+        self,
+        name: Optional[str] = None,
+        label: Optional[Union[str, list, dict]] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> List[VariableObject]:
+        """
+        Filter the variables. The variables are looked up in indexes, so filtering does not go through all variables.
+
+        Args:
+            name (str, optional): Name of the variable. Defaults to None.
+            label (str, list or dict, optional): Label name(s) the variable should have, or a dictionary with label
+                names and the values they should have. Defaults to None.
+            since (datetime, optional): Only variables created at or after this time. A naive datetime is in local
+                time. Defaults to None.
+            until (datetime, optional): Only variables created at or before this time. A naive datetime is in local
+                time. Defaults to None.
+
+        Returns:
+            List[VariableObject]: The variables that match all filters
+        """
+        return [self.columns.get_object(row) for row in self.columns.find_rows(name, label, since, until)]
+
+    def to_numpy(self, name: str):
+        """
+        Get the values of the variable with the name as a NumPy array. Requires NumPy.
+
+        Args:
+            name (str): Name of the variable
+
+        Returns:
+            numpy.ndarray: The values in order of the variables. Float, integer and boolean values get a numeric dtype,
+                other values dtype object.
+        """
+        return self.columns.export_values(self.columns.rows_with_name(name))
+
+    def to_pandas(self):
+        """
+        Get the variables as a pandas DataFrame with the columns name, value, type, run_suuid, created_at and a column
+        'label.<name>' per label. Requires pandas.
+        """
+        return columns_to_pandas(self.columns.export(range(len(self.columns))))
+
+    def to_arrow(self):
+        """
+        Get the variables as a PyArrow Table with the same columns as to_pandas. Columns with values of different types
+        are stored as JSON. Requires NumPy and PyArrow.
+        """
+        return columns_to_arrow(self.columns.export(range(len(self.columns))))
 
     def to_dict(self) -> List[dict]:
-        return [variable.to_dict() for variable in self.variables]
+        return [self.columns.get_dict(row) for row in range(len(self.columns))]
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), default=json_serializer)
 
+    @classmethod
+    def from_dict(cls, data: List[dict]) -> "VariableList":
+        return cls(variables=[VariableObject.from_dict(variable) for variable in data])
 
+
+@with_slots
 @dataclass
 class Metric(Variable):
     pass
 
 
+@with_slots
 @dataclass
 class MetricObject:
     metric: Metric
@@ -160,40 +779,130 @@ class MetricObject:
     def from_dict(cls, data: Dict) -> "MetricObject":
         return cls(
             metric=Metric(
-                name=data["metric"]["name"],
+                name=sys.intern(data["metric"]["name"]),
                 value=data["metric"]["value"],
-                type=data["metric"]["type"],
+                type=sys.intern(data["metric"]["type"]),
             ),
-            label=[Label(**label) for label in data["label"]],
+            label=[Label.from_dict(label) for label in data["label"]],
             run_suuid=data["run_suuid"],
-            created_at=dateutil_parser.isoparse(data["created_at"]),
+            created_at=parse_datetime(data["created_at"]),
         )
 
 
-@dataclass
+class ReadOnlyMetric(ReadOnly, Metric):
+    __slots__ = ()
+
+
+class ReadOnlyMetricObject(ReadOnly, MetricObject):
+    __slots__ = ()
+
+
 class MetricList:
-    metrics: List[MetricObject] = field(default_factory=list)
+    """
+    The metrics are stored in columns, and reading a metric creates a read-only view of it.
+
+    This is an intentional breaking change: setting a field of a metric read from the list raises a
+    FrozenInstanceError and `.metrics` is a tuple. Use append or append_series to add metrics, assign a new list to
+    `.metrics` to replace them, or use dataclasses.replace or copy.copy to get a MetricObject that can be changed.
+    """
+
+    def __init__(self, metrics: Optional[List[MetricObject]] = None):
+        self.metrics = metrics or []
+
+    @property
+    def metrics(self) -> Tuple[MetricObject, ...]:
+        """The metrics as a tuple of read-only views. Use append or append_series to add metrics to the list."""
+        return tuple(self)
+
+    @metrics.setter
+    def metrics(self, metrics: List[MetricObject]) -> None:
+        self.columns = RecordColumns(ReadOnlyMetricObject, ReadOnlyMetric, "metric")
+        for metric in metrics:
+            self.append(metric)
 
     def __len__(self):
-        return len(self.metrics)
+        return len(self.columns)
 
     def __iter__(self):
-        yield from self.metrics
+        for row in range(len(self.columns)):
+            yield self.columns.get_object(row)
 
     def __getitem__(self, row):
-        return self.metrics[row]
+        rows = self.columns.rows(row)
+        if isinstance(rows, range):
+            return [self.columns.get_object(row) for row in rows]
+        return self.columns.get_object(rows)
+
+    def __eq__(self, other):
+        if not isinstance(other, MetricList):
+            return NotImplemented
+        return self.metrics == other.metrics
 
     def __str__(self):
-        return f"List of {len(self.metrics)} metric" + ("s" if len(self.metrics) != 1 else "")
+        return f"List of {len(self)} metric" + ("s" if len(self) != 1 else "")
 
     def __repr__(self):
-        return f"MetricList({len(self.metrics)} metric" + ("s" if len(self.metrics) != 1 else "") + ")"
+        return f"MetricList({len(self)} metric" + ("s" if len(self) != 1 else "") + ")"
 
     def append(self, metric: MetricObject):
-        self.metrics.append(metric)
+        self.columns.append(metric)
+
+    def append_series(
+        self,
+        name: str,
+        type: str,
+        values: List[Any],
+        run_suuid: Optional[str] = None,
+        labels: Optional[List[Label]] = None,
+        steps: Optional[List[Any]] = None,
+        step_type: str = "integer",
+    ):
+        """
+        Append a series of metric values with the same name and type in one operation
+
+        Args:
+            name (str): Name of the metric
+            type (str): Type of the metric values
+            values (List[Any]): The metric values
+            run_suuid (str, optional): SUUID of the run. Defaults to None.
+            labels (List[Label], optional): Labels to add to every metric. Defaults to None.
+            steps (List[Any], optional): Steps of the values, added as label 'step'. Defaults to None.
+            step_type (str, optional): Type of the steps. Defaults to "integer".
+        """
+        if not values:
+            return
+        if steps is not None and len(steps) != len(values):
+            raise ValueError(f"The number of steps ({len(steps)}) does not match the number of values ({len(values)})")
+
+        # The created time is set with timezome set to UTC, similar to MetricObject
+        self.columns.append_series(
+            name=name,
+            type=type,
+            values=values,
+            run_suuid=run_suuid,
+            created_at=datetime.datetime.now(datetime.timezone.utc),
+            labels=labels,
+            steps=steps,
+            step_type=step_type,
+        )
 
-    def get(self, name) -> Union[MetricObject, None]:
-        metrics_filtered = self.filter(name)
+    def get(
+        self,
+        name: str,
+        label: Optional[Union[str, list, dict]] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> Union[MetricObject, None]:
+        """
+        Get the metric with the name. See filter for the other arguments.
+
+        Raises:
+            MultipleObjectsReturnedError: More than one metric matches
+
+        Returns:
+            MetricObject or None: The metric, or None if no metric matches
+        """
+        metrics_filtered = self.filter(name, label=label, since=since, until=until)
         if len(metrics_filtered) == 1:
             return metrics_filtered[0]
         if len(metrics_filtered) > 1:
@@ -202,16 +911,67 @@ class MetricList:
             )
         return None
 
-    def filter(self, name) -> List[MetricObject]:
-        metrics_filtered = list(filter(lambda x: x.metric.name == name, self.metrics))
-        return metrics_filtered
+    def filter(
+        self,
+        name: Optional[str] = None,
+        label: Optional[Union[str, list, dict]] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> List[MetricObject]:
+        """
+        Filter the metrics. The metrics are looked up in indexes, so filtering does not go through all metrics.
+
+        Args:
+            name (str, optional): Name of the metric. Defaults to None.
+            label (str, list or dict, optional): Label name(s) the metric should have, or a dictionary with label
+                names and the values they should have. Defaults to None.
+            since (datetime, optional): Only metrics created at or after this time. A naive datetime is in local
+                time. Defaults to None.
+            until (datetime, optional): Only metrics created at or before this time. A naive datetime is in local
+                time. Defaults to None.
+
+        Returns:
+            List[MetricObject]: The metrics that match all filters
+        """
+        return [self.columns.get_object(row) for row in self.columns.find_rows(name, label, since, until)]
+
+    def to_numpy(self, name: str):
+        """
+        Get the values of the metric with the name as a NumPy array. Requires NumPy.
+
+        Args:
+            name (str): Name of the metric
+
+        Returns:
+            numpy.ndarray: The values in order of the metrics. Float, integer and boolean values get a numeric dtype,
+                other values dtype object.
+        """
+        return self.columns.export_values(self.columns.rows_with_name(name))
+
+    def to_pandas(self):
+        """
+        Get the metrics as a pandas DataFrame with the columns name, value, type, run_suuid, created_at and a column
+        'label.<name>' per label. Requires pandas.
+        """
+        return columns_to_pandas(self.columns.export(range(len(self.columns))))
+
+    def to_arrow(self):
+        """
+        Get the metrics as a PyArrow Table with the same columns as to_pandas. Columns with values of different types
+        are stored as JSON. Requires NumPy and PyArrow.
+        """
+        return columns_to_arrow(self.columns.export(range(len(self.columns))))
 
     def to_dict(self) -> List[dict]:
-        return [metric.to_dict() for metric in self.metrics]
+        return [self.columns.get_dict(row) for row in range(len(self.columns))]
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), default=json_serializer)
 
+    @classmethod
+    def from_dict(cls, data: List[dict]) -> "MetricList":
+        return cls(metrics=[MetricObject.from_dict(metric) for metric in data])
+
 
 @dataclass
 class Run:
@@ -264,13 +1024,13 @@ class Run:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Run":
-        data["created_at"] = dateutil_parser.parse(data["created_at"])
-        data["modified_at"] = dateutil_parser.parse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
 
         if data["started_at"]:
-            data["started_at"] = dateutil_parser.parse(data["started_at"])
+            data["started_at"] = parse_datetime(data["started_at"])
         if data["finished_at"]:
-            data["finished_at"] = dateutil_parser.parse(data["finished_at"])
+            data["finished_at"] = parse_datetime(data["finished_at"])
 
         created_by = CreatedByWithAvatarRelation.from_dict(data["created_by"])
         del data["created_by"]
@@ -286,6 +1046,20 @@ class Run:
         return cls(created_by=created_by, payload=payload, job=job, project=project, workspace=workspace, **data)
 
 
+LazyRun = lazy_dataclass(
+    Run,
+    created_by=CreatedByWithAvatarRelation.from_dict,
+    payload=PayloadRelation.from_dict,
+    job=JobRelation.from_dict,
+    project=ProjectRelation.from_dict,
+    workspace=WorkspaceRelation.from_dict,
+    created_at=parse_datetime,
+    modified_at=parse_datetime,
+    started_at=parse_datetime,
+    finished_at=parse_datetime,
+)
+
+
 @dataclass
 class RunStatus:
     suuid: str
@@ -312,13 +1086,13 @@ class RunStatus:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "RunStatus":
-        data["created_at"] = dateutil_parser.isoparse(data["created_at"])
-        data["modified_at"] = dateutil_parser.isoparse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
 
         if "started_at" in data and data["started_at"]:
-            data["started_at"] = dateutil_parser.isoparse(data["started_at"])
+            data["started_at"] = parse_datetime(data["started_at"])
         if "finished_at" in data and data["finished_at"]:
-            data["finished_at"] = dateutil_parser.isoparse(data["finished_at"])
+            data["finished_at"] = parse_datetime(data["finished_at"])
 
         created_by = CreatedByRelation.from_dict(data["created_by"])
         del data["created_by"]
@@ -332,6 +1106,7 @@ class RunStatus:
         return cls(created_by=created_by, job=job, project=project, workspace=workspace, **data)
 
 
+@with_slots
 @dataclass
 class ArtifactFile:
     name: str
@@ -343,7 +1118,7 @@ class ArtifactFile:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "ArtifactFile":
-        data["last_modified"] = dateutil_parser.isoparse(data["last_modified"])
+        data["last_modified"] = parse_datetime(data["last_modified"])
         return cls(**data)
 
 
@@ -386,10 +1161,15 @@ class ArtifactInfo:
     cdn_base_url: str
     files: ArtifactFileList
 
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["files"] = data["files"]["files"]
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict) -> "ArtifactInfo":
-        data["created_at"] = dateutil_parser.isoparse(data["created_at"])
-        data["modified_at"] = dateutil_parser.isoparse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
 
         data["files"] = ArtifactFileList(
             [ArtifactFile.from_dict(f) for f in data["files"]],
@@ -2,8 +2,7 @@ import datetime
 from dataclasses import dataclass
 from typing import Dict
 
-from dateutil import parser as dateutil_parser
-
+from .decode import lazy_dataclass, parse_datetime
 from .relation import ProjectRelation, WorkspaceRelation
 
 
@@ -20,8 +19,8 @@ class Variable:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Variable":
-        data["created_at"] = dateutil_parser.parse(data["created_at"])
-        data["modified_at"] = dateutil_parser.parse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
 
         project = ProjectRelation.from_dict(data["project"])
         del data["project"]
@@ -29,3 +28,12 @@ class Variable:
         del data["workspace"]
 
         return cls(project=project, workspace=workspace, **data)
+
+
+LazyVariable = lazy_dataclass(
+    Variable,
+    project=ProjectRelation.from_dict,
+    workspace=WorkspaceRelation.from_dict,
+    created_at=parse_datetime,
+    modified_at=parse_datetime,
+)
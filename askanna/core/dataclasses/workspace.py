@@ -2,9 +2,8 @@ import datetime
 from dataclasses import dataclass
 from typing import Dict, Optional
 
-from dateutil import parser as dateutil_parser
-
 from .base import VISIBILITY
+from .decode import lazy_dataclass, parse_datetime
 from .relation import CreatedByWithAvatarRelation
 
 
@@ -25,10 +24,18 @@ class Workspace:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Workspace":
-        data["created_at"] = dateutil_parser.parse(data["created_at"])
-        data["modified_at"] = dateutil_parser.parse(data["modified_at"])
+        data["created_at"] = parse_datetime(data["created_at"])
+        data["modified_at"] = parse_datetime(data["modified_at"])
 
         created_by = CreatedByWithAvatarRelation.from_dict(data["created_by"]) if data["created_by"] else None
         del data["created_by"]
 
         return cls(created_by=created_by, **data)
+
+
+LazyWorkspace = lazy_dataclass(
+    Workspace,
+    created_by=CreatedByWithAvatarRelation.from_dict,
+    created_at=parse_datetime,
+    modified_at=parse_datetime,
+)
@@ -1,18 +1,24 @@
+import datetime
+import json
 import os
 import sys
 import tempfile
 import uuid
-from typing import Union
+from pathlib import Path
+from typing import Optional, Union
 from zipfile import ZipFile
 
 import click
 import git
 
 from askanna.config import config
+from askanna.core.exceptions import GetError
 from askanna.core.upload import PackageUpload
-from askanna.core.utils.file import zip_files_in_dir
+from askanna.core.utils.file import file_sha256, zip_files_in_dir
 from askanna.core.utils.validate import validate_askanna_yml
 from askanna.sdk.package import PackageSDK
+from askanna.sdk.project import ProjectSDK
+from askanna.settings import DEFAULT_PUSH_STATE_DIR
 
 
 def package(src: str) -> str:
@@ -45,6 +51,70 @@ def package(src: str) -> str:
     return zip_file
 
 
+def last_push_path(project_suuid: str) -> Path:
+    return Path(os.getenv("AA_PUSH_STATE_DIR", DEFAULT_PUSH_STATE_DIR)) / f"{project_suuid}.json"
+
+
+def get_last_push(project_suuid: str) -> Optional[dict]:
+    """Get the content hash and package SUUID of the last successful push of the project from this machine"""
+    try:
+        with last_push_path(project_suuid).open() as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_last_push(project_suuid: str, package_hash: str, package_suuid: str) -> None:
+    path = last_push_path(project_suuid)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path_tmp = path.with_suffix(".tmp")
+    with path_tmp.open("w") as f:
+        json.dump(
+            {
+                "project_suuid": project_suuid,
+                "package_hash": package_hash,
+                "package_suuid": package_suuid,
+                "pushed_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            },
+            f,
+        )
+    path_tmp.replace(path)
+
+
+def is_package_unchanged(project_suuid: str, package_hash: str) -> bool:
+    """
+    Check if the package is the same as the package of the last push of the project, and that package is still the
+    current package of the project in AskAnna
+    """
+    last_push = get_last_push(project_suuid)
+    if not last_push or last_push.get("package_hash") != package_hash:
+        return False
+
+    # The code of the project could be replaced by a push from somewhere else
+    try:
+        project = ProjectSDK().get(project_suuid)
+    except GetError:
+        return False
+    return project.package is not None and project.package.suuid == last_push.get("package_suuid")
+
+
+def remove_package_archive(package_archive: str) -> bool:
+    """Remove the temporary zip file including the parent temporary folder"""
+    try:
+        os.remove(package_archive)
+        os.rmdir(os.path.dirname(package_archive))
+        return True
+    except OSError as e:
+        click.echo(
+            "Pushing your code was successful, but we could not remove the temporary file "
+            "used for uploading your code to AskAnna.",
+            err=True,
+        )
+        click.echo(f"The error: {e.strerror}", err=True)
+        click.echo(f"You can manually delete the file: {package_archive}", err=True)
+        return False
+
+
 def is_project_config_push_ready() -> bool:
     if not config.project.project_config_path:
         click.echo(
@@ -66,7 +136,12 @@ def is_project_config_push_ready() -> bool:
     return True
 
 
-def push(overwrite: bool = False, description: Union[str, None] = None) -> bool:
+def push(
+    overwrite: bool = False,
+    description: Union[str, None] = None,
+    upload_concurrency: Union[int, None] = None,
+    skip_unchanged: bool = True,
+) -> bool:
     if not is_project_config_push_ready():
         sys.exit(1)
 
@@ -87,6 +162,16 @@ def push(overwrite: bool = False, description: Union[str, None] = None) -> bool:
     project_folder = os.path.dirname(config.project.project_config_path)
     package_archive = package(project_folder)
 
+    # The package zip file is reproducible, so the hash of the file only changes if the code changes
+    package_hash = file_sha256(package_archive)
+    if skip_unchanged and is_package_unchanged(config.project.project_suuid, package_hash):
+        remove_package_archive(package_archive)
+        click.echo(
+            f"The code in '{project_folder}' did not change since the last push to AskAnna. We are not pushing the "
+            "same code again."
+        )
+        return True
+
     # Attach the description to this package upload
     if not description:
         # Try git and use last commit message
@@ -103,22 +188,13 @@ def push(overwrite: bool = False, description: Union[str, None] = None) -> bool:
     uploader = PackageUpload(
         project_suuid=config.project.project_suuid,
         description=description,
+        concurrency=upload_concurrency,
     )
     status, _ = uploader.upload(package_archive)
     if status:
-        # remove temporary zip-file from the system including the parent temporary folder
-        try:
-            os.remove(package_archive)
-            os.rmdir(os.path.dirname(package_archive))
+        save_last_push(config.project.project_suuid, package_hash, uploader.suuid)  # type: ignore
+        if remove_package_archive(package_archive):
             click.echo("Successfully pushed the project to AskAnna!")
-        except OSError as e:
-            click.echo(
-                "Pushing your code was successful, but we could not remove the temporary file "
-                "used for uploading your code to AskAnna.",
-                err=True,
-            )
-            click.echo(f"The error: {e.strerror}", err=True)
-            click.echo(f"You can manually delete the file: {package_archive}", err=True)
     else:
         click.echo("Pushing your code failed.", err=True)
         sys.exit(1)
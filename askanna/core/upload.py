@@ -1,22 +1,287 @@
+import hashlib
 import io
+import json
+import math
 import os
-from typing import Optional
-
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import List, Optional, Set, Union
+
+import click
+import requests
 import resumable
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
 
+from askanna.config import config
 from askanna.core.exceptions import PostError
-from askanna.core.utils.file import file_type
+from askanna.core.utils.file import FileSlice, file_sha256, file_type
 from askanna.core.utils.settings import diskunit
 from askanna.gateways.api_client import client
+from askanna.settings import (
+    DEFAULT_UPLOAD_CHUNK_SIZE_MAX,
+    DEFAULT_UPLOAD_CHUNK_SIZE_MIN,
+    DEFAULT_UPLOAD_CONCURRENCY,
+    DEFAULT_UPLOAD_STATE_DIR,
+)
+
+# Chunk sizes are rounded up to a multiple of this size
+CHUNK_SIZE_STEP = 64 * diskunit.KiB
+
+
+class ChunkSizePolicy:
+    """
+    Choose the chunk size for uploading a file, based on the size of the file and the measured upload speed
+
+    Without measurements, a file is split in about target_chunks chunks. After chunks are uploaded, the chunk size is
+    chosen so the time per chunk that is spent on the latency of the requests is at most `overhead` of the time to
+    upload the chunk, and uploading a chunk takes at most max_chunk_seconds, so a failed chunk does not waste much. The
+    latency is the time to register a chunk and the throughput is measured per connection, both as a moving average.
+
+    The chunk size is always between min_size and max_size, and a file is split in at least as many chunks as there
+    are chunks uploaded at the same time. The chunk size of an upload is chosen when the upload starts, because the
+    number of chunks and the chunk size are sent with every chunk. The measurements of an upload are used for the
+    uploads that start after it.
+
+    The AskAnna API does not document a maximum chunk size, so the default max_size is a client default. A server with
+    a lower request size limit, for example set by a proxy in front of it, can set `upload_chunk_size_max` in its
+    entry of the server config file (~/.askanna.yml).
+
+    Args:
+        min_size (int, optional): Minimum chunk size in bytes. Defaults to AA_UPLOAD_CHUNK_SIZE_MIN, or 1 MiB.
+        max_size (int, optional): Maximum chunk size in bytes. Defaults to AA_UPLOAD_CHUNK_SIZE_MAX, the
+          upload_chunk_size_max of the server in the server config file, or 32 MiB.
+        target_chunks (int, optional): Number of chunks to split a file in without measurements. Defaults to 64.
+        overhead (float, optional): Maximum fraction of the upload time of a chunk spent on latency. Defaults to 0.1.
+        max_chunk_seconds (float, optional): Maximum time to upload a chunk. Defaults to 30 seconds.
+    """
+
+    # Weight of a new measurement in the moving averages
+    smoothing = 0.3
+
+    def __init__(
+        self,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        target_chunks: int = 64,
+        overhead: float = 0.1,
+        max_chunk_seconds: float = 30.0,
+    ):
+        if max_size is None:
+            max_size = int(
+                os.getenv(
+                    "AA_UPLOAD_CHUNK_SIZE_MAX", config.server.upload_chunk_size_max or DEFAULT_UPLOAD_CHUNK_SIZE_MAX
+                )
+            )
+        if min_size is None:
+            # If the server accepts only chunks smaller than the default minimum size, the minimum follows the server
+            min_size = int(os.getenv("AA_UPLOAD_CHUNK_SIZE_MIN", min(DEFAULT_UPLOAD_CHUNK_SIZE_MIN, max_size)))
+        if min_size < 1 or max_size < min_size:
+            raise ValueError(f"Chunk size bounds should be 1 <= min_size <= max_size, got {min_size} and {max_size}")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_chunks = target_chunks
+        self.overhead = overhead
+        self.max_chunk_seconds = max_chunk_seconds
+
+        self.latency: Optional[float] = None  # seconds
+        self.throughput: Optional[float] = None  # bytes per second
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latency = None
+            self.throughput = None
+
+    def record(self, size: int, latency: float, duration: float) -> None:
+        """Record the upload of a chunk
+
+        Args:
+            size (int): Size of the chunk in bytes
+            latency (float): Seconds to register the chunk, a request without a body
+            duration (float): Seconds to upload the chunk
+        """
+        throughput = size / max(duration - latency, 0.001)
+        with self._lock:
+            if self.latency is None or self.throughput is None:
+                self.latency, self.throughput = latency, throughput
+            else:
+                self.latency += self.smoothing * (latency - self.latency)
+                self.throughput += self.smoothing * (throughput - self.throughput)
+
+    def chunk_size(self, file_size: int, concurrency: int = 1) -> int:
+        """Get the chunk size for uploading a file of file_size bytes with concurrency chunks at the same time"""
+        with self._lock:
+            latency, throughput = self.latency, self.throughput
+
+        if latency is None or throughput is None:
+            size = file_size / self.target_chunks
+        else:
+            size = throughput * latency * (1 - self.overhead) / self.overhead
+            size = min(size, throughput * self.max_chunk_seconds)
+
+        # Give each worker at least one chunk
+        size = min(size, file_size / max(concurrency, 1))
+        size = math.ceil(size / CHUNK_SIZE_STEP) * CHUNK_SIZE_STEP
+        return int(min(max(size, self.min_size), self.max_size))
+
+
+default_chunk_size_policy = ChunkSizePolicy()
+
+
+class MultipartBody(io.RawIOBase):
+    """
+    A multipart/form-data request body with form fields and a file, that reads the file while the body is sent
+
+    The parts are encoded the same way as requests encodes `data` and `files`, but the file is not read in memory
+    first. The body has a length, so requests sends it with a Content-Length header instead of chunked.
+    """
+
+    def __init__(self, fields: dict, file_field: str, file: FileSlice):
+        super().__init__()
+        self.boundary = choose_boundary()
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        self.parts: List = []
+        for name, value in fields.items():
+            if value is None:
+                continue
+            field = RequestField(name=name, data=str(value))
+            field.make_multipart()
+            self.parts.append(io.BytesIO(self._part_header(field) + str(value).encode() + b"\r\n"))
+
+        field = RequestField(name=file_field, data=b"", filename=file_field)
+        field.make_multipart()
+        self.parts.append(io.BytesIO(self._part_header(field)))
+        self.parts.append(file)
+        self.parts.append(io.BytesIO(f"\r\n--{self.boundary}--\r\n".encode()))
+
+        self.lengths = [len(part.getvalue()) if isinstance(part, io.BytesIO) else len(part) for part in self.parts]
+        self.index = 0
+
+    def _part_header(self, field: RequestField) -> bytes:
+        return f"--{self.boundary}\r\n".encode() + field.render_headers().encode()
+
+    def __len__(self) -> int:
+        return sum(self.lengths)
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return sum(self.lengths[: self.index]) + (self.parts[self.index].tell() if self.index < len(self.parts) else 0)
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer)
+        read = 0
+        while read < len(view) and self.index < len(self.parts):
+            size = self.parts[self.index].readinto(view[read:])
+            if not size:
+                self.index += 1
+            read += size
+        return read
+
+
+def file_identity(file_path: Union[Path, str]) -> dict:
+    stat = os.stat(file_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(file_path)}
+
+
+class UploadState:
+    """
+    Progress of an upload, saved in a file so the upload can continue when the process is restarted
+
+    The first line of the file has the upload entry SUUID, the chunk layout and the identity of the uploaded file.
+    Each next line has the number of a chunk that is uploaded. Chunk numbers are appended to the file, so saving the
+    progress of a chunk never rewrites the file.
+
+    An upload is continued if the file has the same size and SHA-256 hash. The modification time is not compared,
+    because a file that is created again with the same content, like the artifact zip, can be continued.
+    """
+
+    def __init__(self, path: Union[Path, str]):
+        self.path = Path(path)
+        self.file: Optional[dict] = None
+        self.info: Optional[dict] = None
+        self.chunks: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def load(self, file: dict) -> bool:
+        """Load the state and return whether it is an upload of a file with the same identity"""
+        self.file = file
+        try:
+            with self.path.open() as f:
+                info = json.loads(f.readline())
+                chunks = set()
+                for line in f:
+                    try:
+                        chunks.add(int(line))
+                    except ValueError:
+                        # A chunk number that was not completely written because the process was killed
+                        continue
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+        if (info["file"]["size"], info["file"]["sha256"]) != (file["size"], file["sha256"]):
+            return False
+
+        self.info, self.chunks = info, chunks
+        return True
+
+    def start(self, info: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w") as f:
+            f.write(json.dumps(info) + "\n")
+        self.info, self.chunks = info, set()
+
+    def add_chunk(self, chunk_number: int) -> None:
+        with self._lock:
+            with self.path.open("a") as f:
+                f.write(f"{chunk_number}\n")
+            self.chunks.add(chunk_number)
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self.info, self.chunks = None, set()
 
 
 class Upload:
+    """
+    Upload a file in chunks to AskAnna
+
+    Args:
+        concurrency (int, optional): Number of chunks to upload at the same time. Defaults to the environment
+          variable AA_UPLOAD_CONCURRENCY, or 4 if it is not set.
+        chunk_size_policy (ChunkSizePolicy, optional): Policy to choose the chunk size. Defaults to the policy shared
+          by all uploads, so the speed measured in an upload is used for the next uploads.
+        resume (bool, optional): Save the progress of an upload with more than one chunk in AA_UPLOAD_STATE_DIR, and
+          continue an upload of the same file to the same target that did not finish. Defaults to the environment
+          variable AA_UPLOAD_RESUME, or True if it is not set.
+    """
+
     message_upload_success = "File is uploaded"
     message_upload_fail = "File upload failed"
 
-    def __init__(self):
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        chunk_size_policy: Optional[ChunkSizePolicy] = None,
+        resume: Optional[bool] = None,
+    ):
         self.suuid = None
         self.resumable_file = None
+        if concurrency is None:
+            concurrency = int(os.getenv("AA_UPLOAD_CONCURRENCY", DEFAULT_UPLOAD_CONCURRENCY))
+        self.concurrency = max(1, concurrency)
+        self.chunk_size_policy = chunk_size_policy or default_chunk_size_policy
+        if resume is None:
+            resume = os.getenv("AA_UPLOAD_RESUME", "true").lower() in ("1", "true", "yes")
+        self.resume = resume
+        self.state_dir = Path(os.getenv("AA_UPLOAD_STATE_DIR", DEFAULT_UPLOAD_STATE_DIR))
 
     def register_upload_url(self) -> str:
         raise NotImplementedError(f"Please implement 'register_upload_url' for {self.__class__.__name__}")
@@ -45,9 +310,48 @@ class Upload:
         }.copy()
 
     def upload(self, file_path: str):
+        # The state of a file that fits in one chunk is not saved, so we only get the identity of the file if there is
+        # a state to compare it with or the file is uploaded in more than one chunk
+        state = None
+        size = os.path.getsize(file_path)
+        if self.resume and (
+            self.state_path().exists() or self.chunk_size_policy.chunk_size(size, self.concurrency) < size
+        ):
+            state = self.load_state(file_path)
+
+        if state and state.info:
+            self.suuid = state.info["suuid"]
+            try:
+                self.upload_file(file_path, state=state)
+                status, message = self.finish_upload()
+            except PostError:
+                status, message = False, self.message_upload_fail
+            if status:
+                state.remove()
+                return status, message
+
+            # The upload entry of the state is removed or does not accept the chunks anymore. We start over with a
+            # new upload entry, so a failed upload cannot be continued over and over again.
+            click.echo("AskAnna could not continue the upload. The upload is started again.", err=True)
+            state.remove()
+
         self.suuid = self.create_entry(file_path)
-        self.upload_file(file_path)
-        return self.finish_upload()
+        self.upload_file(file_path, state=state)
+        status, message = self.finish_upload()
+        if status and state:
+            state.remove()
+        return status, message
+
+    def state_path(self) -> Path:
+        """Path of the upload state file, based on where the file is uploaded to"""
+        target = self.register_upload_url() + "\n" + json.dumps(self.entry_extrafields, sort_keys=True)
+        return self.state_dir / (hashlib.sha256(target.encode()).hexdigest()[:32] + ".jsonl")
+
+    def load_state(self, file_path: str) -> UploadState:
+        """Get the upload state for the file. If the state has info, the upload of the file can be continued."""
+        state = UploadState(self.state_path())
+        state.load(file_identity(file_path))
+        return state
 
     @property
     def entry_extrafields(self) -> dict:
@@ -70,13 +374,67 @@ class Upload:
 
         return reg_upload.json().get("suuid")
 
-    def upload_file(self, file_path):
+    def upload_file(self, file_path, state: Optional[UploadState] = None):
         """
         Take a file and make chunks out of it to upload
+
+        With a concurrency above 1, the chunks are uploaded by a pool of threads and can arrive at the server in any
+        order. If a chunk fails, chunks that did not start yet are skipped and the error of the chunk is raised.
+
+        With an upload state that is loaded for this file, the chunk layout of the state is used and the chunks in the
+        state are skipped. Otherwise, the layout is saved in the state and each uploaded chunk is added to it.
         """
-        self.resumable_file = resumable.file.ResumableFile(file_path, 1 * diskunit.MiB)  # type: ignore
-        for chunk in self.resumable_file.chunks:
+        resumed = state is not None and state.info is not None
+        if resumed:
+            chunk_size = state.info["chunk_size"]  # type: ignore
+        else:
+            chunk_size = self.chunk_size_policy.chunk_size(os.path.getsize(file_path), self.concurrency)
+        self.resumable_file = resumable.file.ResumableFile(file_path, chunk_size)  # type: ignore
+        chunks = self.resumable_file.chunks  # type: ignore
+
+        if resumed:
+            self.resumable_file.unique_identifier = uuid.UUID(state.info["identifier"])  # type: ignore
+            chunks = [chunk for chunk in chunks if chunk.index + 1 not in state.chunks]  # type: ignore
+            click.echo(
+                f"Continuing the upload, {len(state.chunks)} of {len(self.resumable_file.chunks)} "  # type: ignore
+                "chunks are already uploaded"
+            )
+        elif state is not None and len(chunks) > 1:
+            state.start(
+                {
+                    "suuid": self.suuid,
+                    "chunk_size": chunk_size,
+                    "total_chunks": len(chunks),
+                    "identifier": str(self.resumable_file.unique_identifier),  # type: ignore
+                    "file": state.file,
+                }
+            )
+        else:
+            state = None
+
+        def upload_chunk(chunk):
             self.upload_chunk(chunk)
+            if state is not None:
+                state.add_chunk(chunk.index + 1)
+
+        try:
+            max_workers = min(self.concurrency, len(chunks))
+            if max_workers <= 1:
+                for chunk in chunks:
+                    upload_chunk(chunk)
+                return
+
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="askanna-upload") as executor:
+                futures = [executor.submit(upload_chunk, chunk) for chunk in chunks]
+                _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+
+            for future in futures:
+                if not future.cancelled() and future.exception() is not None:
+                    raise future.exception()  # type: ignore
+        finally:
+            self.resumable_file.close()  # type: ignore
 
     @property
     def chunk_dict_template(self) -> dict:
@@ -99,7 +457,9 @@ class Upload:
         )
 
         # Register chunk on the server
+        start = time.perf_counter()
         reg_chunk = client.post(self.register_chunk_url(), json=chunk_dict)
+        latency = time.perf_counter() - start
         if reg_chunk.status_code != 201:
             raise PostError(
                 "In the AskAnna platform something went wrong with creating the chunk entry for file_no "
@@ -107,7 +467,6 @@ class Upload:
             )
         chunk_uuid = reg_chunk.json().get("uuid")
 
-        files = {"file": io.BytesIO(chunk.read())}
         data = self.chunk_baseinfo
         data.update(
             **{
@@ -116,16 +475,25 @@ class Upload:
             }
         )
 
-        upload_chunk_response = client.post(
-            self.upload_chunk_url(chunk_uuid=chunk_uuid),
-            data=data,
-            files=files,
-        )
+        start = time.perf_counter()
+        upload_chunk_response = self.post_chunk(chunk, chunk_uuid, data)
 
         if upload_chunk_response.status_code != 200:
             raise PostError(
                 f"Chunk with file_no '{chunk_dict.get('file_no')}' and chunk UUID '{chunk_uuid}' could not be uploaded"
             )
+        self.chunk_size_policy.record(chunk.size, latency, time.perf_counter() - start)
+
+    def post_chunk(self, chunk, chunk_uuid: str, data: dict) -> requests.Response:
+        """Send the content of the chunk with the form data, reading the chunk from the file while it is sent"""
+        offset = chunk.index * self.resumable_file.chunk_size  # type: ignore
+        with FileSlice(self.resumable_file.path, offset, chunk.size) as file:  # type: ignore
+            body = MultipartBody(data, "file", file)
+            return client.post(
+                self.upload_chunk_url(chunk_uuid=chunk_uuid),
+                data=body,
+                headers={"Content-Type": body.content_type},
+            )
 
     def finish_upload(self):
         # Do final call when all chunks are uploaded
@@ -142,10 +510,17 @@ class PackageUpload(Upload):
     message_upload_success = "Package is uploaded"
     message_upload_fail = "Package upload failed"
 
-    def __init__(self, project_suuid: str, description: Optional[str] = None):
+    def __init__(
+        self,
+        project_suuid: str,
+        description: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        chunk_size_policy: Optional[ChunkSizePolicy] = None,
+        resume: Optional[bool] = None,
+    ):
         self.project_suuid = project_suuid
         self.description = description
-        super().__init__()
+        super().__init__(concurrency=concurrency, chunk_size_policy=chunk_size_policy, resume=resume)
 
     def register_upload_url(self) -> str:
         return client.askanna_url.package.base_package_url
@@ -177,9 +552,15 @@ class ArtifactUpload(Upload):
     message_upload_success = "Artifact is uploaded"
     message_upload_fail = "Artifact upload failed"
 
-    def __init__(self, run_suuid: str):
+    def __init__(
+        self,
+        run_suuid: str,
+        concurrency: Optional[int] = None,
+        chunk_size_policy: Optional[ChunkSizePolicy] = None,
+        resume: Optional[bool] = None,
+    ):
         self.run_suuid = run_suuid
-        super().__init__()
+        super().__init__(concurrency=concurrency, chunk_size_policy=chunk_size_policy, resume=resume)
 
     def register_upload_url(self) -> str:
         if self.run_suuid:
@@ -206,9 +587,15 @@ class ResultUpload(Upload):
     message_upload_success = "Result is uploaded"
     message_upload_fail = "Result upload failed"
 
-    def __init__(self, run_suuid: str):
+    def __init__(
+        self,
+        run_suuid: str,
+        concurrency: Optional[int] = None,
+        chunk_size_policy: Optional[ChunkSizePolicy] = None,
+        resume: Optional[bool] = None,
+    ):
         self.run_suuid = run_suuid
-        super().__init__()
+        super().__init__(concurrency=concurrency, chunk_size_policy=chunk_size_policy, resume=resume)
 
     def register_upload_url(self) -> str:
         if self.run_suuid:
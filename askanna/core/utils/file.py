@@ -1,18 +1,46 @@
+import hashlib
+import io
 import mimetypes
 import os
+import shutil
+import stat
 from typing import List, Union
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
 
 import click
 import igittigitt
 
+# Timestamp of all files in a reproducible zip file, the earliest timestamp a zip file supports
+REPRODUCIBLE_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def zip_file_reproducible(zip_file: ZipFile, file: str) -> None:
+    """
+    Add a file to a zip file with only the path, content and executable bit of the file, so zipping the same files
+    again gives a zip file with the same bytes
+
+    The path is stored with forward slashes, the timestamp is REPRODUCIBLE_ZIP_DATE_TIME and the permissions are
+    0o755 for executable files and 0o644 for other files.
+    """
+    file_stat = os.stat(file)
+    info = ZipInfo(os.path.normpath(file).replace(os.sep, "/"), date_time=REPRODUCIBLE_ZIP_DATE_TIME)
+    info.create_system = 3  # Unix, so the permissions are read the same on every platform
+    mode = 0o755 if file_stat.st_mode & stat.S_IXUSR else 0o644
+    info.external_attr = (stat.S_IFREG | mode) << 16
+    info.compress_type = zip_file.compression
+    info.file_size = file_stat.st_size
+
+    with open(file, "rb") as source, zip_file.open(info, "w") as target:
+        shutil.copyfileobj(source, target, 1024**2)
+
 
 def zip_files_in_dir(directory_path: str, zip_file: ZipFile, ignore_file: Union[str, None] = None) -> None:
-    # Zip the files that matches the filter from given directory
+    # Zip the files that matches the filter from given directory. The files are added in sorted order without
+    # timestamps, so the zip file only changes when the files change.
     files = get_files_in_dir(directory_path=directory_path, ignore_file=ignore_file)
     # Iterate over all the files and zip them
     for file in sorted(files):
-        zip_file.write(file)
+        zip_file_reproducible(zip_file, file)
 
 
 def get_files_in_dir(directory_path: str, ignore_file: Union[str, None] = None) -> set:
@@ -121,6 +149,73 @@ def file_type(path):
     return "" if type_ is None else type_
 
 
+def file_sha256(path: Union[str, os.PathLike], block_size: int = 1024**2) -> str:
+    """Get the SHA-256 hex digest of the content of a file, without reading the whole file in memory"""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+class FileSlice(io.RawIOBase):
+    """
+    Read-only file object for `length` bytes of a file, starting at `offset`
+
+    The bytes are read from the file when they are requested, so sending a slice in a request body does not load the
+    slice in memory. Reads use os.preadv if available, which reads at an offset into the buffer of the caller, so
+    slices of the same file can be read by several threads without a lock or an extra copy.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], offset: int, length: int):
+        super().__init__()
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self.position = 0
+        self.fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.length
+        self.position = min(max(offset, 0), self.length)
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self.length - self.position)
+        if size <= 0:
+            return 0
+        if hasattr(os, "preadv"):
+            # Read directly into the buffer of the caller
+            read = os.preadv(self.fd, [memoryview(buffer)[:size]], self.offset + self.position)
+        else:
+            os.lseek(self.fd, self.offset + self.position, os.SEEK_SET)
+            data = os.read(self.fd, size)
+            read = len(data)
+            buffer[:read] = data
+        self.position += read
+        return read
+
+    def close(self) -> None:
+        if not self.closed:
+            os.close(self.fd)
+        super().close()
+
+
 def content_type_file_extension(content_type: str) -> str:
     content_type_file_extension_mapping = {
         "application/csv": ".csv",
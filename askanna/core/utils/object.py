@@ -1,5 +1,17 @@
 import datetime
-from typing import Any, Tuple
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    ORJSON_INSTALLED = False
+else:
+    ORJSON_INSTALLED = True
+
+# The JSON backend to encode request bodies with: "orjson" or "json". By default orjson is used if it's installed.
+JSON_BACKEND = os.getenv("AA_JSON_BACKEND", "orjson" if ORJSON_INSTALLED else "json")
 
 supported_data_types = {
     # primitive types
@@ -95,53 +107,112 @@ def object_fullname(o):
         return module + "." + o.__class__.__name__
 
 
-def get_type(value: Any) -> str:
+# The full name and the supported data type per Python type. Building the full name of a type is relatively
+# expensive, and tracking metrics often repeats the same types, so we do it once per type.
+type_info_cache: Dict[type, Tuple[str, Optional[str]]] = {}
+
+# The supported data type of the values per NumPy dtype. Getting the name of a dtype is slow, so we cache it.
+numpy_dtype_cache: Dict[Any, Optional[str]] = {}
+
+# Data types of list items by exact type. Lists with only these types are typed without checking every value.
+list_item_data_types = {
+    bool: "boolean",
+    int: "integer",
+    float: "float",
+    str: "string",
+    datetime.datetime: "datetime",
+    datetime.time: "time",
+    datetime.date: "date",
+}
+
+# Data types of array.array items by typecode
+array_typecode_data_types = {
+    **{typecode: "integer" for typecode in "bBhHiIlLqQ"},
+    "f": "float",
+    "d": "float",
+}
+
+
+def type_info(value: Any) -> Tuple[str, Optional[str]]:
     """
-    Return the full name of the type, if not listed, return the typename from the input
+    Return the full name of the type of the value and the supported data type, or None if the type is not supported
     """
-    typename = object_fullname(value)
-    dtype = supported_data_types.get(typename, typename)
+    value_type = value.__class__
+    try:
+        return type_info_cache[value_type]
+    except KeyError:
+        typename = object_fullname(value)
+        info = type_info_cache[value_type] = (typename, supported_data_types.get(typename))
+        return info
 
-    if typename in ("numpy.array", "numpy.ndarray"):
-        dtype_list = supported_data_types.get("numpy." + value.dtype.name)
-        if dtype_list:
-            dtype = "list_" + dtype_list
-    elif typename == "list":
-        dtype_list = None
-        for val in value:
-            dtype_val = None
-            if isinstance(val, bool):
-                dtype_val = "boolean"
-            elif isinstance(val, int):
-                dtype_val = "integer"
-            elif isinstance(val, float):
-                dtype_val = "float"
-            elif isinstance(val, str):
-                dtype_val = "string"
-            elif isinstance(val, datetime.datetime):
-                dtype_val = "datetime"
-            elif isinstance(val, datetime.time):
-                dtype_val = "time"
-            elif isinstance(val, datetime.date):
-                dtype_val = "date"
+
+def get_list_type(values: list) -> Optional[str]:
+    """
+    Return the data type of the values in the list if all values have the same supported data type, else None
+    """
+    value_types = set(map(type, values))
+    if value_types <= list_item_data_types.keys():
+        if len(value_types) == 1:
+            return list_item_data_types[value_types.pop()]
+        if value_types == {int, float}:
+            return "float"
+        return None
+
+    # The list contains subclasses of the supported types, or values that are not supported
+    dtype_list = None
+    for val in values:
+        dtype_val = None
+        if isinstance(val, bool):
+            dtype_val = "boolean"
+        elif isinstance(val, int):
+            dtype_val = "integer"
+        elif isinstance(val, float):
+            dtype_val = "float"
+        elif isinstance(val, str):
+            dtype_val = "string"
+        elif isinstance(val, datetime.datetime):
+            dtype_val = "datetime"
+        elif isinstance(val, datetime.time):
+            dtype_val = "time"
+        elif isinstance(val, datetime.date):
+            dtype_val = "date"
+        else:
+            return None
+
+        if not dtype_list:
+            dtype_list = dtype_val
+
+        if dtype_list != dtype_val:
+            if dtype_list in ("integer", "float") and dtype_val in ("integer", "float"):
+                dtype_list = "float"
             else:
-                dtype_list = "unknown"
-                break
+                return None
 
-            if not dtype_list:
-                dtype_list = dtype_val
+    return dtype_list
 
-            if dtype_list and dtype_list != dtype_val:
-                if dtype_list in ("integer", "float") and dtype_val in ("integer", "float"):
-                    dtype_list = "float"
-                else:
-                    dtype_list = "mixed"
-                    break
 
-        if dtype_list and dtype_list not in ("mixed", "unknown"):
+def get_type(value: Any) -> str:
+    """
+    Return the full name of the type, if not listed, return the typename from the input
+    """
+    typename, dtype = type_info(value)
+
+    if dtype == "list":
+        if typename == "list":
+            dtype_list = get_list_type(value)
+        else:
+            try:
+                dtype_list = numpy_dtype_cache[value.dtype]
+            except KeyError:
+                dtype_list = numpy_dtype_cache[value.dtype] = supported_data_types.get("numpy." + value.dtype.name)
+        if dtype_list:
+            dtype = "list_" + dtype_list
+    elif typename == "array.array":
+        dtype_list = array_typecode_data_types.get(value.typecode)
+        if dtype_list:
             dtype = "list_" + dtype_list
 
-    return dtype
+    return dtype or typename
 
 
 def validate_value(value: Any) -> bool:
@@ -149,15 +220,18 @@ def validate_value(value: Any) -> bool:
     Validate whether the value set is supported
     """
 
-    return object_fullname(value) in supported_data_types
+    return type_info(value)[1] is not None
 
 
 def transform_value(value: Any) -> Tuple[Any, bool]:
     """
     Transform values in support datatypes
     """
-    if object_fullname(value) == "range":
+    typename = type_info(value)[0]
+    if typename == "range":
         return list(value), True
+    if typename == "array.array":
+        return value.tolist(), True
 
     return value, False
 
@@ -177,6 +251,40 @@ def prepare_and_validate_value(value: Any) -> Tuple[Any, bool]:
     return value, False
 
 
+numpy_kind_data_types = {
+    "b": "boolean",
+    "i": "integer",
+    "u": "integer",
+    "f": "float",
+    "U": "string",
+}
+
+
+def prepare_series(values: Any) -> Tuple[List[Any], Optional[str]]:
+    """
+    Transform a one-dimensional NumPy array or a sequence to a list and determine the type of the values. If the
+    values do not all have the same supported type, the type returned is None.
+    """
+    if NUMPY_INSTALLED and isinstance(values, np.ndarray):
+        if values.ndim != 1:
+            raise ValueError(f"Only one-dimensional arrays are supported, the array has {values.ndim} dimensions")
+        return values.tolist(), numpy_kind_data_types.get(values.dtype.kind)
+
+    if isinstance(values, (str, bytes, dict)):
+        raise TypeError(f"The values should be an array or a sequence, not '{object_fullname(values)}'")
+
+    values = list(values)
+    dtype = get_type(values)
+    if not values or not dtype.startswith("list_"):
+        return values, None
+
+    dtype = dtype[len("list_") :]
+    if dtype == "float":
+        # A list with integer and float values is typed float, so we make sure all values are floats
+        values = [float(value) for value in values]
+    return values, dtype
+
+
 def value_not_empty(value: Any) -> bool:
     """
     Check if the value is not empty
@@ -207,3 +315,32 @@ def json_serializer(obj):
     if NUMPY_INSTALLED:
         return serialize_numpy_for_json(obj)
     return obj
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    Encode a value to JSON bytes in one pass, for example to use as request body. Datetimes and NumPy values are
+    encoded the same way as with json_serializer.
+
+    If orjson is installed, it is used to encode the value. orjson encodes datetimes and NumPy arrays natively and is a
+    lot faster than the json module. Set the environment variable AA_JSON_BACKEND to "json" to use the json module.
+
+    NaN and infinite floats are not valid in JSON and raise a ValueError with both backends.
+    """
+    if JSON_BACKEND == "orjson" and ORJSON_INSTALLED:
+        try:
+            encoded = orjson.dumps(
+                obj,
+                default=json_serializer,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # For example integers larger than 64-bit or times with a timezone, which the json module can encode
+            pass
+        else:
+            # orjson encodes NaN and infinite floats as null. If there is a null in the result, we encode the value
+            # with the json module, which raises a ValueError for them.
+            if b"null" not in encoded:
+                return encoded
+
+    return json.dumps(obj, default=json_serializer, allow_nan=False).encode("utf-8")
@@ -1,5 +1,36 @@
 import collections
+import os
+from typing import Callable, TypeVar
+
+import click
 
 StorageUnit = collections.namedtuple("StorageUnit", ["B", "KiB", "MiB", "GiB", "TiB", "PiB"])
 
 diskunit = StorageUnit(B=1, KiB=1024**1, MiB=1024**2, GiB=1024**3, TiB=1024**4, PiB=1024**5)
+
+T = TypeVar("T", int, float)
+
+
+def env_number(name: str, default: T, type: Callable[[str], T] = float) -> T:
+    """Read a number from an environment variable
+
+    Settings that are read when askanna is imported should not make the import fail, so if the value is not a valid
+    number we print a warning and use the default.
+
+    Args:
+        name (str): Name of the environment variable
+        default (int | float): Value to use when the environment variable is not set or not valid
+        type (Callable): Function to convert the value with, for example int or float. Defaults to float.
+
+    Returns:
+        int | float: The number
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+
+    try:
+        return type(value)
+    except ValueError:
+        click.echo(f"The value '{value}' of {name} is not a valid number. AskAnna uses {default} instead.", err=True)
+        return default
@@ -1,25 +1,268 @@
-import json
+import datetime
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
 
+import click
 import requests
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import NewConnectionError
 
 from askanna import ASKANNA_VERSION, USING_ASKANNA_CLI
 from askanna.config import config
 from askanna.config.api_url import askanna_url
 from askanna.core.exceptions import ConnectionError
-from askanna.core.utils.object import json_serializer
+from askanna.core.utils.object import encode_json
+from askanna.settings import (
+    DEFAULT_HTTP_BACKOFF_FACTOR,
+    DEFAULT_HTTP_BACKOFF_MAX,
+    DEFAULT_HTTP_CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_HTTP_CIRCUIT_BREAKER_TIMEOUT,
+    DEFAULT_HTTP_POOL_CONNECTIONS,
+    DEFAULT_HTTP_POOL_MAXSIZE,
+    DEFAULT_HTTP_RETRIES,
+    DEFAULT_HTTP_RETRY_AFTER_MAX,
+    DEFAULT_TRACE_FORMAT,
+)
+
+from .trace import TRACE_FORMATS, RequestEvent, enable_trace, endpoint_template
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+# With these status codes the backend did not handle the request, so requests with any method can be retried
+NOT_HANDLED_STATUS_CODES = frozenset([429, 503])
+# Status codes that count as a failure of the backend for the circuit breaker
+FAILURE_STATUS_CODES = frozenset([502, 503, 504])
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Get the number of seconds to wait from a Retry-After header, which is a number of seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+def body_size(body) -> int:
+    """Get the size in bytes of a request or response body"""
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode())
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if hasattr(body, "__len__"):
+        return len(body)
+    try:
+        return os.fstat(body.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def request_not_sent(error: requests.exceptions.ConnectionError) -> bool:
+    """Check if the connection failed before the request was sent, so the backend did not handle the request"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class RetryPolicy:
+    """
+    Policy for retrying requests that failed because of a connection error or a temporary error of the backend
+
+    Requests with an idempotent method (GET, HEAD, OPTIONS, PUT and DELETE) are retried after connection errors and
+    responses with status 429, 502, 503 or 504. Requests with other methods are only retried when the backend did not
+    handle the request: when the connection failed before the request was sent, or for status 429 and 503. The retry
+    argument of Client.request changes this per request.
+
+    Before each retry we wait a random time between 0 and backoff_factor * 2^retry seconds, with a maximum of
+    backoff_max seconds. If the response has a Retry-After header, we wait the time in the header.
+    """
+
+    def __init__(
+        self,
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+    ):
+        self.retries = int(os.getenv("AA_HTTP_RETRIES", DEFAULT_HTTP_RETRIES)) if retries is None else retries
+        self.backoff_factor = (
+            float(os.getenv("AA_HTTP_BACKOFF_FACTOR", DEFAULT_HTTP_BACKOFF_FACTOR))
+            if backoff_factor is None
+            else backoff_factor
+        )
+        self.backoff_max = (
+            float(os.getenv("AA_HTTP_BACKOFF_MAX", DEFAULT_HTTP_BACKOFF_MAX)) if backoff_max is None else backoff_max
+        )
+
+    def retry_status(self, method: str, status_code: int, retry: Optional[bool] = None) -> bool:
+        if status_code not in RETRY_STATUS_CODES or retry is False:
+            return False
+        return retry or method in IDEMPOTENT_METHODS or status_code in NOT_HANDLED_STATUS_CODES
+
+    def retry_error(
+        self, method: str, error: requests.exceptions.ConnectionError, retry: Optional[bool] = None
+    ) -> bool:
+        if retry is False:
+            return False
+        return retry or method in IDEMPOTENT_METHODS or request_not_sent(error)
+
+    def delay(self, retry_number: int, response: Optional[requests.Response] = None) -> float:
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, DEFAULT_HTTP_RETRY_AFTER_MAX)
+
+        # Random jitter, so clients that failed at the same time don't retry at the same time
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * 2**retry_number))  # nosec: B311
+
+
+class CircuitBreaker:
+    """
+    Fail fast when a host is down
+
+    When threshold requests in a row to a host fail with a connection error or a status 502, 503 or 504, the circuit
+    for the host opens. For timeout seconds, requests to the host raise a ConnectionError without trying. After that,
+    one request is let through. If it succeeds, the circuit closes again, otherwise it stays open for another timeout.
+    Set threshold to 0 to disable the circuit breaker.
+    """
+
+    def __init__(self, threshold: Optional[int] = None, timeout: Optional[float] = None):
+        self.threshold = (
+            int(os.getenv("AA_HTTP_CIRCUIT_BREAKER_THRESHOLD", DEFAULT_HTTP_CIRCUIT_BREAKER_THRESHOLD))
+            if threshold is None
+            else threshold
+        )
+        self.timeout = (
+            float(os.getenv("AA_HTTP_CIRCUIT_BREAKER_TIMEOUT", DEFAULT_HTTP_CIRCUIT_BREAKER_TIMEOUT))
+            if timeout is None
+            else timeout
+        )
+        self.failures: Dict[str, int] = {}
+        self.opened_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def check(self, url: str) -> None:
+        """
+        Raises:
+            ConnectionError: The circuit for the host of the URL is open
+        """
+        if not self.threshold:
+            return
+
+        host = urlsplit(url).netloc
+        with self._lock:
+            opened_at = self.opened_at.get(host)
+            if opened_at is None:
+                return
+
+            wait = opened_at + self.timeout - time.monotonic()
+            if wait > 0:
+                raise ConnectionError(
+                    f"The AskAnna backend at {host} failed {self.failures[host]} times in a row. We try again in "
+                    f"{wait:.0f} seconds."
+                )
+            # Let this request through to try if the host is back, other requests keep failing fast until it's done
+            self.opened_at[host] = time.monotonic()
+
+    def record_success(self, url: str) -> None:
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.failures.pop(host, None)
+            self.opened_at.pop(host, None)
+
+    def record_failure(self, url: str) -> None:
+        if not self.threshold:
+            return
+
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.failures[host] = self.failures.get(host, 0) + 1
+            if self.failures[host] >= self.threshold:
+                self.opened_at[host] = time.monotonic()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.failures.clear()
+            self.opened_at.clear()
 
 
 class Client:
     """
     Client for communication with AskAnna API service
+
+    The client can be used from several threads at the same time. Each thread gets its own requests session, because
+    sessions are not thread-safe. The sessions share one HTTP adapter, so all threads use the same pool of connections
+    that are kept alive. Set the size of the pool with AA_HTTP_POOL_CONNECTIONS (number of hosts) and
+    AA_HTTP_POOL_MAXSIZE (number of connections per host).
+
+    Failed requests are retried according to the RetryPolicy, and the CircuitBreaker makes requests fail fast when
+    the backend is down. See these classes for the environment variables to configure them.
+
+    Functions added with add_hook are called with a RequestEvent after each request. Set AA_TRACE to a file path to
+    save statistics per endpoint and all requests to that file when Python exits. AA_TRACE_FORMAT sets the format of
+    the file: json (default) or chrome for the Chrome trace event format.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
         self.config = config
         self.askanna_url = askanna_url
-        self.session = requests.Session()
-        self.session.headers.update(self.generate_authenication_header())
+
+        if pool_connections is None:
+            pool_connections = int(os.getenv("AA_HTTP_POOL_CONNECTIONS", DEFAULT_HTTP_POOL_CONNECTIONS))
+        if pool_maxsize is None:
+            pool_maxsize = int(os.getenv("AA_HTTP_POOL_MAXSIZE", DEFAULT_HTTP_POOL_MAXSIZE))
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.headers = self.generate_authenication_header()
+        self.headers_version = 0
+        self._headers_lock = threading.Lock()
+        self._local = threading.local()
+
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.hooks: List[Callable[[RequestEvent], None]] = []
+
+    @property
+    def session(self) -> requests.Session:
+        """The requests session of the current thread"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            self._local.session = session
+            self._local.headers_version = None
+
+        if self._local.headers_version != self.headers_version:
+            with self._headers_lock:
+                session.headers.update(self.headers)
+                self._local.headers_version = self.headers_version
+
+        return session
+
+    @session.setter
+    def session(self, session: requests.Session):
+        self._local.session = session
+        self._local.headers_version = None
 
     def generate_authenication_header(self) -> CaseInsensitiveDict:
         askanna_agent = USING_ASKANNA_CLI and "cli" or "python-sdk"
@@ -37,62 +280,170 @@ class Client:
         return auth_header
 
     def update_session(self):
-        self.session.headers.update(self.generate_authenication_header())
+        """Update the headers of the sessions of all threads, for example after the token changed"""
+        with self._headers_lock:
+            self.headers.update(self.generate_authenication_header())
+            self.headers_version += 1
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """Call the hook with a RequestEvent after each request, from the thread that did the request"""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        self.hooks.remove(hook)
+
+    def _call_hooks(
+        self,
+        method: str,
+        url: str,
+        kwargs: dict,
+        start: float,
+        duration: float,
+        retries: int,
+        response: Optional[requests.Response],
+        error: Optional[Exception],
+    ) -> None:
+        if response is not None:
+            request_bytes = body_size(response.request.body)
+            if kwargs.get("stream"):
+                # Don't read a streamed response, the caller reads it
+                response_bytes = int(response.headers.get("Content-Length") or 0)
+            else:
+                response_bytes = len(response.content or b"")
+        else:
+            request_bytes = body_size(kwargs.get("data"))
+            response_bytes = 0
+
+        event = RequestEvent(
+            method=method,
+            url=url,
+            endpoint=endpoint_template(url),
+            status_code=response.status_code if response is not None else None,
+            start=start,
+            duration=duration,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+            retries=retries,
+            thread_id=threading.get_ident(),
+            error=str(error) if error else None,
+        )
+        for hook in list(self.hooks):
+            try:
+                hook(event)
+            except Exception as e:
+                click.echo(f"Request hook {hook!r} failed: {e}", err=True)
 
     def _connection_error_message(self, url, error):
         connection_error_message_base = "Something went wrong. Please check whether the URL is an AskAnna Backend."
         return f"{connection_error_message_base}\n    URL:    {url}\n    Error: {error}"
 
-    def get(self, url, **kwargs):
+    def _encode_json_body(self, kwargs: dict) -> dict:
+        """Encode the json argument of a request to the request body in one pass, instead of letting requests do it"""
+        if kwargs.get("json") is None or kwargs.get("data"):
+            # Like requests, ignore json if data is set
+            return kwargs
+
+        kwargs["data"] = encode_json(kwargs.pop("json"))
+        headers = CaseInsensitiveDict(kwargs.get("headers") or {})
+        headers.setdefault("Content-Type", "application/json")
+        kwargs["headers"] = headers
+        return kwargs
+
+    def request(self, method: str, url: str, retry: Optional[bool] = None, **kwargs) -> requests.Response:
+        """
+        Do a request with the session of the current thread, and retry it if it fails according to the retry policy
+
+        Args:
+            method (str): HTTP method
+            url (str): URL of the request
+            retry (bool, optional): Retry the request also if the method is not idempotent (True) or never retry the
+                request (False). Defaults to None, which retries based on the method.
+            **kwargs: Arguments for requests.Session.request
+
+        Raises:
+            ConnectionError: Could not connect to the backend, or the circuit breaker is open
+
+        Returns:
+            requests.Response: The response of the last try
+        """
+        method = method.upper()
+        kwargs = self._encode_json_body(kwargs)
+        if kwargs.get("files") or hasattr(kwargs.get("data"), "read"):
+            # A file is read while sending the request, so we cannot send the same request again
+            retry = False
+
+        start, start_counter = time.time(), time.perf_counter()
+        retry_number = 0
+        response = error = None
         try:
-            return self.session.get(url, **kwargs)
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionError(self._connection_error_message(url, e))
+            while True:
+                self.circuit_breaker.check(url)
+                can_retry = retry_number < self.retry_policy.retries
+
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except requests.exceptions.ConnectionError as e:
+                    self.circuit_breaker.record_failure(url)
+                    if not can_retry or not self.retry_policy.retry_error(method, e, retry):
+                        raise ConnectionError(self._connection_error_message(url, e))
+                    delay = self.retry_policy.delay(retry_number)
+                else:
+                    if response.status_code in FAILURE_STATUS_CODES:
+                        self.circuit_breaker.record_failure(url)
+                    else:
+                        self.circuit_breaker.record_success(url)
+
+                    if not can_retry or not self.retry_policy.retry_status(method, response.status_code, retry):
+                        return response
+                    delay = self.retry_policy.delay(retry_number, response)
+                    response.close()
+                    response = None
+
+                time.sleep(delay)
+                retry_number += 1
+        except ConnectionError as e:
+            error = e
+            raise
+        finally:
+            if self.hooks:
+                self._call_hooks(
+                    method, url, kwargs, start, time.perf_counter() - start_counter, retry_number, response, error
+                )
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
 
     def head(self, url, **kwargs):
-        try:
-            return self.session.head(url, **kwargs)
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionError(self._connection_error_message(url, e))
+        # Like requests.head, don't follow redirects so the caller can read the Location of a redirect
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
 
     def patch(self, url, **kwargs):
-        if kwargs.get("json"):
-            kwargs["json"] = json.loads(json.dumps(kwargs.get("json"), default=json_serializer))
-
-        try:
-            return self.session.patch(url, **kwargs)
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionError(self._connection_error_message(url, e))
+        return self.request("PATCH", url, **kwargs)
 
     def put(self, url, **kwargs):
-        if kwargs.get("json"):
-            kwargs["json"] = json.loads(json.dumps(kwargs.get("json"), default=json_serializer))
-
-        try:
-            return self.session.put(url, **kwargs)
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionError(self._connection_error_message(url, e))
+        return self.request("PUT", url, **kwargs)
 
     def post(self, url, **kwargs):
-        if kwargs.get("json"):
-            kwargs["json"] = json.loads(json.dumps(kwargs.get("json"), default=json_serializer))
-
-        try:
-            return self.session.post(url, **kwargs)
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionError(self._connection_error_message(url, e))
+        return self.request("POST", url, **kwargs)
 
     def create(self, url, **kwargs):
         return self.post(url, **kwargs)
 
     def delete(self, url, **kwargs):
-        if kwargs.get("json"):
-            kwargs["json"] = json.loads(json.dumps(kwargs.get("json"), default=json_serializer))
-
-        try:
-            return self.session.delete(url, **kwargs)
-        except requests.exceptions.ConnectionError as e:
-            raise ConnectionError(self._connection_error_message(url, e))
+        return self.request("DELETE", url, **kwargs)
 
 
 client = Client()
+
+if os.getenv("AA_TRACE"):
+    trace_format = os.getenv("AA_TRACE_FORMAT", DEFAULT_TRACE_FORMAT)
+    if trace_format not in TRACE_FORMATS:
+        # A wrong setting for the trace should not make the import of askanna fail
+        click.echo(
+            f"Trace format '{trace_format}' of AA_TRACE_FORMAT is not supported, use one of: "
+            f"{', '.join(TRACE_FORMATS)}. AskAnna saves the trace in the format '{DEFAULT_TRACE_FORMAT}'.",
+            err=True,
+        )
+        trace_format = DEFAULT_TRACE_FORMAT
+    enable_trace(client, os.environ["AA_TRACE"], trace_format)
@@ -1,17 +1,17 @@
 from typing import List, Optional
 
-from askanna.core.dataclasses.job import Job
+from askanna.config.api_url import askanna_url
+from askanna.core.dataclasses.job import Job, LazyJob
 from askanna.core.dataclasses.run import RunStatus
 from askanna.core.exceptions import DeleteError, GetError, PatchError, PostError
-from askanna.gateways.api_client import client
 
-from .utils import ListResponse
+from .utils import ListResponse, Operation, Request, run_operation
 
 
 class JobListResponse(ListResponse):
     def __init__(self, data: dict):
         super().__init__(data)
-        self.results: List[Job] = [Job.from_dict(job) for job in data["results"]]
+        self.results: List[Job] = [LazyJob(job) for job in data["results"]]
 
     @property
     def jobs(self):
@@ -49,30 +49,17 @@ class JobGateway:
         Returns:
             JobListResponse: The response from the API with a list of jobs and pagination information
         """
-        assert page_size is None or page_size > 0, "page_size must be a positive integer"
-
-        response = client.get(
-            url=client.askanna_url.job.job_list(),
-            params={
-                "project_suuid": project_suuid,
-                "workspace_suuid": workspace_suuid,
-                "page_size": page_size,
-                "cursor": cursor,
-                "order_by": order_by,
-                "search": search,
-            },
+        return run_operation(
+            list_operation(
+                project_suuid=project_suuid,
+                workspace_suuid=workspace_suuid,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+            )
         )
 
-        if response.status_code != 200:
-            error_message = f"{response.status_code} - Something went wrong while retrieving the job list"
-            try:
-                error_message += f":\n  {response.json()}"
-            except ValueError:
-                pass
-            raise GetError(error_message)
-
-        return JobListResponse(response.json())
-
     def detail(self, job_suuid: str) -> Job:
         """Get information of a job
 
@@ -85,20 +72,7 @@ class JobGateway:
         Returns:
             Job: Job information in a Job dataclass
         """
-
-        response = client.get(
-            url=client.askanna_url.job.job_detail(job_suuid),
-        )
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The job SUUID '{job_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving job SUUID '{job_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Job.from_dict(response.json())
+        return run_operation(detail_operation(job_suuid=job_suuid))
 
     def run_request(
         self,
@@ -118,24 +92,7 @@ class JobGateway:
         Returns:
             RunStatus: The run status information in a RunStatus dataclass
         """
-        response = client.post(
-            url=client.askanna_url.job.run_request(job_suuid),
-            json=data,
-            params={
-                "name": name,
-                "description": description,
-            },
-        )
-
-        if response.status_code == 404:
-            raise PostError(f"404 - The job SUUID '{job_suuid}' was not found")
-        if response.status_code != 201:
-            raise PostError(
-                f"{response.status_code} - Something went wrong while starting the run for job SUUID '{job_suuid}': "
-                f"{response.json()}"
-            )
-
-        return RunStatus.from_dict(response.json())
+        return run_operation(run_request_operation(job_suuid=job_suuid, data=data, name=name, description=description))
 
     def change(
         self,
@@ -157,26 +114,7 @@ class JobGateway:
         Returns:
             Job: The changed job information in a Job dataclass
         """
-        changes = {}
-        if name:
-            changes.update({"name": name})
-        if description:
-            changes.update({"description": description})
-
-        if not changes:
-            raise ValueError("At least one of the parameters 'name' or 'description' must be set")
-
-        response = client.patch(url=client.askanna_url.job.job_detail(job_suuid), json=changes)
-
-        if response.status_code == 404:
-            raise PatchError(f"404 - The job SUUID '{job_suuid}' was not found")
-        if response.status_code != 200:
-            raise PatchError(
-                f"{response.status_code} - Something went wrong while updating the job SUUID '{job_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Job.from_dict(response.json())
+        return run_operation(change_operation(job_suuid=job_suuid, name=name, description=description))
 
     def delete(self, job_suuid: str) -> bool:
         """Delete a job
@@ -190,16 +128,129 @@ class JobGateway:
         Returns:
             bool: True if the job was succesfully deleted
         """
-        response = client.delete(
-            url=client.askanna_url.job.job_detail(job_suuid),
+        return run_operation(delete_operation(job_suuid=job_suuid))
+
+
+# The operations build the requests and handle the responses of JobGateway and the async JobGateway in
+# askanna.aio.gateways.job, see Operation in askanna.gateways.utils
+def list_operation(
+    project_suuid: Optional[str] = None,
+    workspace_suuid: Optional[str] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    order_by: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Operation[JobListResponse]:
+    assert page_size is None or page_size > 0, "page_size must be a positive integer"
+
+    response = yield Request(
+        "get",
+        askanna_url.job.job_list(),
+        params={
+            "project_suuid": project_suuid,
+            "workspace_suuid": workspace_suuid,
+            "page_size": page_size,
+            "cursor": cursor,
+            "order_by": order_by,
+            "search": search,
+        },
+    )
+
+    if response.status_code != 200:
+        error_message = f"{response.status_code} - Something went wrong while retrieving the job list"
+        try:
+            error_message += f":\n  {response.json()}"
+        except ValueError:
+            pass
+        raise GetError(error_message)
+
+    return JobListResponse(response.json())
+
+
+def detail_operation(job_suuid: str) -> Operation[Job]:
+
+    response = yield Request(
+        "get",
+        askanna_url.job.job_detail(job_suuid),
+    )
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The job SUUID '{job_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving job SUUID '{job_suuid}': "
+            f"{response.json()}"
         )
 
-        if response.status_code == 404:
-            raise DeleteError(f"404 - The job SUUID '{job_suuid}' was not found")
-        if response.status_code != 204:
-            raise DeleteError(
-                f"{response.status_code} - Something went wrong while deleting the job SUUID '{job_suuid}': "
-                f"{response.json()}"
-            )
+    return Job.from_dict(response.json())
+
+
+def run_request_operation(
+    job_suuid: str,
+    data: Optional[dict] = None,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Operation[RunStatus]:
+    response = yield Request(
+        "post",
+        askanna_url.job.run_request(job_suuid),
+        json=data,
+        params={
+            "name": name,
+            "description": description,
+        },
+    )
+
+    if response.status_code == 404:
+        raise PostError(f"404 - The job SUUID '{job_suuid}' was not found")
+    if response.status_code != 201:
+        raise PostError(
+            f"{response.status_code} - Something went wrong while starting the run for job SUUID '{job_suuid}': "
+            f"{response.json()}"
+        )
+
+    return RunStatus.from_dict(response.json())
+
+
+def change_operation(
+    job_suuid: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Operation[Job]:
+    changes = {}
+    if name:
+        changes.update({"name": name})
+    if description:
+        changes.update({"description": description})
+
+    if not changes:
+        raise ValueError("At least one of the parameters 'name' or 'description' must be set")
+
+    response = yield Request("patch", askanna_url.job.job_detail(job_suuid), json=changes)
+
+    if response.status_code == 404:
+        raise PatchError(f"404 - The job SUUID '{job_suuid}' was not found")
+    if response.status_code != 200:
+        raise PatchError(
+            f"{response.status_code} - Something went wrong while updating the job SUUID '{job_suuid}': "
+            f"{response.json()}"
+        )
+
+    return Job.from_dict(response.json())
+
+
+def delete_operation(job_suuid: str) -> Operation[bool]:
+    response = yield Request(
+        "delete",
+        askanna_url.job.job_detail(job_suuid),
+    )
+
+    if response.status_code == 404:
+        raise DeleteError(f"404 - The job SUUID '{job_suuid}' was not found")
+    if response.status_code != 204:
+        raise DeleteError(
+            f"{response.status_code} - Something went wrong while deleting the job SUUID '{job_suuid}': "
+            f"{response.json()}"
+        )
 
-        return True
+    return True
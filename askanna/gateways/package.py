@@ -1,18 +1,17 @@
 from pathlib import Path
 from typing import List, Optional, Union
 
-from askanna.core.dataclasses.package import Package
-from askanna.core.download import ChunkedDownload
+from askanna.config.api_url import askanna_url
+from askanna.core.dataclasses.package import LazyPackage, Package
 from askanna.core.exceptions import GetError
-from askanna.gateways.api_client import client
 
-from .utils import ListResponse
+from .utils import Download, ListResponse, Operation, Request, run_operation
 
 
 class PackageListResponse(ListResponse):
     def __init__(self, data: dict):
         super().__init__(data)
-        self.results: List[Package] = [Package.from_dict(package) for package in data["results"]]
+        self.results: List[Package] = [LazyPackage(package) for package in data["results"]]
 
     @property
     def packages(self):
@@ -54,32 +53,19 @@ class PackageGateway:
         Returns:
             PackageListResponse: The response from the API with a list of packages and pagination information
         """
-        assert page_size is None or page_size > 0, "page_size must be a positive integer"
-
-        response = client.get(
-            url=client.askanna_url.package.package_list(),
-            params={
-                "project_suuid": project_suuid,
-                "workspace_suuid": workspace_suuid,
-                "created_by_name": created_by_name,
-                "created_by_suuid": created_by_suuid,
-                "page_size": page_size,
-                "cursor": cursor,
-                "order_by": order_by,
-                "search": search,
-            },
+        return run_operation(
+            list_operation(
+                project_suuid=project_suuid,
+                workspace_suuid=workspace_suuid,
+                created_by_name=created_by_name,
+                created_by_suuid=created_by_suuid,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+            )
         )
 
-        if response.status_code != 200:
-            error_message = f"{response.status_code} - Something went wrong while retrieving package list"
-            try:
-                error_message += f":\n  {response.json()}"
-            except ValueError:
-                pass
-            raise GetError(error_message)
-
-        return PackageListResponse(response.json())
-
     def detail(self, package_suuid: str) -> Package:
         """Get information of a package
 
@@ -92,20 +78,7 @@ class PackageGateway:
         Returns:
             Package: Package information in a Package dataclass
         """
-
-        response = client.get(
-            url=client.askanna_url.package.package_detail(package_suuid),
-        )
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The package SUUID '{package_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving package SUUID '{package_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Package.from_dict(response.json())
+        return run_operation(detail_operation(package_suuid=package_suuid))
 
     def download(self, package_suuid: str, output_path: Optional[Union[Path, str]] = None) -> Union[bytes, None]:
         """Download a package
@@ -120,41 +93,103 @@ class PackageGateway:
         Returns:
             bytes or None: The package as bytes or None if output_path is set
         """
-        url = client.askanna_url.package.package_download(package_suuid)
-        response = client.get(url)
+        return run_operation(download_operation(package_suuid=package_suuid, output_path=output_path))
+
+
+# The operations build the requests and handle the responses of PackageGateway and the async PackageGateway in
+# askanna.aio.gateways.package, see Operation in askanna.gateways.utils
+def list_operation(
+    project_suuid: Optional[str] = None,
+    workspace_suuid: Optional[str] = None,
+    created_by_name: Optional[str] = None,
+    created_by_suuid: Optional[str] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    order_by: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Operation[PackageListResponse]:
+    assert page_size is None or page_size > 0, "page_size must be a positive integer"
+
+    response = yield Request(
+        "get",
+        askanna_url.package.package_list(),
+        params={
+            "project_suuid": project_suuid,
+            "workspace_suuid": workspace_suuid,
+            "created_by_name": created_by_name,
+            "created_by_suuid": created_by_suuid,
+            "page_size": page_size,
+            "cursor": cursor,
+            "order_by": order_by,
+            "search": search,
+        },
+    )
+
+    if response.status_code != 200:
+        error_message = f"{response.status_code} - Something went wrong while retrieving package list"
+        try:
+            error_message += f":\n  {response.json()}"
+        except ValueError:
+            pass
+        raise GetError(error_message)
+
+    return PackageListResponse(response.json())
+
+
+def detail_operation(package_suuid: str) -> Operation[Package]:
+
+    response = yield Request(
+        "get",
+        askanna_url.package.package_detail(package_suuid),
+    )
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The package SUUID '{package_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving package SUUID '{package_suuid}': "
+            f"{response.json()}"
+        )
+
+    return Package.from_dict(response.json())
+
+
+def download_operation(
+    package_suuid: str, output_path: Optional[Union[Path, str]] = None
+) -> Operation[Union[bytes, None]]:
+    url = askanna_url.package.package_download(package_suuid)
+    response = yield Request("get", url)
+
+    if response.status_code == 404:
+        raise GetError(f"404 - Package SUUID '{package_suuid}' was not found")
+    elif response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the package SUUID '{package_suuid}': "
+            + str(response.json())
+        )
+
+    download_url = response.json().get("target")
+
+    if output_path:
+        status_code = yield Download(download_url, output_path)
+
+        if status_code == 404:
+            raise GetError(f"404 - Package SUUID '{package_suuid}' was not found")
+        if status_code != 200:
+            raise GetError(
+                f"{status_code} - Something went wrong while retrieving the package SUUID '{package_suuid}'"
+            )
+
+        return None
+    else:
+        response = yield Request("get", download_url)
 
         if response.status_code == 404:
             raise GetError(f"404 - Package SUUID '{package_suuid}' was not found")
-        elif response.status_code != 200:
+        if response.status_code != 200:
             raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the package SUUID '{package_suuid}': "
-                + str(response.json())
+                f"{response.status_code} - Something went wrong while retrieving the package SUUID "
+                f"'{package_suuid}': {response.json()}"
             )
 
-        download_url = response.json().get("target")
-
-        if output_path:
-            download = ChunkedDownload(download_url)
-
-            if download.status_code == 404:
-                raise GetError(f"404 - Package SUUID '{package_suuid}' was not found")
-            if download.status_code != 200:
-                raise GetError(
-                    f"{download.status_code} - Something went wrong while retrieving the pacakage SUUID "
-                    f"'{package_suuid}'"
-                )
-
-            download.download(output_path)
-            return None
-        else:
-            response = client.get(download_url, stream=True)
-
-            if response.status_code == 404:
-                raise GetError(f"404 - Package SUUID '{package_suuid}' was not found")
-            if response.status_code != 200:
-                raise GetError(
-                    f"{response.status_code} - Something went wrong while retrieving the package SUUID "
-                    f"'{package_suuid}': {response.json()}"
-                )
-
-            return response.content
+        return response.content
@@ -1,17 +1,17 @@
 from typing import List, Optional
 
+from askanna.config.api_url import askanna_url
 from askanna.core.dataclasses.base import VISIBILITY
-from askanna.core.dataclasses.project import Project
+from askanna.core.dataclasses.project import LazyProject, Project
 from askanna.core.exceptions import CreateError, DeleteError, GetError, PatchError
-from askanna.gateways.api_client import client
 
-from .utils import ListResponse
+from .utils import ListResponse, Operation, Request, run_operation
 
 
 class ProjectListResponse(ListResponse):
     def __init__(self, data: dict):
         super().__init__(data)
-        self.results: List[Project] = [Project.from_dict(project) for project in data["results"]]
+        self.results: List[Project] = [LazyProject(project) for project in data["results"]]
 
     @property
     def projects(self):
@@ -50,35 +50,18 @@ class ProjectGateway:
         Returns:
             ProjectListResponse: The response from the API with a list of projects and pagination information.
         """
-        assert page_size is None or page_size > 0, "page_size must be a positive integer"
-        assert is_member is None or isinstance(is_member, bool), "is_member must be a boolean"
-        if visibility is not None:
-            visibility = visibility.lower()  # type: ignore
-            assert visibility in ["public", "private"], "visibility must be 'public' or 'private'"
-
-        response = client.get(
-            url=client.askanna_url.project.project_list(),
-            params={
-                "workspace_suuid": workspace_suuid,
-                "page_size": page_size,
-                "cursor": cursor,
-                "order_by": order_by,
-                "search": search,
-                "is_member": is_member,
-                "visibility": visibility,
-            },
+        return run_operation(
+            list_operation(
+                workspace_suuid=workspace_suuid,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+                is_member=is_member,
+                visibility=visibility,
+            )
         )
 
-        if response.status_code != 200:
-            error_message = f"{response.status_code} - Something went wrong while retrieving the project list"
-            try:
-                error_message += f":\n  {response.json()}"
-            except ValueError:
-                pass
-            raise GetError(error_message)
-
-        return ProjectListResponse(response.json())
-
     def detail(self, project_suuid: str) -> Project:
         """Get information of a project
 
@@ -91,19 +74,7 @@ class ProjectGateway:
         Returns:
             Project: Project information in a Project dataclass
         """
-        response = client.get(
-            url=client.askanna_url.project.project_detail(project_suuid=project_suuid),
-        )
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The project SUUID '{project_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving project SUUID '{project_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Project.from_dict(response.json())
+        return run_operation(detail_operation(project_suuid=project_suuid))
 
     def create(self, workspace_suuid: str, name: str, description: str = "", visibility: str = "PRIVATE") -> Project:
         """Create a new project
@@ -121,28 +92,11 @@ class ProjectGateway:
         Returns:
             Project: The information of the newly created project in a Project dataclass
         """
-        if visibility and visibility not in ["PUBLIC", "PRIVATE"]:
-            raise ValueError("Visibility must be either PUBLIC or PRIVATE")
-
-        if description is None:
-            description = ""
-
-        response = client.create(
-            url=client.askanna_url.project.project(),
-            json={
-                "workspace_suuid": workspace_suuid,
-                "name": name,
-                "description": description,
-                "visibility": visibility,
-            },
-        )
-
-        if response.status_code != 201:
-            raise CreateError(
-                f"{response.status_code} - Something went wrong while creating the project: {response.json()}"
+        return run_operation(
+            create_operation(
+                workspace_suuid=workspace_suuid, name=name, description=description, visibility=visibility
             )
-
-        return Project.from_dict(response.json())
+        )
 
     def change(
         self,
@@ -167,35 +121,10 @@ class ProjectGateway:
         Returns:
             Project: The changed project information in a Project dataclass
         """
-
-        changes = {}
-        if name:
-            changes.update({"name": name})
-        if description:
-            changes.update({"description": description})
-        if visibility:
-            if visibility not in ["PUBLIC", "PRIVATE"]:
-                raise ValueError("Visibility must be either PUBLIC or PRIVATE")
-            changes.update({"visibility": visibility})
-
-        if not changes:
-            raise ValueError("At least one of the parameters 'name', 'description' or 'visibility' must be set.")
-
-        response = client.patch(
-            url=client.askanna_url.project.project_detail(project_suuid=project_suuid),
-            json=changes,
+        return run_operation(
+            change_operation(project_suuid=project_suuid, name=name, description=description, visibility=visibility)
         )
 
-        if response.status_code == 404:
-            raise PatchError(f"404 - The project SUUID '{project_suuid}' was not found")
-        if response.status_code != 200:
-            raise PatchError(
-                f"{response.status_code} - Something went wrong while updating the project SUUID '{project_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Project.from_dict(response.json())
-
     def delete(self, project_suuid: str) -> bool:
         """Delete a project
 
@@ -208,16 +137,145 @@ class ProjectGateway:
         Returns:
             bool: True if the project was succesfully deleted
         """
-        response = client.delete(
-            url=client.askanna_url.project.project_detail(project_suuid),
+        return run_operation(delete_operation(project_suuid=project_suuid))
+
+
+# The operations build the requests and handle the responses of ProjectGateway and the async ProjectGateway in
+# askanna.aio.gateways.project, see Operation in askanna.gateways.utils
+def list_operation(
+    workspace_suuid: Optional[str] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    order_by: Optional[str] = None,
+    search: Optional[str] = None,
+    is_member: Optional[bool] = None,
+    visibility: Optional[VISIBILITY] = None,
+) -> Operation[ProjectListResponse]:
+    assert page_size is None or page_size > 0, "page_size must be a positive integer"
+    assert is_member is None or isinstance(is_member, bool), "is_member must be a boolean"
+    if visibility is not None:
+        visibility = visibility.lower()  # type: ignore
+        assert visibility in ["public", "private"], "visibility must be 'public' or 'private'"
+
+    response = yield Request(
+        "get",
+        askanna_url.project.project_list(),
+        params={
+            "workspace_suuid": workspace_suuid,
+            "page_size": page_size,
+            "cursor": cursor,
+            "order_by": order_by,
+            "search": search,
+            "is_member": is_member,
+            "visibility": visibility,
+        },
+    )
+
+    if response.status_code != 200:
+        error_message = f"{response.status_code} - Something went wrong while retrieving the project list"
+        try:
+            error_message += f":\n  {response.json()}"
+        except ValueError:
+            pass
+        raise GetError(error_message)
+
+    return ProjectListResponse(response.json())
+
+
+def detail_operation(project_suuid: str) -> Operation[Project]:
+    response = yield Request(
+        "get",
+        askanna_url.project.project_detail(project_suuid=project_suuid),
+    )
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The project SUUID '{project_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving project SUUID '{project_suuid}': "
+            f"{response.json()}"
         )
 
-        if response.status_code == 404:
-            raise DeleteError(f"404 - The project SUUID '{project_suuid}' was not found")
-        if response.status_code != 204:
-            raise DeleteError(
-                f"{response.status_code} - Something went wrong while deleting the project SUUID '{project_suuid}': "
-                f"{response.json()}"
-            )
+    return Project.from_dict(response.json())
+
+
+def create_operation(
+    workspace_suuid: str, name: str, description: str = "", visibility: str = "PRIVATE"
+) -> Operation[Project]:
+    if visibility and visibility not in ["PUBLIC", "PRIVATE"]:
+        raise ValueError("Visibility must be either PUBLIC or PRIVATE")
+
+    if description is None:
+        description = ""
+
+    response = yield Request(
+        "create",
+        askanna_url.project.project(),
+        json={
+            "workspace_suuid": workspace_suuid,
+            "name": name,
+            "description": description,
+            "visibility": visibility,
+        },
+    )
+
+    if response.status_code != 201:
+        raise CreateError(
+            f"{response.status_code} - Something went wrong while creating the project: {response.json()}"
+        )
+
+    return Project.from_dict(response.json())
+
+
+def change_operation(
+    project_suuid: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    visibility: Optional[str] = None,
+) -> Operation[Project]:
+
+    changes = {}
+    if name:
+        changes.update({"name": name})
+    if description:
+        changes.update({"description": description})
+    if visibility:
+        if visibility not in ["PUBLIC", "PRIVATE"]:
+            raise ValueError("Visibility must be either PUBLIC or PRIVATE")
+        changes.update({"visibility": visibility})
+
+    if not changes:
+        raise ValueError("At least one of the parameters 'name', 'description' or 'visibility' must be set.")
+
+    response = yield Request(
+        "patch",
+        askanna_url.project.project_detail(project_suuid=project_suuid),
+        json=changes,
+    )
+
+    if response.status_code == 404:
+        raise PatchError(f"404 - The project SUUID '{project_suuid}' was not found")
+    if response.status_code != 200:
+        raise PatchError(
+            f"{response.status_code} - Something went wrong while updating the project SUUID '{project_suuid}': "
+            f"{response.json()}"
+        )
+
+    return Project.from_dict(response.json())
+
+
+def delete_operation(project_suuid: str) -> Operation[bool]:
+    response = yield Request(
+        "delete",
+        askanna_url.project.project_detail(project_suuid),
+    )
+
+    if response.status_code == 404:
+        raise DeleteError(f"404 - The project SUUID '{project_suuid}' was not found")
+    if response.status_code != 204:
+        raise DeleteError(
+            f"{response.status_code} - Something went wrong while deleting the project SUUID '{project_suuid}': "
+            f"{response.json()}"
+        )
 
-        return True
+    return True
@@ -1,11 +1,13 @@
 from pathlib import Path
 from typing import List, Optional, Union
 
+from askanna.config.api_url import askanna_url
 from askanna.core.dataclasses.job import Payload
 from askanna.core.dataclasses.run import (
     STATUS,
     TRIGGER,
     ArtifactInfo,
+    LazyRun,
     MetricList,
     MetricObject,
     Run,
@@ -13,7 +15,6 @@ from askanna.core.dataclasses.run import (
     VariableList,
     VariableObject,
 )
-from askanna.core.download import ChunkedDownload
 from askanna.core.exceptions import (
     DeleteError,
     GetError,
@@ -21,15 +22,14 @@ from askanna.core.exceptions import (
     PatchError,
     PutError,
 )
-from askanna.gateways.api_client import client
 
-from .utils import ListResponse
+from .utils import Download, ListResponse, Operation, Request, run_operation
 
 
 class RunListResponse(ListResponse):
     def __init__(self, data: dict):
         super().__init__(data)
-        self.results: List[Run] = [Run.from_dict(run) for run in data["results"]]
+        self.results: List[Run] = [LazyRun(run) for run in data["results"]]
 
     @property
     def runs(self):
@@ -107,53 +107,31 @@ class RunGateway:
         Returns:
             RunListResponse: The response from the API with a list of runs and pagination information
         """
-        if page_size is not None and (
-            (isinstance(page_size, int) and page_size <= 0)
-            or isinstance(page_size, bool)
-            or not isinstance(page_size, int)
-        ):
-            raise ValueError("page_size must be a positive integer")
-
-        run_suuid = None
-        if run_suuid_list and len(run_suuid_list) > 0:
-            run_suuid = ",".join(run_suuid_list)
-
-        response = client.get(
-            url=client.askanna_url.run.run_list(),
-            params={
-                "status": status,
-                "status__exclude": status__exclude,
-                "run_suuid": run_suuid,
-                "run_suuid__exclude": run_suuid__exclude,
-                "job_suuid": job_suuid,
-                "job_suuid__exclude": job_suuid__exclude,
-                "project_suuid": project_suuid,
-                "project_suuid__exclude": project_suuid__exclude,
-                "workspace_suuid": workspace_suuid,
-                "workspace_suuid__exclude": workspace_suuid__exclude,
-                "created_by_suuid": created_by_suuid,
-                "created_by_suuid__exclude": created_by_suuid__exclude,
-                "trigger": trigger,
-                "trigger__exclude": trigger__exclude,
-                "package_suuid": package_suuid,
-                "package_suuid__exclude": package_suuid__exclude,
-                "page_size": page_size,
-                "cursor": cursor,
-                "order_by": order_by,
-                "search": search,
-            },
+        return run_operation(
+            list_operation(
+                status=status,
+                status__exclude=status__exclude,
+                run_suuid_list=run_suuid_list,
+                run_suuid__exclude=run_suuid__exclude,
+                job_suuid=job_suuid,
+                job_suuid__exclude=job_suuid__exclude,
+                project_suuid=project_suuid,
+                project_suuid__exclude=project_suuid__exclude,
+                workspace_suuid=workspace_suuid,
+                workspace_suuid__exclude=workspace_suuid__exclude,
+                created_by_suuid=created_by_suuid,
+                created_by_suuid__exclude=created_by_suuid__exclude,
+                trigger=trigger,
+                trigger__exclude=trigger__exclude,
+                package_suuid=package_suuid,
+                package_suuid__exclude=package_suuid__exclude,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+            )
         )
 
-        if response.status_code != 200:
-            error_message = f"{response.status_code} - Something went wrong while retrieving the run list"
-            try:
-                error_message += f":\n  {response.json()}"
-            except ValueError:
-                pass
-            raise GetError(error_message)
-
-        return RunListResponse(response.json())
-
     def detail(self, run_suuid: str) -> Run:
         """Get information of a run
 
@@ -166,18 +144,7 @@ class RunGateway:
         Returns:
             Run: Run information in a Run dataclass
         """
-        url = client.askanna_url.run.run_detail(run_suuid)
-        response = client.get(url)
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving run SUUID '{run_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Run.from_dict(response.json())
+        return run_operation(detail_operation(run_suuid=run_suuid))
 
     def change(self, run_suuid: str, name: Optional[str] = None, description: Optional[str] = None) -> Run:
         """Change the name and/or description of a run
@@ -194,27 +161,7 @@ class RunGateway:
         Returns:
             Run: The changed run information in a Run dataclass
         """
-        changes = {}
-        if name:
-            changes.update({"name": name})
-        if description:
-            changes.update({"description": description})
-
-        if not changes:
-            raise ValueError("At least one of the parameters 'name' or 'description' must be set.")
-
-        url = client.askanna_url.run.run_detail(run_suuid)
-        response = client.patch(url, json=changes)
-
-        if response.status_code == 404:
-            raise PatchError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise PatchError(
-                f"{response.status_code} - Something went wrong while updating the run SUUID '{run_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Run.from_dict(response.json())
+        return run_operation(change_operation(run_suuid=run_suuid, name=name, description=description))
 
     def delete(self, run_suuid: str) -> bool:
         """Delete a run
@@ -228,19 +175,7 @@ class RunGateway:
         Returns:
             bool: True if the run was succesfully deleted
         """
-        response = client.delete(
-            url=client.askanna_url.run.run_detail(run_suuid),
-        )
-
-        if response.status_code == 404:
-            raise DeleteError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 204:
-            raise DeleteError(
-                f"{response.status_code} - Something went wrong while deleting the run SUUID '{run_suuid}': "
-                f"{response.json()}"
-            )
-
-        return True
+        return run_operation(delete_operation(run_suuid=run_suuid))
 
     def status(self, run_suuid: str) -> RunStatus:
         """Get the status of a run
@@ -254,19 +189,7 @@ class RunGateway:
         Returns:
             RunStatus: The status of the run in a RunStatus dataclass
         """
-        response = client.get(
-            url=client.askanna_url.run.status(run_suuid),
-        )
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the status of run SUUID "
-                f"'{run_suuid}': {response.json()}"
-            )
-
-        return RunStatus.from_dict(response.json())
+        return run_operation(status_operation(run_suuid=run_suuid))
 
     def manifest(
         self,
@@ -287,34 +210,7 @@ class RunGateway:
         Returns:
             bytes: The manifest of the run
         """
-        url = client.askanna_url.run.manifest(run_suuid)
-
-        if output_path:
-            download = ChunkedDownload(url)
-
-            if download.status_code == 404:
-                raise GetError(f"404 - The manifest for run SUUID '{run_suuid}' was not found")
-            if download.status_code != 200:
-                raise GetError(
-                    f"{download.status_code} - Something went wrong while retrieving the manifest for run SUUID "
-                    f"'{run_suuid}'"
-                )
-
-            download.download(output_file=output_path, overwrite=overwrite)
-            return None
-
-        else:
-            response = client.get(url)
-
-            if response.status_code == 404:
-                raise GetError(f"404 - The manifest for run SUUID '{run_suuid}' was not found")
-            if response.status_code != 200:
-                raise GetError(
-                    f"{response.status_code} - Something went wrong while retrieving the manifest for run SUUID "
-                    f"'{run_suuid}': {response.json()}"
-                )
-
-            return response.content
+        return run_operation(manifest_operation(run_suuid=run_suuid, output_path=output_path, overwrite=overwrite))
 
     def metric(self, run_suuid: str) -> MetricList:
         """Get the metrics of a run
@@ -328,39 +224,22 @@ class RunGateway:
         Returns:
             MetricList: The metrics of the run in a MetricList dataclass
         """
-        url = client.askanna_url.run.metric(run_suuid)
-        response = client.get(url)
+        return run_operation(metric_operation(run_suuid=run_suuid))
 
-        if response.status_code == 404:
-            raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the metrics of run SUUID "
-                f"'{run_suuid}': {response.json()}"
-            )
-
-        return MetricList(metrics=[MetricObject.from_dict(metric) for metric in response.json()["results"]])
-
-    def metric_update(self, run_suuid: str, metrics: MetricList) -> None:
+    def metric_update(self, run_suuid: str, metrics: MetricList, partial: bool = False) -> None:
         """Update the metrics of a run
 
         Args:
             run_suuid (str): SUUID of the run you want to update the metrics of
             metrics (MetricList): The list of metrics you want to save
+            partial (bool, optional): Add the metrics to the metrics already saved for the run instead of replacing
+              them. Defaults to False.
 
         Raises:
             PutError: Error based on response status code with the error message from the API
+            PatchError: Error based on response status code with the error message from the API if partial is True
         """
-        url = client.askanna_url.run.metric_detail(run_suuid)
-        response = client.put(url, json={"metrics": metrics.to_dict()})
-
-        if response.status_code == 404:
-            raise PutError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise PutError(
-                f"{response.status_code} - Something went wrong while updating metrics of run SUUID '{run_suuid}': "
-                f"{response.json()}"
-            )
+        return run_operation(metric_update_operation(run_suuid=run_suuid, metrics=metrics, partial=partial))
 
     def variable(self, run_suuid: str) -> VariableList:
         """Get the variables of a run
@@ -374,18 +253,7 @@ class RunGateway:
         Returns:
             VariableList: The variables of the run in a VariableList dataclass
         """
-        url = client.askanna_url.run.variable(run_suuid)
-        response = client.get(url)
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the variables of run SUUID "
-                f"'{run_suuid}': {response.json()}"
-            )
-
-        return VariableList(variables=[VariableObject.from_dict(variable) for variable in response.json()["results"]])
+        return run_operation(variable_operation(run_suuid=run_suuid))
 
     def variable_update(self, run_suuid: str, variables: VariableList) -> None:
         """Update the variables of a run
@@ -397,16 +265,7 @@ class RunGateway:
         Raises:
             PatchError: Error based on response status code with the error message from the API
         """
-        url = client.askanna_url.run.variable_detail(run_suuid)
-        response = client.patch(url, json={"variables": variables.to_dict()})
-
-        if response.status_code == 404:
-            raise PatchError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise PatchError(
-                f"{response.status_code} - Something went wrong while updating variables of run SUUID '{run_suuid}': "
-                f"{response.json()}"
-            )
+        return run_operation(variable_update_operation(run_suuid=run_suuid, variables=variables))
 
     def log(self, run_suuid: str, limit: Optional[int] = -1, offset: Optional[int] = None) -> List:
         """Get the log of a run
@@ -422,23 +281,7 @@ class RunGateway:
         Returns:
             log (List): The log of the run in a list. Each record is a list with 3 items: index, datetime and log line.
         """
-        response = client.get(
-            url=client.askanna_url.run.log(run_suuid),
-            params={
-                "limit": limit,
-                "offset": offset,
-            },
-        )
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the log of run SUUID '{run_suuid}': "
-                f"{response.json()}"
-            )
-
-        return list(response.json().get("results", []))
+        return run_operation(log_operation(run_suuid=run_suuid, limit=limit, offset=offset))
 
     def payload_info(self, run_suuid: str) -> Union[Payload, None]:
         """Get the payload info of a run
@@ -452,23 +295,7 @@ class RunGateway:
         Returns:
             Payload or None: The payload info of the run in a Payload dataclass, or None in case there is no payload
         """
-        url = client.askanna_url.run.payload_list(run_suuid)
-        response = client.get(url)
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The run with run SUUID '{run_suuid}' was not found")
-        elif response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the payload list of run SUUID "
-                f"'{run_suuid}': {response.json()}"
-            )
-
-        # The payload list is a list of dicts, but we only want the first one because there could only be one payload
-        # per run.
-        if len(response.json()) > 0:
-            return Payload.from_dict(response.json()[0])
-        else:
-            return None
+        return run_operation(payload_info_operation(run_suuid=run_suuid))
 
     def payload(
         self, run_suuid: str, payload_suuid: str, output_path: Optional[Union[Path, str]] = None
@@ -486,34 +313,9 @@ class RunGateway:
         Returns:
             bytes or None: The payload of the run in bytes, or None if output_path is set
         """
-        url = client.askanna_url.run.payload_download(run_suuid, payload_suuid)
-
-        if output_path:
-            download = ChunkedDownload(url)
-
-            if download.status_code == 404:
-                raise GetError(f"404 - The payload for run SUUID '{run_suuid}' was not found")
-            if download.status_code != 200:
-                raise GetError(
-                    f"{download.status_code} - Something went wrong while retrieving the payload for run SUUID "
-                    f"'{run_suuid}'"
-                )
-
-            download.download(output_path)
-            return None
-
-        else:
-            response = client.get(url)
-
-            if response.status_code == 404:
-                raise GetError(f"404 - The payload for run SUUID '{run_suuid}' was not found")
-            if response.status_code != 200:
-                raise GetError(
-                    f"{response.status_code} - Something went wrong while retrieving the payload for run SUUID "
-                    f"'{run_suuid}': {response.json()}"
-                )
-
-            return response.content
+        return run_operation(
+            payload_operation(run_suuid=run_suuid, payload_suuid=payload_suuid, output_path=output_path)
+        )
 
     def result(self, run_suuid: str, output_path: Optional[Union[Path, str]] = None) -> Union[bytes, None]:
         """Get the result of a run and optionally save it to a file
@@ -528,34 +330,7 @@ class RunGateway:
         Returns:
             bytes or None: The result of the run in bytes, or None if output_path is set
         """
-        url = client.askanna_url.run.result(run_suuid)
-
-        if output_path:
-            download = ChunkedDownload(url)
-
-            if download.status_code == 404:
-                raise GetError(f"404 - The result for run SUUID '{run_suuid}' was not found")
-            if download.status_code != 200:
-                raise GetError(
-                    f"{download.status_code} - Something went wrong while retrieving the result for run SUUID "
-                    f"'{run_suuid}'"
-                )
-
-            download.download(output_path)
-            return None
-
-        else:
-            response = client.get(url)
-
-            if response.status_code == 404:
-                raise GetError(f"404 - The result for run SUUID '{run_suuid}' was not found")
-            if response.status_code != 200:
-                raise GetError(
-                    f"{response.status_code} - Something went wrong while retrieving the result for run SUUID "
-                    f"'{run_suuid}': {response.json()}"
-                )
-
-            return response.content
+        return run_operation(result_operation(run_suuid=run_suuid, output_path=output_path))
 
     def result_content_type(self, run_suuid: str) -> str:
         """Get the content type of the result of a run
@@ -569,19 +344,7 @@ class RunGateway:
         Returns:
             str: The content type of the result of the run
         """
-
-        url = client.askanna_url.run.result(run_suuid)
-        response = client.head(url)
-
-        if response.status_code == 404:
-            raise HeadError(f"404 - The result for run SUUID '{run_suuid}' was not found")
-        if response.status_code != 200:
-            raise HeadError(
-                f"{response.status_code} - Something went wrong while retrieving the result content type for run "
-                f"SUUID '{run_suuid}': {response.json()}"
-            )
-
-        return str(response.headers.get("Content-Type"))
+        return run_operation(result_content_type_operation(run_suuid=run_suuid))
 
     def artifact(
         self,
@@ -601,92 +364,419 @@ class RunGateway:
         Returns:
             bytes or None: The artifact of the run in bytes, or None if output_path is set
         """
-        artifact_suuid = artifact_suuid or self._get_artifact_suuid(run_suuid)
-        url = client.askanna_url.run.artifact_download(run_suuid, artifact_suuid)
+        return run_operation(
+            artifact_operation(run_suuid=run_suuid, artifact_suuid=artifact_suuid, output_path=output_path)
+        )
+
+    def artifact_info(self, run_suuid: str, artifact_suuid: Optional[str] = None) -> ArtifactInfo:
+        """Get artifact info of a run
+
+        Args:
+            run_suuid (str): SUUID of the run you want to get the artifact of
+            artifact_suuid (str, optional): SUUID of the artifact you want to get the info of. Defaults to None.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Returns:
+            ArtifactInfo: Info about the artifact of a run in a ArtifactInfo dataclass
+        """
+        return run_operation(artifact_info_operation(run_suuid=run_suuid, artifact_suuid=artifact_suuid))
+
+
+# The operations build the requests and handle the responses of RunGateway and the async RunGateway in
+# askanna.aio.gateways.run, see Operation in askanna.gateways.utils
+def list_operation(
+    status: Optional[STATUS] = None,
+    status__exclude: Optional[STATUS] = None,
+    run_suuid_list: Optional[List[str]] = None,
+    run_suuid__exclude: Optional[str] = None,
+    job_suuid: Optional[str] = None,
+    job_suuid__exclude: Optional[str] = None,
+    project_suuid: Optional[str] = None,
+    project_suuid__exclude: Optional[str] = None,
+    workspace_suuid: Optional[str] = None,
+    workspace_suuid__exclude: Optional[str] = None,
+    created_by_suuid: Optional[str] = None,
+    created_by_suuid__exclude: Optional[str] = None,
+    trigger: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+    trigger__exclude: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+    package_suuid: Optional[str] = None,
+    package_suuid__exclude: Optional[str] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    order_by: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Operation[RunListResponse]:
+    if page_size is not None and (
+        (isinstance(page_size, int) and page_size <= 0)
+        or isinstance(page_size, bool)
+        or not isinstance(page_size, int)
+    ):
+        raise ValueError("page_size must be a positive integer")
+
+    run_suuid = None
+    if run_suuid_list and len(run_suuid_list) > 0:
+        run_suuid = ",".join(run_suuid_list)
+
+    response = yield Request(
+        "get",
+        askanna_url.run.run_list(),
+        params={
+            "status": status,
+            "status__exclude": status__exclude,
+            "run_suuid": run_suuid,
+            "run_suuid__exclude": run_suuid__exclude,
+            "job_suuid": job_suuid,
+            "job_suuid__exclude": job_suuid__exclude,
+            "project_suuid": project_suuid,
+            "project_suuid__exclude": project_suuid__exclude,
+            "workspace_suuid": workspace_suuid,
+            "workspace_suuid__exclude": workspace_suuid__exclude,
+            "created_by_suuid": created_by_suuid,
+            "created_by_suuid__exclude": created_by_suuid__exclude,
+            "trigger": trigger,
+            "trigger__exclude": trigger__exclude,
+            "package_suuid": package_suuid,
+            "package_suuid__exclude": package_suuid__exclude,
+            "page_size": page_size,
+            "cursor": cursor,
+            "order_by": order_by,
+            "search": search,
+        },
+    )
+
+    if response.status_code != 200:
+        error_message = f"{response.status_code} - Something went wrong while retrieving the run list"
+        try:
+            error_message += f":\n  {response.json()}"
+        except ValueError:
+            pass
+        raise GetError(error_message)
+
+    return RunListResponse(response.json())
+
+
+def detail_operation(run_suuid: str) -> Operation[Run]:
+    url = askanna_url.run.run_detail(run_suuid)
+    response = yield Request("get", url)
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving run SUUID '{run_suuid}': "
+            f"{response.json()}"
+        )
+
+    return Run.from_dict(response.json())
+
 
-        response = client.get(url)
+def change_operation(run_suuid: str, name: Optional[str] = None, description: Optional[str] = None) -> Operation[Run]:
+    changes = {}
+    if name:
+        changes.update({"name": name})
+    if description:
+        changes.update({"description": description})
+
+    if not changes:
+        raise ValueError("At least one of the parameters 'name' or 'description' must be set.")
+
+    url = askanna_url.run.run_detail(run_suuid)
+    response = yield Request("patch", url, json=changes)
+
+    if response.status_code == 404:
+        raise PatchError(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise PatchError(
+            f"{response.status_code} - Something went wrong while updating the run SUUID '{run_suuid}': "
+            f"{response.json()}"
+        )
+
+    return Run.from_dict(response.json())
+
+
+def delete_operation(run_suuid: str) -> Operation[bool]:
+    response = yield Request(
+        "delete",
+        askanna_url.run.run_detail(run_suuid),
+    )
+
+    if response.status_code == 404:
+        raise DeleteError(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 204:
+        raise DeleteError(
+            f"{response.status_code} - Something went wrong while deleting the run SUUID '{run_suuid}': "
+            f"{response.json()}"
+        )
+
+    return True
+
+
+def status_operation(run_suuid: str) -> Operation[RunStatus]:
+    response = yield Request(
+        "get",
+        askanna_url.run.status(run_suuid),
+    )
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the status of run SUUID "
+            f"'{run_suuid}': {response.json()}"
+        )
+
+    return RunStatus.from_dict(response.json())
+
+
+def manifest_operation(
+    run_suuid: str,
+    output_path: Optional[Union[Path, str]] = None,
+    overwrite: bool = False,
+) -> Operation[Union[bytes, None]]:
+    url = askanna_url.run.manifest(run_suuid)
+
+    if output_path:
+        status_code = yield Download(url, output_path, overwrite=overwrite)
+
+        if status_code == 404:
+            raise GetError(f"404 - The manifest for run SUUID '{run_suuid}' was not found")
+        if status_code != 200:
+            raise GetError(
+                f"{status_code} - Something went wrong while retrieving the manifest for run SUUID '{run_suuid}'"
+            )
+
+        return None
+
+    else:
+        response = yield Request("get", url)
 
         if response.status_code == 404:
-            raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
+            raise GetError(f"404 - The manifest for run SUUID '{run_suuid}' was not found")
         if response.status_code != 200:
             raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the artifact for run SUUID "
+                f"{response.status_code} - Something went wrong while retrieving the manifest for run SUUID "
                 f"'{run_suuid}': {response.json()}"
             )
 
-        download_url = response.json().get("target")
+        return response.content
 
-        if output_path:
-            download = ChunkedDownload(download_url)
 
-            if download.status_code == 404:
-                raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
-            if download.status_code != 200:
-                raise GetError(
-                    f"{download.status_code} - Something went wrong while retrieving the artifact for run SUUID "
-                    f"'{run_suuid}'"
-                )
+def metric_operation(run_suuid: str) -> Operation[MetricList]:
+    url = askanna_url.run.metric(run_suuid)
+    response = yield Request("get", url)
 
-            download.download(output_path)
-            return None
+    if response.status_code == 404:
+        raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the metrics of run SUUID "
+            f"'{run_suuid}': {response.json()}"
+        )
 
-        else:
-            response = client.get(download_url)
+    return MetricList(metrics=[MetricObject.from_dict(metric) for metric in response.json()["results"]])
 
-            if response.status_code == 404:
-                raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
-            if response.status_code != 200:
-                raise GetError(
-                    f"{response.status_code} - Something went wrong while retrieving the artifact for run SUUID "
-                    f"'{run_suuid}': {response.json()}"
-                )
 
-            return response.content
+def metric_update_operation(run_suuid: str, metrics: MetricList, partial: bool = False) -> Operation[None]:
+    url = askanna_url.run.metric_detail(run_suuid)
+    if partial:
+        response = yield Request("patch", url, json={"metrics": metrics.to_dict()})
+        error_class = PatchError
+    else:
+        response = yield Request("put", url, json={"metrics": metrics.to_dict()})
+        error_class = PutError
 
-    def artifact_info(self, run_suuid: str, artifact_suuid: Optional[str] = None) -> ArtifactInfo:
-        """Get artifact info of a run
+    if response.status_code == 404:
+        raise error_class(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise error_class(
+            f"{response.status_code} - Something went wrong while updating metrics of run SUUID '{run_suuid}': "
+            f"{response.json()}"
+        )
 
-        Args:
-            run_suuid (str): SUUID of the run you want to get the artifact of
-            artifact_suuid (str, optional): SUUID of the artifact you want to get the info of. Defaults to None.
 
-        Raises:
-            GetError: Error based on response status code with the error message from the API
+def variable_operation(run_suuid: str) -> Operation[VariableList]:
+    url = askanna_url.run.variable(run_suuid)
+    response = yield Request("get", url)
 
-        Returns:
-            ArtifactInfo: Info about the artifact of a run in a ArtifactInfo dataclass
-        """
-        artifact_suuid = artifact_suuid or self._get_artifact_suuid(run_suuid)
-        url = client.askanna_url.run.artifact_detail(run_suuid, artifact_suuid)
+    if response.status_code == 404:
+        raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the variables of run SUUID "
+            f"'{run_suuid}': {response.json()}"
+        )
+
+    return VariableList(variables=[VariableObject.from_dict(variable) for variable in response.json()["results"]])
+
+
+def variable_update_operation(run_suuid: str, variables: VariableList) -> Operation[None]:
+    url = askanna_url.run.variable_detail(run_suuid)
+    response = yield Request("patch", url, json={"variables": variables.to_dict()})
+
+    if response.status_code == 404:
+        raise PatchError(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise PatchError(
+            f"{response.status_code} - Something went wrong while updating variables of run SUUID '{run_suuid}': "
+            f"{response.json()}"
+        )
+
+
+def log_operation(run_suuid: str, limit: Optional[int] = -1, offset: Optional[int] = None) -> Operation[List]:
+    response = yield Request(
+        "get",
+        askanna_url.run.log(run_suuid),
+        params={
+            "limit": limit,
+            "offset": offset,
+        },
+    )
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the log of run SUUID '{run_suuid}': "
+            f"{response.json()}"
+        )
+
+    return list(response.json().get("results", []))
+
+
+def payload_info_operation(run_suuid: str) -> Operation[Union[Payload, None]]:
+    url = askanna_url.run.payload_list(run_suuid)
+    response = yield Request("get", url)
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The run with run SUUID '{run_suuid}' was not found")
+    elif response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the payload list of run SUUID "
+            f"'{run_suuid}': {response.json()}"
+        )
+
+    # The payload list is a list of dicts, but we only want the first one because there could only be one payload
+    # per run.
+    if len(response.json()) > 0:
+        return Payload.from_dict(response.json()[0])
+    else:
+        return None
+
+
+def payload_operation(
+    run_suuid: str, payload_suuid: str, output_path: Optional[Union[Path, str]] = None
+) -> Operation[Union[bytes, None]]:
+    url = askanna_url.run.payload_download(run_suuid, payload_suuid)
 
-        response = client.get(url)
+    if output_path:
+        status_code = yield Download(url, output_path)
+
+        if status_code == 404:
+            raise GetError(f"404 - The payload for run SUUID '{run_suuid}' was not found")
+        if status_code != 200:
+            raise GetError(
+                f"{status_code} - Something went wrong while retrieving the payload for run SUUID '{run_suuid}'"
+            )
+
+        return None
+
+    else:
+        response = yield Request("get", url)
 
         if response.status_code == 404:
-            raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
+            raise GetError(f"404 - The payload for run SUUID '{run_suuid}' was not found")
         if response.status_code != 200:
             raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the artifact for run SUUID "
+                f"{response.status_code} - Something went wrong while retrieving the payload for run SUUID "
                 f"'{run_suuid}': {response.json()}"
             )
 
-        return ArtifactInfo.from_dict(response.json())
+        return response.content
 
-    def _get_artifact_suuid(self, run_suuid: str) -> str:
-        """Get the artifact SUUID of the artifact of a run
 
-        Args:
-            run_suuid (str): SUUID of the run you want to get the artifact SUUID of
+def result_operation(run_suuid: str, output_path: Optional[Union[Path, str]] = None) -> Operation[Union[bytes, None]]:
+    url = askanna_url.run.result(run_suuid)
 
-        Raises:
-            GetError: Error based on response status code with the error message from the API
+    if output_path:
+        status_code = yield Download(url, output_path)
 
-        Returns:
-            str: SUUID of the artifact of the run
-        """
-        url = client.askanna_url.run.artifact_list(run_suuid)
-        response = client.get(url)
+        if status_code == 404:
+            raise GetError(f"404 - The result for run SUUID '{run_suuid}' was not found")
+        if status_code != 200:
+            raise GetError(
+                f"{status_code} - Something went wrong while retrieving the result for run SUUID '{run_suuid}'"
+            )
+
+        return None
+
+    else:
+        response = yield Request("get", url)
+
+        if response.status_code == 404:
+            raise GetError(f"404 - The result for run SUUID '{run_suuid}' was not found")
+        if response.status_code != 200:
+            raise GetError(
+                f"{response.status_code} - Something went wrong while retrieving the result for run SUUID "
+                f"'{run_suuid}': {response.json()}"
+            )
+
+        return response.content
+
+
+def result_content_type_operation(run_suuid: str) -> Operation[str]:
+
+    url = askanna_url.run.result(run_suuid)
+    response = yield Request("head", url)
+
+    if response.status_code == 404:
+        raise HeadError(f"404 - The result for run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise HeadError(
+            f"{response.status_code} - Something went wrong while retrieving the result content type for run "
+            f"SUUID '{run_suuid}': {response.json()}"
+        )
+
+    return str(response.headers.get("Content-Type"))
+
+
+def artifact_operation(
+    run_suuid: str,
+    artifact_suuid: Optional[str] = None,
+    output_path: Optional[Union[Path, str]] = None,
+) -> Operation[Union[bytes, None]]:
+    artifact_suuid = artifact_suuid or (yield from get_artifact_suuid_operation(run_suuid))
+    url = askanna_url.run.artifact_download(run_suuid, artifact_suuid)
+
+    response = yield Request("get", url)
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the artifact for run SUUID "
+            f"'{run_suuid}': {response.json()}"
+        )
 
-        if response.status_code == 404 or len(response.json()) == 0:
+    download_url = response.json().get("target")
+
+    if output_path:
+        status_code = yield Download(download_url, output_path)
+
+        if status_code == 404:
+            raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
+        if status_code != 200:
+            raise GetError(
+                f"{status_code} - Something went wrong while retrieving the artifact for run SUUID '{run_suuid}'"
+            )
+
+        return None
+
+    else:
+        response = yield Request("get", download_url)
+
+        if response.status_code == 404:
             raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
         if response.status_code != 200:
             raise GetError(
@@ -694,4 +784,36 @@ class RunGateway:
                 f"'{run_suuid}': {response.json()}"
             )
 
-        return response.json()[0]["suuid"]
+        return response.content
+
+
+def artifact_info_operation(run_suuid: str, artifact_suuid: Optional[str] = None) -> Operation[ArtifactInfo]:
+    artifact_suuid = artifact_suuid or (yield from get_artifact_suuid_operation(run_suuid))
+    url = askanna_url.run.artifact_detail(run_suuid, artifact_suuid)
+
+    response = yield Request("get", url)
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the artifact for run SUUID "
+            f"'{run_suuid}': {response.json()}"
+        )
+
+    return ArtifactInfo.from_dict(response.json())
+
+
+def get_artifact_suuid_operation(run_suuid: str) -> Operation[str]:
+    url = askanna_url.run.artifact_list(run_suuid)
+    response = yield Request("get", url)
+
+    if response.status_code == 404 or len(response.json()) == 0:
+        raise GetError(f"404 - The artifact for run SUUID '{run_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the artifact for run SUUID "
+            f"'{run_suuid}': {response.json()}"
+        )
+
+    return response.json()[0]["suuid"]
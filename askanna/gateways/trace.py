@@ -0,0 +1,209 @@
+import atexit
+import json
+import math
+import os
+import re
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlsplit
+
+import click
+
+SUUID_PATTERN = re.compile(r"^[0-9A-Za-z]{4}-[0-9A-Za-z]{4}-[0-9A-Za-z]{4}-[0-9A-Za-z]{4}$")
+UUID_PATTERN = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+TRACE_FORMATS = ["json", "chrome"]
+
+
+def endpoint_template(url: str) -> str:
+    """Get the path of a URL with the SUUIDs and UUIDs in it replaced by {suuid} and {uuid}
+
+    Example:
+        >>> endpoint_template("https://beta-api.askanna.eu/v1/run/1234-1234-1234-1234/metric/?cursor=123")
+        '/v1/run/{suuid}/metric/'
+    """
+    segments = urlsplit(url).path.split("/")
+    for index, segment in enumerate(segments):
+        if SUUID_PATTERN.match(segment):
+            segments[index] = "{suuid}"
+        elif UUID_PATTERN.match(segment):
+            segments[index] = "{uuid}"
+    return "/".join(segments)
+
+
+@dataclass
+class RequestEvent:
+    """A request done by the API client, including the retries of the request
+
+    The status code and sizes are those of the last try. The status code is None if the request failed with a
+    connection error. The start is a Unix timestamp, and the duration includes the time waiting before retries.
+    """
+
+    method: str
+    url: str
+    endpoint: str
+    status_code: Optional[int]
+    start: float
+    duration: float  # seconds
+    request_bytes: int
+    response_bytes: int
+    retries: int
+    thread_id: int
+    error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.endpoint}"
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Get the q-th percentile of the values with the nearest-rank method"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(values)))
+    return values[rank - 1]
+
+
+class RequestStatistics:
+    """Collect request events of the API client and aggregate them per endpoint
+
+    Add it as a hook of the client to collect the events:
+
+        statistics = RequestStatistics()
+        client.add_hook(statistics)
+    """
+
+    def __init__(self):
+        self.events: List[RequestEvent] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events = []
+
+    def summary(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Get the statistics per endpoint, with the durations in milliseconds
+
+        Returns:
+            dict: For each method and endpoint the number of requests, errors and retries, the total request and
+              response bytes, and the total, p50, p95 and maximum duration. Sorted on total duration, slowest first.
+        """
+        with self._lock:
+            events = list(self.events)
+
+        endpoints = defaultdict(list)
+        for event in events:
+            endpoints[event.name].append(event)
+
+        summary = {}
+        for name, endpoint_events in endpoints.items():
+            durations = [event.duration * 1000 for event in endpoint_events]
+            summary[name] = {
+                "count": len(endpoint_events),
+                "errors": sum(1 for event in endpoint_events if event.status_code is None or event.status_code >= 400),
+                "retries": sum(event.retries for event in endpoint_events),
+                "request_bytes": sum(event.request_bytes for event in endpoint_events),
+                "response_bytes": sum(event.response_bytes for event in endpoint_events),
+                "total_ms": sum(durations),
+                "p50_ms": percentile(durations, 50),
+                "p95_ms": percentile(durations, 95),
+                "max_ms": max(durations),
+            }
+
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+    def to_json(self) -> Dict:
+        with self._lock:
+            events = list(self.events)
+        return {
+            "endpoints": self.summary(),
+            "requests": [asdict(event) for event in events],
+        }
+
+    def to_chrome_trace(self) -> Dict:
+        """Get the requests in the Chrome trace event format, which you can open in chrome://tracing or Perfetto"""
+        with self._lock:
+            events = list(self.events)
+
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": event.name,
+                    "cat": "http",
+                    "ph": "X",
+                    "ts": round(event.start * 1_000_000),
+                    "dur": round(event.duration * 1_000_000),
+                    "pid": pid,
+                    "tid": event.thread_id,
+                    "args": {
+                        "url": event.url,
+                        "status_code": event.status_code,
+                        "request_bytes": event.request_bytes,
+                        "response_bytes": event.response_bytes,
+                        "retries": event.retries,
+                        "error": event.error,
+                    },
+                }
+                for event in events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def dump(self, path: Union[str, Path], trace_format: str = "json") -> None:
+        """Save the collected requests to a file
+
+        Args:
+            path (str | Path): Path of the file
+            trace_format (str, optional): "json" for the statistics per endpoint and all requests, or "chrome" for
+              the Chrome trace event format. Defaults to "json".
+
+        Raises:
+            ValueError: The trace format is not supported
+        """
+        if trace_format == "json":
+            content = self.to_json()
+        elif trace_format == "chrome":
+            content = self.to_chrome_trace()
+        else:
+            raise ValueError(f"Trace format '{trace_format}' is not supported, use one of: {', '.join(TRACE_FORMATS)}")
+
+        with open(path, "w") as f:
+            json.dump(content, f, indent=2)
+
+
+def enable_trace(client, path: Union[str, Path], trace_format: str = "json") -> RequestStatistics:
+    """Collect the requests of the client and save them to a file when Python exits
+
+    Args:
+        client (Client): The API client to trace
+        path (str | Path): Path of the file to save the trace to
+        trace_format (str, optional): Format of the file, "json" or "chrome". Defaults to "json".
+
+    Raises:
+        ValueError: The trace format is not supported
+
+    Returns:
+        RequestStatistics: The statistics that collect the requests
+    """
+    if trace_format not in TRACE_FORMATS:
+        raise ValueError(f"Trace format '{trace_format}' is not supported, use one of: {', '.join(TRACE_FORMATS)}")
+
+    statistics = RequestStatistics()
+    client.add_hook(statistics)
+
+    def dump():
+        try:
+            statistics.dump(path, trace_format)
+        except OSError as e:
+            click.echo(f"Could not save the request trace to '{path}': {e}", err=True)
+
+    atexit.register(dump)
+    return statistics
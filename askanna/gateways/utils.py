@@ -1,6 +1,13 @@
-from typing import Optional
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Generator, Optional, TypeVar, Union
 from urllib.parse import parse_qs, urlsplit
 
+from askanna.core.download import ChunkedDownload
+from askanna.gateways.api_client import client
+
+T = TypeVar("T")
+
 
 class ListResponse:
     def __init__(self, data: dict):
@@ -20,3 +27,47 @@ class ListResponse:
     @property
     def previous_url_cursor(self) -> Optional[str]:
         return self.get_cursor(self.previous_url) if self.previous_url else None
+
+
+class Request:
+    """A request that an operation asks the client to do, the operation gets the response back
+
+    The method is the name of the client method, for example "get" or "create", so the defaults of that method apply.
+    The keyword arguments are passed to the client method.
+    """
+
+    def __init__(self, method: str, url: str, **kwargs):
+        self.method = method
+        self.url = url
+        self.kwargs: Dict[str, Any] = kwargs
+
+
+@dataclass
+class Download:
+    """A download of the URL to a file that an operation asks the client to do, the operation gets the status code"""
+
+    url: str
+    output_file: Union[Path, str]
+    overwrite: bool = False
+
+
+# An operation is a generator that yields the requests of a gateway method, gets the responses back and returns the
+# result of the method. The operations build the requests and handle the responses without doing I/O, so the sync and
+# the async gateways share them and only differ in how they do the requests.
+Operation = Generator[Union[Request, Download], Any, T]
+
+
+def run_operation(operation: Operation[T]) -> T:
+    """Do the requests of an operation with the sync client and return the result of the operation"""
+    try:
+        step = next(operation)
+        while True:
+            if isinstance(step, Download):
+                download = ChunkedDownload(step.url)
+                if download.status_code == 200:
+                    download.download(output_file=step.output_file, overwrite=step.overwrite)
+                step = operation.send(download.status_code)
+            else:
+                step = operation.send(getattr(client, step.method)(step.url, **step.kwargs))
+    except StopIteration as stop:
+        return stop.value
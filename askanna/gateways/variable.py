@@ -1,16 +1,16 @@
 from typing import List, Optional
 
-from askanna.core.dataclasses.variable import Variable
+from askanna.config.api_url import askanna_url
+from askanna.core.dataclasses.variable import LazyVariable, Variable
 from askanna.core.exceptions import DeleteError, GetError, PatchError, PostError
-from askanna.gateways.api_client import client
 
-from .utils import ListResponse
+from .utils import ListResponse, Operation, Request, run_operation
 
 
 class VariableListResponse(ListResponse):
     def __init__(self, data: dict):
         super().__init__(data)
-        self.results: List[Variable] = [Variable.from_dict(variable) for variable in data["results"]]
+        self.results: List[Variable] = [LazyVariable(variable) for variable in data["results"]]
 
     @property
     def variables(self):
@@ -49,32 +49,18 @@ class VariableGateway:
         Returns:
             VariableListResponse: The response from the API with a list of variables and pagination information.
         """
-        assert page_size is None or page_size > 0, "page_size must be a positive integer"
-        assert is_masked is None or isinstance(is_masked, bool), "is_masked must be a boolean"
-
-        response = client.get(
-            url=client.askanna_url.variable.variable(),
-            params={
-                "project_suuid": project_suuid,
-                "workspace_suuid": workspace_suuid,
-                "is_masked": is_masked,
-                "page_size": page_size,
-                "cursor": cursor,
-                "order_by": order_by,
-                "search": search,
-            },
+        return run_operation(
+            list_operation(
+                project_suuid=project_suuid,
+                workspace_suuid=workspace_suuid,
+                is_masked=is_masked,
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+            )
         )
 
-        if response.status_code != 200:
-            error_message = response.json().get("detail", "Something went wrong while retrieving variable list")
-            try:
-                error_message += f": {response.json()}"
-            except ValueError:
-                pass
-            raise GetError(error_message)
-
-        return VariableListResponse(response.json())
-
     def detail(self, variable_suuid: str) -> Variable:
         """Get the details of a variable
 
@@ -84,16 +70,7 @@ class VariableGateway:
         Returns:
             Variable: A variable dataclass
         """
-        response = client.get(url=client.askanna_url.variable.variable_detail(variable_suuid))
-        if response.status_code == 404:
-            raise GetError(f"{response.status_code} - The variable SUUID '{variable_suuid}' was not found")
-        if response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving the variable SUUID "
-                f"'{variable_suuid}': {response.json()}"
-            )
-
-        return Variable.from_dict(response.json())
+        return run_operation(detail_operation(variable_suuid=variable_suuid))
 
     def create(self, project_suuid: str, name: str, value: str, is_masked: bool = False) -> Variable:
         """Create a new variable for a project
@@ -110,25 +87,10 @@ class VariableGateway:
         Returns:
             Variable: A variable dataclass of the newly created variable
         """
-        assert isinstance(is_masked, bool), "is_masked must be a boolean"
-
-        response = client.create(
-            url=client.askanna_url.variable.variable(),
-            json={
-                "name": name,
-                "value": value,
-                "is_masked": is_masked,
-                "project_suuid": project_suuid,
-            },
+        return run_operation(
+            create_operation(project_suuid=project_suuid, name=name, value=value, is_masked=is_masked)
         )
 
-        if response.status_code != 201:
-            raise PostError(
-                f"{response.status_code} - Something went wrong while creating the variable: {response.json()}"
-            )
-
-        return Variable.from_dict(response.json())
-
     def change(
         self,
         variable_suuid: str,
@@ -153,33 +115,10 @@ class VariableGateway:
         Returns:
             Variable: The updated variable in a Variable dataclass
         """
-        changes = {}
-        if name:
-            changes.update({"name": name})
-        if value:
-            changes.update({"value": value})
-        if is_masked:
-            assert isinstance(is_masked, bool), "is_masked must be a boolean"
-            changes.update({"is_masked": is_masked})
-
-        if not changes:
-            raise ValueError("At least one of the arguments 'name', 'value' or 'is_masked' should be provided.")
-
-        response = client.patch(
-            url=client.askanna_url.variable.variable_detail(variable_suuid),
-            json=changes,
+        return run_operation(
+            change_operation(variable_suuid=variable_suuid, name=name, value=value, is_masked=is_masked)
         )
 
-        if response.status_code == 404:
-            raise PatchError(f"{response.status_code} - The variable SUUID '{variable_suuid}' was not found")
-        if response.status_code != 200:
-            raise PatchError(
-                f"{response.status_code} - Something went wrong while updating the variable SUUID '{variable_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Variable.from_dict(response.json())
-
     def delete(self, variable_suuid: str) -> bool:
         """Delete a variable
 
@@ -192,16 +131,130 @@ class VariableGateway:
         Returns:
             bool: True if the variable was succesfully deleted
         """
-        response = client.delete(
-            url=client.askanna_url.variable.variable_detail(variable_suuid),
+        return run_operation(delete_operation(variable_suuid=variable_suuid))
+
+
+# The operations build the requests and handle the responses of VariableGateway and the async VariableGateway in
+# askanna.aio.gateways.variable, see Operation in askanna.gateways.utils
+def list_operation(
+    project_suuid: Optional[str] = None,
+    workspace_suuid: Optional[str] = None,
+    is_masked: Optional[bool] = None,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    order_by: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Operation[VariableListResponse]:
+    assert page_size is None or page_size > 0, "page_size must be a positive integer"
+    assert is_masked is None or isinstance(is_masked, bool), "is_masked must be a boolean"
+
+    response = yield Request(
+        "get",
+        askanna_url.variable.variable(),
+        params={
+            "project_suuid": project_suuid,
+            "workspace_suuid": workspace_suuid,
+            "is_masked": is_masked,
+            "page_size": page_size,
+            "cursor": cursor,
+            "order_by": order_by,
+            "search": search,
+        },
+    )
+
+    if response.status_code != 200:
+        error_message = response.json().get("detail", "Something went wrong while retrieving variable list")
+        try:
+            error_message += f": {response.json()}"
+        except ValueError:
+            pass
+        raise GetError(error_message)
+
+    return VariableListResponse(response.json())
+
+
+def detail_operation(variable_suuid: str) -> Operation[Variable]:
+    response = yield Request("get", askanna_url.variable.variable_detail(variable_suuid))
+    if response.status_code == 404:
+        raise GetError(f"{response.status_code} - The variable SUUID '{variable_suuid}' was not found")
+    if response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving the variable SUUID "
+            f"'{variable_suuid}': {response.json()}"
         )
 
-        if response.status_code == 404:
-            raise DeleteError(f"{response.status_code} - The variable SUUID '{variable_suuid}' was not found")
-        if response.status_code != 204:
-            raise DeleteError(
-                f"{response.status_code} - Something went wrong while deleting the variable SUUID '{variable_suuid}': "
-                f"{response.json()}"
-            )
+    return Variable.from_dict(response.json())
+
+
+def create_operation(project_suuid: str, name: str, value: str, is_masked: bool = False) -> Operation[Variable]:
+    assert isinstance(is_masked, bool), "is_masked must be a boolean"
+
+    response = yield Request(
+        "create",
+        askanna_url.variable.variable(),
+        json={
+            "name": name,
+            "value": value,
+            "is_masked": is_masked,
+            "project_suuid": project_suuid,
+        },
+    )
+
+    if response.status_code != 201:
+        raise PostError(
+            f"{response.status_code} - Something went wrong while creating the variable: {response.json()}"
+        )
+
+    return Variable.from_dict(response.json())
+
+
+def change_operation(
+    variable_suuid: str,
+    name: Optional[str] = None,
+    value: Optional[str] = None,
+    is_masked: Optional[bool] = None,
+) -> Operation[Variable]:
+    changes = {}
+    if name:
+        changes.update({"name": name})
+    if value:
+        changes.update({"value": value})
+    if is_masked:
+        assert isinstance(is_masked, bool), "is_masked must be a boolean"
+        changes.update({"is_masked": is_masked})
+
+    if not changes:
+        raise ValueError("At least one of the arguments 'name', 'value' or 'is_masked' should be provided.")
+
+    response = yield Request(
+        "patch",
+        askanna_url.variable.variable_detail(variable_suuid),
+        json=changes,
+    )
+
+    if response.status_code == 404:
+        raise PatchError(f"{response.status_code} - The variable SUUID '{variable_suuid}' was not found")
+    if response.status_code != 200:
+        raise PatchError(
+            f"{response.status_code} - Something went wrong while updating the variable SUUID '{variable_suuid}': "
+            f"{response.json()}"
+        )
+
+    return Variable.from_dict(response.json())
+
+
+def delete_operation(variable_suuid: str) -> Operation[bool]:
+    response = yield Request(
+        "delete",
+        askanna_url.variable.variable_detail(variable_suuid),
+    )
+
+    if response.status_code == 404:
+        raise DeleteError(f"{response.status_code} - The variable SUUID '{variable_suuid}' was not found")
+    if response.status_code != 204:
+        raise DeleteError(
+            f"{response.status_code} - Something went wrong while deleting the variable SUUID '{variable_suuid}': "
+            f"{response.json()}"
+        )
 
-        return True
+    return True
@@ -1,17 +1,17 @@
 from typing import List, Optional
 
+from askanna.config.api_url import askanna_url
 from askanna.core.dataclasses.base import VISIBILITY
-from askanna.core.dataclasses.workspace import Workspace
+from askanna.core.dataclasses.workspace import LazyWorkspace, Workspace
 from askanna.core.exceptions import CreateError, DeleteError, GetError, PatchError
-from askanna.gateways.api_client import client
 
-from .utils import ListResponse
+from .utils import ListResponse, Operation, Request, run_operation
 
 
 class WorkspaceListResponse(ListResponse):
     def __init__(self, data: dict):
         super().__init__(data)
-        self.results: List[Workspace] = [Workspace.from_dict(workspace) for workspace in data["results"]]
+        self.results: List[Workspace] = [LazyWorkspace(workspace) for workspace in data["results"]]
 
     @property
     def workspaces(self):
@@ -49,34 +49,17 @@ class WorkspaceGateway:
         Returns:
             WorkspaceListResponse: The response from the API with a list of workspaces and pagination information.
         """
-        assert page_size is None or page_size > 0, "page_size must be a positive integer"
-        assert is_member is None or isinstance(is_member, bool), "is_member must be a boolean"
-        if visibility is not None:
-            visibility = visibility.lower()  # type: ignore
-            assert visibility in ["public", "private"], "visibility must be 'public' or 'private'"
-
-        response = client.get(
-            url=client.askanna_url.workspace.workspace_list(),
-            params={
-                "page_size": page_size,
-                "cursor": cursor,
-                "order_by": order_by,
-                "search": search,
-                "is_member": is_member,
-                "visibility": visibility,
-            },
+        return run_operation(
+            list_operation(
+                page_size=page_size,
+                cursor=cursor,
+                order_by=order_by,
+                search=search,
+                is_member=is_member,
+                visibility=visibility,
+            )
         )
 
-        if response.status_code != 200:
-            error_message = f"{response.status_code} - Something went wrong while retrieving the workspace list"
-            try:
-                error_message += f":\n  {response.json()}"
-            except ValueError:
-                pass
-            raise GetError(error_message)
-
-        return WorkspaceListResponse(response.json())
-
     def detail(self, workspace_suuid: str) -> Workspace:
         """Get information of a workspace
 
@@ -89,19 +72,7 @@ class WorkspaceGateway:
         Returns:
             Workspace: Workspace information in a Workspace dataclass
         """
-        response = client.get(
-            url=client.askanna_url.workspace.workspace_detail(workspace_suuid=workspace_suuid),
-        )
-
-        if response.status_code == 404:
-            raise GetError(f"404 - The workspace SUUID '{workspace_suuid}' was not found")
-        elif response.status_code != 200:
-            raise GetError(
-                f"{response.status_code} - Something went wrong while retrieving workspace SUUID '{workspace_suuid}': "
-                f"{response.json()}"
-            )
-
-        return Workspace.from_dict(response.json())
+        return run_operation(detail_operation(workspace_suuid=workspace_suuid))
 
     def create(self, name: str, description: str = "", visibility: str = "PRIVATE") -> Workspace:
         """Create a new workspace
@@ -118,24 +89,7 @@ class WorkspaceGateway:
         Returns:
             Workspace: The information of the newly created workspace in a Workspace dataclass
         """
-        if visibility and visibility not in ["PUBLIC", "PRIVATE"]:
-            raise ValueError("Visibility must be either PUBLIC or PRIVATE")
-
-        response = client.create(
-            url=client.askanna_url.workspace.workspace(),
-            json={
-                "name": name,
-                "description": description,
-                "visibility": visibility,
-            },
-        )
-
-        if response.status_code == 201:
-            return Workspace.from_dict(response.json())
-        else:
-            raise CreateError(
-                f"{response.status_code} - Something went wrong while creating the workspace: {response.json()}"
-            )
+        return run_operation(create_operation(name=name, description=description, visibility=visibility))
 
     def change(
         self,
@@ -160,32 +114,11 @@ class WorkspaceGateway:
         Returns:
             Workspace: The changed workspace information in a Workspace dataclass
         """
-        if visibility and visibility not in ["PUBLIC", "PRIVATE"]:
-            raise ValueError("Visibility must be either PUBLIC or PRIVATE")
-
-        changes = {}
-        if name:
-            changes.update({"name": name})
-        if description:
-            changes.update({"description": description})
-        if visibility:
-            changes.update({"visibility": visibility})
-
-        if not changes:
-            raise ValueError("At least one of the parameters 'name', 'description' or 'visibility' must be set.")
-
-        response = client.patch(
-            url=client.askanna_url.workspace.workspace_detail(workspace_suuid),
-            json=changes,
-        )
-
-        if response.status_code == 200:
-            return Workspace.from_dict(response.json())
-        else:
-            raise PatchError(
-                f"{response.status_code} - Something went wrong while updating the workspace SUUID "
-                f"'{workspace_suuid}': {response.json()}"
+        return run_operation(
+            change_operation(
+                workspace_suuid=workspace_suuid, name=name, description=description, visibility=visibility
             )
+        )
 
     def delete(self, workspace_suuid: str) -> bool:
         """Delete a workspace
@@ -199,16 +132,135 @@ class WorkspaceGateway:
         Returns:
             bool: True if the workspace was succesfully deleted
         """
-        response = client.delete(
-            url=client.askanna_url.workspace.workspace_detail(workspace_suuid),
+        return run_operation(delete_operation(workspace_suuid=workspace_suuid))
+
+
+# The operations build the requests and handle the responses of WorkspaceGateway and the async WorkspaceGateway in
+# askanna.aio.gateways.workspace, see Operation in askanna.gateways.utils
+def list_operation(
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    order_by: Optional[str] = None,
+    search: Optional[str] = None,
+    is_member: Optional[bool] = None,
+    visibility: Optional[VISIBILITY] = None,
+) -> Operation[WorkspaceListResponse]:
+    assert page_size is None or page_size > 0, "page_size must be a positive integer"
+    assert is_member is None or isinstance(is_member, bool), "is_member must be a boolean"
+    if visibility is not None:
+        visibility = visibility.lower()  # type: ignore
+        assert visibility in ["public", "private"], "visibility must be 'public' or 'private'"
+
+    response = yield Request(
+        "get",
+        askanna_url.workspace.workspace_list(),
+        params={
+            "page_size": page_size,
+            "cursor": cursor,
+            "order_by": order_by,
+            "search": search,
+            "is_member": is_member,
+            "visibility": visibility,
+        },
+    )
+
+    if response.status_code != 200:
+        error_message = f"{response.status_code} - Something went wrong while retrieving the workspace list"
+        try:
+            error_message += f":\n  {response.json()}"
+        except ValueError:
+            pass
+        raise GetError(error_message)
+
+    return WorkspaceListResponse(response.json())
+
+
+def detail_operation(workspace_suuid: str) -> Operation[Workspace]:
+    response = yield Request(
+        "get",
+        askanna_url.workspace.workspace_detail(workspace_suuid=workspace_suuid),
+    )
+
+    if response.status_code == 404:
+        raise GetError(f"404 - The workspace SUUID '{workspace_suuid}' was not found")
+    elif response.status_code != 200:
+        raise GetError(
+            f"{response.status_code} - Something went wrong while retrieving workspace SUUID '{workspace_suuid}': "
+            f"{response.json()}"
         )
 
-        if response.status_code == 204:
-            return True
-        elif response.status_code == 404:
-            raise DeleteError(f"404 - The workspace SUUID '{workspace_suuid}' was not found")
-        else:
-            raise DeleteError(
-                f"{response.status_code} - Something went wrong while deleting the workspace SUUID "
-                f"'{workspace_suuid}': {response.json()}"
-            )
+    return Workspace.from_dict(response.json())
+
+
+def create_operation(name: str, description: str = "", visibility: str = "PRIVATE") -> Operation[Workspace]:
+    if visibility and visibility not in ["PUBLIC", "PRIVATE"]:
+        raise ValueError("Visibility must be either PUBLIC or PRIVATE")
+
+    response = yield Request(
+        "create",
+        askanna_url.workspace.workspace(),
+        json={
+            "name": name,
+            "description": description,
+            "visibility": visibility,
+        },
+    )
+
+    if response.status_code == 201:
+        return Workspace.from_dict(response.json())
+    else:
+        raise CreateError(
+            f"{response.status_code} - Something went wrong while creating the workspace: {response.json()}"
+        )
+
+
+def change_operation(
+    workspace_suuid: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    visibility: Optional[str] = None,
+) -> Operation[Workspace]:
+    if visibility and visibility not in ["PUBLIC", "PRIVATE"]:
+        raise ValueError("Visibility must be either PUBLIC or PRIVATE")
+
+    changes = {}
+    if name:
+        changes.update({"name": name})
+    if description:
+        changes.update({"description": description})
+    if visibility:
+        changes.update({"visibility": visibility})
+
+    if not changes:
+        raise ValueError("At least one of the parameters 'name', 'description' or 'visibility' must be set.")
+
+    response = yield Request(
+        "patch",
+        askanna_url.workspace.workspace_detail(workspace_suuid),
+        json=changes,
+    )
+
+    if response.status_code == 200:
+        return Workspace.from_dict(response.json())
+    else:
+        raise PatchError(
+            f"{response.status_code} - Something went wrong while updating the workspace SUUID "
+            f"'{workspace_suuid}': {response.json()}"
+        )
+
+
+def delete_operation(workspace_suuid: str) -> Operation[bool]:
+    response = yield Request(
+        "delete",
+        askanna_url.workspace.workspace_detail(workspace_suuid),
+    )
+
+    if response.status_code == 204:
+        return True
+    elif response.status_code == 404:
+        raise DeleteError(f"404 - The workspace SUUID '{workspace_suuid}' was not found")
+    else:
+        raise DeleteError(
+            f"{response.status_code} - Something went wrong while deleting the workspace SUUID "
+            f"'{workspace_suuid}': {response.json()}"
+        )
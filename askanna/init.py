@@ -9,7 +9,9 @@ from askanna.sdk.project import ProjectSDK
 from askanna.sdk.run import ResultSDK, RunSDK
 from askanna.sdk.track import (  # noqa: F401
     track_metric,
+    track_metric_series,
     track_metrics,
+    track_metrics_series,
     track_variable,
     track_variables,
 )
@@ -1,10 +1,11 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from askanna.config import config
 from askanna.core.dataclasses.job import Job
 from askanna.core.dataclasses.run import RunStatus
 from askanna.core.exceptions import GetError
 from askanna.gateways.job import JobGateway
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
 
 from .mixins import ListMixin
 
@@ -60,6 +61,47 @@ class JobSDK(ListMixin):
             },
         )
 
+    def iter(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[Job]:
+        """Iterate over jobs with filter and order options. The jobs are requested page by page when they are
+        needed, so only one page of jobs is kept in memory.
+
+        Args:
+            project_suuid (str, optional): Project SUUID to filter for jobs in a project. Defaults to None.
+            workspace_suuid (str, optional): Workspace SUUID to filter for jobs in a workspace. Defaults to None.
+            number_of_results (int, optional): Maximum number of jobs. Defaults to None (all jobs).
+            page_size (int, optional): Number of jobs to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead on a worker thread while the jobs of the
+                current page are handled. Defaults to 0 (no prefetching).
+            order_by (str, optional): Order by field(s).
+            search (str, optional): Search for a specific job.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Job: Job dataclass
+        """
+        return self.iter_list(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params={
+                "project_suuid": project_suuid,
+                "workspace_suuid": workspace_suuid,
+                "search": search,
+            },
+        )
+
     def get(self, job_suuid: str) -> Job:
         """Get information of a job
 
@@ -93,24 +135,7 @@ class JobSDK(ListMixin):
             Job: Job information in a Job dataclass
         """
         job_list = self.list(project_suuid=project_suuid, search=job_name)
-
-        # The above list contain all jobs where the name of the job contains the job name we are looking for.
-        # We need to filter on the exact name.
-        matching_jobs = list(filter(lambda x: x.name == job_name, job_list))
-        if len(matching_jobs) == 0:
-            raise GetError("A job with this name is not available. Did you push your code?")
-        if len(matching_jobs) > 1:
-            if not project_suuid:
-                raise GetError(
-                    "There are multiple jobs with the same name. You can narrow the selection by providing the "
-                    "project SUUID."
-                )
-            raise GetError(
-                "There are multiple jobs with the same name. This could happen if you changed names of the job "
-                "manually. Please make sure the job names are unique."
-            )
-
-        return matching_jobs[0]
+        return match_job_by_name(job_list, job_name=job_name, project_suuid=project_suuid)
 
     def run_request(
         self,
@@ -193,3 +218,29 @@ class JobSDK(ListMixin):
             bool: True if the job was succesfully deleted
         """
         return self.gateway.delete(job_suuid=job_suuid)
+
+
+def match_job_by_name(job_list: List[Job], job_name: str, project_suuid: Optional[str] = None) -> Job:
+    """Get the job with exactly the job name from the jobs found by searching on the job name. Shared by JobSDK and
+    the async JobSDK in askanna.aio.sdk.job.
+
+    Raises:
+        GetError: If the job name is not unique or not found
+    """
+    # The job list contains all jobs where the name of the job contains the job name we are looking for. We need to
+    # filter on the exact name.
+    matching_jobs = list(filter(lambda x: x.name == job_name, job_list))
+    if len(matching_jobs) == 0:
+        raise GetError("A job with this name is not available. Did you push your code?")
+    if len(matching_jobs) > 1:
+        if not project_suuid:
+            raise GetError(
+                "There are multiple jobs with the same name. You can narrow the selection by providing the "
+                "project SUUID."
+            )
+        raise GetError(
+            "There are multiple jobs with the same name. This could happen if you changed names of the job "
+            "manually. Please make sure the job names are unique."
+        )
+
+    return matching_jobs[0]
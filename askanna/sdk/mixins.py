@@ -1,4 +1,9 @@
-from typing import Optional
+import queue
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+from askanna.gateways.utils import ListResponse
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
 
 __all__ = [
     "ListMixin",
@@ -11,6 +16,10 @@ class ListMixin:
     This class contains the list method, which is used by all SDKs that have a list method. The list method contains
     logic to get all results from the API, even if the number of results is higher than the page size.
 
+    The iter_list method returns a generator that requests the pages when they are needed, so only one page of
+    results is in memory at a time. With prefetch, the next pages are requested on a worker thread while the caller
+    handles the current page.
+
     To use this class, you need to set the gateway attribute to the gateway class
 
     Example:
@@ -34,25 +43,170 @@ class ListMixin:
         order_by: Optional[str] = None,
         other_query_params: Optional[dict] = None,
     ) -> list:
+        return list(
+            self.iter_list(
+                number_of_results=number_of_results,
+                page_size=number_of_results,
+                order_by=order_by,
+                other_query_params=other_query_params,
+            )
+        )
+
+    def iter_pages(
+        self,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        order_by: Optional[str] = None,
+        other_query_params: Optional[dict] = None,
+        prefetch: int = 0,
+    ) -> Iterator[List]:
+        """Generator that yields the results page by page. The next page is requested when the previous page is
+        consumed, following the cursor of the previous page.
+
+        With prefetch, a worker thread requests and decodes up to prefetch pages ahead of the page that is consumed.
+        This way the time waiting for the API overlaps with the time spent on handling the results.
+
+        Args:
+            number_of_results (int, optional): Maximum number of results. Defaults to None, which means all results.
+            page_size (int, optional): Number of results per page. Defaults to 100.
+            order_by (str, optional): Order by field(s).
+            other_query_params (dict, optional): Query parameters to filter the results.
+            prefetch (int, optional): Number of pages to request ahead. Defaults to 0 (no prefetching).
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            List: The results of a page
+        """
+        pages = self._iter_pages(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            order_by=order_by,
+            other_query_params=other_query_params,
+        )
+        if prefetch > 0:
+            return prefetch_iterator(pages, depth=prefetch)
+        return pages
+
+    def _iter_pages(
+        self,
+        number_of_results: Optional[int],
+        page_size: int,
+        order_by: Optional[str],
+        other_query_params: Optional[dict],
+    ) -> Iterator[List]:
         gateway = self.get_gateway()
-        query_params = {
-            "page_size": number_of_results,
-            "order_by": order_by,
-        }
-        if other_query_params:
-            assert isinstance(other_query_params, dict), "other_query_params must be a dict"
-            query_params.update(other_query_params)
+        query_params = list_query_params(page_size, order_by, other_query_params)
 
         list_response = gateway.list(**query_params)
-        results = list_response.results
-
         self.list_total_count = list_response.total_count
-        if number_of_results > len(results):
-            while list_response.next_url is not None and len(results) < number_of_results:
-                list_response = gateway.list(
-                    cursor=list_response.next_url_cursor,
-                    **query_params,
-                )
-                results.extend(list_response.results)
-
-        return results[:number_of_results]
+
+        remaining = number_of_results
+        while True:
+            results, remaining = page_results(list_response, remaining)
+            if results:
+                yield results
+
+            if is_last_page(list_response, remaining):
+                return
+            list_response = gateway.list(
+                cursor=list_response.next_url_cursor,
+                **query_params,
+            )
+
+    def iter_list(
+        self,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        order_by: Optional[str] = None,
+        other_query_params: Optional[dict] = None,
+        prefetch: int = 0,
+    ) -> Iterator:
+        """Generator that yields the results one by one. See iter_pages for the arguments."""
+        for page in self.iter_pages(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            order_by=order_by,
+            other_query_params=other_query_params,
+            prefetch=prefetch,
+        ):
+            yield from page
+
+
+# The list helpers are shared by ListMixin and AsyncListMixin in askanna.aio.sdk.mixins
+def list_query_params(page_size: int, order_by: Optional[str], other_query_params: Optional[dict]) -> dict:
+    """Query parameters to request the pages of a list"""
+    query_params = {
+        "page_size": page_size,
+        "order_by": order_by,
+    }
+    if other_query_params:
+        assert isinstance(other_query_params, dict), "other_query_params must be a dict"
+        query_params.update(other_query_params)
+    return query_params
+
+
+def page_results(list_response: ListResponse, remaining: Optional[int]) -> Tuple[List, Optional[int]]:
+    """The results of a page, cut off at the remaining number of results, and the number of results that remain"""
+    results = list_response.results
+    if remaining is not None:
+        results = results[:remaining]
+        remaining -= len(results)
+    return results, remaining
+
+
+def is_last_page(list_response: ListResponse, remaining: Optional[int]) -> bool:
+    """Whether no next page has to be requested"""
+    return list_response.next_url is None or remaining == 0
+
+
+def prefetch_iterator(iterator: Iterator, depth: int) -> Iterator:
+    """Consume an iterator on a worker thread and yield its items, with at most depth items waiting to be yielded
+
+    Exceptions raised by the iterator are raised when the item that failed is next. If the generator is closed before
+    the iterator is exhausted, the worker thread stops after the item it is working on.
+
+    Args:
+        iterator (Iterator): The iterator to consume on the worker thread
+        depth (int): Maximum number of items that are consumed ahead
+
+    Yields:
+        The items of the iterator
+    """
+    assert depth > 0, "depth must be larger than 0"
+    items: queue.Queue = queue.Queue(maxsize=depth)
+    stop_event = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except BaseException as e:
+            put((done, e))
+        else:
+            put((done, None))
+
+    thread = threading.Thread(target=worker, name="askanna-list-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop_event.set()
@@ -1,8 +1,9 @@
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 from askanna.core.dataclasses.package import Package
 from askanna.gateways.package import PackageGateway
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
 
 from .mixins import ListMixin
 
@@ -66,6 +67,53 @@ class PackageSDK(ListMixin):
             },
         )
 
+    def iter(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        created_by_name: Optional[str] = None,
+        created_by_suuid: Optional[str] = None,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[Package]:
+        """Iterate over packages with filter and order options. The packages are requested page by page when they are
+        needed, so only one page of packages is kept in memory.
+
+        Args:
+            project_suuid (str, optional): Project SUUID to filter for packages in a project. Defaults to None.
+            workspace_suuid (str, optional): Workspace SUUID to filter for packages in a workspace. Defaults to None.
+            created_by_name (str, optional): Filter packages on a created by name. Defaults to None.
+            created_by_suuid (str, optional): Filter packages on a created by SUUID. Defaults to None.
+            number_of_results (int, optional): Maximum number of packages. Defaults to None (all packages).
+            page_size (int, optional): Number of packages to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead on a worker thread while the packages of the
+                current page are handled. Defaults to 0 (no prefetching).
+            order_by (str, optional): Order by field(s).
+            search (str, optional): Search for a specific package.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Package: Package dataclass
+        """
+        return self.iter_list(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params={
+                "project_suuid": project_suuid,
+                "workspace_suuid": workspace_suuid,
+                "created_by_name": created_by_name,
+                "created_by_suuid": created_by_suuid,
+                "search": search,
+            },
+        )
+
     def info(self, package_suuid: Optional[str] = None) -> Package:
         """Get information of a package
 
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from askanna.core.dataclasses.base import VISIBILITY
 from askanna.core.dataclasses.project import Project
 from askanna.gateways.project import ProjectGateway
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
 
 from .mixins import ListMixin
 
@@ -54,6 +55,50 @@ class ProjectSDK(ListMixin):
             },
         )
 
+    def iter(
+        self,
+        workspace_suuid: Optional[str] = None,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+        is_member: Optional[bool] = None,
+        visibility: Optional[VISIBILITY] = None,
+    ) -> Iterator[Project]:
+        """Iterate over projects with filter and order options. The projects are requested page by page when they are
+        needed, so only one page of projects is kept in memory.
+
+        Args:
+            workspace_suuid (str, optional): Workspace SUUID to filter for projects in a workspace. Defaults to None.
+            number_of_results (int, optional): Maximum number of projects. Defaults to None (all projects).
+            page_size (int, optional): Number of projects to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead on a worker thread while the projects of the
+                current page are handled. Defaults to 0 (no prefetching).
+            order_by (str, optional): Order by field(s).
+            search (str, optional): Search for a specific project.
+            is_member (bool, optional): Filter on projects where the authenticated user is a member.
+            visibility ("PRIVATE" or "PUBLIC", optional): Filter on projects with a specific visibility.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Project: Project dataclass
+        """
+        return self.iter_list(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params={
+                "workspace_suuid": workspace_suuid,
+                "search": search,
+                "is_member": is_member,
+                "visibility": visibility,
+            },
+        )
+
     def get(self, project_suuid: str) -> Project:
         """Get information of a project
 
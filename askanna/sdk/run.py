@@ -1,7 +1,11 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from askanna.config import config
+from askanna.core.cache import RunKey, run_cache
 from askanna.core.dataclasses.job import Payload
 from askanna.core.dataclasses.run import (
     STATUS,
@@ -14,6 +18,7 @@ from askanna.core.dataclasses.run import (
 )
 from askanna.core.exceptions import GetError
 from askanna.gateways.run import RunGateway
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE, DEFAULT_RUN_FETCH_CONCURRENCY
 
 from .job import JobSDK
 from .mixins import ListMixin
@@ -32,6 +37,11 @@ class RunSDK(ListMixin):
 
     gateway = RunGateway()
     run_suuid = None
+    # Maximum number of requests at the same time to get the metrics and variables of runs
+    fetch_concurrency = int(os.getenv("AA_RUN_FETCH_CONCURRENCY", DEFAULT_RUN_FETCH_CONCURRENCY))
+    # Read the data of finished and failed runs from the local cache, see askanna.core.cache
+    use_cache = os.getenv("AA_RUN_CACHE", "false").lower() in ("1", "true", "yes")
+    cache = run_cache
 
     def _get_run_suuid(self) -> str:
         if not self.run_suuid:
@@ -39,6 +49,109 @@ class RunSDK(ListMixin):
 
         return self.run_suuid
 
+    def _cacheable_run(self, run_suuid: str) -> Optional[RunKey]:
+        """Get the run if the cache is used and the data of the run can be cached, else None"""
+        if not self.use_cache:
+            return None
+
+        # Only finished and failed runs are in the cache and their data does not change, so we trust the cache and
+        # don't get the run again
+        cached_run = self.cache.get_run(run_suuid)
+        if cached_run:
+            return cached_run
+
+        run = self.gateway.detail(run_suuid)
+        return run if self.cache.is_cacheable(run) else None
+
+    def _cached(
+        self, run: Optional[RunKey], name: str, get: Callable[[], Any], from_dict: Callable[[Any], Any]
+    ) -> Any:
+        """
+        Get the value from the cache, or get it with get() and add it to the cache if the run can be cached. The value
+        is saved with its to_dict method and read with from_dict.
+        """
+        if run is None:
+            return get()
+
+        try:
+            return self.cache.get_object(run, name, from_dict)
+        except KeyError:
+            value = get()
+            self.cache.put_object(run, name, value)
+            return value
+
+    def _cached_file(
+        self, run: Optional[RunKey], name: str, get: Callable[..., Any], output_path: Optional[Union[Path, str]] = None
+    ) -> Union[bytes, None]:
+        """Similar to _cached for a file that get(output_path) returns as bytes, or saves to output_path"""
+        if run is None:
+            return get(output_path)
+
+        try:
+            if not output_path:
+                return self.cache.get_bytes(run, name)
+            Path(output_path).write_bytes(self.cache.get_bytes(run, name))
+            return None
+        except KeyError:
+            content = get(output_path)
+            if output_path:
+                self.cache.put_file(run, name, output_path)
+            else:
+                self.cache.put_bytes(run, name, content)
+            return content
+
+    def _include_metrics_and_variables(
+        self, runs: List[Run], include_metrics: bool = False, include_variables: bool = False
+    ) -> None:
+        """Get the metrics and/or variables of the runs and add them to the Run dataclasses
+
+        The requests are done concurrently with at most fetch_concurrency requests at the same time. All requests
+        are finished before errors are raised, so one failing run does not hide the errors of other runs.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API. If more than one
+              request failed, the error lists the errors per run.
+        """
+        requests = []
+        if include_metrics:
+            requests.extend((run, "metrics", self.gateway.metric, MetricList.from_dict) for run in runs)
+        if include_variables:
+            requests.extend((run, "variables", self.gateway.variable, VariableList.from_dict) for run in runs)
+        if not requests:
+            return
+
+        failed: List[Tuple[Run, str, BaseException]] = []
+        max_workers = max(1, min(self.fetch_concurrency, len(requests)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="askanna-run-fetch") as executor:
+            futures = [
+                executor.submit(
+                    self._cached,
+                    run if self.use_cache and self.cache.is_cacheable(run) else None,
+                    field,
+                    partial(get, run.suuid),
+                    from_dict,
+                )
+                for run, field, get, from_dict in requests
+            ]
+            for (run, field, _, _), future in zip(requests, futures):
+                try:
+                    setattr(run, field, future.result())
+                except Exception as e:
+                    failed.append((run, field, e))
+
+        raise_fetch_errors(failed)
+
+    def _list_query_params(self, job_name: Optional[str] = None, **query_params) -> dict:
+        """Query parameters to list runs. If job_name is set, the runs are filtered on the SUUID of that job."""
+        if query_params.get("job_suuid") and job_name:
+            raise ValueError("Parameters 'job_suuid' and 'job_name' are both set. Please only set one.")
+        if job_name:
+            project_suuid = query_params.get("project_suuid") or config.project.project_suuid
+            query_params["project_suuid"] = project_suuid
+            query_params["job_suuid"] = JobSDK().get_job_by_name(job_name=job_name, project_suuid=project_suuid).suuid
+
+        return query_params
+
     def list(
         self,
         status: Optional[STATUS] = None,
@@ -110,46 +223,108 @@ class RunSDK(ListMixin):
             List[Run]: List of runs. List items are of type Run dataclass.
         """
 
-        if job_suuid and job_name:
-            raise ValueError("Parameters 'job_suuid' and 'job_name' are both set. Please only set one.")
-        if job_name:
-            project_suuid = project_suuid or config.project.project_suuid
-            job_suuid = JobSDK().get_job_by_name(job_name=job_name, project_suuid=project_suuid).suuid
-
         run_list = super().list(
             number_of_results=number_of_results,
             order_by=order_by,
-            other_query_params={
-                "status": status,
-                "status__exclude": status__exclude,
-                "run_suuid_list": run_suuid_list,
-                "run_suuid__exclude": run_suuid__exclude,
-                "job_suuid": job_suuid,
-                "job_suuid__exclude": job_suuid__exclude,
-                "project_suuid": project_suuid,
-                "project_suuid__exclude": project_suuid__exclude,
-                "workspace_suuid": workspace_suuid,
-                "workspace_suuid__exclude": workspace_suuid__exclude,
-                "created_by_suuid": created_by_suuid,
-                "created_by_suuid__exclude": created_by_suuid__exclude,
-                "trigger": trigger,
-                "trigger__exclude": trigger__exclude,
-                "package_suuid": package_suuid,
-                "package_suuid__exclude": package_suuid__exclude,
-                "search": search,
-            },
+            other_query_params=self._list_query_params(
+                status=status,
+                status__exclude=status__exclude,
+                run_suuid_list=run_suuid_list,
+                run_suuid__exclude=run_suuid__exclude,
+                job_name=job_name,
+                job_suuid=job_suuid,
+                job_suuid__exclude=job_suuid__exclude,
+                project_suuid=project_suuid,
+                project_suuid__exclude=project_suuid__exclude,
+                workspace_suuid=workspace_suuid,
+                workspace_suuid__exclude=workspace_suuid__exclude,
+                created_by_suuid=created_by_suuid,
+                created_by_suuid__exclude=created_by_suuid__exclude,
+                trigger=trigger,
+                trigger__exclude=trigger__exclude,
+                package_suuid=package_suuid,
+                package_suuid__exclude=package_suuid__exclude,
+                search=search,
+            ),
         )
 
-        if include_metrics:
-            for run in run_list:
-                run.metrics = self.gateway.metric(run.suuid)
-
-        if include_variables:
-            for run in run_list:
-                run.variables = self.gateway.variable(run.suuid)
+        self._include_metrics_and_variables(run_list, include_metrics, include_variables)
 
         return run_list
 
+    def iter(
+        self,
+        status: Optional[STATUS] = None,
+        status__exclude: Optional[STATUS] = None,
+        run_suuid_list: Optional[List[str]] = None,
+        run_suuid__exclude: Optional[str] = None,
+        job_name: Optional[str] = None,
+        job_suuid: Optional[str] = None,
+        job_suuid__exclude: Optional[str] = None,
+        project_suuid: Optional[str] = None,
+        project_suuid__exclude: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        workspace_suuid__exclude: Optional[str] = None,
+        created_by_suuid: Optional[str] = None,
+        created_by_suuid__exclude: Optional[str] = None,
+        trigger: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+        trigger__exclude: Optional[Union[TRIGGER, List[TRIGGER]]] = None,
+        package_suuid: Optional[str] = None,
+        package_suuid__exclude: Optional[str] = None,
+        include_metrics: bool = False,
+        include_variables: bool = False,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[Run]:
+        """Iterate over runs with filter and order options. Runs are requested page by page when they are needed, so
+        also iterating over a large number of runs only keeps one page of runs in memory.
+
+        The filter and include arguments are the same as for the list method.
+
+        Args:
+            number_of_results (int, optional): Maximum number of runs. Defaults to None (all runs).
+            page_size (int, optional): Number of runs to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead on a worker thread while the runs of the
+                current page are handled. Defaults to 0 (no prefetching).
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Run: Run dataclass
+        """
+        for page in self.iter_pages(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params=self._list_query_params(
+                status=status,
+                status__exclude=status__exclude,
+                run_suuid_list=run_suuid_list,
+                run_suuid__exclude=run_suuid__exclude,
+                job_name=job_name,
+                job_suuid=job_suuid,
+                job_suuid__exclude=job_suuid__exclude,
+                project_suuid=project_suuid,
+                project_suuid__exclude=project_suuid__exclude,
+                workspace_suuid=workspace_suuid,
+                workspace_suuid__exclude=workspace_suuid__exclude,
+                created_by_suuid=created_by_suuid,
+                created_by_suuid__exclude=created_by_suuid__exclude,
+                trigger=trigger,
+                trigger__exclude=trigger__exclude,
+                package_suuid=package_suuid,
+                package_suuid__exclude=package_suuid__exclude,
+                search=search,
+            ),
+        ):
+            self._include_metrics_and_variables(page, include_metrics, include_variables)
+            yield from page
+
     def get(
         self,
         run_suuid: Optional[str] = None,
@@ -171,12 +346,7 @@ class RunSDK(ListMixin):
         """
         run_suuid = run_suuid or self._get_run_suuid()
         run = self.gateway.detail(run_suuid)
-
-        if include_metrics:
-            run.metrics = self.gateway.metric(run.suuid)
-
-        if include_variables:
-            run.variables = self.gateway.variable(run.suuid)
+        self._include_metrics_and_variables([run], include_metrics, include_variables)
 
         return run
 
@@ -287,7 +457,12 @@ class RunSDK(ListMixin):
             MetricList: List of metrics
         """
         run_suuid = run_suuid or self._get_run_suuid()
-        return self.gateway.metric(run_suuid=run_suuid)
+        return self._cached(
+            self._cacheable_run(run_suuid),
+            "metrics",
+            lambda: self.gateway.metric(run_suuid=run_suuid),
+            MetricList.from_dict,
+        )
 
     def get_variable(self, run_suuid: Optional[str] = None) -> VariableList:
         """Get the variables used for a run
@@ -302,7 +477,12 @@ class RunSDK(ListMixin):
             VariableList: List of variables
         """
         run_suuid = run_suuid or self._get_run_suuid()
-        return self.gateway.variable(run_suuid=run_suuid)
+        return self._cached(
+            self._cacheable_run(run_suuid),
+            "variables",
+            lambda: self.gateway.variable(run_suuid=run_suuid),
+            VariableList.from_dict,
+        )
 
     def payload(
         self,
@@ -323,16 +503,26 @@ class RunSDK(ListMixin):
             bytes: if output_path is not set, the payload is returned as bytes
         """
         run_suuid = run_suuid or self._get_run_suuid()
+        run = self._cacheable_run(run_suuid)
 
         if not payload_suuid:
-            payload_info = self.payload_info(run_suuid)
+            payload_info = self._cached(
+                run, "payload_info", lambda: self.gateway.payload_info(run_suuid), Payload.from_dict
+            )
 
             if not payload_info:
                 return
 
             payload_suuid = payload_info.suuid
 
-        return self.gateway.payload(run_suuid=run_suuid, payload_suuid=payload_suuid, output_path=output_path)
+        return self._cached_file(
+            run,
+            f"payload-{payload_suuid}",
+            lambda output_path: self.gateway.payload(
+                run_suuid=run_suuid, payload_suuid=payload_suuid, output_path=output_path
+            ),
+            output_path,
+        )
 
     def payload_info(self, run_suuid: Optional[str] = None) -> Union[Payload, None]:
         """Get the payload info of a run
@@ -348,7 +538,12 @@ class RunSDK(ListMixin):
             None: If no payload is available for the run
         """
         run_suuid = run_suuid or self._get_run_suuid()
-        return self.gateway.payload_info(run_suuid)
+        return self._cached(
+            self._cacheable_run(run_suuid),
+            "payload_info",
+            lambda: self.gateway.payload_info(run_suuid),
+            Payload.from_dict,
+        )
 
     def result(
         self, run_suuid: Optional[str] = None, output_path: Optional[Union[Path, str]] = None
@@ -367,7 +562,12 @@ class RunSDK(ListMixin):
             bytes: if output_path is not set, the result is returned as bytes
         """
         run_suuid = run_suuid or self._get_run_suuid()
-        return self.gateway.result(run_suuid, output_path)
+        return self._cached_file(
+            self._cacheable_run(run_suuid),
+            "result",
+            lambda output_path: self.gateway.result(run_suuid, output_path),
+            output_path,
+        )
 
     def result_content_type(self, run_suuid: Optional[str] = None) -> str:
         """Get the content type of the result of a run
@@ -416,7 +616,40 @@ class RunSDK(ListMixin):
             ArtifactInfo: Artifact info in a ArtifactInfo dataclass
         """
         run_suuid = run_suuid or self._get_run_suuid()
-        return self.gateway.artifact_info(run_suuid)
+        return self._cached(
+            self._cacheable_run(run_suuid),
+            "artifact_info",
+            lambda: self.gateway.artifact_info(run_suuid),
+            ArtifactInfo.from_dict,
+        )
+
+
+def raise_fetch_errors(failed: List[Tuple[Run, str, BaseException]]) -> None:
+    """Raise the errors of the failed requests for the metrics or variables of runs. Shared by RunSDK and the async
+    RunSDK in askanna.aio.sdk.run.
+
+    Args:
+        failed (list): The run, the field ("metrics" or "variables") and the error of each failed request
+
+    Raises:
+        GetError: The error of the request if one request failed, else an error that lists the errors per run
+    """
+    if len(failed) == 1:
+        raise failed[0][2]
+    if not failed:
+        return
+
+    errors_per_run: Dict[str, List[str]] = {}
+    for run, field, error in failed:
+        errors_per_run.setdefault(run.suuid, []).append(f"{field}: {error}")
+    raise GetError(
+        f"Something went wrong while retrieving the metrics or variables of {len(errors_per_run)} "
+        + ("runs" if len(errors_per_run) != 1 else "run")
+        + ":\n"
+        + "\n".join(
+            f"  - {run_suuid} {error}" for run_suuid, run_errors in errors_per_run.items() for error in run_errors
+        )
+    ) from failed[0][2]
 
 
 class ResultSDK:
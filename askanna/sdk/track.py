@@ -12,24 +12,44 @@ from askanna.core.utils.object import (
     get_type,
     object_fullname,
     prepare_and_validate_value,
+    prepare_series,
     value_not_empty,
 )
+from askanna.core.utils.settings import env_number
+from askanna.settings import (
+    DEFAULT_METRIC_FLUSH_INTERVAL,
+    DEFAULT_METRIC_FLUSH_SIZE,
+    DEFAULT_METRIC_FLUSH_TIMEOUT,
+)
 
 __all__ = [
     "track_metric",
     "track_metrics",
+    "track_metric_series",
+    "track_metrics_series",
     "track_variable",
     "track_variables",
 ]
 
-# Start metric and variable collection for the current session and register save collections on exit
-metric_collector = MetricCollector(run_suuid=os.getenv("AA_RUN_SUUID"))
+# Start metric and variable collection for the current session and register save collections on exit. With
+# AA_METRIC_BUFFERED set, tracked metrics are buffered and flushed by a background thread.
+metric_collector = MetricCollector(
+    run_suuid=os.getenv("AA_RUN_SUUID"),
+    buffered=os.getenv("AA_METRIC_BUFFERED", "false").lower() in ("1", "true", "yes"),
+    flush_size=env_number("AA_METRIC_FLUSH_SIZE", DEFAULT_METRIC_FLUSH_SIZE, type=int),
+    flush_interval=env_number("AA_METRIC_FLUSH_INTERVAL", DEFAULT_METRIC_FLUSH_INTERVAL),
+)
 variable_collector = VariableCollector(run_suuid=os.getenv("AA_RUN_SUUID"))
 
 
 @exit_register
 def at_exit_save_metrics():
-    if len(metric_collector) > 0:
+    # Drain the metric buffer, but don't let a slow backend block the exit of the run
+    drained = metric_collector.stop_flush_thread(
+        timeout=env_number("AA_METRIC_FLUSH_TIMEOUT", DEFAULT_METRIC_FLUSH_TIMEOUT),
+    )
+    # If the buffer was not drained in time, the metrics are saved locally and we don't push them again
+    if drained and len(metric_collector) > 0:
         metric_collector.save()
     if len(variable_collector) > 0:
         variable_collector.save()
@@ -65,6 +85,63 @@ def track_metrics(metrics: dict, label: Optional[Union[str, list, dict]] = None)
         track_metric(name, value, label)
 
 
+def track_metric_series(
+    name: str,
+    values: Any,
+    steps: Optional[Any] = None,
+    label: Optional[Union[str, list, dict]] = None,
+) -> None:
+    """
+    Track a series of values for one metric in one operation. The values can be a one-dimensional NumPy array or a
+    sequence. If steps are set, each metric gets a label 'step' with the step of the value.
+
+    Values are validated and typed once for the whole series. If the values do not have one supported type, each value
+    is tracked with track_metric.
+    """
+    values, dtype = prepare_series(values)
+
+    if steps is not None:
+        steps, step_type = prepare_series(steps)
+        if len(steps) != len(values):
+            raise ValueError(f"The number of steps ({len(steps)}) does not match the number of values ({len(values)})")
+    else:
+        step_type = None
+
+    if not dtype or (steps is not None and not step_type):
+        if isinstance(label, str):
+            label = {label: None}
+        elif isinstance(label, list):
+            label = {label_name: None for label_name in label}
+
+        for index, value in enumerate(values):
+            value_label = dict(label or {})
+            if steps is not None:
+                value_label["step"] = steps[index]
+            track_metric(name, value, value_label or None)
+        return
+
+    metric_collector.add_series(
+        name=name,
+        type=dtype,
+        values=values,
+        labels=make_label_list(label) if label else [],
+        steps=steps,
+        step_type=step_type or "integer",
+    )
+
+
+def track_metrics_series(
+    metrics: dict,
+    steps: Optional[Any] = None,
+    label: Optional[Union[str, list, dict]] = None,
+) -> None:
+    """
+    Track a series of values for many metrics using track_metric_series
+    """
+    for name, values in metrics.items():
+        track_metric_series(name, values, steps, label)
+
+
 def track_variable(name: str, value: Any = None, label: Optional[Union[str, list, dict]] = None) -> None:
     if value_not_empty(value):
         value, valid = prepare_and_validate_value(value)
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from askanna.core.dataclasses.variable import Variable
 from askanna.gateways.variable import VariableGateway
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
 
 from .mixins import ListMixin
 
@@ -53,6 +54,50 @@ class VariableSDK(ListMixin):
             },
         )
 
+    def iter(
+        self,
+        project_suuid: Optional[str] = None,
+        workspace_suuid: Optional[str] = None,
+        is_masked: Optional[bool] = None,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[Variable]:
+        """Iterate over variables with filter and order options. The variables are requested page by page when they are
+        needed, so only one page of variables is kept in memory.
+
+        Args:
+            project_suuid (str, optional): SUUID of the project to filter on. Defaults to None.
+            workspace_suuid (str, optional): SUUID of the workspace to filter on. Defaults to None.
+            is_masked (bool, optional): Filter on masked variables. Defaults to None.
+            number_of_results (int, optional): Maximum number of variables. Defaults to None (all variables).
+            page_size (int, optional): Number of variables to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead on a worker thread while the variables of the
+                current page are handled. Defaults to 0 (no prefetching).
+            order_by (str, optional): Order by field(s).
+            search (str, optional): Search for a specific variable. Defaults to None.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Variable: Variable dataclass
+        """
+        return self.iter_list(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params={
+                "project_suuid": project_suuid,
+                "workspace_suuid": workspace_suuid,
+                "is_masked": is_masked,
+                "search": search,
+            },
+        )
+
     def get(self, variable_suuid: str) -> Variable:
         """Get information of a variable
 
@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from askanna.core.dataclasses.base import VISIBILITY
 from askanna.core.dataclasses.workspace import Workspace
 from askanna.gateways.workspace import WorkspaceGateway
+from askanna.settings import DEFAULT_LIST_PAGE_SIZE
 
 from .mixins import ListMixin
 
@@ -51,6 +52,47 @@ class WorkspaceSDK(ListMixin):
             },
         )
 
+    def iter(
+        self,
+        number_of_results: Optional[int] = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        prefetch: int = 0,
+        order_by: Optional[str] = None,
+        search: Optional[str] = None,
+        is_member: Optional[bool] = None,
+        visibility: Optional[VISIBILITY] = None,
+    ) -> Iterator[Workspace]:
+        """Iterate over workspaces with filter and order options. The workspaces are requested page by page when they
+        are needed, so only one page of workspaces is kept in memory.
+
+        Args:
+            number_of_results (int, optional): Maximum number of workspaces. Defaults to None (all workspaces).
+            page_size (int, optional): Number of workspaces to request per page. Defaults to 100.
+            prefetch (int, optional): Number of pages to request ahead on a worker thread while the workspaces of the
+                current page are handled. Defaults to 0 (no prefetching).
+            order_by (str, optional): Order by field(s).
+            search (str, optional): Search for a specific workspace.
+            is_member (bool, optional): Filter on workspaces where the authenticated user is a member.
+            visibility ("PRIVATE" or "PUBLIC", optional): Filter on workspaces with a specific visibility.
+
+        Raises:
+            GetError: Error based on response status code with the error message from the API
+
+        Yields:
+            Workspace: Workspace dataclass
+        """
+        return self.iter_list(
+            number_of_results=number_of_results,
+            page_size=page_size,
+            prefetch=prefetch,
+            order_by=order_by,
+            other_query_params={
+                "search": search,
+                "is_member": is_member,
+                "visibility": visibility,
+            },
+        )
+
     def get(self, workspace_suuid: str) -> Workspace:
         """Get information of a workspace
 
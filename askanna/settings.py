@@ -1,9 +1,36 @@
 from pathlib import Path
 
 DEFAULT_SERVER_CONFIG_PATH = str(Path("~/.askanna.yml").expanduser())
+DEFAULT_CACHE_DIR = str(Path("~/.askanna/cache").expanduser())
+DEFAULT_UPLOAD_STATE_DIR = str(Path("~/.askanna/upload").expanduser())
+DEFAULT_PUSH_STATE_DIR = str(Path("~/.askanna/push").expanduser())
+DEFAULT_CACHE_MAX_SIZE = 1024**3  # bytes
 DEFAULT_SERVER_REMOTE = "https://beta-api.askanna.eu"
 DEFAULT_SERVER_UI = "https://beta.askanna.eu"
 
 DEFAULT_PROJECT_TEMPLATE = "https://gitlab.com/askanna/project-templates/blanco-template.git"
 
 PYPI_PROJECT_URL = "https://pypi.org/pypi/askanna/json"
+
+DEFAULT_LIST_PAGE_SIZE = 100
+
+DEFAULT_METRIC_FLUSH_SIZE = 1000
+DEFAULT_METRIC_FLUSH_INTERVAL = 30.0  # seconds
+DEFAULT_METRIC_FLUSH_TIMEOUT = 30.0  # seconds
+
+DEFAULT_RUN_FETCH_CONCURRENCY = 8  # number of requests at the same time to get the metrics and variables of runs
+DEFAULT_UPLOAD_CONCURRENCY = 4  # number of chunks of a file to upload at the same time
+DEFAULT_UPLOAD_CHUNK_SIZE_MIN = 1024**2  # bytes
+DEFAULT_UPLOAD_CHUNK_SIZE_MAX = 32 * 1024**2  # bytes
+
+DEFAULT_HTTP_POOL_CONNECTIONS = 10  # number of hosts to keep a connection pool for
+DEFAULT_HTTP_POOL_MAXSIZE = 32  # number of connections to keep alive per host, shared by all threads
+DEFAULT_HTTP_RETRIES = 3
+DEFAULT_HTTP_BACKOFF_FACTOR = 0.5  # seconds, the maximum delay before retry n is factor * 2^n
+DEFAULT_HTTP_BACKOFF_MAX = 30.0  # seconds
+DEFAULT_HTTP_RETRY_AFTER_MAX = 300.0  # seconds, the maximum time to wait for a Retry-After header
+DEFAULT_HTTP_CIRCUIT_BREAKER_THRESHOLD = 5  # number of failed requests in a row to a host before failing fast
+DEFAULT_HTTP_CIRCUIT_BREAKER_TIMEOUT = 30.0  # seconds to fail fast before trying the host again
+DEFAULT_AIO_MAX_CONNECTIONS = 100  # number of connections of the async client, more requests wait for a connection
+
+DEFAULT_TRACE_FORMAT = "json"  # format of the file set with AA_TRACE, json or chrome
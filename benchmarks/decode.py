@@ -0,0 +1,111 @@
+"""
+Benchmark of decoding list responses of the AskAnna API into dataclasses
+
+The list responses are built from the response fixtures in tests/fixtures/responses, with a different timestamp for
+each item. For each dataclass, the time to decode a list of NUMBER items is reported. The first lines compare parsing
+the timestamps with dateutil to parse_datetime. The last lines report the time to create a run list response, which
+decodes the fields of a run on first access, and to read only the suuid and name or all fields of the runs.
+
+Run it from the root of the repository with:
+
+    python benchmarks/decode.py
+"""
+
+import copy
+import datetime
+import json
+import tempfile
+import timeit
+
+NUMBER = 1_000
+REPEAT = 5
+
+
+def report(name: str, seconds: float):
+    print(f"{name:<40} {seconds * 1_000:>8.2f} ms per {NUMBER} items")
+
+
+def timestamps(index: int) -> str:
+    moment = datetime.datetime(2023, 1, 26, 9, 47, 41, 77335) + datetime.timedelta(seconds=index, microseconds=index)
+    return moment.isoformat() + "Z"
+
+
+def with_timestamps(data: dict, index: int, fields) -> dict:
+    data = copy.deepcopy(data)
+    for name in fields:
+        data[name] = timestamps(index)
+    return data
+
+
+def main():
+    from dateutil import parser as dateutil_parser
+
+    from askanna.core.dataclasses.decode import parse_datetime
+    from askanna.core.dataclasses.job import Job
+    from askanna.core.dataclasses.project import Project
+    from askanna.core.dataclasses.run import MetricObject, Run
+    from askanna.core.dataclasses.workspace import Workspace
+    from askanna.gateways.run import RunListResponse
+    from tests.fixtures.responses import job, project, run, workspace
+
+    values = [timestamps(index) for index in range(NUMBER)]
+
+    def parse_with(parse):
+        def parse_all():
+            parse_datetime.cache_clear()
+            for value in values:
+                parse(value)
+
+        return parse_all
+
+    report("dateutil parse", min(timeit.repeat(parse_with(dateutil_parser.parse), number=1, repeat=REPEAT)))
+    report("dateutil isoparse", min(timeit.repeat(parse_with(dateutil_parser.isoparse), number=1, repeat=REPEAT)))
+    report("parse_datetime", min(timeit.repeat(parse_with(parse_datetime), number=1, repeat=REPEAT)))
+
+    responses = {
+        Run: (run.run_detail.__wrapped__(), ["created_at", "modified_at", "started_at", "finished_at"]),
+        MetricObject: (run.run_metric.__wrapped__(), ["created_at"]),
+        Job: (job.job_detail.__wrapped__(), ["created_at", "modified_at"]),
+        Project: (project.project_detail.__wrapped__(), ["created_at", "modified_at"]),
+        Workspace: (workspace.workspace_detail.__wrapped__(), ["created_at", "modified_at"]),
+    }
+
+    for cls, (detail, fields) in responses.items():
+        # The decoded JSON is changed by from_dict, so decode it again for each repeat
+        response = json.dumps([with_timestamps(detail, index, fields) for index in range(NUMBER)])
+
+        def decode():
+            parse_datetime.cache_clear()
+            for data in json.loads(response):
+                cls.from_dict(data)
+
+        report(f"{cls.__name__}.from_dict (incl. json.loads)", min(timeit.repeat(decode, number=1, repeat=REPEAT)))
+
+    run_detail, fields = responses[Run]
+    response = json.dumps(
+        {
+            "count": NUMBER,
+            "next": None,
+            "previous": None,
+            "results": [with_timestamps(run_detail, index, fields) for index in range(NUMBER)],
+        }
+    )
+
+    def list_runs(read):
+        def decode():
+            parse_datetime.cache_clear()
+            for run_object in RunListResponse(json.loads(response)).results:
+                read(run_object)
+
+        return min(timeit.repeat(decode, number=1, repeat=REPEAT))
+
+    report("RunListResponse (incl. json.loads)", list_runs(lambda run_object: None))
+    report("RunListResponse, read suuid and name", list_runs(lambda run_object: (run_object.suuid, run_object.name)))
+    report("RunListResponse, read all fields", list_runs(lambda run_object: run_object.materialize()))
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The metric collector stores its files in the temporary directory, so set it before importing AskAnna
+        tempfile.tempdir = tmp_dir
+        main()
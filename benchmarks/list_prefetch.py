@@ -0,0 +1,123 @@
+"""
+Benchmark of iterating over a long list of runs with and without prefetching the next pages
+
+The runs are listed from a fake backend that waits LATENCY seconds before it returns a page, like a request to the
+AskAnna API would. The page is decoded into Run dataclasses the same way as the run gateway does. For every run, the
+caller spends some time on handling the run.
+
+Run it from the root of the repository with:
+
+    python benchmarks/list_prefetch.py
+"""
+
+import copy
+import json
+import tempfile
+import time
+
+NUMBER_OF_RUNS = 2_000
+PAGE_SIZE = 100
+LATENCY = 0.1  # seconds per page
+WORK_PER_RUN = 0.0005  # seconds
+
+RUN = {
+    "suuid": "1234-1234-1234-1234",
+    "name": "",
+    "description": "",
+    "status": "finished",
+    "started_at": "2022-01-26T09:47:41.874998Z",
+    "finished_at": "2022-01-26T09:48:15.766553Z",
+    "duration": 33,
+    "trigger": "WEBUI",
+    "created_by": {
+        "relation": "membership",
+        "suuid": "7FzS-oPBG-BIi5-lTeL",
+        "name": "Robbert",
+        "job_title": "Founder AskAnna",
+        "role": {"name": "Workspace Admin", "code": "WA"},
+        "status": "active",
+        "avatar": {"icon": "", "small": "", "medium": "", "large": ""},
+    },
+    "package": {"relation": "package", "suuid": "3FqG-if1Z-Gd2s-uYvq", "name": "package.zip"},
+    "payload": None,
+    "result": None,
+    "artifact": None,
+    "metrics_meta": {"count": 0, "size": 0, "metric_names": [], "label_names": []},
+    "variables_meta": {"count": 0, "size": 0, "variable_names": [], "label_names": []},
+    "log": {"relation": "log", "suuid": "6Uda-gBIN-HjDS-5KAj", "name": "log.json", "size": 13720, "lines": 88},
+    "environment": {
+        "name": "",
+        "image": {
+            "relation": "image",
+            "suuid": "6UyU-pZUX-wyBo-PEAN",
+            "name": "askanna/python:3.12-slim",
+            "tag": "3.12-slim",
+            "digest": "sha256:d3be9e9aa5873db96c83147eea63e7b534715875efe4f705d2b1394abbb5ab14",
+        },
+        "timezone": "UTC",
+    },
+    "job": {"relation": "jobdef", "suuid": "69Nk-vIwe-0YKU-uSRB", "name": "train-model"},
+    "project": {"relation": "project", "suuid": "GZFT-EmyJ-CJ5V-kYKM", "name": "Train, select and serve"},
+    "workspace": {"relation": "workspace", "suuid": "1S6G-K3fI-visU-LKac", "name": "Demo AskAnna"},
+    "created_at": "2023-01-26T09:47:41.077335Z",
+    "modified_at": "2023-01-26T09:48:15.774587Z",
+}
+
+
+class SlowRunGateway:
+    def __init__(self):
+        self.pages = {}
+        for start in range(0, NUMBER_OF_RUNS, PAGE_SIZE):
+            end = min(start + PAGE_SIZE, NUMBER_OF_RUNS)
+            runs = []
+            for index in range(start, end):
+                run = copy.deepcopy(RUN)
+                run["suuid"] = f"run-{index}"
+                runs.append(run)
+            self.pages[str(start)] = json.dumps(
+                {
+                    "count": NUMBER_OF_RUNS,
+                    "next": f"https://api/v1/run/?cursor={end}" if end < NUMBER_OF_RUNS else None,
+                    "previous": None,
+                    "results": runs,
+                }
+            )
+
+    def list(self, page_size=None, cursor=None, **query_params):
+        from askanna.gateways.run import RunListResponse
+
+        time.sleep(LATENCY)
+        return RunListResponse(json.loads(self.pages[cursor or "0"]))
+
+
+def handle(run):
+    end = time.perf_counter() + WORK_PER_RUN
+    while time.perf_counter() < end:
+        pass
+
+
+def main():
+    from askanna.sdk.run import RunSDK
+
+    sdk = RunSDK()
+    sdk.gateway = SlowRunGateway()
+
+    print(f"{NUMBER_OF_RUNS} runs, page size {PAGE_SIZE}, {LATENCY * 1000:.0f} ms latency per page")
+    baseline = None
+    for prefetch in (0, 1, 2, 4):
+        start = time.perf_counter()
+        count = 0
+        for run in sdk.iter(page_size=PAGE_SIZE, prefetch=prefetch):
+            handle(run)
+            count += 1
+        seconds = time.perf_counter() - start
+        assert count == NUMBER_OF_RUNS
+        baseline = baseline or seconds
+        print(f"prefetch={prefetch:<5} {seconds:>6.2f} s  ({baseline / seconds:.2f}x)")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The metric collector stores its files in the temporary directory, so set it before importing AskAnna
+        tempfile.tempdir = tmp_dir
+        main()
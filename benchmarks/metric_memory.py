@@ -0,0 +1,71 @@
+"""
+Memory benchmark of tracking 1M metrics and of the metric objects created from them
+
+The memory is measured with tracemalloc. The metrics are tracked with track_metrics_series, each with a label 'step'
+and a label 'model'. Reported are the memory used by the tracked metrics, by the MetricObject of each tracked metric
+and by MetricObject's decoded from the dicts as they are returned by the API.
+
+Run it from the root of the repository with:
+
+    python benchmarks/metric_memory.py
+"""
+
+import gc
+import json
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+NUMBER = 1_000_000
+
+
+def report(name: str, size: int, number: int = NUMBER):
+    print(f"{name:<40} {size / 1024**2:>8.1f} MiB  {size / number:>6.1f} bytes per metric")
+
+
+def measure(create):
+    gc.collect()
+    tracemalloc.start()
+    result = create()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    from askanna.core.dataclasses.run import MetricList, MetricObject
+    from askanna.sdk.track import metric_collector, track_metrics_series
+
+    steps = np.arange(NUMBER // 2)
+
+    def track():
+        track_metrics_series(
+            {"loss": np.linspace(1, 0, NUMBER // 2), "accuracy": np.linspace(0, 1, NUMBER // 2)},
+            steps=steps,
+            label={"model": "forest"},
+        )
+
+    _, size = measure(track)
+    report("tracked metrics", size)
+
+    metrics, size = measure(lambda: list(metric_collector.metrics))
+    report("MetricObject's of tracked metrics", size)
+
+    del metrics
+    # Like responses of the API, the names and types in the decoded JSON are separate string objects
+    dicts = json.loads(metric_collector.metrics.to_json())
+    _, size = measure(lambda: [MetricObject.from_dict(data) for data in dicts])
+    report("MetricObject.from_dict", size)
+
+    # Don't save the tracked metrics when the benchmark exits
+    metric_collector.metrics = MetricList()
+    metric_collector.journal_file.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The metric collector stores its files in the temporary directory, so set it before importing AskAnna
+        tempfile.tempdir = tmp_dir
+        main()
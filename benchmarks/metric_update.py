@@ -0,0 +1,73 @@
+"""
+Benchmark of encoding the request body to push 100k metrics with metric_update
+
+Compared are encoding the JSON twice, as the API client did before, and encoding it once with the json module and with
+orjson (if installed). The time includes preparing the request with requests, but not the time to create the dicts of
+the metrics with MetricList.to_dict. That time is reported separately.
+
+Run it from the root of the repository with:
+
+    python benchmarks/metric_update.py
+"""
+
+import json
+import tempfile
+import timeit
+
+import numpy as np
+
+NUMBER = 100_000
+REPEAT = 3
+
+
+def report(name: str, seconds: float):
+    print(f"{name:<40} {seconds * 1_000:>8.0f} ms")
+
+
+def main():
+    import requests
+
+    from askanna.core.dataclasses.run import MetricList
+    from askanna.core.utils import object as object_utils
+    from askanna.core.utils.object import encode_json, json_serializer
+    from askanna.sdk.track import metric_collector, track_metrics_series
+
+    track_metrics_series(
+        {"loss": np.linspace(1, 0, NUMBER // 2), "accuracy": np.linspace(0, 1, NUMBER // 2)},
+        steps=np.arange(NUMBER // 2),
+        label={"model": "forest"},
+    )
+    metrics = metric_collector.metrics
+
+    report("MetricList.to_dict", min(timeit.repeat(metrics.to_dict, number=1, repeat=REPEAT)))
+    payload = {"metrics": metrics.to_dict()}
+
+    def encode_twice():
+        data = json.loads(json.dumps(payload, default=json_serializer))
+        requests.Request("PATCH", "https://api/v1/run/metric/", json=data).prepare()
+
+    def encode_once():
+        requests.Request(
+            "PATCH",
+            "https://api/v1/run/metric/",
+            data=encode_json(payload),
+            headers={"Content-Type": "application/json"},
+        ).prepare()
+
+    report("encode twice (before)", min(timeit.repeat(encode_twice, number=1, repeat=REPEAT)))
+
+    backends = ["json", "orjson"] if object_utils.ORJSON_INSTALLED else ["json"]
+    for backend in backends:
+        object_utils.JSON_BACKEND = backend
+        report(f"encode once with {backend}", min(timeit.repeat(encode_once, number=1, repeat=REPEAT)))
+
+    # Don't save the tracked metrics when the benchmark exits
+    metric_collector.metrics = MetricList()
+    metric_collector.journal_file.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The metric collector stores its files in the temporary directory, so set it before importing AskAnna
+        tempfile.tempdir = tmp_dir
+        main()
@@ -0,0 +1,56 @@
+"""
+Micro-benchmark of the per-call overhead of tracking metrics and of typing values
+
+Run it from the root of the repository with:
+
+    python benchmarks/track_metric.py
+
+The collected metrics are stored in a temporary directory that is removed afterwards.
+"""
+
+import tempfile
+import timeit
+
+import numpy as np
+
+NUMBER = 20_000
+
+
+def report(name: str, seconds: float, number: int = NUMBER):
+    print(f"{name:<40} {seconds / number * 1_000_000:>8.2f} µs per call")
+
+
+def main():
+    from askanna.core.dataclasses.run import MetricList
+    from askanna.core.utils.object import get_type, prepare_and_validate_value
+    from askanna.sdk.track import metric_collector, track_metric
+
+    values = {
+        "float": 0.5,
+        "numpy float": np.float64(0.5),
+        "list of 1,000 floats": [index / 3 for index in range(1_000)],
+        "list of 1,000 mixed numbers": [index if index % 2 else index / 3 for index in range(1_000)],
+        "numpy array of 1,000 floats": np.arange(1_000, dtype=np.float64),
+    }
+
+    for name, value in values.items():
+        report(f"get_type: {name}", timeit.timeit(lambda: get_type(value), number=NUMBER))
+
+    report("prepare_and_validate_value: float", timeit.timeit(lambda: prepare_and_validate_value(0.5), number=NUMBER))
+
+    report("track_metric: float", timeit.timeit(lambda: track_metric("accuracy", 0.5), number=NUMBER))
+    report(
+        "track_metric: float with label",
+        timeit.timeit(lambda: track_metric("accuracy", 0.5, label={"model": "forest"}), number=NUMBER),
+    )
+
+    # Don't save the tracked metrics when the benchmark exits
+    metric_collector.metrics = MetricList()
+    metric_collector.journal_file.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The metric collector stores its files in the temporary directory, so set it before importing AskAnna
+        tempfile.tempdir = tmp_dir
+        main()
@@ -0,0 +1,125 @@
+"""
+Benchmark of uploading files with a fixed chunk size of 1 MiB and with the adaptive chunk size policy
+
+The files are uploaded to a local stand-in server that waits LATENCY seconds before it answers a request, and reads
+the body of a chunk at BANDWIDTH bytes per second per connection, like a remote AskAnna backend would. The files are
+sparse files, so creating them is fast and does not use disk space. For each file size, the upload time and number
+of chunks is reported for:
+
+- fixed: chunks of 1 MiB, the chunk size before the chunk size policy
+- adaptive (cold): the chunk size policy without measurements, so the chunk size is based on the file size
+- adaptive (warm): the chunk size policy with the measurements of a previous upload
+
+Run it from the root of the repository with:
+
+    python benchmarks/upload_chunk_size.py [SIZE ...]
+
+The sizes default to 10MB 1GB 10GB. Uploading the 10 GB file with fixed chunks takes a few minutes.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY = 0.02  # seconds per request
+BANDWIDTH = 200 * 1024**2  # bytes per second per connection
+CONCURRENCY = 4
+SIZES = {"10MB": 10 * 1000**2, "1GB": 1000**3, "10GB": 10 * 1000**3}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        start = time.perf_counter()
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1024**2)))
+        size = int(self.headers.get("Content-Length", 0))
+        time.sleep(max(0.0, LATENCY + size / BANDWIDTH - (time.perf_counter() - start)))
+
+        if self.path.endswith("/register/"):
+            status, body = 201, {"suuid": "abcd-abcd-abcd-abcd"}
+        elif self.path.endswith("/chunk/"):
+            status, body = 201, {"uuid": "efgh-efgh-efgh-efgh"}
+        else:
+            status, body = 200, {}
+
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def benchmark_upload_class(server_url: str):
+    from askanna.core.upload import Upload
+
+    class BenchmarkUpload(Upload):
+        def register_upload_url(self) -> str:
+            return f"{server_url}/register/"
+
+        def register_chunk_url(self) -> str:
+            return f"{server_url}/chunk/"
+
+        def upload_chunk_url(self, chunk_uuid: str) -> str:
+            return f"{server_url}/chunk/{chunk_uuid}/upload/"
+
+        def finish_upload_url(self) -> str:
+            return f"{server_url}/finish/"
+
+    return BenchmarkUpload
+
+
+def main(sizes):
+    from askanna.core.upload import ChunkSizePolicy
+    from askanna.core.utils.settings import diskunit
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    BenchmarkUpload = benchmark_upload_class(f"http://127.0.0.1:{server.server_address[1]}")
+
+    print(f"{LATENCY * 1000:.0f} ms latency per request, {BANDWIDTH / 1024**2:.0f} MiB/s per connection, ", end="")
+    print(f"{CONCURRENCY} chunks at the same time")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in sizes:
+            file_path = os.path.join(tmp_dir, f"{name}.bin")
+            with open(file_path, "wb") as f:
+                f.truncate(SIZES[name])
+
+            warm_policy = ChunkSizePolicy()
+            policies = [
+                ("fixed", ChunkSizePolicy(min_size=diskunit.MiB, max_size=diskunit.MiB)),
+                ("adaptive (cold)", warm_policy),
+                ("adaptive (warm)", warm_policy),
+            ]
+            baseline = None
+            for label, policy in policies:
+                upload = BenchmarkUpload(concurrency=CONCURRENCY, chunk_size_policy=policy)
+                start = time.perf_counter()
+                status, _ = upload.upload(file_path)
+                seconds = time.perf_counter() - start
+                assert status
+
+                baseline = baseline or seconds
+                chunks = len(upload.resumable_file.chunks)
+                chunk_size = upload.resumable_file.chunk_size / diskunit.MiB
+                print(
+                    f"{name:<5} {label:<16} {seconds:>8.2f} s  ({baseline / seconds:>5.2f}x)  "
+                    f"{chunks:>6} chunks of {chunk_size:>5.2f} MiB"
+                )
+            os.remove(file_path)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or list(SIZES))
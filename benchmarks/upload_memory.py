@@ -0,0 +1,129 @@
+"""
+Benchmark of the peak memory use of uploading a large file with several chunks at the same time
+
+Each upload runs in a new Python process, which reports its peak resident set size (RSS) before and after the
+upload. The file is uploaded to a local stand-in server, which runs in the benchmark process and discards the chunks.
+The file is a sparse file of FILE_SIZE bytes with chunks of CHUNK_SIZE bytes. Two ways to send a chunk are compared:
+
+- copy: read the chunk in a bytes object and let requests encode the multipart body, as before MultipartBody
+- stream: send a MultipartBody that reads the chunk from the file with os.preadv while it is sent
+
+Run it from the root of the repository with:
+
+    python benchmarks/upload_memory.py
+"""
+
+import io
+import json
+import os
+import resource
+import subprocess  # nosec: B404
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FILE_SIZE = 1024**3
+CHUNK_SIZE = 32 * 1024**2
+CONCURRENCY = (1, 4, 8)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1024**2)))
+
+        if self.path.endswith("/register/"):
+            status, body = 201, {"suuid": "abcd-abcd-abcd-abcd"}
+        elif self.path.endswith("/chunk/"):
+            status, body = 201, {"uuid": "efgh-efgh-efgh-efgh"}
+        else:
+            status, body = 200, {}
+
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def peak_rss_mib() -> float:
+    # On Linux ru_maxrss is in KiB, on macOS in bytes
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 1024**2 if sys.platform == "darwin" else maxrss / 1024
+
+
+def child(mode: str, concurrency: int, server_url: str, file_path: str):
+    from askanna.core.upload import ChunkSizePolicy, Upload
+    from askanna.gateways.api_client import client
+
+    class BenchmarkUpload(Upload):
+        def register_upload_url(self) -> str:
+            return f"{server_url}/register/"
+
+        def register_chunk_url(self) -> str:
+            return f"{server_url}/chunk/"
+
+        def upload_chunk_url(self, chunk_uuid: str) -> str:
+            return f"{server_url}/chunk/{chunk_uuid}/upload/"
+
+        def finish_upload_url(self) -> str:
+            return f"{server_url}/finish/"
+
+    class CopyUpload(BenchmarkUpload):
+        def post_chunk(self, chunk, chunk_uuid, data):
+            files = {"file": io.BytesIO(chunk.read())}
+            return client.post(self.upload_chunk_url(chunk_uuid=chunk_uuid), data=data, files=files)
+
+    before = peak_rss_mib()
+    upload_class = CopyUpload if mode == "copy" else BenchmarkUpload
+    upload = upload_class(
+        concurrency=concurrency,
+        chunk_size_policy=ChunkSizePolicy(min_size=CHUNK_SIZE, max_size=CHUNK_SIZE),
+        resume=False,
+    )
+    status, _ = upload.upload(file_path)
+    assert status
+    print(json.dumps({"before": before, "after": peak_rss_mib()}))
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{FILE_SIZE / 1024**3:.0f} GiB file, chunks of {CHUNK_SIZE / 1024**2:.0f} MiB, peak RSS of the process")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "large.bin")
+        with open(file_path, "wb") as f:
+            f.truncate(FILE_SIZE)
+
+        for mode in ("copy", "stream"):
+            for concurrency in CONCURRENCY:
+                output = subprocess.run(  # nosec: B603
+                    [sys.executable, __file__, "--child", mode, str(concurrency), server_url, file_path],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                rss = json.loads(output.splitlines()[-1])
+                print(
+                    f"{mode:<7} concurrency={concurrency:<3} {rss['after']:>8.1f} MiB  "
+                    f"({rss['after'] - rss['before']:>+7.1f} MiB for the upload)"
+                )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], int(sys.argv[3]), sys.argv[4], sys.argv[5])
+    else:
+        main()
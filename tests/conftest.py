@@ -32,3 +32,43 @@ def reset_environment_and_work_dir():
     os.chdir(cwd)
     os.environ.clear()
     os.environ.update(environ_bck)
+
+
+@pytest.fixture(autouse=True)
+def api_client_without_backoff():
+    from askanna.gateways.api_client import client
+
+    backoff_factor = client.retry_policy.backoff_factor
+    client.retry_policy.backoff_factor = 0
+    client.circuit_breaker.reset()
+
+    yield
+
+    client.retry_policy.backoff_factor = backoff_factor
+    client.circuit_breaker.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_chunk_size_policy():
+    from askanna.core.upload import default_chunk_size_policy
+
+    # The measured upload speed of a test should not change the chunk size in other tests
+    default_chunk_size_policy.reset()
+    yield
+    default_chunk_size_policy.reset()
+
+
+@pytest.fixture(autouse=True)
+def upload_state_dir(tmp_path_factory, monkeypatch):
+    # Do not save the progress of uploads in the home directory of the user that runs the tests
+    path = tmp_path_factory.mktemp("upload-state")
+    monkeypatch.setenv("AA_UPLOAD_STATE_DIR", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def push_state_dir(tmp_path_factory, monkeypatch):
+    # Do not save the hash of pushed packages in the home directory of the user that runs the tests
+    path = tmp_path_factory.mktemp("push-state")
+    monkeypatch.setenv("AA_PUSH_STATE_DIR", str(path))
+    return path
@@ -347,6 +347,19 @@ def run_response(
         content_type="application/json",
         json={"error": "Internal Server Error"},
     )
+    api_responses.add(
+        "PATCH",
+        url=askanna_url.run.metric_detail("1234-1234-1234-1234"),
+        status=200,
+        content_type="application/json",
+    )
+    api_responses.add(
+        "PATCH",
+        url=f"{askanna_url.run.metric_detail('wxyz-wxyz-wxyz-wxyz')}",
+        status=404,
+        content_type="application/json",
+        json={"detail": "Not found."},
+    )
 
     # Run variable
     api_responses.add(
@@ -0,0 +1,126 @@
+import asyncio
+import inspect
+import json
+from typing import Callable, Dict, Tuple
+
+import httpx
+import pytest
+import requests
+
+from askanna.aio.api_client import client
+from askanna.config.api_url import askanna_url
+
+Route = Tuple[str, str]
+
+
+class FakeAPI:
+    """Routes requests of the async client to responses, keyed on method and URL without the query string"""
+
+    def __init__(self):
+        self.routes: Dict[Route, Callable[[httpx.Request], httpx.Response]] = {}
+        self.requests = []
+
+    def add(self, method: str, url: str, status: int = 200, json_data=None, content: bytes = b""):
+        def respond(request: httpx.Request) -> httpx.Response:
+            if json_data is not None:
+                return httpx.Response(status, json=json_data)
+            return httpx.Response(status, content=content)
+
+        self.routes[(method, url)] = respond
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        url = str(request.url.copy_with(query=None))
+        respond = self.routes.get((request.method, url))
+        if respond is None:
+            return httpx.Response(404, json={"detail": "Not found."})
+        return respond(request)
+
+    def query(self, request: httpx.Request) -> dict:
+        return dict(request.url.params)
+
+    def body(self, request: httpx.Request) -> dict:
+        return json.loads(request.content)
+
+
+@pytest.fixture()
+def fake_api(monkeypatch, run_list, run_detail, run_metric_list, run_variable_list, job_list, job_run_request):
+    api = FakeAPI()
+    api.add("GET", askanna_url.run.run_list(), json_data=run_list)
+    api.add("GET", askanna_url.run.run_detail("1234-1234-1234-1234"), json_data=run_detail)
+    api.add("GET", askanna_url.run.status("1234-1234-1234-1234"), json_data=job_run_request)
+    api.add("GET", askanna_url.run.metric("1234-1234-1234-1234"), json_data=run_metric_list)
+    api.add("GET", askanna_url.run.variable("1234-1234-1234-1234"), json_data=run_variable_list)
+    api.add("GET", askanna_url.job.job_list(), json_data=job_list)
+    api.add("POST", askanna_url.job.run_request("1234-1234-1234-1234"), status=201, json_data=job_run_request)
+    api.add("GET", askanna_url.run.status("0987-0987-0987-0987"), status=500, json_data={"error": "Internal Error"})
+
+    monkeypatch.setattr(client, "transport", httpx.MockTransport(api.handler))
+    monkeypatch.setattr(client.retry_policy, "backoff_factor", 0)
+    client.circuit_breaker.reset()
+
+    yield api
+
+    client.circuit_breaker.reset()
+
+
+@pytest.fixture()
+def aio_api_response(monkeypatch, api_response):
+    """
+    Send the requests of the async client to the responses of the api_response fixture, so the async gateways and
+    SDKs are tested with the same responses as the sync gateways and SDKs
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        try:
+            response = requests.request(
+                request.method, str(request.url), headers=dict(request.headers), data=request.read()
+            )
+        except requests.ConnectionError as e:
+            raise httpx.ConnectError(str(e), request=request)
+
+        headers = {name: value for name, value in response.headers.items() if name.lower() != "content-encoding"}
+        return httpx.Response(response.status_code, headers=headers, content=response.content)
+
+    monkeypatch.setattr(client, "transport", httpx.MockTransport(handler))
+    monkeypatch.setattr(client.retry_policy, "backoff_factor", 0)
+    client.circuit_breaker.reset()
+
+    yield
+
+    client.circuit_breaker.reset()
+
+
+def blocking(async_class):
+    """
+    Create a class that wraps an object of async_class and runs its coroutine methods with asyncio.run, so the tests of
+    the sync gateways and SDKs can run against the async versions. Async iterators are collected in a list.
+    """
+
+    async def collect(iterator):
+        return [item async for item in iterator]
+
+    class Blocking:
+        def __init__(self, *args, **kwargs):
+            object.__setattr__(self, "wrapped", async_class(*args, **kwargs))
+
+        def __getattr__(self, name):
+            value = getattr(self.wrapped, name)
+            if not inspect.ismethod(value):
+                return value
+
+            def method(*args, **kwargs):
+                result = value(*args, **kwargs)
+                if inspect.iscoroutine(result):
+                    return asyncio.run(result)
+                if hasattr(result, "__aiter__"):
+                    return iter(asyncio.run(collect(result)))
+                return result
+
+            return method
+
+        def __setattr__(self, name, value):
+            setattr(self.wrapped, name, value)
+
+    Blocking.__name__ = async_class.__name__
+    return Blocking
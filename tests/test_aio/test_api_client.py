@@ -0,0 +1,140 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from askanna.aio.api_client import AsyncClient
+from askanna.core.exceptions import ConnectionError
+from askanna.gateways.api_client import CircuitBreaker, RetryPolicy
+from askanna.gateways.api_client import client as sync_client
+
+URL = "https://api.askanna.eu/v1/run/1234-1234-1234-1234/"
+
+
+def async_client(handler, retries: int = 3, threshold: int = 0) -> AsyncClient:
+    return AsyncClient(
+        retry_policy=RetryPolicy(retries=retries, backoff_factor=0),
+        circuit_breaker=CircuitBreaker(threshold=threshold),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_request_arguments():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    async def main():
+        client = async_client(handler)
+        await client.patch(URL, params={"cursor": None, "page_size": 10}, json={"name": "a run"})
+        await client.aclose()
+
+    asyncio.run(main())
+
+    assert dict(requests[0].url.params) == {"page_size": "10"}
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert json.loads(requests[0].content) == {"name": "a run"}
+    assert requests[0].headers["askanna-agent-version"] == sync_client.headers["askanna-agent-version"]
+
+
+def test_retry():
+    statuses = [502, 503]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0) if statuses else 200, json={})
+
+    events = []
+
+    async def main():
+        client = async_client(handler)
+        client.add_hook(events.append)
+        return await client.get(URL)
+
+    assert asyncio.run(main()).status_code == 200
+    assert events[0].retries == 2
+    assert events[0].endpoint == "/v1/run/{suuid}/"
+
+
+def test_retry_post():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadError("connection reset", request=request)
+        return httpx.Response(201, json={})
+
+    # The request was sent before the connection broke, so a POST is not retried
+    with pytest.raises(ConnectionError):
+        asyncio.run(async_client(handler).post(URL, json={}))
+    assert len(calls) == 1
+
+    def refused(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 2:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(201, json={})
+
+    # The connection failed before the request was sent, so also a POST is retried
+    assert asyncio.run(async_client(refused).post(URL, json={})).status_code == 201
+    assert len(calls) == 3
+
+
+def test_circuit_breaker():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    client = async_client(handler, retries=0, threshold=2)
+
+    async def main():
+        await client.get(URL)
+        await client.get(URL)
+        await client.get(URL)
+
+    with pytest.raises(ConnectionError) as e:
+        asyncio.run(main())
+    assert "failed 2 times in a row" in str(e.value)
+
+
+def test_concurrent_requests():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    async def main():
+        client = async_client(handler)
+        return await asyncio.gather(*(client.get(URL) for _ in range(200)))
+
+    responses = asyncio.run(main())
+
+    assert len(responses) == 200
+    assert max_in_flight > 1
+
+
+def test_download(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"x" * 100_000)
+
+    client = async_client(handler)
+    output_file = tmp_path / "data" / "result.bin"
+
+    assert asyncio.run(client.download("https://cdn.askanna.eu/file", output_file)) == 200
+    assert output_file.read_bytes() == b"x" * 100_000
+    assert not (tmp_path / "data" / "result.bin.part").exists()
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.download("https://cdn.askanna.eu/file", output_file))
+    assert asyncio.run(client.download("https://cdn.askanna.eu/missing", tmp_path / "missing.bin")) == 404
+    assert not (tmp_path / "missing.bin").exists()
@@ -0,0 +1,206 @@
+import asyncio
+
+import pytest
+
+from askanna.aio.api_client import client
+from askanna.aio.gateways.job import JobGateway
+from askanna.aio.gateways.package import PackageGateway
+from askanna.aio.gateways.project import ProjectGateway
+from askanna.aio.gateways.run import RunGateway
+from askanna.aio.gateways.variable import VariableGateway
+from askanna.aio.gateways.workspace import WorkspaceGateway
+from askanna.core.dataclasses.run import MetricList, RunStatus
+from askanna.core.exceptions import DeleteError, GetError, PatchError, PostError
+from askanna.gateways.run import RunListResponse
+from askanna.gateways.variable import VariableListResponse
+from tests.test_aio.conftest import blocking
+from tests.test_gateways import (
+    test_job,
+    test_package,
+    test_project,
+    test_run,
+    test_workspace,
+)
+
+
+def test_run_list(fake_api):
+    result = asyncio.run(RunGateway().list(page_size=10, status="finished"))
+
+    assert isinstance(result, RunListResponse)
+    assert result.runs[0].suuid == "1234-1234-1234-1234"
+    assert fake_api.query(fake_api.requests[0]) == {"page_size": "10", "status": "finished"}
+
+
+def test_run_status(fake_api):
+    async def main():
+        gateway = RunGateway()
+        return await asyncio.gather(*(gateway.status("1234-1234-1234-1234") for _ in range(100)))
+
+    statuses = asyncio.run(main())
+
+    assert len(statuses) == 100
+    assert all(isinstance(status, RunStatus) for status in statuses)
+    assert statuses[0].status == "queued"
+
+
+def test_run_status_error(fake_api):
+    with pytest.raises(GetError) as e:
+        asyncio.run(RunGateway().status("0987-0987-0987-0987"))
+    assert "500 - Something went wrong while retrieving the status of run SUUID" in e.value.args[0]
+
+    with pytest.raises(GetError) as e:
+        asyncio.run(RunGateway().status("7890-7890-7890-7890"))
+    assert "404 - The run SUUID '7890-7890-7890-7890' was not found" in e.value.args[0]
+
+
+def test_run_metric(fake_api):
+    metrics = asyncio.run(RunGateway().metric("1234-1234-1234-1234"))
+
+    assert isinstance(metrics, MetricList)
+    assert len(metrics) == 1
+
+
+def test_job_run_request(fake_api):
+    run_status = asyncio.run(JobGateway().run_request("1234-1234-1234-1234", data={"x": 1}, name="a run"))
+
+    assert run_status.suuid == "abcd-abcd-abcd-abcd"
+    assert fake_api.body(fake_api.requests[0]) == {"x": 1}
+    assert fake_api.query(fake_api.requests[0]) == {"name": "a run"}
+
+
+# The tests of the sync gateways run against the async gateways, with the responses of the api_response fixture
+@pytest.fixture()
+def aio_gateways(monkeypatch, aio_api_response):
+    monkeypatch.setattr(test_job, "JobGateway", blocking(JobGateway))
+    monkeypatch.setattr(test_package, "PackageGateway", blocking(PackageGateway))
+    monkeypatch.setattr(test_project, "ProjectGateway", blocking(ProjectGateway))
+    monkeypatch.setattr(test_run, "RunGateway", blocking(RunGateway))
+    monkeypatch.setattr(test_run, "client", client)
+    monkeypatch.setattr(test_workspace, "WorkspaceGateway", blocking(WorkspaceGateway))
+
+
+@pytest.mark.usefixtures("aio_gateways")
+class TestAioGatewayJob(test_job.TestGatewayJob):
+    pass
+
+
+@pytest.mark.usefixtures("aio_gateways")
+class TestAioGatewayPackage(test_package.TestGatewayPackage):
+    pass
+
+
+@pytest.mark.usefixtures("aio_gateways")
+class TestAioGatewayProject(test_project.TestGatewayProject):
+    pass
+
+
+@pytest.mark.usefixtures("aio_gateways")
+class TestAioGatewayRun(test_run.TestGatewayRun):
+    pass
+
+
+@pytest.mark.usefixtures("aio_gateways")
+class TestAioGatewayWorkspace(test_workspace.TestGatewayWorkspace):
+    pass
+
+
+@pytest.mark.usefixtures("aio_api_response")
+class TestAioGatewayVariable:
+    def test_list(self):
+        result = asyncio.run(VariableGateway().list())
+
+        assert isinstance(result, VariableListResponse)
+        assert result.variables[0].suuid == "1234-1234-1234-1234"
+
+    def test_list_page_size(self):
+        result = asyncio.run(VariableGateway().list(page_size=1, cursor="123"))
+
+        assert len(result.variables) == 1
+        assert result.next_url == "https://api.askanna.eu/v1/variable/?cursor=567&page_size=1"
+
+    def test_list_error(self):
+        with pytest.raises(GetError) as e:
+            asyncio.run(VariableGateway().list(cursor="999"))
+
+        assert "Something went wrong while retrieving variable list" in e.value.args[0]
+
+    def test_detail(self):
+        variable = asyncio.run(VariableGateway().detail("1234-1234-1234-1234"))
+
+        assert variable.suuid == "1234-1234-1234-1234"
+
+    def test_detail_not_found(self):
+        with pytest.raises(GetError) as e:
+            asyncio.run(VariableGateway().detail("7890-7890-7890-7890"))
+
+        assert e.value.args[0] == "404 - The variable SUUID '7890-7890-7890-7890' was not found"
+
+    def test_detail_error(self):
+        with pytest.raises(GetError) as e:
+            asyncio.run(VariableGateway().detail("0987-0987-0987-0987"))
+
+        assert "500 - Something went wrong while retrieving the variable SUUID '0987-0987-0987-0987'" in (
+            e.value.args[0]
+        )
+
+    def test_create(self):
+        variable = asyncio.run(
+            VariableGateway().create(
+                project_suuid="1234-1234-1234-1234", name="a new variable", value="new variable value"
+            )
+        )
+
+        assert variable.suuid == "4321-4321-4321-4321"
+        assert variable.name == "a new variable"
+
+    def test_create_error(self):
+        with pytest.raises(PostError) as e:
+            asyncio.run(
+                VariableGateway().create(
+                    project_suuid="1234-1234-1234-1234", name="variable with error", value="value", is_masked=True
+                )
+            )
+
+        assert "500 - Something went wrong while creating the variable" in e.value.args[0]
+
+    def test_change(self):
+        variable = asyncio.run(VariableGateway().change("1234-1234-1234-1234", name="new name"))
+
+        assert variable.name == "new name"
+
+    def test_change_without_changes(self):
+        with pytest.raises(ValueError) as e:
+            asyncio.run(VariableGateway().change("1234-1234-1234-1234"))
+
+        assert "At least one of the arguments 'name', 'value' or 'is_masked' should be provided." in e.value.args[0]
+
+    def test_change_not_found(self):
+        with pytest.raises(PatchError) as e:
+            asyncio.run(VariableGateway().change("7890-7890-7890-7890", value="new value"))
+
+        assert e.value.args[0] == "404 - The variable SUUID '7890-7890-7890-7890' was not found"
+
+    def test_change_error(self):
+        with pytest.raises(PatchError) as e:
+            asyncio.run(VariableGateway().change("0987-0987-0987-0987", name="new name"))
+
+        assert "500 - Something went wrong while updating the variable SUUID '0987-0987-0987-0987'" in (
+            e.value.args[0]
+        )
+
+    def test_delete(self):
+        assert asyncio.run(VariableGateway().delete("1234-1234-1234-1234")) is True
+
+    def test_delete_not_found(self):
+        with pytest.raises(DeleteError) as e:
+            asyncio.run(VariableGateway().delete("7890-7890-7890-7890"))
+
+        assert e.value.args[0] == "404 - The variable SUUID '7890-7890-7890-7890' was not found"
+
+    def test_delete_error(self):
+        with pytest.raises(DeleteError) as e:
+            asyncio.run(VariableGateway().delete("0987-0987-0987-0987"))
+
+        assert "500 - Something went wrong while deleting the variable SUUID '0987-0987-0987-0987'" in (
+            e.value.args[0]
+        )
@@ -0,0 +1,259 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from askanna import aio
+from askanna.aio.sdk.job import JobSDK
+from askanna.aio.sdk.mixins import AsyncListMixin, prefetch_iterator
+from askanna.aio.sdk.package import PackageSDK
+from askanna.aio.sdk.project import ProjectSDK
+from askanna.aio.sdk.run import RunSDK
+from askanna.aio.sdk.variable import VariableSDK
+from askanna.aio.sdk.workspace import WorkspaceSDK
+from askanna.config.api_url import askanna_url
+from askanna.core.exceptions import GetError
+from tests.test_aio.conftest import blocking
+from tests.test_sdk import test_job, test_mixins, test_project, test_run, test_workspace
+
+
+def test_run_list(fake_api):
+    runs = asyncio.run(aio.run.list(job_name="a job", project_suuid="abcd-abcd-abcd-abcd", include_metrics=True))
+
+    assert [run.suuid for run in runs] == ["1234-1234-1234-1234"]
+    assert len(runs[0].metrics) == 1
+    run_list_request = fake_api.requests[1]
+    assert fake_api.query(run_list_request)["job_suuid"] == "1234-1234-1234-1234"
+
+
+def test_run_iter(fake_api, run_detail):
+    pages = {
+        None: {"count": 3, "next": f"{askanna_url.run.run_list()}?cursor=2", "previous": None},
+        "2": {"count": 3, "next": None, "previous": None},
+    }
+
+    def respond(request):
+        page = dict(pages[request.url.params.get("cursor")])
+        page["results"] = [dict(run_detail)] * (2 if page["next"] else 1)
+        return httpx.Response(200, json=page)
+
+    fake_api.routes[("GET", askanna_url.run.run_list())] = respond
+
+    async def main():
+        return [run.suuid async for run in aio.run.iter(page_size=2)]
+
+    assert len(asyncio.run(main())) == 3
+    assert aio.run.list_total_count == 3
+
+
+def test_run_get_and_status(fake_api):
+    async def main():
+        return await asyncio.gather(
+            aio.run.get("1234-1234-1234-1234", include_variables=True),
+            aio.run.status("1234-1234-1234-1234"),
+        )
+
+    run, status = asyncio.run(main())
+
+    assert run.suuid == "1234-1234-1234-1234"
+    assert len(run.variables) == 1
+    assert status.status == "queued"
+
+
+def test_run_start(fake_api):
+    run = aio.RunSDK()
+    run_status = asyncio.run(run.start(job_suuid="1234-1234-1234-1234"))
+
+    assert run_status.suuid == "abcd-abcd-abcd-abcd"
+    assert run.run_suuid == "abcd-abcd-abcd-abcd"
+
+
+# The tests of the sync SDKs run against the async SDKs, with the responses of the api_response fixture
+@pytest.fixture()
+def aio_sdks(monkeypatch, aio_api_response):
+    monkeypatch.setattr(test_job, "JobSDK", blocking(JobSDK))
+    monkeypatch.setattr(test_project, "ProjectSDK", blocking(ProjectSDK))
+    monkeypatch.setattr(test_run, "RunSDK", blocking(RunSDK))
+    monkeypatch.setattr(test_workspace, "WorkspaceSDK", blocking(WorkspaceSDK))
+    monkeypatch.setattr(test_mixins, "RunSDK", blocking(RunSDK))
+    monkeypatch.setattr(test_mixins, "WorkspaceSDK", blocking(WorkspaceSDK))
+
+
+@pytest.mark.usefixtures("aio_sdks")
+class TestAioSDKJob(test_job.TestSDKJob):
+    pass
+
+
+@pytest.mark.usefixtures("aio_sdks")
+class TestAioSDKProject(test_project.TestProjectSDK):
+    pass
+
+
+@pytest.mark.usefixtures("aio_sdks")
+class TestAioSDKRun(test_run.TestSDKRun):
+    pass
+
+
+@pytest.mark.usefixtures("aio_sdks")
+class TestAioSDKWorkspace(test_workspace.TestWorkspaceSDK):
+    pass
+
+
+@pytest.mark.usefixtures("aio_sdks")
+class TestAioSDKIter(test_mixins.TestSDKIter):
+    pass
+
+
+class FakeAsyncListGateway(test_mixins.FakeListGateway):
+    async def list(self, page_size, cursor=None, **query_params):
+        return super().list(page_size, cursor=cursor, **query_params)
+
+
+class FakeAsyncListSDK(AsyncListMixin):
+    def __init__(self, gateway):
+        super().__init__()
+        self.gateway = gateway
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestAsyncListMixin:
+    def test_iter_list_prefetch(self):
+        gateway = FakeAsyncListGateway()
+        results = FakeAsyncListSDK(gateway).iter_list(page_size=100, prefetch=2)
+
+        assert asyncio.run(collect(results)) == list(range(250))
+        assert [call["cursor"] for call in gateway.calls] == [None, "100", "200"]
+
+    def test_iter_list_prefetch_error(self):
+        consumed = []
+
+        async def main():
+            async for result in FakeAsyncListSDK(FakeAsyncListGateway(fail_at_cursor="200")).iter_list(
+                page_size=100, prefetch=1
+            ):
+                consumed.append(result)
+
+        with pytest.raises(GetError):
+            asyncio.run(main())
+        assert consumed == list(range(200))
+
+
+class TestAioPrefetchIterator:
+    def test_prefetch_iterator(self):
+        async def items():
+            for item in range(10):
+                yield item
+
+        assert asyncio.run(collect(prefetch_iterator(items(), depth=3))) == list(range(10))
+
+    def test_prefetch_iterator_depth(self):
+        consumed = []
+
+        async def items():
+            for item in range(10):
+                consumed.append(item)
+                yield item
+
+        async def main():
+            prefetched = prefetch_iterator(items(), depth=2)
+            assert await prefetched.__anext__() == 0
+
+            # One item is yielded, two items wait in the queue and the task waits to add the next item
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert len(consumed) == 4
+
+            assert await collect(prefetched) == list(range(1, 10))
+
+        asyncio.run(main())
+
+    def test_prefetch_iterator_close(self):
+        async def items():
+            for item in range(1000):
+                yield item
+
+        async def main():
+            prefetched = prefetch_iterator(items(), depth=1)
+            assert await prefetched.__anext__() == 0
+            await prefetched.aclose()
+            await asyncio.sleep(0)
+
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        assert asyncio.run(main()) == []
+
+
+@pytest.mark.usefixtures("aio_api_response")
+class TestAioSDKVariable:
+    def test_variable_list(self):
+        variables = asyncio.run(VariableSDK().list(number_of_results=1))
+
+        assert len(variables) == 1
+        assert variables[0].suuid == "1234-1234-1234-1234"
+
+    def test_variable_iter(self):
+        async def collect():
+            return [variable async for variable in VariableSDK().iter(page_size=1)]
+
+        assert len(asyncio.run(collect())) >= 1
+
+    def test_variable_get(self):
+        variable = asyncio.run(VariableSDK().get("1234-1234-1234-1234"))
+
+        assert variable.suuid == "1234-1234-1234-1234"
+
+    def test_variable_get_not_found(self):
+        with pytest.raises(GetError) as e:
+            asyncio.run(VariableSDK().get("7890-7890-7890-7890"))
+
+        assert e.value.args[0] == "404 - The variable SUUID '7890-7890-7890-7890' was not found"
+
+    def test_variable_add(self):
+        variable = asyncio.run(
+            VariableSDK().add(project_suuid="1234-1234-1234-1234", name="a new variable", value="new variable value")
+        )
+
+        assert variable.suuid == "4321-4321-4321-4321"
+
+    def test_variable_change(self):
+        variable = asyncio.run(VariableSDK().change("1234-1234-1234-1234", name="new name"))
+
+        assert variable.name == "new name"
+
+    def test_variable_delete(self):
+        assert asyncio.run(VariableSDK().delete("1234-1234-1234-1234")) is True
+
+
+@pytest.mark.usefixtures("aio_api_response")
+class TestAioSDKPackage:
+    def test_package_list(self):
+        packages = asyncio.run(PackageSDK().list(project_suuid="1234-1234-1234-1234"))
+
+        assert len(packages) > 0
+
+    def test_package_get(self, package_zip_file):
+        package = asyncio.run(PackageSDK().get("1234-1234-1234-1234"))
+
+        assert package == package_zip_file
+
+    def test_package_download(self, package_zip_file, temp_dir):
+        package_path = temp_dir + "/aio-package.zip"
+        asyncio.run(PackageSDK().download(package_path, "1234-1234-1234-1234"))
+
+        assert Path(package_path).read_bytes() == package_zip_file
+
+    def test_package_download_not_found(self, temp_dir):
+        with pytest.raises(GetError) as e:
+            asyncio.run(PackageSDK().download(temp_dir + "/aio-package.zip", "wxyz-wxyz-wxyz-wxyz"))
+
+        assert e.value.args[0] == "404 - Package SUUID 'wxyz-wxyz-wxyz-wxyz' was not found"
+
+    def test_package_without_suuid(self):
+        with pytest.raises(ValueError) as e:
+            asyncio.run(PackageSDK().get())
+
+        assert e.value.args[0] == "No package SUUID set"
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from askanna.cli import cli
+from askanna.core.cache import run_cache
+from askanna.core.dataclasses.run import Run
+
+
+@pytest.fixture
+def cache_with_entry(monkeypatch, temp_dir, run_detail):
+    monkeypatch.setattr(run_cache, "path", Path(temp_dir))
+    run_cache.put_bytes(Run.from_dict(run_detail.copy()), "result", b"result")
+    return run_cache
+
+
+class TestCliCache:
+    """
+    Test 'askanna cache' where we expect to manage the local cache of runs
+    """
+
+    def test_command_cache_help(self):
+        result = CliRunner().invoke(cli, ["cache", "--help"])
+        assert result.exit_code == 0
+        assert "cache [OPTIONS]" in result.output
+
+    def test_command_cache_stats(self, cache_with_entry):
+        result = CliRunner().invoke(cli, ["cache", "stats"])
+        assert result.exit_code == 0
+        assert f"Path:            {cache_with_entry.path}" in result.output
+        assert "Runs:            1" in result.output
+        assert "Entries:         1" in result.output
+
+    def test_command_cache_clear(self, cache_with_entry):
+        result = CliRunner().invoke(cli, ["cache", "clear"])
+        assert result.exit_code == 0
+        assert "is cleared" in result.output
+        assert cache_with_entry.stats()["entries"] == 0
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from click.testing import CliRunner
 
@@ -72,3 +74,31 @@ class TestCliPush:
 
         assert not result.exception
         assert "Uploading" in result.output
+
+    def test_command_push_skip_unchanged(self, push_state_dir):
+        config.project.project_config_path = "tests/fixtures/projects/project-001-simple/askanna.yml"
+        config.project.project_suuid = "1234-1234-1234-1234"
+        last_push_file = push_state_dir / "1234-1234-1234-1234.json"
+
+        result = CliRunner().invoke(cli, "push --force")
+        assert not result.exception
+        assert "Uploading" in result.output
+        last_push = json.loads(last_push_file.read_text())
+        assert last_push["package_suuid"] == "abcd-abcd-abcd-abcd"
+
+        # The current package of the project is not the package of the last push, so we push again
+        result = CliRunner().invoke(cli, "push --force")
+        assert not result.exception
+        assert "Uploading" in result.output
+        assert json.loads(last_push_file.read_text())["package_hash"] == last_push["package_hash"]
+
+        last_push["package_suuid"] = "3FqG-if1Z-Gd2s-uYvq"
+        last_push_file.write_text(json.dumps(last_push))
+        result = CliRunner().invoke(cli, "push --force")
+        assert not result.exception
+        assert "did not change since the last push" in result.output
+        assert "Uploading" not in result.output
+
+        result = CliRunner().invoke(cli, "push --force --no-skip-unchanged")
+        assert not result.exception
+        assert "Uploading" in result.output
@@ -17,7 +17,7 @@ class TestCliAskWhichWorkspace:
     @pytest.mark.usefixtures("api_response")
     def test_ask_which_workspace(self):
         result = utils.ask_which_workspace()
-        assert type(result) == Workspace
+        assert isinstance(result, Workspace)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -50,7 +50,7 @@ class TestCliAskWhichWorkspace:
         monkeypatch.setattr("sys.stdin", io.StringIO("1"))
         result = utils.ask_which_workspace()
 
-        assert type(result) == Workspace
+        assert isinstance(result, Workspace)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -72,7 +72,7 @@ class TestCliAskWhichWorkspace:
         result = utils.ask_which_workspace()
         captured = capsys.readouterr()
 
-        assert type(result) == Workspace
+        assert isinstance(result, Workspace)
         assert result.suuid == "1234-1234-1234-1234"
 
         assert "Note: the 99 most recent workspaces of 100 workspaces are in the list." in captured.out
@@ -82,7 +82,7 @@ class TestCliAskWhichProject:
     @pytest.mark.usefixtures("api_response")
     def test_ask_which_project(self):
         result = utils.ask_which_project()
-        assert type(result) == Project
+        assert isinstance(result, Project)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -115,7 +115,7 @@ class TestCliAskWhichProject:
         monkeypatch.setattr("sys.stdin", io.StringIO("1"))
         result = utils.ask_which_project()
 
-        assert type(result) == Project
+        assert isinstance(result, Project)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -137,7 +137,7 @@ class TestCliAskWhichProject:
         result = utils.ask_which_project()
         captured = capsys.readouterr()
 
-        assert type(result) == Project
+        assert isinstance(result, Project)
         assert result.suuid == "1234-1234-1234-1234"
 
         assert "Note: the 99 most recent projects of 100 projects are in the list." in captured.out
@@ -147,7 +147,7 @@ class TestCliAskWhichJob:
     @pytest.mark.usefixtures("api_response")
     def test_ask_which_job(self):
         result = utils.ask_which_job()
-        assert type(result) == Job
+        assert isinstance(result, Job)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -180,7 +180,7 @@ class TestCliAskWhichJob:
         monkeypatch.setattr("sys.stdin", io.StringIO("1"))
         result = utils.ask_which_job()
 
-        assert type(result) == Job
+        assert isinstance(result, Job)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -202,7 +202,7 @@ class TestCliAskWhichJob:
         result = utils.ask_which_job()
         captured = capsys.readouterr()
 
-        assert type(result) == Job
+        assert isinstance(result, Job)
         assert result.suuid == "1234-1234-1234-1234"
 
         assert "Note: the 99 most recent jobs of 100 jobs are in the list." in captured.out
@@ -212,7 +212,7 @@ class TestCliAskWhichRun:
     @pytest.mark.usefixtures("api_response")
     def test_ask_which_run(self):
         result = utils.ask_which_run()
-        assert type(result) == Run
+        assert isinstance(result, Run)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -245,7 +245,7 @@ class TestCliAskWhichRun:
         monkeypatch.setattr("sys.stdin", io.StringIO("1"))
         result = utils.ask_which_run()
 
-        assert type(result) == Run
+        assert isinstance(result, Run)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -267,7 +267,7 @@ class TestCliAskWhichRun:
         result = utils.ask_which_run()
         captured = capsys.readouterr()
 
-        assert type(result) == Run
+        assert isinstance(result, Run)
         assert result.suuid == "1234-1234-1234-1234"
 
         assert "Note: the 99 most recent runs of 100 runs are in the list." in captured.out
@@ -284,7 +284,7 @@ class TestCliAskWhichVariable:
             json={"count": 1, "next": None, "previous": None, "results": [variable_detail]},
         )
         result = utils.ask_which_variable()
-        assert type(result) == Variable
+        assert isinstance(result, Variable)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -317,7 +317,7 @@ class TestCliAskWhichVariable:
         monkeypatch.setattr("sys.stdin", io.StringIO("1"))
         result = utils.ask_which_variable()
 
-        assert type(result) == Variable
+        assert isinstance(result, Variable)
         assert result.suuid == "1234-1234-1234-1234"
 
     @responses.activate
@@ -339,7 +339,7 @@ class TestCliAskWhichVariable:
         result = utils.ask_which_variable()
         captured = capsys.readouterr()
 
-        assert type(result) == Variable
+        assert isinstance(result, Variable)
         assert result.suuid == "1234-1234-1234-1234"
 
         assert "Note: the 99 most recent variables of 100 variables are in the list." in captured.out
@@ -349,12 +349,12 @@ class TestCliAskWhichVariable:
 class TestCliUtilsDetermineProjectForRunRequest:
     def test_determine_project(self):
         result = utils.determine_project_for_run_request("1234-1234-1234-1234")
-        assert type(result) == Project
+        assert isinstance(result, Project)
         assert result.suuid == "1234-1234-1234-1234"
 
     def test_determine_project_no_project_suuid(self):
         result = utils.determine_project_for_run_request()
-        assert type(result) == Project
+        assert isinstance(result, Project)
         assert result.suuid == "1234-1234-1234-1234"
 
 
@@ -135,6 +135,12 @@ class TestLoadConfig(unittest.TestCase):
         self.assertTrue(config.is_authenticated)
         self.assertEqual(config.config_dict["server"]["default"], server_dict)
 
+    def test_load_upload_chunk_size_max(self):
+        path = f'{self.tempdir}/{fake.file_name(extension="yml")}'
+        store_config(path, {"server": {"default": {"remote": "localhost", "upload_chunk_size_max": 524288}}})
+
+        self.assertEqual(load_config(path).upload_chunk_size_max, 524288)
+
     def test_load_isnotfile(self):
         path = fake.file_path(extension="yml", depth=fake.random_int(min=0, max=10))
         config = load_config(path)
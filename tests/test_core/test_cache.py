@@ -0,0 +1,116 @@
+import datetime
+import math
+import os
+from pathlib import Path
+
+import pytest
+
+from askanna.core.cache import RunCache
+from askanna.core.dataclasses.run import Metric, MetricList, MetricObject, Run
+
+
+@pytest.fixture
+def run(run_detail):
+    return Run.from_dict(run_detail.copy())
+
+
+@pytest.fixture
+def cache(temp_dir):
+    return RunCache(path=Path(temp_dir) / "cache", max_size=1000)
+
+
+class TestRunCache:
+    def test_is_cacheable(self, cache, run):
+        assert cache.is_cacheable(run)
+
+        run.status = "running"
+        assert not cache.is_cacheable(run)
+
+    def test_object(self, cache, run):
+        with pytest.raises(KeyError):
+            cache.get_object(run, "metrics", MetricList.from_dict)
+
+        metrics = MetricList(metrics=[MetricObject(metric=Metric(name="loss", value=float("nan"), type="float"))])
+        cache.put_object(run, "metrics", metrics)
+        assert cache.entry_path(run, "metrics").read_bytes().startswith(b'[{"metric": {"name": "loss"')
+        cached_metrics = cache.get_object(run, "metrics", MetricList.from_dict)
+        assert cached_metrics.to_dict()[0]["created_at"] == metrics[0].created_at
+        assert math.isnan(cached_metrics[0].metric.value)
+
+        cache.put_object(run, "payload_info", None)
+        assert cache.get_object(run, "payload_info", MetricList.from_dict) is None
+
+    def test_object_not_decoded(self, cache, run):
+        # For example an entry written by another version of AskAnna
+        cache.put_bytes(run, "metrics", b"\x80\x05not json")
+        with pytest.raises(KeyError):
+            cache.get_object(run, "metrics", MetricList.from_dict)
+
+        cache.put_bytes(run, "metrics", b'[{"name": "loss"}]')
+        with pytest.raises(KeyError):
+            cache.get_object(run, "metrics", MetricList.from_dict)
+
+    def test_bytes_and_file(self, cache, run, temp_dir):
+        cache.put_bytes(run, "result", b"result")
+        assert cache.get_bytes(run, "result") == b"result"
+
+        source = Path(temp_dir) / "payload.json"
+        source.write_bytes(b"{}")
+        cache.put_file(run, "payload", source)
+        assert cache.get_file(run, "payload").read_bytes() == b"{}"
+
+    def test_too_large(self, cache, run):
+        cache.put_bytes(run, "result", b"x" * 1001)
+
+        with pytest.raises(KeyError):
+            cache.get_bytes(run, "result")
+
+    def test_modified_run(self, cache, run):
+        cache.put_bytes(run, "result", b"result")
+        run.modified_at = run.modified_at + datetime.timedelta(seconds=1)
+
+        with pytest.raises(KeyError):
+            cache.get_bytes(run, "result")
+
+        # Adding an entry for the modified run removes the entries of the old version
+        cache.put_bytes(run, "metrics", b"metrics")
+        assert cache.stats()["entries"] == 1
+
+    def test_get_run(self, cache, run):
+        assert cache.get_run(run.suuid) is None
+
+        cache.put_bytes(run, "result", b"result")
+        cached_run = cache.get_run(run.suuid)
+        assert cached_run.suuid == run.suuid
+        assert cached_run.modified_at == run.modified_at
+        assert cache.get_bytes(cached_run, "result") == b"result"
+        assert cache.entry_path(cached_run, "result") == cache.entry_path(run, "result")
+
+    def test_evict_least_recently_used(self, cache, run):
+        cache.put_bytes(run, "first", b"x" * 400)
+        cache.put_bytes(run, "second", b"x" * 400)
+        os.utime(cache.entry_path(run, "first"), (1, 1))
+        os.utime(cache.entry_path(run, "second"), (2, 2))
+        cache.get_bytes(run, "first")
+
+        cache.put_bytes(run, "third", b"x" * 400)
+
+        assert cache.get_bytes(run, "first")
+        assert cache.get_bytes(run, "third")
+        with pytest.raises(KeyError):
+            cache.get_bytes(run, "second")
+
+    def test_stats_and_clear(self, cache, run):
+        cache.put_bytes(run, "result", b"result")
+        cache.put_bytes(run, "metrics", b"metrics")
+
+        assert cache.stats() == {
+            "path": str(cache.path),
+            "runs": 1,
+            "entries": 2,
+            "size": 13,
+            "max_size": 1000,
+        }
+
+        cache.clear()
+        assert cache.stats()["entries"] == 0
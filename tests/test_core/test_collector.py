@@ -0,0 +1,429 @@
+import json
+import tempfile
+import threading
+import time
+
+import pytest
+
+from askanna.core.collector import MetricCollector, VariableCollector
+from askanna.core.dataclasses.base import Label
+from askanna.core.dataclasses.run import (
+    Metric,
+    MetricList,
+    MetricObject,
+    Variable,
+    VariableObject,
+)
+from askanna.core.exceptions import PutError
+from askanna.gateways.run import RunGateway
+
+
+@pytest.fixture
+def collector_temp_dir(monkeypatch, temp_dir):
+    monkeypatch.setattr(tempfile, "tempdir", temp_dir)
+    yield temp_dir
+
+
+def a_metric(name: str = "accuracy", value=0.9) -> MetricObject:
+    return MetricObject(
+        metric=Metric(name=name, value=value, type="float"),
+        label=[Label(name="city", value="Amsterdam", type="string")],
+    )
+
+
+@pytest.mark.usefixtures("collector_temp_dir")
+class TestCollectorJournal:
+    def test_add_appends_to_journal(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add(a_metric("accuracy"))
+        collector.add(a_metric("loss", 0.1))
+
+        assert not collector.collector_file.exists()
+        with collector.journal_file.open() as f:
+            lines = f.readlines()
+
+        assert len(lines) == 3
+        assert json.loads(lines[0]) == {"journal_id": collector.journal_id}
+        assert json.loads(lines[1])["metric"]["name"] == "accuracy"
+        assert json.loads(lines[2])["metric"]["name"] == "loss"
+        assert json.loads(lines[2])["run_suuid"] == "abcd-abcd-abcd-abcd"
+
+    def test_restore_session_from_journal(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add(a_metric("accuracy"))
+        collector.add(a_metric("loss", 0.1))
+
+        restored_collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        assert len(restored_collector) == 2
+        assert restored_collector.metrics[1].metric.name == "loss"
+        assert restored_collector.metrics[1].label[0].value == "Amsterdam"
+        assert restored_collector.metrics[1].created_at == collector.metrics[1].created_at
+
+    def test_restore_session_skips_incomplete_record(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add(a_metric("accuracy"))
+        with collector.journal_file.open("a") as f:
+            f.write('{"metric": {"name": "lo')
+
+        restored_collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        assert len(restored_collector) == 1
+
+    def test_save_local_compacts_journal(self):
+        collector = VariableCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add(VariableObject(variable=Variable(name="model", value="forest", type="string")))
+        collector.save_local()
+
+        assert not collector.journal_file.exists()
+        with collector.collector_file.open() as f:
+            assert len(json.load(f)["records"]) == 1
+
+        collector.add(VariableObject(variable=Variable(name="seed", value=42, type="integer")))
+
+        restored_collector = VariableCollector(run_suuid="abcd-abcd-abcd-abcd")
+        assert len(restored_collector) == 2
+        assert [variable.variable.name for variable in restored_collector.variables] == ["model", "seed"]
+
+    def test_restore_session_after_stop_during_save_local(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add(a_metric("accuracy"))
+        collector.add(a_metric("loss", 0.1))
+        journal = collector.journal_file.read_text()
+
+        # The process stopped after the collector file was saved and before the journal was removed
+        collector.save_local()
+        collector.journal_file.write_text(journal)
+
+        restored_collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        assert len(restored_collector) == 2
+        assert not restored_collector.journal_file.exists()
+
+        restored_collector.add(a_metric("precision"))
+        assert len(MetricCollector(run_suuid="abcd-abcd-abcd-abcd")) == 3
+
+    def test_restore_session_from_collector_file(self):
+        # Sessions started before the journal was introduced only have a collector file
+        metric = a_metric()
+        metric.run_suuid = "abcd-abcd-abcd-abcd"
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.collector_file.parent.mkdir(parents=True, exist_ok=True)
+        with collector.collector_file.open("w") as f:
+            f.write(MetricList(metrics=[metric]).to_json())
+
+        restored_collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        assert len(restored_collector) == 1
+        assert restored_collector.metrics[0].metric.name == "accuracy"
+
+    def test_collectors_do_not_share_data(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add(a_metric())
+
+        assert len(MetricCollector()) == 0
+
+
+@pytest.mark.usefixtures("collector_temp_dir")
+class TestMetricCollectorSeries:
+    def test_add_series(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add(a_metric("accuracy"))
+        collector.add_series(
+            name="loss",
+            type="float",
+            values=[0.5, 0.25, float("nan")],
+            labels=[Label(name="city", value="Amsterdam", type="string")],
+            steps=[1, 2, 3],
+        )
+
+        assert len(collector) == 4
+        assert collector.metrics[2].metric.value == 0.25
+        assert collector.metrics[2].metric.type == "float"
+        assert collector.metrics[2].run_suuid == "abcd-abcd-abcd-abcd"
+        assert collector.metrics[2].label == (
+            Label(name="city", value="Amsterdam", type="string"),
+            Label(name="step", value=2, type="integer"),
+        )
+
+        restored_collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        assert restored_collector.metrics.to_dict()[:3] == collector.metrics.to_dict()[:3]
+        assert restored_collector.metrics[3].metric.value != restored_collector.metrics[3].metric.value  # NaN
+
+    def test_add_series_strings(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add_series(name="city", type="string", values=["Amsterdam", 'Rotterdam, "010"'])
+
+        restored_collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        assert [metric.metric.value for metric in restored_collector.metrics] == ["Amsterdam", 'Rotterdam, "010"']
+        assert restored_collector.metrics[0].label == ()
+
+    def test_add_series_buffered(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_interval=60)
+        collector.add(a_metric("accuracy"))
+        collector.add_series(name="loss", type="integer", values=[1, 2])
+
+        assert [metric.metric.name for metric in collector.metrics] == ["accuracy", "loss", "loss"]
+        collector.stop_flush_thread(timeout=5)
+
+    def test_add_series_steps_mismatch(self):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        with pytest.raises(ValueError):
+            collector.add_series(name="loss", type="integer", values=[1, 2], steps=[1])
+
+
+@pytest.fixture
+def metric_update_calls(monkeypatch):
+    calls = []
+
+    def metric_update(self, run_suuid, metrics):
+        calls.append((run_suuid, len(metrics)))
+
+    monkeypatch.setattr(RunGateway, "metric_update", metric_update)
+    yield calls
+
+
+@pytest.mark.usefixtures("collector_temp_dir")
+class TestMetricCollectorBuffered:
+    def test_add_buffers_metric(self, metric_update_calls):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_interval=60)
+        collector.add(a_metric())
+
+        assert len(collector) == 1
+        assert len(collector.metrics) == 0
+        assert not collector.journal_file.exists()
+
+        assert collector.stop_flush_thread(timeout=5)
+        assert len(collector.metrics) == 1
+        assert collector.journal_file.exists()
+        assert metric_update_calls == [("abcd-abcd-abcd-abcd", 1)]
+        assert collector.changed is False
+
+    def test_flush_on_size(self, metric_update_calls):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_size=2, flush_interval=60)
+        collector.add(a_metric("accuracy"))
+        collector.add(a_metric("loss"))
+
+        for _ in range(100):
+            if metric_update_calls:
+                break
+            time.sleep(0.05)
+
+        assert metric_update_calls == [("abcd-abcd-abcd-abcd", 2)]
+        assert collector.stop_flush_thread(timeout=5)
+        assert metric_update_calls == [("abcd-abcd-abcd-abcd", 2)]
+
+    def test_flush_on_size_pushes_when_metrics_doubled(self, metric_update_calls):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_size=1, flush_interval=60)
+
+        for index, expected_calls in enumerate([1, 2, 2, 3]):
+            collector.add(a_metric(f"metric-{index}"))
+            for _ in range(100):
+                if len(metric_update_calls) == expected_calls and len(collector.metrics) == index + 1:
+                    break
+                time.sleep(0.05)
+
+        assert [count for _, count in metric_update_calls] == [1, 2, 4]
+        assert collector.stop_flush_thread(timeout=5)
+        assert [count for _, count in metric_update_calls] == [1, 2, 4]
+
+    def test_flush_on_interval(self, metric_update_calls):
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_interval=0.05)
+        collector.add(a_metric())
+
+        for _ in range(100):
+            if metric_update_calls:
+                break
+            time.sleep(0.05)
+
+        assert metric_update_calls == [("abcd-abcd-abcd-abcd", 1)]
+        assert collector.stop_flush_thread(timeout=5)
+
+    def test_flush_without_run_suuid(self, metric_update_calls):
+        collector = MetricCollector(buffered=True, flush_interval=60)
+        collector.add(a_metric())
+
+        assert collector.stop_flush_thread(timeout=5)
+        assert len(collector.metrics) == 1
+        assert collector.changed is True
+        assert metric_update_calls == []
+
+    def test_failed_push_keeps_metrics(self, monkeypatch, capsys):
+        def metric_update(self, run_suuid, metrics):
+            raise PutError("500 - Something went wrong")
+
+        monkeypatch.setattr(RunGateway, "metric_update", metric_update)
+
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_interval=60)
+        collector.add(a_metric())
+
+        assert collector.stop_flush_thread(timeout=5)
+        assert len(collector.metrics) == 1
+        assert collector.changed is True
+        assert "AskAnna could not push the metrics to the platform" in capsys.readouterr().err
+
+    def test_stop_flush_thread_timeout(self, monkeypatch, capsys):
+        release = threading.Event()
+
+        def metric_update(self, run_suuid, metrics):
+            release.wait(5)
+
+        monkeypatch.setattr(RunGateway, "metric_update", metric_update)
+
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_interval=60)
+        collector.add(a_metric("accuracy"))
+        collector._flush_event.set()
+        time.sleep(0.1)
+        collector.add(a_metric("loss"))
+
+        assert collector.stop_flush_thread(timeout=0.1) is False
+        assert "AskAnna could not push all metrics within 0.1 seconds" in capsys.readouterr().err
+        assert collector.collector_file.exists()
+        assert not collector.journal_file.exists()
+        release.set()
+
+        restored_collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        assert len(restored_collector) == 2
+
+    def test_at_exit_after_timeout_does_not_push(self, monkeypatch):
+        from askanna.sdk import track
+
+        release = threading.Event()
+        calls = []
+
+        def metric_update(self, run_suuid, metrics):
+            calls.append(len(metrics))
+            release.wait(5)
+
+        monkeypatch.setattr(RunGateway, "metric_update", metric_update)
+        monkeypatch.setenv("AA_METRIC_FLUSH_TIMEOUT", "0.1")
+
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_interval=60)
+        monkeypatch.setattr(track, "metric_collector", collector)
+        collector.add(a_metric("accuracy"))
+        collector._flush_event.set()
+        time.sleep(0.1)
+
+        track.at_exit_save_metrics()
+        release.set()
+
+        assert calls == [1]
+
+    def test_pushes_do_not_overlap(self, monkeypatch):
+        release = threading.Event()
+        calls = []
+
+        def metric_update(self, run_suuid, metrics):
+            calls.append(len(metrics))
+            release.wait(5)
+
+        monkeypatch.setattr(RunGateway, "metric_update", metric_update)
+
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd")
+        collector.add(a_metric("accuracy"))
+        pushes = [threading.Thread(target=collector.save_to_askanna) for _ in range(2)]
+        for push in pushes:
+            push.start()
+        time.sleep(0.1)
+        release.set()
+        for push in pushes:
+            push.join()
+
+        assert calls == [1]
+        assert collector.pushed_count == 1
+
+    def test_metrics_added_during_push_are_pushed(self, monkeypatch):
+        pushing = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def metric_update(self, run_suuid, metrics):
+            calls.append(len(metrics))
+            pushing.set()
+            release.wait(5)
+
+        monkeypatch.setattr(RunGateway, "metric_update", metric_update)
+
+        collector = MetricCollector(run_suuid="abcd-abcd-abcd-abcd", buffered=True, flush_interval=60)
+        collector.add(a_metric("accuracy"))
+        collector._flush_event.set()
+        assert pushing.wait(5)
+
+        collector.add_series(name="loss", type="float", values=[0.3, 0.2, 0.1])
+        release.set()
+
+        assert collector.stop_flush_thread(timeout=5)
+        collector.save()
+
+        assert calls == [1, 4]
+        assert collector.pushed_count == 4
+        assert collector.changed is False
+
+
+@pytest.fixture
+def run_gateway_update_calls(monkeypatch):
+    calls = []
+    metric_update = RunGateway.metric_update
+    variable_update = RunGateway.variable_update
+
+    def metric_update_spy(self, run_suuid, metrics):
+        calls.append(("metric", [metric.metric.name for metric in metrics]))
+        return metric_update(self, run_suuid, metrics)
+
+    def variable_update_spy(self, run_suuid, variables):
+        calls.append(("variable", [variable.variable.name for variable in variables]))
+        return variable_update(self, run_suuid, variables)
+
+    monkeypatch.setattr(RunGateway, "metric_update", metric_update_spy)
+    monkeypatch.setattr(RunGateway, "variable_update", variable_update_spy)
+    yield calls
+
+
+@pytest.mark.usefixtures("api_response", "collector_temp_dir")
+class TestCollectorSave:
+    def test_metric_save_pushes_all_metrics(self, run_gateway_update_calls):
+        collector = MetricCollector(run_suuid="1234-1234-1234-1234")
+        collector.add(a_metric("accuracy"))
+        collector.add(a_metric("loss"))
+        collector.save()
+        collector.add(a_metric("precision"))
+        collector.save()
+        collector.save()
+
+        assert run_gateway_update_calls == [
+            ("metric", ["accuracy", "loss"]),
+            ("metric", ["accuracy", "loss", "precision"]),
+        ]
+        assert collector.pushed_count == 3
+
+    def test_metric_save_skips_push_without_new_metrics(self, run_gateway_update_calls):
+        collector = MetricCollector(run_suuid="1234-1234-1234-1234")
+        collector.add(a_metric("accuracy"))
+        collector.save()
+        collector.changed = True
+        collector.save()
+        collector.save(force=True)
+
+        assert run_gateway_update_calls == [
+            ("metric", ["accuracy"]),
+            ("metric", ["accuracy"]),
+        ]
+
+    def test_metric_save_failed_push_is_retried(self, run_gateway_update_calls):
+        collector = MetricCollector(run_suuid="zyxw-zyxw-zyxw-zyxw")
+        collector.add(a_metric("accuracy"))
+
+        with pytest.raises(PutError):
+            collector.save()
+
+        assert collector.pushed_count == 0
+
+    def test_variable_save_pushes_all_variables(self, run_gateway_update_calls):
+        collector = VariableCollector(run_suuid="1234-1234-1234-1234")
+        collector.add(VariableObject(variable=Variable(name="model", value="forest", type="string")))
+        collector.save()
+        collector.add(VariableObject(variable=Variable(name="seed", value=42, type="integer")))
+        collector.save()
+        collector.save(force=True)
+
+        assert run_gateway_update_calls == [
+            ("variable", ["model"]),
+            ("variable", ["model", "seed"]),
+            ("variable", ["model", "seed"]),
+        ]
@@ -1,4 +1,10 @@
+import copy
+import dataclasses
 import datetime
+import pickle
+import sys
+
+import pytest
 
 from askanna.core.dataclasses.base import Label, MembershipRole, User
 
@@ -32,3 +38,39 @@ def test_membership_role():
 
     assert membership_role.name == "test name"
     assert membership_role.code == "test code"
+
+
+def test_label_from_dict():
+    label = Label.from_dict({"name": "".join(["mo", "del"]), "value": "forest", "type": "".join(["str", "ing"])})
+
+    assert label == Label(name="model", value="forest", type="string")
+    assert label.name is sys.intern("model")
+    assert label.type is sys.intern("string")
+
+
+def test_with_slots():
+    label = Label(name="test name", value="test value", type="string")
+
+    assert not hasattr(label, "__dict__")
+    assert Label.__slots__ == ("name", "value", "type")
+    with pytest.raises(AttributeError):
+        label.other = "value"
+
+    assert dataclasses.asdict(label) == label.to_dict()
+    assert copy.copy(label) == label
+    assert copy.deepcopy(label) == label
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(label, protocol=protocol)) == label
+
+
+class LabelPickledWithoutSlots:
+    """Pickles to the same state as a Label before it had slots"""
+
+    def __reduce__(self):
+        return object.__new__, (Label,), {"name": "test name", "value": "test value", "type": "string"}
+
+
+def test_with_slots_load_pickle_without_slots():
+    label = pickle.loads(pickle.dumps(LabelPickledWithoutSlots()))
+
+    assert label == Label(name="test name", value="test value", type="string")
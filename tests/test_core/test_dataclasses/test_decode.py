@@ -0,0 +1,107 @@
+import copy
+import dataclasses
+import datetime
+import pickle
+
+import pytest
+from dateutil import parser as dateutil_parser
+
+from askanna.core.dataclasses.decode import parse_datetime
+from askanna.core.dataclasses.relation import ProjectRelation
+from askanna.core.dataclasses.run import LazyRun, MetricList, Run
+
+
+def test_parse_datetime():
+    for value in [
+        "2023-01-26T09:47:41.077335Z",
+        "2023-01-26T09:47:41Z",
+        "2023-01-26T10:47:41.077335+01:00",
+        "2023-01-26T09:47:41.077",
+        "2023-01-26",
+    ]:
+        assert parse_datetime(value) == dateutil_parser.parse(value)
+
+
+def test_parse_datetime_utc():
+    assert parse_datetime("2023-01-26T09:47:41.077335Z") == datetime.datetime(
+        2023, 1, 26, 9, 47, 41, 77335, tzinfo=datetime.timezone.utc
+    )
+
+
+def test_parse_datetime_fallback():
+    assert parse_datetime("26 January 2023 09:47") == datetime.datetime(2023, 1, 26, 9, 47)
+
+
+def test_relation_not_shared(run_detail):
+    run = Run.from_dict(copy.deepcopy(run_detail))
+    other_run = Run.from_dict(copy.deepcopy(run_detail))
+
+    assert other_run.created_by == run.created_by
+    assert other_run.created_by is not run.created_by
+    assert other_run.created_by.role is not run.created_by.role
+
+    other_run.project.name = "another project"
+    assert run.project.name == run_detail["project"]["name"]
+
+
+def test_lazy_run(run_detail):
+    run = LazyRun(copy.deepcopy(run_detail))
+
+    assert isinstance(run, Run)
+    assert run.__dict__ == {"_data": run_detail}
+
+    assert run.suuid == run_detail["suuid"]
+    assert isinstance(run.project, ProjectRelation)
+    assert run.created_at == datetime.datetime(2023, 1, 26, 9, 47, 41, 77335, tzinfo=datetime.timezone.utc)
+    assert set(run.__dict__) == {"_data", "suuid", "project", "created_at"}
+
+    # Optional fields that are not decoded and fields that are not in the data
+    assert run.payload is None
+    assert run.metrics is None
+
+    assert run == Run.from_dict(copy.deepcopy(run_detail))
+    assert Run.from_dict(copy.deepcopy(run_detail)) == run
+    assert dataclasses.asdict(run) == dataclasses.asdict(Run.from_dict(copy.deepcopy(run_detail)))
+
+
+def test_lazy_run_set_attribute(run_detail):
+    run = LazyRun(run_detail)
+    run.name = "a new name"
+    run.metrics = MetricList()
+
+    assert run.name == "a new name"
+    assert isinstance(run.metrics, MetricList)
+
+
+def test_lazy_run_pickle(run_detail):
+    run = LazyRun(run_detail)
+    run.name = "a new name"
+
+    for result in [pickle.loads(pickle.dumps(run)), copy.copy(run), copy.deepcopy(run)]:
+        assert type(result) is Run
+        assert result == run
+        assert result.name == "a new name"
+
+
+def test_lazy_run_replace(run_detail):
+    run = LazyRun(run_detail)
+    result = dataclasses.replace(run, name="a new name")
+
+    assert type(result) is Run
+    assert result.name == "a new name"
+    assert result.suuid == run.suuid
+    assert run.name == run_detail["name"]
+
+
+def test_lazy_run_repr(run_detail):
+    run = LazyRun(copy.deepcopy(run_detail))
+
+    assert repr(run).startswith("Run(")
+    assert repr(run) == repr(Run.from_dict(copy.deepcopy(run_detail)))
+
+
+def test_lazy_missing_field(run_detail):
+    del run_detail["suuid"]
+
+    with pytest.raises(AttributeError):
+        LazyRun(run_detail).suuid
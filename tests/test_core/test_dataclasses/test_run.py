@@ -1,12 +1,25 @@
-from datetime import datetime
+import copy
+import dataclasses
+import pickle
+import sys
+import time
+
+try:
+    import zoneinfo
+except ImportError:  # pragma: no cover
+    from backports import zoneinfo
+
+from datetime import datetime, timezone
 
 import pytest
+from dateutil.tz import tzutc
 
 from askanna.core.dataclasses.base import Label
 from askanna.core.dataclasses.run import (
     ArtifactFile,
     ArtifactFileList,
     ArtifactInfo,
+    Metric,
     MetricList,
     MetricObject,
     Run,
@@ -163,6 +176,17 @@ def test_metric_object_fom_dict(run_metric):
     assert metric_object.run_suuid == run_metric["run_suuid"]
 
 
+def test_metric_object_slots(run_metric):
+    metric_object = MetricObject.from_dict(run_metric)
+
+    for value in [metric_object, metric_object.metric, metric_object.label[0]]:
+        assert not hasattr(value, "__dict__")
+    assert metric_object.metric.type is sys.intern("string")
+
+    assert pickle.loads(pickle.dumps(metric_object)) == metric_object
+    assert pickle.loads(pickle.dumps(metric_object.metric)).__class__ is Metric
+
+
 def test_metric_list(run_metric):
     metric_object = MetricObject.from_dict(run_metric)
     metric_list = MetricList(metrics=[metric_object])
@@ -213,3 +237,334 @@ def test_artifact_info(run_artifact_item):
     artifact_info = ArtifactInfo.from_dict(run_artifact_item.copy())
 
     assert artifact_info.suuid == "abcd-abcd-abcd-abcd"
+
+
+def test_metric_list_columnar_values():
+    values = [0.5, 3, True, False, 2**70, "text", {"key": "value"}, [1, 2], None]
+    metric_list = MetricList(
+        metrics=[MetricObject(metric=Metric(name="test", value=value, type="any")) for value in values]
+    )
+
+    assert [metric.metric.value for metric in metric_list] == values
+    assert isinstance(metric_list[2].metric.value, bool)
+    assert not isinstance(metric_list[1].metric.value, bool)
+    assert len(metric_list.columns.float_values) == 1
+    assert len(metric_list.columns.integer_values) == 3
+    assert len(metric_list.columns.object_values) == 5
+
+
+def test_metric_list_columnar_created_at():
+    created_at_values = [
+        datetime(2023, 3, 23, 14, 2, 0, 123456),
+        datetime(2023, 3, 23, 14, 2, 0, 123456, tzinfo=timezone.utc),
+        datetime(2023, 3, 23, 14, 2, 0, 123456, tzinfo=tzutc()),
+        datetime(2023, 3, 23, 14, 2, 0, 123456, tzinfo=zoneinfo.ZoneInfo("Europe/Amsterdam")),
+        datetime(1960, 1, 1, tzinfo=timezone.utc),
+    ]
+    metric_list = MetricList(
+        metrics=[
+            MetricObject(metric=Metric(name="test", value=1, type="integer"), created_at=created_at)
+            for created_at in created_at_values
+        ]
+    )
+
+    for metric, created_at in zip(metric_list, created_at_values):
+        assert metric.created_at == created_at
+        assert metric.created_at.utcoffset() == created_at.utcoffset()
+
+    assert metric_list[0].created_at.tzinfo is None
+
+
+def test_metric_list_columnar_labels():
+    label_a = [Label(name="city", value="Amsterdam", type="string")]
+    label_b = [Label(name="config", value={"depth": 3}, type="dictionary"), Label(name="test", value=None, type="tag")]
+    metric_list = MetricList(
+        metrics=[
+            MetricObject(metric=Metric(name="test", value=index, type="integer"), label=labels)
+            for index, labels in enumerate([label_a, label_b, label_a, label_b, []])
+        ]
+    )
+
+    assert len(metric_list.columns.label_sets) == 3
+    assert metric_list[0].label == tuple(label_a)
+    assert metric_list[3].label == tuple(label_b)
+    assert metric_list[4].label == ()
+
+    # Labels of a record are new objects that are read-only, because a change would not change the list
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        metric_list[0].label[0].value = "Rotterdam"
+    assert metric_list[0].label[0].value == "Amsterdam"
+
+
+def test_metric_list_records_read_only():
+    metric_list = MetricList(metrics=[MetricObject(metric=Metric(name="accuracy", value=0.5, type="float"))])
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        metric_list[0].metric.value = 0.9
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        metric_list[0].run_suuid = "abcd-abcd-abcd-abcd"
+    with pytest.raises(AttributeError):
+        metric_list.metrics.append(MetricObject(metric=Metric(name="loss", value=0.1, type="float")))
+
+    with pytest.raises(AttributeError):
+        metric_list[0].label.append(Label(name="city", value="Amsterdam", type="string"))
+
+    # Copies can be changed
+    assert type(pickle.loads(pickle.dumps(metric_list[0]))) is MetricObject
+    assert type(copy.deepcopy(metric_list[0]).metric) is Metric
+    assert type(copy.copy(metric_list[0])) is MetricObject
+    assert pickle.loads(pickle.dumps(metric_list[0])) == metric_list[0]
+    metric = dataclasses.replace(metric_list[0], metric=dataclasses.replace(metric_list[0].metric, value=0.9))
+    metric_list.metrics = [metric]
+    assert metric_list[0].metric.value == 0.9
+    assert len(metric_list) == 1
+
+
+def test_variable_list_records_read_only():
+    variable_list = VariableList(variables=[VariableObject(variable=Variable(name="seed", value=1, type="integer"))])
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        variable_list[0].variable.value = 2
+    with pytest.raises(AttributeError):
+        variable_list.variables.append(variable_list[0])
+
+    variable_list.variables = [
+        *variable_list.variables,
+        VariableObject(variable=Variable("model", "forest", "string")),
+    ]
+    assert [variable.variable.name for variable in variable_list] == ["seed", "model"]
+
+
+def test_metric_list_columnar_indexing():
+    metric_list = MetricList(
+        metrics=[
+            MetricObject(metric=Metric(name=f"metric-{index}", value=index, type="integer")) for index in range(5)
+        ]
+    )
+
+    assert metric_list[-1].metric.name == "metric-4"
+    assert [metric.metric.name for metric in metric_list[1:3]] == ["metric-1", "metric-2"]
+    assert len(metric_list.metrics) == 5
+
+    with pytest.raises(IndexError):
+        metric_list[5]
+
+    with pytest.raises(IndexError):
+        metric_list[-6]
+
+
+def test_metric_list_columnar_to_dict(run_metric):
+    metric_object = MetricObject.from_dict(run_metric)
+    metric_list = MetricList(metrics=[metric_object])
+
+    assert metric_list.to_dict() == [metric_object.to_dict()]
+    assert metric_list == MetricList(metrics=[MetricObject.from_dict(run_metric)])
+    assert pickle.loads(pickle.dumps(metric_list)) == metric_list
+
+
+def test_variable_list_columnar_to_dict(run_variable):
+    variable_object = VariableObject.from_dict(run_variable)
+    variable_list = VariableList(variables=[variable_object])
+
+    assert variable_list.to_dict() == [variable_object.to_dict()]
+    assert variable_list[0] == variable_object
+
+
+def metric_list_with_labels():
+    return MetricList(
+        metrics=[
+            MetricObject(
+                metric=Metric(name="loss" if index % 2 else "accuracy", value=index, type="integer"),
+                label=[
+                    Label(name="model", value="forest" if index < 3 else "tree", type="string"),
+                    Label(name="step", value=index, type="integer"),
+                ],
+                created_at=datetime(2023, 3, 23, 14, index, tzinfo=timezone.utc),
+            )
+            for index in range(6)
+        ]
+    )
+
+
+def test_metric_list_filter_label():
+    metric_list = metric_list_with_labels()
+
+    assert [metric.metric.value for metric in metric_list.filter("loss", label={"model": "forest"})] == [1]
+    assert [metric.metric.value for metric in metric_list.filter(label={"model": "tree"})] == [3, 4, 5]
+    assert [metric.metric.value for metric in metric_list.filter(label={"model": "tree", "step": 4})] == [4]
+    assert len(metric_list.filter(label="model")) == 6
+    assert len(metric_list.filter(label=["model", "step"])) == 6
+    assert metric_list.filter(label="city") == []
+    assert metric_list.filter(label={"model": "bush"}) == []
+    assert metric_list.get("accuracy", label={"step": 2}).metric.value == 2
+
+    with pytest.raises(MultipleObjectsReturnedError):
+        metric_list.get("accuracy", label="model")
+
+
+def test_metric_list_filter_created_at():
+    metric_list = metric_list_with_labels()
+
+    since = datetime(2023, 3, 23, 14, 2, tzinfo=timezone.utc)
+    until = datetime(2023, 3, 23, 14, 4, tzinfo=timezone.utc)
+    assert [metric.metric.value for metric in metric_list.filter(since=since)] == [2, 3, 4, 5]
+    assert [metric.metric.value for metric in metric_list.filter(until=until)] == [0, 1, 2, 3, 4]
+    assert [metric.metric.value for metric in metric_list.filter("loss", since=since, until=until)] == [3]
+    assert metric_list.filter(since=datetime(2023, 3, 24, tzinfo=timezone.utc)) == []
+
+    # The time range is compared on the moment in time, also for other timezones
+    since_amsterdam = datetime(2023, 3, 23, 15, 4, tzinfo=zoneinfo.ZoneInfo("Europe/Amsterdam"))
+    assert [metric.metric.value for metric in metric_list.filter(since=since_amsterdam)] == [4, 5]
+
+
+@pytest.fixture
+def local_timezone_amsterdam(monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/Amsterdam")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="Setting the local timezone requires time.tzset")
+def test_metric_list_filter_created_at_naive_is_local_time(local_timezone_amsterdam):
+    metric_list = metric_list_with_labels()
+
+    # On 23 March 2023 the time in Amsterdam is UTC+1
+    assert [metric.metric.value for metric in metric_list.filter(since=datetime(2023, 3, 23, 15, 4))] == [4, 5]
+    assert [metric.metric.value for metric in metric_list.filter(until=datetime(2023, 3, 23, 15, 1))] == [0, 1]
+
+    naive_created_at = datetime(2023, 3, 23, 15, 3)
+    metric_list.append(
+        MetricObject(metric=Metric(name="loss", value=6, type="integer"), label=[], created_at=naive_created_at)
+    )
+    assert metric_list[-1].created_at == naive_created_at
+    since = datetime(2023, 3, 23, 14, 3, tzinfo=timezone.utc)
+    assert [metric.metric.value for metric in metric_list.filter(since=since)] == [3, 4, 5, 6]
+    assert [metric.metric.value for metric in metric_list.filter(since=since, until=naive_created_at)] == [3, 6]
+
+
+def test_metric_list_filter_after_append():
+    metric_list = metric_list_with_labels()
+    assert len(metric_list.filter("loss")) == 3
+    assert len(metric_list.filter(since=datetime(2023, 3, 23, 14, 0, tzinfo=timezone.utc))) == 6
+
+    # Records created before the records already in the index are inserted in order of created_at
+    metric_list.append(
+        MetricObject(
+            metric=Metric(name="loss", value=6, type="integer"),
+            label=[Label(name="model", value="bush", type="string")],
+            created_at=datetime(2023, 3, 23, 13, 0, tzinfo=timezone.utc),
+        )
+    )
+    metric_list.append_series(name="loss", type="integer", values=[7, 8], steps=[7, 8])
+
+    assert [metric.metric.value for metric in metric_list.filter("loss")] == [1, 3, 5, 6, 7, 8]
+    assert [metric.metric.value for metric in metric_list.filter(label={"model": "bush"})] == [6]
+    assert [metric.metric.value for metric in metric_list.filter(label={"step": 8})] == [8]
+    assert [
+        metric.metric.value for metric in metric_list.filter(until=datetime(2023, 3, 23, 14, 1, tzinfo=timezone.utc))
+    ] == [0, 1, 6]
+
+
+def test_variable_list_filter_label():
+    variable_list = VariableList(
+        variables=[
+            VariableObject(variable=Variable(name="model", value="forest", type="string")),
+            VariableObject(
+                variable=Variable(name="model", value="tree", type="string"),
+                label=[Label(name="source", value="run", type="string")],
+            ),
+        ]
+    )
+
+    assert variable_list.get("model", label={"source": "run"}).variable.value == "tree"
+    assert len(variable_list.filter("model")) == 2
+    assert len(variable_list.filter()) == 2
+
+
+def metric_list_for_export():
+    metric_list = MetricList()
+    metric_list.append_series(
+        name="loss", type="float", values=[0.5, 0.25], run_suuid="abcd-abcd-abcd-abcd", steps=[1, 2]
+    )
+    metric_list.append(
+        MetricObject(
+            metric=Metric(name="accuracy", value=3, type="integer"),
+            label=[Label(name="model", value="forest", type="string")],
+            created_at=datetime(2023, 3, 23, 15, 2, tzinfo=zoneinfo.ZoneInfo("Europe/Amsterdam")),
+        )
+    )
+    metric_list.append(MetricObject(metric=Metric(name="accuracy", value="high", type="string")))
+    return metric_list
+
+
+def test_metric_list_to_numpy():
+    np = pytest.importorskip("numpy")
+    metric_list = metric_list_for_export()
+    metric_list.append(MetricObject(metric=Metric(name="epoch", value=1, type="integer")))
+    metric_list.append(MetricObject(metric=Metric(name="epoch", value=2.5, type="float")))
+    metric_list.append(MetricObject(metric=Metric(name="done", value=True, type="boolean")))
+    metric_list.append(MetricObject(metric=Metric(name="list", value=[1, 2], type="list_integer")))
+
+    assert metric_list.to_numpy("loss").dtype == np.float64
+    assert metric_list.to_numpy("loss").tolist() == [0.5, 0.25]
+    assert metric_list.to_numpy("epoch").tolist() == [1.0, 2.5]
+    assert metric_list.to_numpy("done").dtype == np.bool_
+    assert metric_list.to_numpy("accuracy").tolist() == [3, "high"]
+    assert metric_list.to_numpy("list").shape == (1,)
+    assert metric_list.to_numpy("list")[0] == [1, 2]
+    assert metric_list.to_numpy("not_exist").tolist() == []
+
+    # The exported array is a copy, so the list can still grow
+    values = metric_list.to_numpy("loss")
+    metric_list.append_series(name="loss", type="float", values=[0.125])
+    assert values.tolist() == [0.5, 0.25]
+    assert metric_list.to_numpy("loss").tolist() == [0.5, 0.25, 0.125]
+
+
+def test_metric_list_to_pandas():
+    pd = pytest.importorskip("pandas")
+    dataframe = metric_list_for_export().to_pandas()
+
+    assert list(dataframe.columns) == ["name", "value", "type", "run_suuid", "created_at", "label.step", "label.model"]
+    assert dataframe["name"].tolist() == ["loss", "loss", "accuracy", "accuracy"]
+    assert dataframe["value"].tolist() == [0.5, 0.25, 3, "high"]
+    assert dataframe["run_suuid"].tolist()[:2] == ["abcd-abcd-abcd-abcd"] * 2
+    assert dataframe["run_suuid"].isna().tolist() == [False, False, True, True]
+    assert dataframe["created_at"][2] == pd.Timestamp("2023-03-23 14:02", tz="UTC")
+    assert dataframe["label.step"].tolist()[:2] == [1, 2]
+    assert dataframe["label.model"].tolist()[2] == "forest"
+
+
+def test_metric_list_to_arrow():
+    pytest.importorskip("pyarrow")
+    table = metric_list_for_export().to_arrow()
+
+    assert table.column_names == ["name", "value", "type", "run_suuid", "created_at", "label.step", "label.model"]
+    data = table.to_pydict()
+    assert data["name"] == ["loss", "loss", "accuracy", "accuracy"]
+    assert data["run_suuid"] == ["abcd-abcd-abcd-abcd", "abcd-abcd-abcd-abcd", None, None]
+    assert data["label.step"] == [1, 2, None, None]
+    # Values with different types are stored as JSON
+    assert data["value"] == ["0.5", "0.25", "3", '"high"']
+
+    assert MetricList().to_arrow().num_rows == 0
+
+
+def test_variable_list_to_pandas(run_variable):
+    pytest.importorskip("pandas")
+    variable_list = VariableList(variables=[VariableObject.from_dict(run_variable)])
+    dataframe = variable_list.to_pandas()
+
+    assert dataframe["name"].tolist() == [run_variable["variable"]["name"]]
+    assert variable_list.to_numpy(run_variable["variable"]["name"]).tolist() == [run_variable["variable"]["value"]]
+    assert variable_list.to_arrow().num_rows == 1
+
+
+def test_metric_list_to_pandas_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pandas", None)
+
+    with pytest.raises(ImportError) as exc:
+        metric_list_for_export().to_pandas()
+    assert "pip install pandas" in str(exc.value)
@@ -1,8 +1,29 @@
+import io
+import json
+import os
+import re
+import threading
+import time
+
 import pytest
+import requests
+import responses
 
+from askanna.config import config
 from askanna.config.api_url import askanna_url
 from askanna.core.exceptions import PostError
-from askanna.core.upload import ArtifactUpload, PackageUpload, ResultUpload, Upload
+from askanna.core.upload import (
+    ArtifactUpload,
+    ChunkSizePolicy,
+    MultipartBody,
+    PackageUpload,
+    ResultUpload,
+    Upload,
+    UploadState,
+    file_identity,
+)
+from askanna.core.utils.file import FileSlice
+from askanna.core.utils.settings import diskunit
 
 
 class TestUploadInit:
@@ -188,3 +209,372 @@ class TestUploadFail:
             upload.upload("tests/fixtures/files/zip_file.zip")
 
         assert "In the AskAnna platform something went wrong with creating the upload entry" in error.value.args[0]
+
+
+def multipart_file_content(request) -> bytes:
+    body = request.body.read() if hasattr(request.body, "read") else request.body
+    assert int(request.headers["Content-Length"]) == len(body)
+    boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+    for part in body.split(b"--" + boundary)[1:-1]:
+        headers, value = part[2:-2].split(b"\r\n\r\n", 1)
+        if b'name="file"' in headers:
+            return value
+    raise AssertionError("The request has no file")
+
+
+class TestUploadConcurrent:
+    run_suuid = "1234-1234-1234-1234"
+    artifact_suuid = "abcd-abcd-abcd-abcd"
+
+    def mock_upload(self, api_responses, fail_chunk=None, received=None):
+        uploaded_chunks = []
+        in_flight = []
+        max_in_flight = [0]
+        lock = threading.Lock()
+
+        def register_chunk(request):
+            file_no = json.loads(request.body)["file_no"]
+            return 201, {}, json.dumps({"uuid": f"0000-0000-0000-{file_no:04d}"})
+
+        def upload_chunk(request):
+            chunk_number = int(request.url.rstrip("/").split("/")[-2].split("-")[-1])
+            if received is not None:
+                received[chunk_number] = multipart_file_content(request)
+            with lock:
+                in_flight.append(chunk_number)
+                max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(chunk_number)
+                uploaded_chunks.append(chunk_number)
+            return (500 if chunk_number == fail_chunk else 200), {}, ""
+
+        api_responses.add(
+            "POST",
+            askanna_url.run.artifact_list(self.run_suuid),
+            json={"suuid": self.artifact_suuid},
+            status=201,
+        )
+        api_responses.add_callback(
+            "POST", askanna_url.run.artifact_chunk(self.run_suuid, self.artifact_suuid), callback=register_chunk
+        )
+        api_responses.add_callback(
+            "POST",
+            re.compile(re.escape(askanna_url.run.artifact_chunk(self.run_suuid, self.artifact_suuid)) + r".+/"),
+            callback=upload_chunk,
+        )
+        api_responses.add(
+            "POST", askanna_url.run.artifact_finish_upload(self.run_suuid, self.artifact_suuid), status=200
+        )
+        return uploaded_chunks, max_in_flight
+
+    @pytest.fixture()
+    def large_file(self, tmp_path):
+        file_path = tmp_path / "artifact.zip"
+        file_path.write_bytes(os.urandom(int(7.5 * 1024 * 1024)))
+        return str(file_path)
+
+    def test_upload_concurrent(self, large_file):
+        with responses.RequestsMock() as api_responses:
+            uploaded_chunks, max_in_flight = self.mock_upload(api_responses)
+            result = ArtifactUpload(self.run_suuid, concurrency=4).upload(large_file)
+            finish_call = api_responses.calls[-1]
+
+        assert result == (True, "Artifact is uploaded")
+        assert sorted(uploaded_chunks) == list(range(1, 9))
+        assert 1 < max_in_flight[0] <= 4
+        assert finish_call.request.url == askanna_url.run.artifact_finish_upload(self.run_suuid, self.artifact_suuid)
+
+    def test_upload_concurrency_env(self, large_file, monkeypatch):
+        monkeypatch.setenv("AA_UPLOAD_CONCURRENCY", "1")
+
+        with responses.RequestsMock() as api_responses:
+            uploaded_chunks, max_in_flight = self.mock_upload(api_responses)
+            ArtifactUpload(self.run_suuid).upload(large_file)
+
+        assert uploaded_chunks == list(range(1, 9))
+        assert max_in_flight[0] == 1
+
+    def test_upload_concurrent_chunk_fail(self, large_file):
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as api_responses:
+            uploaded_chunks, _ = self.mock_upload(api_responses, fail_chunk=2)
+            with pytest.raises(PostError) as error:
+                ArtifactUpload(self.run_suuid, concurrency=2).upload(large_file)
+            called_urls = [call.request.url for call in api_responses.calls]
+
+        assert "Chunk with file_no '2'" in error.value.args[0]
+        assert len(uploaded_chunks) < 8
+        assert askanna_url.run.artifact_finish_upload(self.run_suuid, self.artifact_suuid) not in called_urls
+
+
+class TestChunkSizePolicy:
+    def test_chunk_size_from_file_size(self):
+        policy = ChunkSizePolicy(min_size=diskunit.MiB, max_size=32 * diskunit.MiB)
+
+        assert policy.chunk_size(10 * diskunit.KiB) == diskunit.MiB
+        assert policy.chunk_size(10_000_000) == diskunit.MiB
+        assert policy.chunk_size(diskunit.GiB) == 16 * diskunit.MiB
+        assert policy.chunk_size(10 * diskunit.GiB) == 32 * diskunit.MiB
+
+    def test_chunk_size_concurrency(self):
+        policy = ChunkSizePolicy(min_size=64 * diskunit.KiB, max_size=32 * diskunit.MiB, target_chunks=2)
+
+        assert policy.chunk_size(8 * diskunit.MiB, concurrency=1) == 4 * diskunit.MiB
+        assert policy.chunk_size(8 * diskunit.MiB, concurrency=8) == diskunit.MiB
+
+    def test_chunk_size_from_measurements(self):
+        policy = ChunkSizePolicy(min_size=diskunit.MiB, max_size=64 * diskunit.MiB, overhead=0.1)
+
+        # 0.1 second latency and 10 MiB per second: the latency is 10% of the upload time of a 9 MiB chunk
+        policy.record(10 * diskunit.MiB, latency=0.1, duration=1.1)
+        assert policy.latency == 0.1
+        assert policy.throughput == pytest.approx(10 * diskunit.MiB)
+        assert policy.chunk_size(10 * diskunit.GiB) == 9 * diskunit.MiB
+
+        # A faster connection gives larger chunks, up to the maximum size
+        for _ in range(20):
+            policy.record(100 * diskunit.MiB, latency=0.1, duration=1.1)
+        assert policy.chunk_size(10 * diskunit.GiB) == 64 * diskunit.MiB
+
+        policy.reset()
+        assert policy.latency is None
+        assert policy.chunk_size(10 * diskunit.GiB) == 64 * diskunit.MiB
+
+    def test_chunk_size_max_chunk_seconds(self):
+        policy = ChunkSizePolicy(min_size=diskunit.MiB, max_size=64 * diskunit.MiB, max_chunk_seconds=2)
+
+        # With a high latency, a 9 seconds chunk keeps the latency at 10%, but a chunk should take at most 2 seconds
+        policy.record(diskunit.MiB, latency=1, duration=2)
+        assert policy.chunk_size(10 * diskunit.GiB) == 2 * diskunit.MiB
+
+    def test_chunk_size_bounds(self, monkeypatch):
+        monkeypatch.setenv("AA_UPLOAD_CHUNK_SIZE_MIN", str(5 * diskunit.MiB))
+        monkeypatch.setenv("AA_UPLOAD_CHUNK_SIZE_MAX", str(5 * diskunit.MiB))
+        policy = ChunkSizePolicy()
+
+        assert policy.chunk_size(10) == 5 * diskunit.MiB
+        assert policy.chunk_size(10 * diskunit.GiB) == 5 * diskunit.MiB
+
+        with pytest.raises(ValueError):
+            ChunkSizePolicy(min_size=2 * diskunit.MiB, max_size=diskunit.MiB)
+
+    def test_chunk_size_server_config(self, monkeypatch):
+        monkeypatch.delenv("AA_UPLOAD_CHUNK_SIZE_MIN", raising=False)
+        monkeypatch.delenv("AA_UPLOAD_CHUNK_SIZE_MAX", raising=False)
+        monkeypatch.setattr(config.server, "upload_chunk_size_max", 512 * diskunit.KiB)
+        policy = ChunkSizePolicy()
+
+        assert policy.max_size == 512 * diskunit.KiB
+        assert policy.min_size == 512 * diskunit.KiB
+        assert policy.chunk_size(10 * diskunit.GiB) == 512 * diskunit.KiB
+
+        # The environment variable takes precedence over the server config
+        monkeypatch.setenv("AA_UPLOAD_CHUNK_SIZE_MAX", str(diskunit.MiB))
+        assert ChunkSizePolicy().max_size == diskunit.MiB
+
+    def test_upload_uses_policy(self, tmp_path):
+        file_path = tmp_path / "result.bin"
+        file_path.write_bytes(b"x" * 300 * diskunit.KiB)
+        policy = ChunkSizePolicy(min_size=64 * diskunit.KiB, max_size=diskunit.MiB, target_chunks=3)
+        upload = ArtifactUpload(TestUploadConcurrent.run_suuid, concurrency=1, chunk_size_policy=policy)
+
+        with responses.RequestsMock() as api_responses:
+            uploaded_chunks, _ = TestUploadConcurrent().mock_upload(api_responses)
+            upload.upload(str(file_path))
+
+        assert upload.resumable_file.chunk_size == 128 * diskunit.KiB
+        assert uploaded_chunks == [1, 2, 3]
+        assert policy.throughput is not None
+
+
+class TestUploadResume:
+    run_suuid = TestUploadConcurrent.run_suuid
+
+    @pytest.fixture()
+    def file_path(self, tmp_path):
+        file_path = tmp_path / "artifact.zip"
+        file_path.write_bytes(os.urandom(4 * 256 * diskunit.KiB))
+        return str(file_path)
+
+    def upload(self, concurrency=1, resume=None):
+        policy = ChunkSizePolicy(min_size=256 * diskunit.KiB, max_size=256 * diskunit.KiB)
+        return ArtifactUpload(self.run_suuid, concurrency=concurrency, chunk_size_policy=policy, resume=resume)
+
+    def test_upload_resume(self, file_path, upload_state_dir):
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as api_responses:
+            uploaded_chunks, _ = TestUploadConcurrent().mock_upload(api_responses, fail_chunk=3)
+            upload = self.upload()
+            with pytest.raises(PostError):
+                upload.upload(file_path)
+        identifier = str(upload.resumable_file.unique_identifier)
+
+        assert uploaded_chunks == [1, 2, 3]
+        state = UploadState(upload.state_path())
+        assert state.load(file_identity(file_path))
+        assert state.chunks == {1, 2}
+        assert state.info["suuid"] == TestUploadConcurrent.artifact_suuid
+        assert state.info["chunk_size"] == 256 * diskunit.KiB
+        assert state.info["total_chunks"] == 4
+
+        # Continue the upload with a new process, and the file created again with the same content
+        with open(file_path, "rb") as f:
+            content = f.read()
+        os.remove(file_path)
+        with open(file_path, "wb") as f:
+            f.write(content)
+
+        with responses.RequestsMock() as api_responses:
+            uploaded_chunks, _ = TestUploadConcurrent().mock_upload(api_responses)
+            api_responses.assert_all_requests_are_fired = False
+            upload = self.upload(concurrency=2)
+            result = upload.upload(file_path)
+            called_urls = [call.request.url for call in api_responses.calls]
+
+        assert result == (True, "Artifact is uploaded")
+        assert sorted(uploaded_chunks) == [3, 4]
+        assert askanna_url.run.artifact_list(self.run_suuid) not in called_urls
+        assert str(upload.resumable_file.unique_identifier) == identifier
+        assert not upload.state_path().exists()
+        assert list(upload_state_dir.iterdir()) == []
+
+    def test_upload_resume_changed_file(self, file_path):
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as api_responses:
+            TestUploadConcurrent().mock_upload(api_responses, fail_chunk=3)
+            with pytest.raises(PostError):
+                self.upload().upload(file_path)
+
+        with open(file_path, "r+b") as f:
+            f.write(b"changed")
+
+        with responses.RequestsMock() as api_responses:
+            uploaded_chunks, _ = TestUploadConcurrent().mock_upload(api_responses)
+            result = self.upload().upload(file_path)
+
+        assert result == (True, "Artifact is uploaded")
+        assert uploaded_chunks == [1, 2, 3, 4]
+
+    def test_upload_resume_removed_entry(self, file_path, upload_state_dir, capsys):
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as api_responses:
+            TestUploadConcurrent().mock_upload(api_responses, fail_chunk=3)
+            with pytest.raises(PostError):
+                self.upload().upload(file_path)
+
+        # The upload entry of the state is removed, so the upload starts over with a new entry
+        new_upload = TestUploadConcurrent()
+        new_upload.artifact_suuid = "efgh-efgh-efgh-efgh"
+        with responses.RequestsMock() as api_responses:
+            api_responses.add(
+                "POST",
+                askanna_url.run.artifact_chunk(self.run_suuid, TestUploadConcurrent.artifact_suuid),
+                json={"detail": "Not found."},
+                status=404,
+            )
+            uploaded_chunks, _ = new_upload.mock_upload(api_responses)
+            upload = self.upload()
+            result = upload.upload(file_path)
+
+        assert result == (True, "Artifact is uploaded")
+        assert uploaded_chunks == [1, 2, 3, 4]
+        assert upload.suuid == "efgh-efgh-efgh-efgh"
+        assert "AskAnna could not continue the upload" in capsys.readouterr().err
+        assert list(upload_state_dir.iterdir()) == []
+
+    def test_upload_one_chunk_without_identity(self, tmp_path, monkeypatch):
+        file_path = tmp_path / "artifact.zip"
+        file_path.write_bytes(os.urandom(100 * diskunit.KiB))
+
+        def file_sha256(file_path):
+            raise AssertionError("The identity of a file that fits in one chunk is not needed")
+
+        monkeypatch.setattr("askanna.core.upload.file_sha256", file_sha256)
+
+        with responses.RequestsMock() as api_responses:
+            uploaded_chunks, _ = TestUploadConcurrent().mock_upload(api_responses)
+            result = self.upload().upload(str(file_path))
+
+        assert result == (True, "Artifact is uploaded")
+        assert uploaded_chunks == [1]
+
+    def test_upload_without_resume(self, file_path, upload_state_dir, monkeypatch):
+        monkeypatch.setenv("AA_UPLOAD_RESUME", "false")
+
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as api_responses:
+            TestUploadConcurrent().mock_upload(api_responses, fail_chunk=3)
+            upload = self.upload()
+            with pytest.raises(PostError):
+                upload.upload(file_path)
+
+        assert upload.resume is False
+        assert list(upload_state_dir.iterdir()) == []
+
+    def test_upload_state_partial_line(self, tmp_path):
+        state = UploadState(tmp_path / "state.jsonl")
+        file = {"size": 10, "mtime_ns": 1, "sha256": "abc"}
+        state.start({"suuid": "abcd-abcd-abcd-abcd", "file": file})
+        state.add_chunk(1)
+        with state.path.open("a") as f:
+            f.write("2")
+        with state.path.open("a") as f:
+            f.write("x\n")
+
+        state = UploadState(tmp_path / "state.jsonl")
+        assert state.load(dict(file, mtime_ns=2))
+        assert state.chunks == {1}
+        assert not state.load(dict(file, sha256="def"))
+
+
+class TestUploadStreaming:
+    def test_file_slice(self, tmp_path):
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(bytes(range(256)) * 4)
+
+        with FileSlice(file_path, offset=250, length=10) as file:
+            assert len(file) == 10
+            assert file.read(3) == bytes([250, 251, 252])
+            assert file.tell() == 3
+            assert file.read() == bytes([253, 254, 255, 0, 1, 2, 3])
+            assert file.read() == b""
+            assert file.seek(1) == 1
+            assert file.read(2) == bytes([251, 252])
+            assert file.seek(-2, io.SEEK_END) == 8
+            assert file.read() == bytes([2, 3])
+
+        with FileSlice(file_path, offset=1020, length=10) as file:
+            # The slice is longer than the rest of the file
+            assert file.read() == bytes([252, 253, 254, 255])
+
+    def test_multipart_body(self, tmp_path):
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(os.urandom(100_000))
+        fields = {"resumableChunkNumber": 2, "resumableFilename": "data.bin", "resumableType": ""}
+
+        with FileSlice(file_path, offset=10_000, length=50_000) as file:
+            body = MultipartBody(fields, "file", file)
+            content = body.read()
+
+        expected = requests.Request(
+            "POST",
+            "https://api.askanna.eu/",
+            data=fields,
+            files={"file": io.BytesIO(file_path.read_bytes()[10_000:60_000])},
+        ).prepare()
+        expected_boundary = expected.headers["Content-Type"].split("boundary=")[1]
+
+        assert len(body) == len(content) == len(expected.body)
+        assert content.replace(body.boundary.encode(), expected_boundary.encode()) == expected.body
+        assert body.content_type == f"multipart/form-data; boundary={body.boundary}"
+
+    def test_upload_chunk_content(self, tmp_path):
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(os.urandom(3 * 256 * diskunit.KiB + 1000))
+        policy = ChunkSizePolicy(min_size=256 * diskunit.KiB, max_size=256 * diskunit.KiB)
+        received = {}
+
+        with responses.RequestsMock() as api_responses:
+            TestUploadConcurrent().mock_upload(api_responses, received=received)
+            ArtifactUpload(TestUploadConcurrent.run_suuid, concurrency=2, chunk_size_policy=policy).upload(
+                str(file_path)
+            )
+
+        assert sorted(received) == [1, 2, 3, 4]
+        assert b"".join(received[number] for number in sorted(received)) == file_path.read_bytes()
@@ -0,0 +1,22 @@
+from askanna.core.utils.settings import env_number
+
+
+def test_env_number(monkeypatch):
+    monkeypatch.setenv("AA_TEST_NUMBER", "2.5")
+
+    assert env_number("AA_TEST_NUMBER", 1.0) == 2.5
+
+
+def test_env_number_not_set(monkeypatch):
+    monkeypatch.delenv("AA_TEST_NUMBER", raising=False)
+
+    assert env_number("AA_TEST_NUMBER", 1000, type=int) == 1000
+
+
+def test_env_number_not_valid(monkeypatch, capsys):
+    monkeypatch.setenv("AA_TEST_NUMBER", "1k")
+
+    assert env_number("AA_TEST_NUMBER", 1000, type=int) == 1000
+    assert "The value '1k' of AA_TEST_NUMBER is not a valid number. AskAnna uses 1000 instead." in (
+        capsys.readouterr().err
+    )
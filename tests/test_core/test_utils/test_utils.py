@@ -1,13 +1,20 @@
 import datetime
+import json
 import unittest
+from array import array
+from unittest import mock
 
 import numpy as np
 
+from askanna.core.utils import object as object_utils
 from askanna.core.utils.main import update_available
 from askanna.core.utils.object import (
+    encode_json,
     get_type,
     prepare_and_validate_value,
+    prepare_series,
     transform_value,
+    type_info,
     validate_value,
     value_not_empty,
 )
@@ -56,6 +63,33 @@ class TestPrepareAndValidateValue(unittest.TestCase):
         self.assertTrue(valid)
 
 
+class TestPrepareSeries(unittest.TestCase):
+    def test_prepare_series_numpy(self):
+        self.assertEqual(prepare_series(np.array([0.5, 1.5])), ([0.5, 1.5], "float"))
+        self.assertEqual(prepare_series(np.array([1, 2], dtype=np.uint8)), ([1, 2], "integer"))
+        self.assertEqual(prepare_series(np.array([True, False])), ([True, False], "boolean"))
+        self.assertEqual(prepare_series(np.array(["foo", "bar"])), (["foo", "bar"], "string"))
+        self.assertEqual(prepare_series(np.array([1 + 2j]))[1], None)
+
+        values, dtype = prepare_series(np.array([0.5, 1.5], dtype=np.float32))
+        self.assertIsInstance(values[0], float)
+
+    def test_prepare_series_numpy_dimensions(self):
+        with self.assertRaises(ValueError):
+            prepare_series(np.array([[0.5, 1.5]]))
+
+    def test_prepare_series_sequence(self):
+        self.assertEqual(prepare_series([1, 2]), ([1, 2], "integer"))
+        self.assertEqual(prepare_series((1, 2.5)), ([1.0, 2.5], "float"))
+        self.assertEqual(prepare_series(range(3)), ([0, 1, 2], "integer"))
+        self.assertEqual(prepare_series([1, "bar"]), ([1, "bar"], None))
+        self.assertEqual(prepare_series([1, None]), ([1, None], None))
+        self.assertEqual(prepare_series([]), ([], None))
+
+        with self.assertRaises(TypeError):
+            prepare_series("foo")
+
+
 class TestTransformValue(unittest.TestCase):
     def test_transform_value_string(self):
         value, transform = transform_value("some text")
@@ -67,6 +101,11 @@ class TestTransformValue(unittest.TestCase):
         self.assertEqual(value, [0, 1, 2])
         self.assertTrue(transform)
 
+    def test_transform_value_array(self):
+        value, transform = transform_value(array("d", [0.5, 1.5]))
+        self.assertEqual(value, [0.5, 1.5])
+        self.assertTrue(transform)
+
     def test_transform_value_numpy_float(self):
         value, transform = transform_value(np.float16(5.21))
         self.assertEqual(value, np.float16(5.21))
@@ -120,6 +159,29 @@ class TestTranslateDtype(unittest.TestCase):
 
         self.assertEqual(get_type([{"dict": "string"}, {"dict": 1}]), "list")
 
+    def test_get_type_list_subclasses(self):
+        self.assertEqual(get_type([np.float64(1.11), 1.12]), "list_float")
+        self.assertEqual(get_type([np.float64(1.11), 1]), "list_float")
+        self.assertEqual(get_type([datetime.datetime.now(), datetime.datetime.now()]), "list_datetime")
+        self.assertEqual(get_type([datetime.datetime.now(), datetime.date(2021, 4, 9)]), "list")
+        self.assertEqual(get_type([np.float64(1.11), "bar"]), "list")
+        self.assertEqual(get_type([np.float64(1.11), None]), "list")
+        self.assertEqual(get_type([]), "list")
+
+    def test_get_type_array(self):
+        self.assertEqual(get_type(array("q", [0, 1])), "list_integer")
+        self.assertEqual(get_type(array("f", [1.11, 1.12])), "list_float")
+        self.assertEqual(get_type(array("u", "foo")), "array.array")
+
+    def test_get_type_cached(self):
+        class Custom:
+            pass
+
+        self.assertEqual(get_type(Custom()), "tests.test_core.test_utils.test_utils.Custom")
+        self.assertEqual(type_info(Custom()), ("tests.test_core.test_utils.test_utils.Custom", None))
+        self.assertIs(type_info(Custom()), type_info(Custom()))
+        self.assertFalse(validate_value(Custom()))
+
 
 class TestUpdateAvailable(unittest.TestCase):
     def test_update_available(self):
@@ -185,3 +247,46 @@ class TestValueNotEmpty(unittest.TestCase):
 
         value = np.bool_(True)
         self.assertTrue(value_not_empty(value))
+
+
+class TestEncodeJson(unittest.TestCase):
+    value = {
+        "float": 0.5,
+        "numpy": [np.float32(1.5), np.int64(5), np.bool_(True), np.arange(3), np.array([[0.5, 1.5]])],
+        "datetime": datetime.datetime(2023, 3, 23, 14, 2, 0, 123456, tzinfo=datetime.timezone.utc),
+        "date": datetime.date(2023, 3, 23),
+        "time": datetime.time(14, 2),
+        "text": "café",
+        1: "integer key",
+        "big integer": 2**70,
+    }
+    expected = {
+        "float": 0.5,
+        "numpy": [1.5, 5, True, [0, 1, 2], [[0.5, 1.5]]],
+        "datetime": "2023-03-23T14:02:00.123456+00:00",
+        "date": "2023-03-23",
+        "time": "14:02:00",
+        "text": "café",
+        "1": "integer key",
+        "big integer": 2**70,
+    }
+
+    def test_encode_json(self):
+        for backend in ["json", "orjson"]:
+            with mock.patch.object(object_utils, "JSON_BACKEND", backend):
+                encoded = encode_json(self.value)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json.loads(encoded), self.expected)
+
+    def test_encode_json_nan(self):
+        for backend in ["json", "orjson"]:
+            with mock.patch.object(object_utils, "JSON_BACKEND", backend):
+                for value in [float("nan"), float("inf"), -float("inf"), np.float64("nan"), np.array([0.5, np.inf])]:
+                    with self.assertRaises(ValueError):
+                        encode_json({"value": value})
+
+    def test_encode_json_null(self):
+        for backend in ["json", "orjson"]:
+            with mock.patch.object(object_utils, "JSON_BACKEND", backend):
+                value = {"value": None, "text": "null"}
+                self.assertEqual(json.loads(encode_json(value)), value)
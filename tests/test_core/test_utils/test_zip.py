@@ -1,6 +1,8 @@
 import builtins
+import hashlib
 import io
 import os
+import shutil
 import tempfile
 import unittest
 import uuid
@@ -9,7 +11,11 @@ from zipfile import ZipFile
 import pytest
 
 from askanna.config.utils import read_config
-from askanna.core.utils.file import create_zip_from_paths, zip_files_in_dir
+from askanna.core.utils.file import (
+    REPRODUCIBLE_ZIP_DATE_TIME,
+    create_zip_from_paths,
+    zip_files_in_dir,
+)
 from askanna.core.utils.suuid import create_suuid
 
 
@@ -114,6 +120,31 @@ class TestZipFiles(unittest.TestCase):
         self.assertEqual(len(files), 21)
         self.assertTrue("askanna.yml" in files)
 
+    def test_zip_dir_reproducible(self):
+        project_dir = os.path.join(tempfile.mkdtemp(prefix="askanna-project"), "project")
+        shutil.copytree("tests/fixtures/projects/project-002-directories", project_dir)
+        os.chdir(project_dir)
+
+        def zip_sha256() -> str:
+            with ZipFile(self.zip_file, mode="w") as f:
+                zip_files_in_dir(".", f)
+            with open(self.zip_file, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+
+        first_sha256 = zip_sha256()
+        os.utime("askanna.yml", (0, 1_000_000_000))
+        self.assertEqual(zip_sha256(), first_sha256)
+
+        with ZipFile(self.zip_file, "r") as f:
+            for info in f.infolist():
+                self.assertEqual(info.date_time, REPRODUCIBLE_ZIP_DATE_TIME)
+                self.assertEqual(info.external_attr >> 16 & 0o777, 0o644)
+                self.assertNotIn("\\", info.filename)
+
+        with open("askanna.yml", "a") as f:
+            f.write("\n")
+        self.assertNotEqual(zip_sha256(), first_sha256)
+
     def test_zip_paths_simple(self):
         project_dir = "tests/fixtures/projects/project-001-simple"
         os.chdir(project_dir)
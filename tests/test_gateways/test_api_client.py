@@ -0,0 +1,373 @@
+import datetime
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+import requests
+import responses
+from requests.structures import CaseInsensitiveDict
+
+from askanna.core.exceptions import ConnectionError
+from askanna.core.utils.object import encode_json
+from askanna.gateways.api_client import (
+    CircuitBreaker,
+    Client,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+URL = "https://api.askanna.eu/v1/run/1234-1234-1234-1234/metric/"
+
+
+def test_json_body():
+    payload = {
+        "metrics": [
+            {
+                "metric": {"name": "accuracy", "value": np.float64(0.5), "type": "float"},
+                "label": [{"name": "steps", "value": np.arange(3), "type": "list"}],
+                "created_at": datetime.datetime(2023, 3, 23, 14, 2, tzinfo=datetime.timezone.utc),
+            }
+        ]
+    }
+
+    with responses.RequestsMock() as response:
+        response.add(responses.PATCH, URL, status=200)
+        Client().patch(URL, json=payload)
+
+        request = response.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {
+            "metrics": [
+                {
+                    "metric": {"name": "accuracy", "value": 0.5, "type": "float"},
+                    "label": [{"name": "steps", "value": [0, 1, 2], "type": "list"}],
+                    "created_at": "2023-03-23T14:02:00+00:00",
+                }
+            ]
+        }
+
+
+def test_json_body_empty():
+    with responses.RequestsMock() as response:
+        response.add(responses.POST, URL, status=201)
+        Client().post(URL, json={})
+
+        assert response.calls[0].request.body == b"{}"
+
+
+def test_json_body_keeps_headers():
+    with responses.RequestsMock() as response:
+        response.add(responses.PUT, URL, status=200)
+        Client().put(URL, json={"name": "value"}, headers={"Content-Type": "application/vnd.api+json"})
+
+        assert response.calls[0].request.headers["Content-Type"] == "application/vnd.api+json"
+
+
+def test_no_json_body():
+    with responses.RequestsMock() as response:
+        response.add(responses.DELETE, URL, status=204)
+        Client().delete(URL)
+
+        assert response.calls[0].request.body is None
+
+
+def test_head_does_not_follow_redirect():
+    cdn_url = "https://cdn.askanna.eu/files/result.json"
+
+    with responses.RequestsMock() as response:
+        response.add(responses.HEAD, URL, status=302, headers={"Location": cdn_url})
+        response.add(responses.HEAD, cdn_url, status=200)
+        result = Client().head(URL)
+
+        assert result.status_code == 302
+        assert result.headers["Location"] == cdn_url
+        assert len(response.calls) == 1
+
+        result = Client().head(URL, allow_redirects=True)
+        assert result.status_code == 200
+        assert result.url == cdn_url
+
+
+def test_session_per_thread():
+    client = Client()
+    sessions = []
+
+    def get_sessions():
+        sessions.extend([client.session, client.session])
+
+    threads = [threading.Thread(target=get_sessions) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sessions[0] is sessions[1]
+    assert len({id(session) for session in sessions + [client.session]}) == 3
+    for session in sessions:
+        assert session.get_adapter("https://api.askanna.eu") is client.adapter
+        assert session.headers["askanna-agent"] == client.headers["askanna-agent"]
+
+
+def test_update_session(monkeypatch):
+    client = Client()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        session = executor.submit(lambda: client.session).result()
+        assert session.headers.get("Authorization") != "Token 1234"
+
+        monkeypatch.setattr(
+            client,
+            "generate_authenication_header",
+            lambda: CaseInsensitiveDict({"Authorization": "Token 1234"}),
+        )
+        client.update_session()
+
+        assert executor.submit(lambda: client.session).result() is session
+        assert session.headers["Authorization"] == "Token 1234"
+    assert client.session.headers["Authorization"] == "Token 1234"
+
+
+def test_pool_size(monkeypatch):
+    monkeypatch.setenv("AA_HTTP_POOL_MAXSIZE", "4")
+    assert Client().adapter._pool_maxsize == 4
+    assert Client(pool_connections=2, pool_maxsize=8).adapter._pool_connections == 2
+
+
+def test_concurrent_requests():
+    client = Client()
+    with responses.RequestsMock() as response:
+        response.add(responses.GET, URL, json={"count": 1}, status=200)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: client.get(URL).json(), range(32)))
+
+    assert results == [{"count": 1}] * 32
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Respond with the status codes in server.statuses, and with 200 when there are no status codes left"""
+
+    def respond(self):
+        self.server.requests.append(self.command)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = b"{}"
+        self.send_response(status)
+        for name, value in self.server.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def flaky_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.statuses = []
+    server.headers = {}
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+
+    # Requests to the local server should pass through any active mock of the requests library
+    with responses.RequestsMock(passthru_prefixes=(f"http://127.0.0.1:{server.server_port}/",)):
+        yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def flaky_client(**kwargs) -> Client:
+    return Client(
+        retry_policy=RetryPolicy(retries=kwargs.get("retries", 3), backoff_factor=0),
+        circuit_breaker=CircuitBreaker(threshold=kwargs.get("threshold", 0), timeout=kwargs.get("timeout", 30)),
+    )
+
+
+def server_url(server) -> str:
+    return f"http://127.0.0.1:{server.server_port}/v1/run/"
+
+
+def test_retry_get(flaky_server):
+    flaky_server.statuses = [502, 503, 504]
+    response = flaky_client().get(server_url(flaky_server))
+
+    assert response.status_code == 200
+    assert flaky_server.requests == ["GET"] * 4
+
+
+def test_retry_get_gives_up(flaky_server):
+    flaky_server.statuses = [502] * 5
+    response = flaky_client(retries=2).get(server_url(flaky_server))
+
+    assert response.status_code == 502
+    assert len(flaky_server.requests) == 3
+
+
+def test_retry_post(flaky_server):
+    flaky_server.statuses = [502, 503]
+    response = flaky_client().post(server_url(flaky_server), json={"name": "run"})
+
+    # A 502 may come after the backend handled the request, so a POST is not retried
+    assert response.status_code == 502
+    assert flaky_server.requests == ["POST"]
+
+    # A 503 means the request was not handled, so also a POST is retried
+    response = flaky_client().post(server_url(flaky_server), json={"name": "run"})
+    assert response.status_code == 200
+    assert flaky_server.requests == ["POST"] * 3
+
+
+def test_retry_forced_and_disabled(flaky_server):
+    flaky_server.statuses = [502]
+    assert flaky_client().post(server_url(flaky_server), json={}, retry=True).status_code == 200
+
+    flaky_server.statuses = [502]
+    assert flaky_client().get(server_url(flaky_server), retry=False).status_code == 502
+
+
+def test_retry_file_upload(flaky_server, tmp_path):
+    path = tmp_path / "chunk"
+    path.write_bytes(b"chunk")
+    flaky_server.statuses = [503]
+
+    with path.open("rb") as f:
+        response = flaky_client().put(server_url(flaky_server), data=f)
+
+    assert response.status_code == 503
+    assert len(flaky_server.requests) == 1
+
+
+def test_retry_after(flaky_server, monkeypatch):
+    delays = []
+    monkeypatch.setattr("askanna.gateways.api_client.time.sleep", delays.append)
+    flaky_server.statuses = [429]
+    flaky_server.headers = {"Retry-After": "2"}
+
+    response = flaky_client().post(server_url(flaky_server), json={})
+
+    assert response.status_code == 200
+    assert delays == [2.0]
+
+
+def test_retry_connection_error(monkeypatch):
+    sleep = []
+    monkeypatch.setattr("askanna.gateways.api_client.time.sleep", sleep.append)
+
+    # Nothing listens on port 9 on the loopback interface, so the connection is refused
+    with responses.RequestsMock(passthru_prefixes=("http://127.0.0.1:9/",)), pytest.raises(ConnectionError):
+        flaky_client(retries=2).get("http://127.0.0.1:9/v1/run/")
+    assert len(sleep) == 2
+
+
+def test_circuit_breaker(flaky_server):
+    flaky_server.statuses = [503] * 3
+    client = flaky_client(retries=0, threshold=3)
+    url = server_url(flaky_server)
+
+    for _ in range(3):
+        assert client.get(url).status_code == 503
+
+    with pytest.raises(ConnectionError) as e:
+        client.get(url)
+    assert "failed 3 times in a row" in str(e.value)
+    assert len(flaky_server.requests) == 3
+
+
+def test_circuit_breaker_half_open(flaky_server, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("askanna.gateways.api_client.time.monotonic", lambda: now[0])
+    flaky_server.statuses = [503, 503, 503]
+    client = flaky_client(retries=0, threshold=2, timeout=10)
+    url = server_url(flaky_server)
+
+    client.get(url)
+    client.get(url)
+    with pytest.raises(ConnectionError):
+        client.get(url)
+
+    # After the timeout, one request is let through. It fails, so the circuit opens again.
+    now[0] += 11
+    assert client.get(url).status_code == 503
+    with pytest.raises(ConnectionError):
+        client.get(url)
+
+    now[0] += 11
+    assert client.get(url).status_code == 200
+    assert client.get(url).status_code == 200
+    assert len(flaky_server.requests) == 5
+
+
+def test_retry_delay(monkeypatch):
+    policy = RetryPolicy(retries=3, backoff_factor=1, backoff_max=5)
+    monkeypatch.setattr("askanna.gateways.api_client.random.uniform", lambda low, high: high)
+
+    assert [policy.delay(retry_number) for retry_number in range(4)] == [1, 2, 4, 5]
+
+
+def test_retry_policy_environment(monkeypatch):
+    monkeypatch.setenv("AA_HTTP_RETRIES", "7")
+    monkeypatch.setenv("AA_HTTP_BACKOFF_FACTOR", "0.1")
+    monkeypatch.setenv("AA_HTTP_CIRCUIT_BREAKER_THRESHOLD", "0")
+
+    policy = RetryPolicy()
+    assert policy.retries == 7
+    assert policy.backoff_factor == 0.1
+    assert CircuitBreaker().threshold == 0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=60)
+    assert 55 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 60
+
+
+def test_request_not_sent():
+    error = requests.exceptions.ConnectTimeout()
+    assert RetryPolicy().retry_error("POST", error)
+    assert not RetryPolicy().retry_error("POST", requests.exceptions.ConnectionError())
+    assert RetryPolicy().retry_error("GET", requests.exceptions.ConnectionError())
+
+
+def test_request_hook(flaky_server):
+    events = []
+    client = flaky_client()
+    client.add_hook(events.append)
+    flaky_server.statuses = [502]
+
+    client.put(server_url(flaky_server) + "1234-1234-1234-1234/", json={"name": "run"})
+
+    assert len(events) == 1
+    assert events[0].method == "PUT"
+    assert events[0].endpoint == "/v1/run/{suuid}/"
+    assert events[0].status_code == 200
+    assert events[0].retries == 1
+    assert events[0].request_bytes == len(encode_json({"name": "run"}))
+    assert events[0].response_bytes == 2
+    assert events[0].duration > 0
+
+    client.remove_hook(events.append)
+    client.get(server_url(flaky_server))
+    assert len(events) == 1
+
+
+def test_request_hook_connection_error():
+    events = []
+    client = flaky_client(retries=0)
+    client.add_hook(events.append)
+
+    with responses.RequestsMock(passthru_prefixes=("http://127.0.0.1:9/",)), pytest.raises(ConnectionError):
+        client.get("http://127.0.0.1:9/v1/run/")
+
+    assert events[0].status_code is None
+    assert "Something went wrong" in events[0].error
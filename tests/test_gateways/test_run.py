@@ -10,6 +10,7 @@ from askanna.core.dataclasses.run import (
     VariableObject,
 )
 from askanna.core.exceptions import DeleteError, GetError, PatchError, PutError
+from askanna.gateways.api_client import client
 from askanna.gateways.run import RunGateway
 from tests.utils import str_to_datetime
 
@@ -40,7 +41,10 @@ class TestGatewayRun:
             in e.value.args[0]
         )
 
-    def test_run_list_error_2(self):
+    def test_run_list_error_2(self, monkeypatch):
+        # The mocked 503 response is returned only once, a retry gets the run list
+        monkeypatch.setattr(client.retry_policy, "retries", 0)
+
         run_gateway = RunGateway()
         with pytest.raises(GetError) as e:
             run_gateway.list(cursor="888")
@@ -281,6 +285,17 @@ class TestGatewayRun:
             "500 - Something went wrong while updating metrics of run SUUID 'zyxw-zyxw-zyxw-zyxw'" in exc.value.args[0]
         )
 
+    def test_run_metric_update_partial(self, run_metric):
+        run_gateway = RunGateway()
+        metric_list = MetricList(metrics=[MetricObject.from_dict(run_metric)])
+
+        assert run_gateway.metric_update("1234-1234-1234-1234", metric_list, partial=True) is None
+
+        with pytest.raises(PatchError) as exc:
+            run_gateway.metric_update("wxyz-wxyz-wxyz-wxyz", metric_list, partial=True)
+
+        assert "404 - The run SUUID 'wxyz-wxyz-wxyz-wxyz' was not found" in exc.value.args[0]
+
     def test_run_variable_update(self, run_variable):
         run_gateway = RunGateway()
         variable_object = VariableObject.from_dict(run_variable)
@@ -0,0 +1,127 @@
+import json
+import os
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+from askanna.gateways.trace import (
+    RequestEvent,
+    RequestStatistics,
+    enable_trace,
+    endpoint_template,
+    percentile,
+)
+
+
+def request_event(endpoint="/v1/run/{suuid}/", duration=0.1, status_code=200, retries=0) -> RequestEvent:
+    return RequestEvent(
+        method="GET",
+        url="https://beta-api.askanna.eu" + endpoint.replace("{suuid}", "1234-1234-1234-1234"),
+        endpoint=endpoint,
+        status_code=status_code,
+        start=1679580000.0,
+        duration=duration,
+        request_bytes=0,
+        response_bytes=100,
+        retries=retries,
+        thread_id=1,
+    )
+
+
+def test_endpoint_template():
+    assert endpoint_template("https://beta-api.askanna.eu/v1/run/") == "/v1/run/"
+    assert (
+        endpoint_template("https://beta-api.askanna.eu/v1/run/1234-1234-1234-1234/metric/?cursor=abc")
+        == "/v1/run/{suuid}/metric/"
+    )
+    assert (
+        endpoint_template(
+            "https://beta-api.askanna.eu/v1/package/abcd-1234-ABCD-5678/packagechunk/"
+            "7b3e1c1a-2f6d-4a8e-9c1b-0e5f4d3c2b1a/chunk/"
+        )
+        == "/v1/package/{suuid}/packagechunk/{uuid}/chunk/"
+    )
+
+
+def test_percentile():
+    assert percentile([], 50) == 0.0
+    assert percentile([3.0], 95) == 3.0
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+
+
+def test_summary():
+    statistics = RequestStatistics()
+    for duration in [0.1, 0.2, 0.3, 0.4]:
+        statistics(request_event(duration=duration))
+    statistics(request_event(endpoint="/v1/job/", duration=0.05, status_code=503, retries=3))
+
+    summary = statistics.summary()
+
+    assert list(summary) == ["GET /v1/run/{suuid}/", "GET /v1/job/"]
+    assert summary["GET /v1/run/{suuid}/"]["count"] == 4
+    assert summary["GET /v1/run/{suuid}/"]["p50_ms"] == pytest.approx(200)
+    assert summary["GET /v1/run/{suuid}/"]["p95_ms"] == pytest.approx(400)
+    assert summary["GET /v1/run/{suuid}/"]["response_bytes"] == 400
+    assert summary["GET /v1/job/"]["errors"] == 1
+    assert summary["GET /v1/job/"]["retries"] == 3
+
+
+def test_dump(tmp_path):
+    statistics = RequestStatistics()
+    statistics(request_event())
+
+    statistics.dump(tmp_path / "trace.json")
+    content = json.loads((tmp_path / "trace.json").read_text())
+    assert content["endpoints"]["GET /v1/run/{suuid}/"]["count"] == 1
+    assert content["requests"][0]["url"] == "https://beta-api.askanna.eu/v1/run/1234-1234-1234-1234/"
+
+    statistics.dump(tmp_path / "chrome.json", "chrome")
+    content = json.loads((tmp_path / "chrome.json").read_text())
+    assert content["traceEvents"][0]["ph"] == "X"
+    assert content["traceEvents"][0]["dur"] == 100_000
+    assert content["traceEvents"][0]["args"]["status_code"] == 200
+
+    with pytest.raises(ValueError) as e:
+        statistics.dump(tmp_path / "trace.txt", "txt")
+    assert "Trace format 'txt' is not supported" in e.value.args[0]
+
+
+def test_enable_trace(tmp_path):
+    client = mock.Mock()
+    with mock.patch("askanna.gateways.trace.atexit.register") as register:
+        statistics = enable_trace(client, tmp_path / "trace.json")
+
+    client.add_hook.assert_called_once_with(statistics)
+    statistics(request_event())
+    register.call_args[0][0]()
+    assert json.loads((tmp_path / "trace.json").read_text())["endpoints"]
+
+    with pytest.raises(ValueError):
+        enable_trace(client, tmp_path / "trace.json", "xml")
+
+
+def test_trace_environment(tmp_path):
+    path = tmp_path / "trace.json"
+    env = dict(os.environ, AA_TRACE=str(path), AA_TRACE_FORMAT="chrome")
+    subprocess.run([sys.executable, "-c", "import askanna.gateways.api_client"], env=env, check=True)
+
+    assert json.loads(path.read_text()) == {"traceEvents": [], "displayTimeUnit": "ms"}
+
+
+def test_trace_environment_format_not_supported(tmp_path):
+    path = tmp_path / "trace.json"
+    env = dict(os.environ, AA_TRACE=str(path), AA_TRACE_FORMAT="xml")
+    result = subprocess.run(
+        [sys.executable, "-c", "import askanna.gateways.api_client"],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert "Trace format 'xml' of AA_TRACE_FORMAT is not supported" in result.stderr
+    assert json.loads(path.read_text()) == {"endpoints": {}, "requests": []}
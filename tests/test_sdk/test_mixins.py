@@ -0,0 +1,157 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from askanna.core.exceptions import GetError
+from askanna.sdk.mixins import ListMixin, prefetch_iterator
+from askanna.sdk.run import RunSDK
+from askanna.sdk.workspace import WorkspaceSDK
+
+
+class FakeListGateway:
+    """Gateway with 250 results, the cursor of a page is the index of the first result"""
+
+    def __init__(self, count=250, fail_at_cursor=None):
+        self.count = count
+        self.fail_at_cursor = fail_at_cursor
+        self.calls = []
+
+    def list(self, page_size, cursor=None, **query_params):
+        if cursor is not None and cursor == self.fail_at_cursor:
+            raise GetError("500 - Something went wrong")
+        self.calls.append({"page_size": page_size, "cursor": cursor, **query_params})
+        start = int(cursor or 0)
+        end = min(start + page_size, self.count)
+        return SimpleNamespace(
+            results=list(range(start, end)),
+            total_count=self.count,
+            next_url=f"?cursor={end}" if end < self.count else None,
+            next_url_cursor=str(end) if end < self.count else None,
+        )
+
+
+class FakeListSDK(ListMixin):
+    def __init__(self, gateway):
+        super().__init__()
+        self.gateway = gateway
+
+
+class TestListMixin:
+    def test_list(self):
+        gateway = FakeListGateway()
+        result = FakeListSDK(gateway).list(number_of_results=120, other_query_params={"search": "model"})
+
+        assert result == list(range(120))
+        assert [call["page_size"] for call in gateway.calls] == [120]
+        assert gateway.calls[0]["search"] == "model"
+
+    def test_iter_list_is_lazy(self):
+        gateway = FakeListGateway()
+        sdk = FakeListSDK(gateway)
+        results = sdk.iter_list(page_size=100)
+
+        assert gateway.calls == []
+        assert next(results) == 0
+        assert len(gateway.calls) == 1
+        assert sdk.list_total_count == 250
+
+        for _ in range(99):
+            next(results)
+        assert len(gateway.calls) == 1
+        assert next(results) == 100
+        assert gateway.calls[1]["cursor"] == "100"
+
+        assert list(results) == list(range(101, 250))
+        assert len(gateway.calls) == 3
+
+    def test_iter_list_number_of_results(self):
+        gateway = FakeListGateway()
+
+        assert list(FakeListSDK(gateway).iter_list(number_of_results=150, page_size=100)) == list(range(150))
+        assert len(gateway.calls) == 2
+
+    def test_iter_pages(self):
+        gateway = FakeListGateway()
+        pages = list(FakeListSDK(gateway).iter_pages(page_size=100))
+
+        assert [len(page) for page in pages] == [100, 100, 50]
+
+    def test_iter_list_empty(self):
+        assert list(FakeListSDK(FakeListGateway(count=0)).iter_list()) == []
+
+    def test_iter_list_prefetch(self):
+        gateway = FakeListGateway()
+
+        assert list(FakeListSDK(gateway).iter_list(page_size=100, prefetch=2)) == list(range(250))
+        assert [call["cursor"] for call in gateway.calls] == [None, "100", "200"]
+
+    def test_iter_list_prefetch_error(self):
+        results = FakeListSDK(FakeListGateway(fail_at_cursor="200")).iter_list(page_size=100, prefetch=1)
+
+        with pytest.raises(GetError):
+            for index, result in enumerate(results):
+                assert result == index
+        assert index == 199
+
+
+def wait_for(condition, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestPrefetchIterator:
+    def test_prefetch_iterator(self):
+        assert list(prefetch_iterator(iter(range(10)), depth=3)) == list(range(10))
+
+    def test_prefetch_iterator_depth(self):
+        consumed = []
+
+        def items():
+            for item in range(10):
+                consumed.append(item)
+                yield item
+
+        prefetched = prefetch_iterator(items(), depth=2)
+        assert next(prefetched) == 0
+
+        # One item is yielded, two items wait in the queue and the worker waits to add the next item
+        assert wait_for(lambda: len(consumed) == 4)
+        time.sleep(0.05)
+        assert len(consumed) == 4
+
+        assert list(prefetched) == list(range(1, 10))
+
+    def test_prefetch_iterator_close(self):
+        def items():
+            yield from range(1000)
+
+        prefetched = prefetch_iterator(items(), depth=1)
+        assert next(prefetched) == 0
+        prefetched.close()
+
+        assert wait_for(lambda: not any(t.name == "askanna-list-prefetch" for t in threading.enumerate()))
+
+
+@pytest.mark.usefixtures("api_response")
+class TestSDKIter:
+    def test_run_iter(self):
+        runs = list(RunSDK().iter(include_metrics=True))
+
+        assert len(runs) == 1
+        assert runs[0].suuid == "1234-1234-1234-1234"
+        assert runs[0].metrics is not None
+
+    def test_run_iter_prefetch(self):
+        runs = list(RunSDK().iter(prefetch=1))
+
+        assert len(runs) == 1
+        assert runs[0].suuid == "1234-1234-1234-1234"
+
+    def test_workspace_iter(self):
+        workspaces = WorkspaceSDK().iter(number_of_results=1)
+
+        assert len(list(workspaces)) == 1
@@ -1,6 +1,13 @@
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
+from askanna.core.cache import RunCache
 from askanna.core.dataclasses.run import ArtifactInfo, MetricList, VariableList
+from askanna.core.exceptions import GetError
 from askanna.sdk.run import RunSDK
 from tests.utils import str_to_datetime
 
@@ -34,6 +41,29 @@ class TestSDKRun:
 
         assert result.suuid == "1234-1234-1234-1234"
 
+    def test_run_list_include_metrics_and_variables(self):
+        run_sdk = RunSDK()
+        result = run_sdk.list(include_metrics=True, include_variables=True)
+
+        assert isinstance(result[0].metrics, MetricList)
+        assert isinstance(result[0].variables, VariableList)
+
+    def test_run_get_include_metrics_and_variables(self):
+        run_sdk = RunSDK()
+        result = run_sdk.get("1234-1234-1234-1234", include_metrics=True, include_variables=True)
+
+        assert isinstance(result.metrics, MetricList)
+        assert isinstance(result.variables, VariableList)
+
+    def test_run_include_metrics_error(self):
+        run_sdk = RunSDK()
+        runs = [SimpleNamespace(suuid="1234-1234-1234-1234"), SimpleNamespace(suuid="wxyz-wxyz-wxyz-wxyz")]
+
+        with pytest.raises(GetError) as exc:
+            run_sdk._include_metrics_and_variables(runs, include_metrics=True)
+        assert str(exc.value) == "404 - The run SUUID 'wxyz-wxyz-wxyz-wxyz' was not found"
+        assert isinstance(runs[0].metrics, MetricList)
+
     def test_run_status(self):
         run_sdk = RunSDK()
         result = run_sdk.status("1234-1234-1234-1234")
@@ -78,3 +108,172 @@ class TestSDKRun:
         assert isinstance(result, ArtifactInfo)
         assert result.files is not None
         assert result.files[0].name == run_artifact_item["files"][0]["name"]
+
+
+class FakeRunGateway:
+    def __init__(self, failing_runs=(), delay=0.0):
+        self.failing_runs = failing_runs
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def get(self, kind, run_suuid):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if run_suuid in self.failing_runs:
+            raise GetError(f"500 - Something went wrong while retrieving the {kind} of run SUUID '{run_suuid}'")
+        return f"{kind} of {run_suuid}"
+
+    def metric(self, run_suuid):
+        return self.get("metrics", run_suuid)
+
+    def variable(self, run_suuid):
+        return self.get("variables", run_suuid)
+
+
+class TestSDKRunIncludeMetricsAndVariables:
+    def test_include_in_order(self):
+        run_sdk = RunSDK()
+        run_sdk.gateway = FakeRunGateway(delay=0.01)
+        run_sdk.fetch_concurrency = 4
+        runs = [SimpleNamespace(suuid=f"run-{index}", metrics=None, variables=None) for index in range(20)]
+
+        run_sdk._include_metrics_and_variables(runs, include_metrics=True, include_variables=True)
+
+        assert [run.metrics for run in runs] == [f"metrics of run-{index}" for index in range(20)]
+        assert [run.variables for run in runs] == [f"variables of run-{index}" for index in range(20)]
+        assert 1 < run_sdk.gateway.max_active <= 4
+
+    def test_include_concurrency_one(self):
+        run_sdk = RunSDK()
+        run_sdk.gateway = FakeRunGateway()
+        run_sdk.fetch_concurrency = 1
+        runs = [SimpleNamespace(suuid=f"run-{index}", metrics=None, variables=None) for index in range(5)]
+
+        run_sdk._include_metrics_and_variables(runs, include_metrics=True)
+
+        assert runs[4].metrics == "metrics of run-4"
+        assert runs[4].variables is None
+        assert run_sdk.gateway.max_active == 1
+
+    def test_include_errors_per_run(self):
+        run_sdk = RunSDK()
+        run_sdk.gateway = FakeRunGateway(failing_runs=("run-1", "run-3"))
+        runs = [SimpleNamespace(suuid=f"run-{index}", metrics=None, variables=None) for index in range(5)]
+
+        with pytest.raises(GetError) as exc:
+            run_sdk._include_metrics_and_variables(runs, include_metrics=True, include_variables=True)
+
+        assert str(exc.value).startswith("Something went wrong while retrieving the metrics or variables of 2 runs:")
+        assert "  - run-1 metrics: 500 - Something went wrong while retrieving the metrics" in str(exc.value)
+        assert "  - run-3 variables: 500 - Something went wrong while retrieving the variables" in str(exc.value)
+        # The runs that did not fail still get their metrics and variables
+        assert runs[4].metrics == "metrics of run-4"
+        assert runs[4].variables == "variables of run-4"
+
+
+@pytest.fixture
+def run_sdk_with_cache(temp_dir):
+    run_sdk = RunSDK()
+    run_sdk.use_cache = True
+    run_sdk.cache = RunCache(path=temp_dir, max_size=1024**2)
+    return run_sdk
+
+
+@pytest.fixture
+def gateway_calls(monkeypatch):
+    """Count the calls to the run gateway, and fake getting the result of a run"""
+    calls = []
+    gateway = RunSDK.gateway
+
+    def spy(name, method):
+        def wrapper(*args, **kwargs):
+            calls.append(name)
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    def result(run_suuid, output_path=None):
+        if output_path:
+            Path(output_path).write_bytes(b"result")
+            return None
+        return b"result"
+
+    for name in ("metric", "variable", "artifact_info"):
+        monkeypatch.setattr(gateway, name, spy(name, getattr(gateway, name)))
+    monkeypatch.setattr(gateway, "result", spy("result", result))
+    return calls
+
+
+@pytest.mark.usefixtures("api_response")
+class TestSDKRunCache:
+    def test_get_metric(self, run_sdk_with_cache, gateway_calls):
+        first = run_sdk_with_cache.get_metric("1234-1234-1234-1234")
+        second = run_sdk_with_cache.get_metric("1234-1234-1234-1234")
+
+        assert first == second
+        assert gateway_calls == ["metric"]
+
+    def test_get_variable_and_artifact_info(self, run_sdk_with_cache, gateway_calls):
+        results = [
+            (
+                run_sdk_with_cache.get_variable("1234-1234-1234-1234"),
+                run_sdk_with_cache.artifact_info("1234-1234-1234-1234"),
+            )
+            for _ in range(2)
+        ]
+
+        assert results[0] == results[1]
+        assert gateway_calls == ["variable", "artifact_info"]
+        assert run_sdk_with_cache.cache.stats()["entries"] == 2
+
+    def test_result(self, run_sdk_with_cache, gateway_calls, temp_dir):
+        output_path = Path(temp_dir) / "result.json"
+
+        assert run_sdk_with_cache.result("1234-1234-1234-1234", output_path=output_path) is None
+        assert run_sdk_with_cache.result("1234-1234-1234-1234") == b"result"
+        assert gateway_calls == ["result"]
+
+        output_path.unlink()
+        run_sdk_with_cache.result("1234-1234-1234-1234", output_path=output_path)
+        assert output_path.read_bytes() == b"result"
+        assert gateway_calls == ["result"]
+
+    def test_list_include_metrics(self, run_sdk_with_cache, gateway_calls):
+        run_sdk_with_cache.list(include_metrics=True)
+        result = run_sdk_with_cache.list(include_metrics=True)
+
+        assert isinstance(result[0].metrics, MetricList)
+        assert gateway_calls == ["metric"]
+
+    def test_cached_run_is_not_requested_again(self, run_sdk_with_cache, gateway_calls, monkeypatch):
+        detail_calls = []
+        detail = RunSDK.gateway.detail
+
+        def detail_spy(run_suuid):
+            detail_calls.append(run_suuid)
+            return detail(run_suuid)
+
+        monkeypatch.setattr(RunSDK.gateway, "detail", detail_spy)
+
+        first = run_sdk_with_cache.get_metric("1234-1234-1234-1234")
+        second = run_sdk_with_cache.get_metric("1234-1234-1234-1234")
+        run_sdk_with_cache.get_variable("1234-1234-1234-1234")
+
+        assert first == second
+        assert detail_calls == ["1234-1234-1234-1234"]
+        assert gateway_calls == ["metric", "variable"]
+
+    def test_without_cache(self, gateway_calls, temp_dir):
+        run_sdk = RunSDK()
+        run_sdk.cache = RunCache(path=temp_dir, max_size=1024**2)
+        run_sdk.get_metric("1234-1234-1234-1234")
+        run_sdk.get_metric("1234-1234-1234-1234")
+
+        assert gateway_calls == ["metric", "metric"]
+        assert run_sdk.cache.stats()["entries"] == 0
@@ -20,6 +20,12 @@ class TestSDKImport:
     def test_track_metrics(self):
         from askanna import track_metrics  # noqa
 
+    def test_track_metric_series(self):
+        from askanna import track_metric_series  # noqa
+
+    def test_track_metrics_series(self):
+        from askanna import track_metrics_series  # noqa
+
     def test_track_variable(self):
         from askanna import track_variable  # noqa
 
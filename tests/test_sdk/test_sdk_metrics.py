@@ -1,4 +1,12 @@
-from askanna import track_metric, track_metrics
+import numpy as np
+
+from askanna import (
+    track_metric,
+    track_metric_series,
+    track_metrics,
+    track_metrics_series,
+)
+from askanna.sdk.track import metric_collector
 
 
 class TestSDKMetrics:
@@ -16,3 +24,28 @@ class TestSDKMetrics:
         track_metric("metricname_bool_F", False)
         track_metric("metricname_bool_N", None)
         track_metric("metricname_dict", {"dictkey": "dictvalue"})
+
+    def test_track_metric_series(self):
+        count = len(metric_collector)
+        track_metric_series("loss", np.array([0.5, 0.25]), steps=np.array([1, 2]), label={"model": "forest"})
+
+        assert len(metric_collector) == count + 2
+        metric = metric_collector.metrics[-1]
+        assert metric.metric.name == "loss"
+        assert metric.metric.value == 0.25
+        assert metric.metric.type == "float"
+        assert [(label.name, label.value) for label in metric.label] == [("model", "forest"), ("step", 2)]
+
+    def test_track_metric_series_mixed_values(self):
+        count = len(metric_collector)
+        track_metric_series("mixed", [1, "two", None], steps=[1, 2, 3], label="test")
+
+        assert len(metric_collector) == count + 3
+        assert [metric.metric.type for metric in metric_collector.metrics[-3:]] == ["integer", "string", "tag"]
+        assert [label.name for label in metric_collector.metrics[-1].label] == ["test", "step"]
+
+    def test_track_metrics_series(self):
+        count = len(metric_collector)
+        track_metrics_series({"precision": [0.5, 0.6], "recall": [0.7, 0.8]}, steps=range(2))
+
+        assert len(metric_collector) == count + 4